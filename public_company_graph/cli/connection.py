@@ -9,12 +9,16 @@ import sys
 
 from public_company_graph.config import get_neo4j_database
 from public_company_graph.neo4j import get_neo4j_driver, verify_connection
+from public_company_graph.pipeline import active_context
 
 
 def get_driver_and_database(logger: logging.Logger | None = None) -> tuple:
     """
     Get Neo4j driver and database name with error handling.
 
+    Inside a pipeline run (public_company_graph.pipeline) this returns the run's
+    shared driver; closing it does not close the shared pool.
+
     Args:
         logger: Optional logger instance
 
@@ -27,6 +31,10 @@ def get_driver_and_database(logger: logging.Logger | None = None) -> tuple:
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    context = active_context()
+    if context is not None:
+        return context.borrow_driver(), context.database
+
     try:
         driver = get_neo4j_driver()
         database = get_neo4j_database()
@@ -21,6 +21,9 @@ def setup_logging(
     """
     Set up logging for a script.
 
+    Inside a pipeline run (public_company_graph.pipeline) the run's logging is kept
+    and a child of its logger is returned.
+
     Args:
         script_name: Name of the script (for log file naming)
         execute: If True, log to file + console. If False, only console.
@@ -30,6 +33,14 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    from public_company_graph.pipeline import active_context
+
+    context = active_context()
+    if context is not None:
+        # Inside a pipeline run logging is already configured, and clearing the
+        # handlers here would cut off the stages running alongside this one
+        return context.logger.getChild(script_name)
+
     # Console formatter: no timestamps (clean output)
     console_formatter = logging.Formatter("%(message)s")
 
@@ -18,17 +18,28 @@ Future signals (when data is enriched):
 All data sources are public domain or Creative Commons licensed.
 """
 
+from public_company_graph.company.composite_index import (
+    COMPOSITE_INDEX_TOP_N,
+    build_composite_index,
+    composite_neighbors,
+)
 from public_company_graph.company.enrichment import (
     fetch_sec_company_info,
+    fetch_sec_company_info_async,
     fetch_wikidata_info,
     fetch_yahoo_finance_info,
     merge_company_data,
     normalize_industry_codes,
+    parse_sec_submissions,
 )
+from public_company_graph.company.frame import CompanyFrame, load_company_frame
 from public_company_graph.company.queries import (
     DEFAULT_SIMILARITY_WEIGHTS,
     SHARED_TECHNOLOGY_WEIGHT,
+    SIMILAR_BATCH_CHUNK_SIZE,
     find_similar_companies,
+    find_similar_companies_batch,
+    get_composite_similar_companies_query,
     get_similarity_breakdown,
     get_similarity_breakdown_query,
     get_top_similar_companies_query,
@@ -38,6 +49,11 @@ from public_company_graph.company.similarity import (
     bucket_companies_by_size,
     compute_industry_similarity,
     compute_size_similarity,
+    industry_group_memberships,
+    iter_industry_similarity,
+    iter_size_similarity,
+    size_bucket_memberships,
+    unique_pairs,
 )
 
 __all__ = [
@@ -46,19 +62,36 @@ __all__ = [
     "SHARED_TECHNOLOGY_WEIGHT",
     # Enrichment functions
     "fetch_sec_company_info",
+    "fetch_sec_company_info_async",
+    "parse_sec_submissions",
     "fetch_yahoo_finance_info",
     "fetch_wikidata_info",
     "merge_company_data",
     "normalize_industry_codes",
+    # Columnar company table
+    "CompanyFrame",
+    "load_company_frame",
     # Similarity functions
     "compute_industry_similarity",
     "compute_size_similarity",
     "bucket_companies_by_size",
+    "iter_industry_similarity",
+    "iter_size_similarity",
+    "unique_pairs",
+    "industry_group_memberships",
+    "size_bucket_memberships",
     # Query generators
     "get_top_similar_companies_query",
     "get_top_similar_companies_query_extended",
     "get_similarity_breakdown_query",
+    "get_composite_similar_companies_query",
     # Helper functions (execute queries directly)
     "find_similar_companies",
+    "find_similar_companies_batch",
+    "SIMILAR_BATCH_CHUNK_SIZE",
     "get_similarity_breakdown",
+    # Precomputed composite similarity index
+    "COMPOSITE_INDEX_TOP_N",
+    "build_composite_index",
+    "composite_neighbors",
 ]
@@ -0,0 +1,341 @@
+"""
+Precomputed composite similarity index.
+
+get_top_similar_companies_query scores candidates per request: it aggregates the
+SIMILAR_RISK/SIMILAR_DESCRIPTION edges of the company and counts shared technologies
+through Company-Domain-Technology paths, which fan out through ubiquitous
+technologies. This module computes the same score for every company in one batch
+job and stores each company's top-N neighbours as
+
+    (c1:Company)-[:SIMILAR_COMPOSITE {score, rank, ...}]->(c2:Company)
+
+so find_similar_companies becomes an index lookup of `limit` edges.
+
+Refreshes are incremental: each company stores a signature of its component edges
+and technology set, and only companies whose signature changed (and their direct
+neighbours, whose lists contain or used to contain them) are rewritten.
+"""
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from public_company_graph.company.queries import (
+    DEFAULT_SIMILARITY_WEIGHTS,
+    SHARED_TECHNOLOGY_WEIGHT,
+)
+from public_company_graph.constants import BATCH_SIZE_LARGE
+from public_company_graph.gds.sparse import BipartiteGraph, shared_counts
+from public_company_graph.gds.utils import write_relationships, write_unwind_batches
+
+logger = logging.getLogger(__name__)
+
+# Neighbours stored per company; find_similar_companies falls back to the live
+# query for larger limits
+COMPOSITE_INDEX_TOP_N = 50
+
+
+def composite_neighbors(
+    edges: pd.DataFrame,
+    technologies: pd.DataFrame,
+    top_n: int = COMPOSITE_INDEX_TOP_N,
+    weights: dict[str, float] | None = None,
+    shared_tech_weight: float = SHARED_TECHNOLOGY_WEIGHT,
+) -> pd.DataFrame:
+    """
+    Composite similarity scores and top-N neighbours of every company.
+
+    Mirrors get_top_similar_companies_query with include_shared_tech=True: candidates
+    are companies linked by a component edge in either direction, each edge adds
+    weight × score (and one match), and each shared technology adds
+    shared_tech_weight. Neighbours are ranked by score, then risk matches, shared
+    technologies and description matches.
+
+    Args:
+        edges: Columns cik1, cik2, rel_type, score (one row per directed edge)
+        technologies: Columns cik, tech_id (one row per company technology)
+        top_n: Neighbours to keep per company
+        weights: Relationship weights (default: DEFAULT_SIMILARITY_WEIGHTS)
+        shared_tech_weight: Score added per shared technology
+
+    Returns:
+        DataFrame with cik1, cik2, score, risk_score, desc_score, shared_tech_count,
+        risk_matches, desc_matches, rank (0 = most similar)
+    """
+    if weights is None:
+        weights = DEFAULT_SIMILARITY_WEIGHTS
+
+    columns = [
+        "cik1",
+        "cik2",
+        "score",
+        "risk_score",
+        "desc_score",
+        "shared_tech_count",
+        "risk_matches",
+        "desc_matches",
+        "rank",
+    ]
+    edges = edges[edges["cik1"] != edges["cik2"]]
+    if edges.empty:
+        return pd.DataFrame(columns=columns)
+
+    # (c1)-[r]-(c2) matches each edge from both endpoints
+    both = pd.concat(
+        [edges, edges.rename(columns={"cik1": "cik2", "cik2": "cik1"})], ignore_index=True
+    )
+    is_risk = (both["rel_type"] == "SIMILAR_RISK").to_numpy()
+    is_desc = (both["rel_type"] == "SIMILAR_DESCRIPTION").to_numpy()
+    score = both["score"].to_numpy(dtype=np.float64)
+    both = both.assign(
+        risk_score=np.where(is_risk, weights.get("SIMILAR_RISK", 1.0) * score, 0.0),
+        desc_score=np.where(is_desc, weights.get("SIMILAR_DESCRIPTION", 0.5) * score, 0.0),
+        risk_matches=is_risk.astype(np.int64),
+        desc_matches=is_desc.astype(np.int64),
+    )
+    pairs = (
+        both.groupby(["cik1", "cik2"], sort=False)[
+            ["risk_score", "desc_score", "risk_matches", "desc_matches"]
+        ]
+        .sum()  # skips null scores, like Cypher's sum()
+        .reset_index()
+    )
+
+    pairs["shared_tech_count"] = _shared_technology_counts(
+        technologies, pairs["cik1"].to_numpy(), pairs["cik2"].to_numpy()
+    )
+    pairs["score"] = (
+        pairs["risk_score"] + pairs["desc_score"] + pairs["shared_tech_count"] * shared_tech_weight
+    )
+
+    pairs = pairs.sort_values(
+        ["cik1", "score", "risk_matches", "shared_tech_count", "desc_matches", "cik2"],
+        ascending=[True, False, False, False, False, True],
+        kind="stable",
+    )
+    pairs["rank"] = pairs.groupby("cik1", sort=False).cumcount()
+    return pairs[pairs["rank"] < top_n][columns].reset_index(drop=True)
+
+
+def _shared_technology_counts(
+    technologies: pd.DataFrame, cik1: np.ndarray, cik2: np.ndarray
+) -> np.ndarray:
+    """Distinct technologies used by both companies of each pair (0 if either has none)."""
+    counts = np.zeros(len(cik1), dtype=np.int64)
+    if technologies.empty or not len(cik1):
+        return counts
+
+    graph = BipartiteGraph.from_edges(
+        technologies["cik"].to_numpy(), technologies["tech_id"].to_numpy()
+    )
+    row_of = pd.Index(graph.left_ids)
+    left = row_of.get_indexer(cik1)
+    right = row_of.get_indexer(cik2)
+    known = (left >= 0) & (right >= 0)
+    counts[known] = shared_counts(graph.matrix, left[known], right[known]).astype(np.int64)
+    return counts
+
+
+def component_signatures(edges: pd.DataFrame, technologies: pd.DataFrame) -> pd.Series:
+    """
+    Order-independent fingerprint of each company's composite inputs.
+
+    Combines a hash of every component edge touching the company (either direction)
+    with a hash of its technology set, so any added, removed or re-scored edge and
+    any technology change alters the signature.
+
+    Returns:
+        Series cik -> 16-hex-digit signature
+    """
+    parts = []
+    if not edges.empty:
+        edge_hash = pd.util.hash_pandas_object(
+            edges[["cik1", "cik2", "rel_type", "score"]], index=False
+        ).to_numpy()
+        for column in ("cik1", "cik2"):
+            parts.append(pd.Series(edge_hash, index=edges[column].to_numpy()))
+    if not technologies.empty:
+        tech_hash = pd.util.hash_pandas_object(technologies[["cik", "tech_id"]], index=False)
+        # Distinct multiplier keeps a technology hash from cancelling an edge hash
+        parts.append(
+            pd.Series(tech_hash.to_numpy() * np.uint64(31), index=technologies["cik"].to_numpy())
+        )
+    if not parts:
+        return pd.Series(dtype=object)
+
+    # uint64 sums wrap around, which is fine for a fingerprint
+    combined = pd.concat(parts).groupby(level=0).sum()
+    return combined.map(lambda value: f"{int(value) & 0xFFFFFFFFFFFFFFFF:016x}")
+
+
+def _export(driver, database: str | None):
+    """Load component edges, company technologies and stored signatures."""
+    with driver.session(database=database) as session:
+        result = session.run(
+            """
+            MATCH (c1:Company)-[r:SIMILAR_RISK|SIMILAR_DESCRIPTION]->(c2:Company)
+            WHERE c1.cik IS NOT NULL AND c2.cik IS NOT NULL
+            RETURN c1.cik AS cik1, c2.cik AS cik2, type(r) AS rel_type, r.score AS score
+            """
+        )
+        edges = pd.DataFrame(
+            [dict(record) for record in result], columns=["cik1", "cik2", "rel_type", "score"]
+        )
+        result = session.run(
+            """
+            MATCH (c:Company)-[:HAS_DOMAIN]->(:Domain)-[:USES]->(t:Technology)
+            WHERE c.cik IS NOT NULL
+            RETURN DISTINCT c.cik AS cik, id(t) AS tech_id
+            """
+        )
+        technologies = pd.DataFrame([dict(record) for record in result], columns=["cik", "tech_id"])
+        result = session.run(
+            """
+            MATCH (c:Company)
+            WHERE c.cik IS NOT NULL
+            RETURN c.cik AS cik, c.composite_signature AS signature
+            """
+        )
+        stored = {record["cik"]: record["signature"] for record in result}
+    edges["score"] = pd.to_numeric(edges["score"], errors="coerce")
+    return edges, technologies, stored
+
+
+def _indexed_listers(driver, database: str | None, ciks: pd.Index) -> pd.Index:
+    """CIKs whose stored SIMILAR_COMPOSITE lists contain any of the given CIKs."""
+    if ciks.empty:
+        return pd.Index([], dtype=object)
+    with driver.session(database=database) as session:
+        result = session.run(
+            """
+            MATCH (c1:Company)-[:SIMILAR_COMPOSITE]->(c2:Company)
+            WHERE c2.cik IN $ciks
+            RETURN DISTINCT c1.cik AS lister
+            """,
+            ciks=ciks.tolist(),
+        )
+        return pd.Index([record["lister"] for record in result], dtype=object)
+
+
+def build_composite_index(
+    driver,
+    database: str | None = None,
+    top_n: int = COMPOSITE_INDEX_TOP_N,
+    incremental: bool = True,
+    batch_size: int = BATCH_SIZE_LARGE,
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Build or refresh SIMILAR_COMPOSITE edges for all companies.
+
+    Args:
+        driver: Neo4j driver instance
+        database: Neo4j database name
+        top_n: Neighbours to store per company
+        incremental: Only rewrite companies whose inputs changed since the last run
+            (and their neighbours); False rewrites every company
+        batch_size: Relationships per write transaction
+        logger: Optional logger instance
+
+    Returns:
+        Number of SIMILAR_COMPOSITE relationships written
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    start_time = time.perf_counter()
+    edges, technologies, stored = _export(driver, database)
+    logger.info(
+        f"   ✓ Exported {len(edges)} component edges and {len(technologies)} "
+        f"company technologies in {time.perf_counter() - start_time:.1f}s"
+    )
+
+    neighbors = composite_neighbors(edges, technologies, top_n=top_n)
+    signatures = component_signatures(edges, technologies)
+    current = pd.Series(stored, dtype=object)
+    current_signatures = signatures.reindex(current.index)
+
+    if incremental:
+        changed = current.index[
+            current.fillna("").to_numpy() != current_signatures.fillna("").to_numpy()
+        ]
+        # A changed company appears in its neighbours' lists, so they are refreshed too:
+        # both the companies listing it now and those whose stored lists still do
+        is_neighbor = neighbors["cik2"].isin(changed)
+        dirty = (
+            pd.Index(changed)
+            .union(pd.Index(neighbors.loc[is_neighbor, "cik1"].unique()))
+            .union(_indexed_listers(driver, database, pd.Index(changed)))
+        )
+    else:
+        changed = current.index
+        dirty = current.index
+    logger.info(
+        f"   Refreshing {len(dirty)} of {len(current)} companies "
+        f"({len(changed)} with changed inputs)"
+    )
+    if dirty.empty:
+        logger.info("   ✓ Composite index is up to date")
+        return 0
+
+    rows = neighbors[neighbors["cik1"].isin(dirty)]
+    with driver.session(database=database) as session:
+        write_unwind_batches(
+            session,
+            """
+            UNWIND $batch AS row
+            MATCH (c:Company {cik: row.cik})-[r:SIMILAR_COMPOSITE]->()
+            DELETE r
+            """,
+            {"cik": dirty.to_numpy(dtype=object)},
+            batch_size=batch_size,
+            count_key=None,
+            logger=logger,
+        )
+
+    # The dirty companies' edges were just deleted, so CREATE skips MERGE's check
+    written = write_relationships(
+        driver,
+        "SIMILAR_COMPOSITE",
+        "Company",
+        "Company",
+        {
+            "source": rows["cik1"].to_numpy(),
+            "target": rows["cik2"].to_numpy(),
+            **{column: rows[column].to_numpy() for column in rows.columns[2:]},
+        },
+        source_key="cik",
+        target_key="cik",
+        fresh=True,
+        expressions={"computed_at": "datetime()"},
+        database=database,
+        batch_size=batch_size,
+        logger=logger,
+    )
+    with driver.session(database=database) as session:
+        write_unwind_batches(
+            session,
+            """
+            UNWIND $batch AS row
+            MATCH (c:Company {cik: row.cik})
+            SET c.composite_signature = row.signature
+            """,
+            {
+                "cik": changed.to_numpy(dtype=object),
+                "signature": current_signatures.reindex(changed)
+                .astype(object)
+                .where(lambda signature: signature.notna(), None)
+                .to_numpy(),
+            },
+            batch_size=batch_size,
+            count_key=None,
+            logger=logger,
+        )
+
+    logger.info(
+        f"   ✓ Wrote {written} SIMILAR_COMPOSITE relationships "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+    return written
@@ -36,6 +36,44 @@ def _rate_limit_sec():
     _sec_rate_limiter()
 
 
+SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
+# SEC requires a User-Agent header identifying the requester
+SEC_HEADERS = {
+    "User-Agent": "public_company_graph enrichment script (contact: alex@woolford.io)",
+    "Accept": "application/json",
+}
+
+
+def _first_code(value) -> str | None:
+    """Industry code from a submissions field: "3571", ["3571", "Desc"] or ["3571 - Desc"]."""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, list) and len(value) > 0:
+        return str(value[0]).split("-")[0].split()[0].strip()
+    return None
+
+
+def parse_sec_submissions(data: dict) -> dict:
+    """
+    Company info (SIC, NAICS, name) from an SEC submissions document.
+
+    Args:
+        data: Parsed https://data.sec.gov/submissions/CIK##########.json
+
+    Returns:
+        Dictionary with sic_code, naics_code, company_name and normalized codes
+    """
+    sic_code = _first_code(data.get("sic"))
+    naics_code = _first_code(data.get("naics"))
+    result = {
+        "sic_code": sic_code,
+        "naics_code": naics_code,
+        "company_name": data.get("name", ""),
+    }
+    result.update(normalize_industry_codes(sic_code, naics_code))
+    return result
+
+
 def fetch_sec_company_info(cik: str, session: requests.Session | None = None) -> dict | None:
     """
     Fetch company information from SEC EDGAR API.
@@ -56,62 +94,43 @@ def fetch_sec_company_info(cik: str, session: requests.Session | None = None) ->
         if session is None:
             session = requests.Session()
 
-        # SEC requires User-Agent header
-        url = f"https://data.sec.gov/submissions/CIK{cik.zfill(10)}.json"
-        headers = {
-            "User-Agent": "public_company_graph enrichment script (contact: alex@woolford.io)",
-            "Accept": "application/json",
-        }
-
-        response = session.get(url, headers=headers, timeout=10)
+        url = SEC_SUBMISSIONS_URL.format(cik=cik.zfill(10))
+        response = session.get(url, headers=SEC_HEADERS, timeout=10)
         response.raise_for_status()
+        return parse_sec_submissions(response.json())
 
-        data = response.json()
-        company_info = data.get("name", "")
-
-        # Extract SIC and NAICS from the submissions data
-        sic_code = None
-        naics_code = None
-
-        # SIC code: SEC API returns as string (e.g., "3571") or array
-        sic_value = data.get("sic")
-        if sic_value:
-            if isinstance(sic_value, str):
-                # Format: "3571" (just the code)
-                sic_code = sic_value.strip()
-            elif isinstance(sic_value, list) and len(sic_value) > 0:
-                # Format: ["3571", "Description"] or ["3571 - Description"]
-                sic_entry = str(sic_value[0])
-                sic_code = sic_entry.split("-")[0].split()[0].strip()
-
-        # NAICS code: SEC API may return as string or array
-        naics_value = data.get("naics")
-        if naics_value:
-            if isinstance(naics_value, str):
-                # Format: "511210" (just the code)
-                naics_code = naics_value.strip()
-            elif isinstance(naics_value, list) and len(naics_value) > 0:
-                # Format: ["511210", "Description"] or ["511210 - Description"]
-                naics_entry = str(naics_value[0])
-                naics_code = naics_entry.split("-")[0].split()[0].strip()
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"SEC EDGAR API error for CIK {cik}: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"Unexpected error fetching SEC data for CIK {cik}: {e}")
+        return None
 
-        result = {
-            "sic_code": sic_code,
-            "naics_code": naics_code,
-            "company_name": company_info,
-        }
 
-        # Normalize codes
-        normalized = normalize_industry_codes(sic_code, naics_code)
-        result.update(normalized)
+async def fetch_sec_company_info_async(cik: str, client) -> dict | None:
+    """
+    Async variant of fetch_sec_company_info.
 
-        return result
+    Args:
+        cik: SEC Central Index Key
+        client: Open AsyncHttpClient (rate-limits to the SEC's 10 req/s and
+            revalidates cached submissions with ETag/Last-Modified)
 
-    except requests.exceptions.RequestException as e:
+    Returns:
+        Dictionary with company info or None if not found or on error
+    """
+    url = SEC_SUBMISSIONS_URL.format(cik=cik.zfill(10))
+    try:
+        data = await client.get_json(url, headers=SEC_HEADERS)
+    except Exception as e:
         logger.debug(f"SEC EDGAR API error for CIK {cik}: {e}")
         return None
+    if data is None:
+        return None
+    try:
+        return parse_sec_submissions(data)
     except Exception as e:
-        logger.warning(f"Unexpected error fetching SEC data for CIK {cik}: {e}")
+        logger.warning(f"Unexpected error parsing SEC data for CIK {cik}: {e}")
         return None
 
 
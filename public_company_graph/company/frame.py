@@ -0,0 +1,216 @@
+"""
+Columnar in-memory table of Company properties.
+
+Similarity and analytics jobs need the same handful of Company properties for every
+company. CompanyFrame holds them as NumPy columns (one array per property, one row
+per company) loaded with a single Cypher query, so bucketing and grouping run as
+array operations instead of per-company dict lookups and if/elif chains:
+
+    frame = load_company_frame(driver, database)
+    frame.group_by("sic_code")          # {"7372": array([row, ...]), ...}
+    frame.size_tiers("revenue")         # tier index per row (-1 = missing)
+
+Inside a pipeline run the frame is shared between stages and reloaded after a stage
+rewrites Company properties (see public_company_graph.pipeline).
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
+
+from public_company_graph.pipeline import shared_resource
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_COLUMNS = ("sic_code", "naics_code", "sector", "industry")
+NUMERIC_COLUMNS = ("revenue", "market_cap", "employees")
+
+# Size tier edges (a value v is in tier i when edges[i-1] <= v < edges[i]) and labels
+SIZE_TIERS: dict[str, tuple[np.ndarray, tuple[str, ...]]] = {
+    "employees": (
+        np.array([100, 1_000, 10_000], dtype=np.float64),
+        ("<100", "100-1000", "1000-10000", ">10000"),
+    ),
+    # revenue and market_cap, in USD
+    "revenue": (
+        np.array([1e8, 1e9, 1e10], dtype=np.float64),
+        ("<$100M", "$100M-$1B", "$1B-$10B", ">$10B"),
+    ),
+}
+SIZE_TIERS["market_cap"] = SIZE_TIERS["revenue"]
+
+COMPANY_FRAME_QUERY = """
+MATCH (c:Company)
+WHERE c.cik IS NOT NULL
+RETURN c.cik AS cik,
+       c.sic_code AS sic_code,
+       c.naics_code AS naics_code,
+       c.sector AS sector,
+       c.industry AS industry,
+       c.revenue AS revenue,
+       c.market_cap AS market_cap,
+       c.employees AS employees
+"""
+
+
+def _category(value) -> str:
+    """Classification as a string; "" for missing (None, "", 0)."""
+    return str(value) if value else ""
+
+
+def _number(value) -> float:
+    """Metric as a float; NaN for missing or non-numeric values."""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _group_rows(rows: np.ndarray, keys: np.ndarray) -> list[tuple]:
+    """
+    Group rows by key with one sort: [(key, rows with that key)] in order of first
+    occurrence, rows within a group in their original order.
+    """
+    if len(rows) == 0:
+        return []
+    unique, first, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(rows[order], np.cumsum(counts)[:-1])
+    return [(unique[g], groups[g]) for g in np.argsort(first, kind="stable")]
+
+
+@dataclass(frozen=True, eq=False)
+class CompanyFrame:
+    """
+    Company properties as aligned NumPy columns (row i of every column is one company).
+
+    Category columns are str arrays with "" for missing; numeric columns are float64
+    with NaN for missing.
+    """
+
+    cik: np.ndarray
+    sic_code: np.ndarray
+    naics_code: np.ndarray
+    sector: np.ndarray
+    industry: np.ndarray
+    revenue: np.ndarray
+    market_cap: np.ndarray
+    employees: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "CompanyFrame":
+        """
+        Build a frame from company dicts (rows without a CIK are dropped).
+
+        Args:
+            records: Dicts with 'cik' and any of the category/numeric columns
+        """
+        rows = [r for r in records if r.get("cik")]
+        columns = {"cik": np.array([str(r["cik"]) for r in rows], dtype=str)}
+        for name in CATEGORY_COLUMNS:
+            columns[name] = np.array([_category(r.get(name)) for r in rows], dtype=str)
+        for name in NUMERIC_COLUMNS:
+            columns[name] = np.array([_number(r.get(name)) for r in rows], dtype=np.float64)
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.cik)
+
+    def column(self, name: str) -> np.ndarray:
+        """A column by name (KeyError for unknown columns)."""
+        if name != "cik" and name not in CATEGORY_COLUMNS and name not in NUMERIC_COLUMNS:
+            raise KeyError(f"Unknown CompanyFrame column: {name}")
+        return cast(np.ndarray, getattr(self, name))
+
+    def group_by(self, column: str) -> dict[str, np.ndarray]:
+        """
+        Row indices per distinct value of a category column (missing values excluded).
+
+        Groups are sorted by first occurrence and rows within a group keep frame order.
+
+        Returns:
+            Dict of value -> int array of row indices
+        """
+        values = self.column(column)
+        rows = np.flatnonzero(values != "")
+        return {str(key): group for key, group in _group_rows(rows, values[rows])}
+
+    def size_tiers(self, metric: str) -> np.ndarray:
+        """
+        Size tier index (into SIZE_TIERS[metric] labels) per row; -1 where missing.
+        """
+        edges, _ = SIZE_TIERS[metric]
+        values = self.column(metric)
+        tiers = np.asarray(np.digitize(values, edges))
+        tiers[np.isnan(values)] = -1
+        return tiers
+
+    def group_by_size(self, metric: str) -> dict[str, np.ndarray]:
+        """
+        Row indices per size tier label of a metric (rows missing the metric excluded).
+
+        Groups are sorted by first occurrence and rows within a group keep frame order.
+        """
+        _, labels = SIZE_TIERS[metric]
+        tiers = self.size_tiers(metric)
+        rows = np.flatnonzero(tiers >= 0)
+        return {labels[tier]: group for tier, group in _group_rows(rows, tiers[rows])}
+
+    def to_records(self) -> list[dict]:
+        """Rows as company dicts (None for missing values)."""
+        records = []
+        for i in range(len(self)):
+            record: dict[str, str | float | None] = {"cik": str(self.cik[i])}
+            for name in CATEGORY_COLUMNS:
+                value = self.column(name)[i]
+                record[name] = str(value) if value else None
+            for name in NUMERIC_COLUMNS:
+                value = self.column(name)[i]
+                record[name] = None if np.isnan(value) else float(value)
+            records.append(record)
+        return records
+
+
+def as_company_frame(companies: "CompanyFrame | Iterable[dict]") -> CompanyFrame:
+    """A CompanyFrame as is, or one built from company dicts."""
+    if isinstance(companies, CompanyFrame):
+        return companies
+    return CompanyFrame.from_records(companies)
+
+
+def load_company_frame(driver, database: str | None = None) -> CompanyFrame:
+    """
+    Load every Company's properties with one query.
+
+    Inside a pipeline run the frame is built once and reused by later stages until
+    a stage rewrites Company nodes or their properties.
+
+    Args:
+        driver: Neo4j driver
+        database: Neo4j database name
+
+    Returns:
+        CompanyFrame
+    """
+
+    def load() -> CompanyFrame:
+        with driver.session(database=database) as session:
+            frame = CompanyFrame.from_records(dict(r) for r in session.run(COMPANY_FRAME_QUERY))
+        logger.info(f"Loaded {len(frame):,} companies into a columnar frame")
+        return frame
+
+    return cast(
+        CompanyFrame,
+        shared_resource(
+            "company_frame",
+            load,
+            depends_on=("Company", "Company.identifiers", "Company.properties"),
+        ),
+    )
@@ -10,8 +10,16 @@ Similarity signals used:
 3. SIMILAR_INDUSTRY - SIC code / industry / sector matches
 4. SIMILAR_SIZE - Company size similarity
 5. Shared Technologies - Via Company -> Domain -> Technology path (indirect signal)
+
+All queries are fixed templates registered in the prepared-query registry; tickers,
+weights and limits are passed as parameters so Neo4j reuses cached plans.
 """
 
+from collections.abc import Iterable
+
+from public_company_graph.neo4j.prepared import register_query
+from public_company_graph.utils.parallel import execute_parallel
+
 # Default weights for different similarity types (Company-Company relationships)
 # Higher weight = more important signal
 #
@@ -41,139 +49,126 @@ DEFAULT_SIMILARITY_WEIGHTS = {
 # Each shared technology adds this much to the score
 SHARED_TECHNOLOGY_WEIGHT = 0.05
 
+# Weight used for a relationship type missing from a custom weights dict
+_FALLBACK_WEIGHTS = {"SIMILAR_RISK": 1.0, "SIMILAR_DESCRIPTION": 0.5}
+_FALLBACK_WEIGHTS_EXTENDED = {
+    "HAS_COMPETITOR": 4.0,
+    "SIMILAR_RISK": 1.0,
+    "SIMILAR_INDUSTRY": 0.8,
+    "SIMILAR_DESCRIPTION": 0.6,
+    "SIMILAR_TECHNOLOGY": 0.5,
+    "SIMILAR_SIZE": 0.4,
+    "SIMILAR_KEYWORD": 0.1,
+}
 
-def get_top_similar_companies_query(
-    ticker: str,
-    limit: int = 20,
-    weights: dict[str, float] | None = None,
-    min_score: float = 0.0,
-    include_shared_tech: bool = True,
-    shared_tech_weight: float = SHARED_TECHNOLOGY_WEIGHT,
-) -> str:
-    """
-    Generate a Cypher query to find top similar companies using composite scoring.
+# Tickers per query in find_similar_companies_batch
+SIMILAR_BATCH_CHUNK_SIZE = 100
 
-    The query combines multiple similarity signals:
-    1. Direct Company-Company relationships (SIMILAR_RISK, SIMILAR_DESCRIPTION, etc.)
-    2. Shared technologies via Domain path (Company -> Domain -> Technology)
 
-    Relationship weights:
-    - SIMILAR_RISK uses cosine similarity score (0.6-1.0) from 10-K risk factors
-    - SIMILAR_DESCRIPTION uses cosine similarity score from business descriptions
-    - SIMILAR_INDUSTRY is weighted by method specificity (SIC > INDUSTRY > SECTOR)
-
-    Args:
-        ticker: Company ticker symbol
-        limit: Maximum number of results
-        weights: Optional custom weights for relationship types
-        min_score: Minimum composite score to include
-        include_shared_tech: Whether to include shared technologies via Domain path
-        shared_tech_weight: Weight per shared technology (default 0.05)
+def _direct_scores(ticker_expr: str) -> str:
+    """
+    Fragment scoring the direct similarity edges of the company matched by ticker_expr.
 
-    Returns:
-        Cypher query string
+    ticker_expr is a Cypher expression spliced into the query text (a parameter such
+    as "$ticker" or a variable bound by an enclosing UNWIND); it must be a constant
+    from this module, never user input.
     """
-    if weights is None:
-        weights = DEFAULT_SIMILARITY_WEIGHTS
+    return (
+        """
+    // Find direct Company-Company similarity relationships
+    MATCH (c1:Company {ticker: """
+        + ticker_expr
+        + """})-[r:SIMILAR_RISK|SIMILAR_DESCRIPTION]-(c2:Company)
+    WITH c1, c2,
+         sum(CASE WHEN type(r) = 'SIMILAR_RISK'
+                  THEN $weights.SIMILAR_RISK * r.score
+                  ELSE 0.0 END) AS risk_score,
+         sum(CASE WHEN type(r) = 'SIMILAR_DESCRIPTION'
+                  THEN $weights.SIMILAR_DESCRIPTION * r.score
+                  ELSE 0.0 END) AS desc_score,
+         sum(CASE WHEN type(r) = 'SIMILAR_RISK' THEN 1 ELSE 0 END) AS risk_matches,
+         sum(CASE WHEN type(r) = 'SIMILAR_DESCRIPTION' THEN 1 ELSE 0 END) AS desc_matches
+    """
+    )
 
-    # Build the shared technology clause if enabled
-    if include_shared_tech:
-        shared_tech_clause = f"""
+
+_SHARED_TECH_RANKING = """
     // Count shared technologies via Domain path
     OPTIONAL MATCH (c1)-[:HAS_DOMAIN]->(:Domain)-[:USES]->(t:Technology)<-[:USES]-(:Domain)<-[:HAS_DOMAIN]-(c2)
     WITH c2, risk_score, desc_score, risk_matches, desc_matches,
          count(DISTINCT t) AS shared_tech_count
     WITH c2,
-         risk_score + desc_score AS direct_score,
-         risk_score, desc_score,
-         risk_matches, desc_matches,
-         shared_tech_count,
-         shared_tech_count * {shared_tech_weight} AS tech_bonus
-    WITH c2,
-         (risk_score + desc_score + shared_tech_count * {shared_tech_weight}) AS weighted_score,
+         (risk_score + desc_score + shared_tech_count * $shared_tech_weight) AS weighted_score,
          risk_score, desc_score, shared_tech_count,
          risk_matches, desc_matches
-    WHERE weighted_score >= {min_score}
+    WHERE weighted_score >= $min_score
+    RETURN c2.ticker AS ticker, c2.name AS name,
+           weighted_score, risk_score, desc_score, shared_tech_count,
+           risk_matches, desc_matches
+    ORDER BY weighted_score DESC, risk_matches DESC, shared_tech_count DESC, desc_matches DESC
+    LIMIT $limit
     """
-        return_cols = (
-            "c2.ticker AS ticker, c2.name AS name, "
-            "weighted_score, risk_score, desc_score, shared_tech_count, "
-            "risk_matches, desc_matches"
-        )
-        order_by = (
-            "weighted_score DESC, risk_matches DESC, shared_tech_count DESC, desc_matches DESC"
-        )
-    else:
-        shared_tech_clause = f"""
+
+_NO_TECH_RANKING = """
     WITH c2,
          (risk_score + desc_score) AS weighted_score,
          risk_score, desc_score,
          risk_matches, desc_matches
-    WHERE weighted_score >= {min_score}
+    WHERE weighted_score >= $min_score
+    RETURN c2.ticker AS ticker, c2.name AS name,
+           weighted_score, risk_score, desc_score,
+           risk_matches, desc_matches
+    ORDER BY weighted_score DESC, risk_matches DESC, desc_matches DESC
+    LIMIT $limit
     """
-        return_cols = (
-            "c2.ticker AS ticker, c2.name AS name, "
-            "weighted_score, risk_score, desc_score, "
-            "risk_matches, desc_matches"
-        )
-        order_by = "weighted_score DESC, risk_matches DESC, desc_matches DESC"
 
-    query = f"""
-    // Find direct Company-Company similarity relationships
-    MATCH (c1:Company {{ticker: '{ticker}'}})-[r]-(c2:Company)
-    WHERE type(r) IN ['SIMILAR_RISK', 'SIMILAR_DESCRIPTION']
-    WITH c1, c2,
-         sum(CASE WHEN type(r) = 'SIMILAR_RISK'
-                  THEN {weights.get("SIMILAR_RISK", 1.0)} * r.score
-                  ELSE 0.0 END) AS risk_score,
-         sum(CASE WHEN type(r) = 'SIMILAR_DESCRIPTION'
-                  THEN {weights.get("SIMILAR_DESCRIPTION", 0.5)} * r.score
-                  ELSE 0.0 END) AS desc_score,
-         sum(CASE WHEN type(r) = 'SIMILAR_RISK' THEN 1 ELSE 0 END) AS risk_matches,
-         sum(CASE WHEN type(r) = 'SIMILAR_DESCRIPTION' THEN 1 ELSE 0 END) AS desc_matches
-    {shared_tech_clause}
-    RETURN {return_cols}
-    ORDER BY {order_by}
-    LIMIT {limit}
-    """
-
-    return query
 
-
-def get_top_similar_companies_query_extended(
-    ticker: str,
-    limit: int = 20,
-    weights: dict[str, float] | None = None,
-    min_score: float = 0.0,
-) -> str:
+def _batched(body: str, columns: str) -> str:
+    """Run a per-company body once per ticker in $tickers (bound as `source`)."""
+    return (
+        """
+    UNWIND $tickers AS source
+    CALL {
+      WITH source
     """
-    Generate a Cypher query with all Company-Company similarity relationship types.
-
-    Uses these real relationships from the graph:
-    - SIMILAR_RISK (197K) - 10-K risk factor embedding similarity
-    - SIMILAR_DESCRIPTION (210K) - Business description embedding similarity
-    - SIMILAR_TECHNOLOGY (124K) - Technology stack similarity
-    - SIMILAR_INDUSTRY (260K) - SIC/Industry/Sector classification match
-    - SIMILAR_SIZE (207K) - Revenue/market cap similarity
-    - SIMILAR_KEYWORD (71) - Keyword embedding similarity (sparse)
+        + body
+        + """
+    }
+    RETURN source, """
+        + columns
+    )
 
-    Args:
-        ticker: Company ticker symbol
-        limit: Maximum number of results
-        weights: Optional custom weights for relationship types
-        min_score: Minimum composite score to include
 
-    Returns:
-        Cypher query string
+TOP_SIMILAR_COMPANIES = register_query(
+    "company.top_similar", _direct_scores("$ticker") + _SHARED_TECH_RANKING
+)
+
+TOP_SIMILAR_COMPANIES_NO_TECH = register_query(
+    "company.top_similar_no_tech", _direct_scores("$ticker") + _NO_TECH_RANKING
+)
+
+TOP_SIMILAR_COMPANIES_BATCH = register_query(
+    "company.top_similar_batch",
+    _batched(
+        _direct_scores("source") + _SHARED_TECH_RANKING,
+        "ticker, name, weighted_score, risk_score, desc_score, shared_tech_count, "
+        "risk_matches, desc_matches",
+    ),
+)
+
+TOP_SIMILAR_COMPANIES_NO_TECH_BATCH = register_query(
+    "company.top_similar_no_tech_batch",
+    _batched(
+        _direct_scores("source") + _NO_TECH_RANKING,
+        "ticker, name, weighted_score, risk_score, desc_score, risk_matches, desc_matches",
+    ),
+)
+
+TOP_SIMILAR_COMPANIES_EXTENDED = register_query(
+    "company.top_similar_extended",
     """
-    if weights is None:
-        weights = DEFAULT_SIMILARITY_WEIGHTS
-
-    rel_types_list = ", ".join([f"'{rt}'" for rt in weights.keys()])
-
-    query = f"""
-    MATCH (c1:Company {{ticker: '{ticker}'}})-[r]-(c2:Company)
-    WHERE type(r) IN [{rel_types_list}]
+    MATCH (c1:Company {ticker: $ticker})-[r]-(c2:Company)
+    WHERE type(r) IN $rel_types
     WITH c1, c2, collect(r) as rels
     UNWIND rels as r
     WITH c1, c2, rels, r,
@@ -181,31 +176,31 @@ def get_top_similar_companies_query_extended(
          CASE
            // HAS_COMPETITOR: direct competitor mention from 10-K - strongest signal!
            WHEN type(r) = 'HAS_COMPETITOR' THEN
-             {weights.get("HAS_COMPETITOR", 4.0)} * coalesce(r.confidence, 1.0)
+             $weights.HAS_COMPETITOR * coalesce(r.confidence, 1.0)
            // SIMILAR_RISK: cosine similarity from 10-K risk factor embeddings
            WHEN type(r) = 'SIMILAR_RISK' THEN
-             {weights.get("SIMILAR_RISK", 1.0)} * coalesce(r.score, 1.0)
+             $weights.SIMILAR_RISK * coalesce(r.score, 1.0)
            // SIMILAR_INDUSTRY: weight by method specificity (SIC > INDUSTRY > SECTOR)
            WHEN type(r) = 'SIMILAR_INDUSTRY' AND r.method = 'SIC' THEN
-             {weights.get("SIMILAR_INDUSTRY", 0.8)} * 1.2
+             $weights.SIMILAR_INDUSTRY * 1.2
            WHEN type(r) = 'SIMILAR_INDUSTRY' AND r.method = 'INDUSTRY' THEN
-             {weights.get("SIMILAR_INDUSTRY", 0.8)} * 0.8
+             $weights.SIMILAR_INDUSTRY * 0.8
            WHEN type(r) = 'SIMILAR_INDUSTRY' AND r.method = 'SECTOR' THEN
-             {weights.get("SIMILAR_INDUSTRY", 0.8)} * 0.6
+             $weights.SIMILAR_INDUSTRY * 0.6
            WHEN type(r) = 'SIMILAR_INDUSTRY' THEN
-             {weights.get("SIMILAR_INDUSTRY", 0.8)} * 0.7
+             $weights.SIMILAR_INDUSTRY * 0.7
            // SIMILAR_DESCRIPTION: cosine similarity from business description embeddings
            WHEN type(r) = 'SIMILAR_DESCRIPTION' THEN
-             {weights.get("SIMILAR_DESCRIPTION", 0.6)} * coalesce(r.score, 1.0)
+             $weights.SIMILAR_DESCRIPTION * coalesce(r.score, 1.0)
            // SIMILAR_TECHNOLOGY: Jaccard similarity from tech stack
            WHEN type(r) = 'SIMILAR_TECHNOLOGY' THEN
-             {weights.get("SIMILAR_TECHNOLOGY", 0.5)} * coalesce(r.score, 1.0)
+             $weights.SIMILAR_TECHNOLOGY * coalesce(r.score, 1.0)
            // SIMILAR_SIZE: size bucket match
            WHEN type(r) = 'SIMILAR_SIZE' THEN
-             {weights.get("SIMILAR_SIZE", 0.4)} * coalesce(r.score, 1.0)
+             $weights.SIMILAR_SIZE * coalesce(r.score, 1.0)
            // SIMILAR_KEYWORD: keyword embedding similarity (very sparse)
            WHEN type(r) = 'SIMILAR_KEYWORD' THEN
-             {weights.get("SIMILAR_KEYWORD", 0.1)} * coalesce(r.score, 1.0)
+             $weights.SIMILAR_KEYWORD * coalesce(r.score, 1.0)
            ELSE 0.0
          END as rel_score
     WITH c1, c2, sum(rel_score) as base_score,
@@ -229,7 +224,7 @@ def get_top_similar_companies_query_extended(
     WITH c1, c2, (base_score + sic_size_bonus + risk_sic_bonus) as weighted_score,
          risk_matches, sic_matches, size_matches, desc_matches, tech_matches,
          competitor_matches, edge_count
-    WHERE weighted_score >= {min_score}
+    WHERE weighted_score >= $min_score
     // Tie-breaker: exact industry name match (most specific)
     WITH c1, c2, weighted_score, risk_matches, sic_matches, desc_matches,
          tech_matches, competitor_matches, edge_count,
@@ -241,10 +236,163 @@ def get_top_similar_companies_query_extended(
     ORDER BY weighted_score DESC, competitor_matches DESC, exact_industry_match DESC,
              risk_matches DESC, sic_matches DESC, desc_matches DESC, tech_matches DESC,
              edge_count DESC
-    LIMIT {limit}
+    LIMIT $limit
+    """,
+)
+
+COMPOSITE_SIMILAR_COMPANIES = register_query(
+    "company.composite_similar",
+    """
+    MATCH (c1:Company {ticker: $ticker})-[r:SIMILAR_COMPOSITE]->(c2:Company)
+    WHERE r.score >= $min_score
+    RETURN c2.ticker AS ticker, c2.name AS name,
+           r.score AS weighted_score, r.risk_score AS risk_score,
+           r.desc_score AS desc_score, r.shared_tech_count AS shared_tech_count,
+           r.risk_matches AS risk_matches, r.desc_matches AS desc_matches
+    ORDER BY r.rank
+    LIMIT $limit
+    """,
+)
+
+# Index ranks are a score-ordered prefix, so rank < $limit after the score filter
+# equals ORDER BY rank LIMIT $limit per company
+COMPOSITE_SIMILAR_COMPANIES_BATCH = register_query(
+    "company.composite_similar_batch",
+    """
+    UNWIND $tickers AS source
+    MATCH (c1:Company {ticker: source})-[r:SIMILAR_COMPOSITE]->(c2:Company)
+    WHERE r.score >= $min_score AND r.rank < $limit
+    RETURN source, c2.ticker AS ticker, c2.name AS name,
+           r.score AS weighted_score, r.risk_score AS risk_score,
+           r.desc_score AS desc_score, r.shared_tech_count AS shared_tech_count,
+           r.risk_matches AS risk_matches, r.desc_matches AS desc_matches
+    ORDER BY source, r.rank
+    """,
+)
+
+SIMILARITY_BREAKDOWN = register_query(
+    "company.similarity_breakdown",
     """
+    // Get direct Company-Company relationships
+    MATCH (c1:Company {ticker: $ticker1}), (c2:Company {ticker: $ticker2})
+    OPTIONAL MATCH (c1)-[r]-(c2)
+    WHERE (type(r) STARTS WITH 'SIMILAR' AND type(r) <> 'SIMILAR_COMPOSITE')
+       OR type(r) IN ['COMMON_EXECUTIVE', 'MERGED_OR_ACQUIRED']
+    WITH c1, c2, collect({rel_type: type(r), score: r.score, method: r.method}) AS rels
+    // Get shared technologies via Domain path
+    OPTIONAL MATCH (c1)-[:HAS_DOMAIN]->(:Domain)-[:USES]->(t:Technology)<-[:USES]-(:Domain)<-[:HAS_DOMAIN]-(c2)
+    WITH c1, c2, rels, collect(DISTINCT t.name) AS shared_technologies
+    RETURN c1.ticker AS company1, c2.ticker AS company2,
+           rels AS direct_relationships,
+           shared_technologies,
+           size(shared_technologies) AS shared_tech_count
+    """,
+)
 
-    return query
+
+def _resolved_weights(
+    weights: dict[str, float] | None, fallbacks: dict[str, float]
+) -> dict[str, float]:
+    """$weights map: a weight for every type the query scores, falling back per type."""
+    if weights is None:
+        weights = DEFAULT_SIMILARITY_WEIGHTS
+    return {rel_type: weights.get(rel_type, default) for rel_type, default in fallbacks.items()}
+
+
+def get_top_similar_companies_query(
+    ticker: str,
+    limit: int = 20,
+    weights: dict[str, float] | None = None,
+    min_score: float = 0.0,
+    include_shared_tech: bool = True,
+    shared_tech_weight: float = SHARED_TECHNOLOGY_WEIGHT,
+) -> tuple[str, dict]:
+    """
+    Cypher query and parameters to find top similar companies using composite scoring.
+
+    The query combines multiple similarity signals:
+    1. Direct Company-Company relationships (SIMILAR_RISK, SIMILAR_DESCRIPTION, etc.)
+    2. Shared technologies via Domain path (Company -> Domain -> Technology)
+
+    Relationship weights:
+    - SIMILAR_RISK uses cosine similarity score (0.6-1.0) from 10-K risk factors
+    - SIMILAR_DESCRIPTION uses cosine similarity score from business descriptions
+    - SIMILAR_INDUSTRY is weighted by method specificity (SIC > INDUSTRY > SECTOR)
+
+    The query text depends only on include_shared_tech; everything else is a parameter.
+
+    Args:
+        ticker: Company ticker symbol
+        limit: Maximum number of results
+        weights: Optional custom weights for relationship types
+        min_score: Minimum composite score to include
+        include_shared_tech: Whether to include shared technologies via Domain path
+        shared_tech_weight: Weight per shared technology (default 0.05)
+
+    Returns:
+        (query, parameters) for session.run(query, parameters)
+    """
+    prepared = TOP_SIMILAR_COMPANIES if include_shared_tech else TOP_SIMILAR_COMPANIES_NO_TECH
+    return prepared.text, {
+        "ticker": ticker,
+        "limit": limit,
+        "weights": _resolved_weights(weights, _FALLBACK_WEIGHTS),
+        "min_score": min_score,
+        "shared_tech_weight": shared_tech_weight,
+    }
+
+
+def get_top_similar_companies_query_extended(
+    ticker: str,
+    limit: int = 20,
+    weights: dict[str, float] | None = None,
+    min_score: float = 0.0,
+) -> tuple[str, dict]:
+    """
+    Cypher query and parameters using all Company-Company similarity relationship types.
+
+    Uses these real relationships from the graph:
+    - SIMILAR_RISK (197K) - 10-K risk factor embedding similarity
+    - SIMILAR_DESCRIPTION (210K) - Business description embedding similarity
+    - SIMILAR_TECHNOLOGY (124K) - Technology stack similarity
+    - SIMILAR_INDUSTRY (260K) - SIC/Industry/Sector classification match
+    - SIMILAR_SIZE (207K) - Revenue/market cap similarity
+    - SIMILAR_KEYWORD (71) - Keyword embedding similarity (sparse)
+
+    The relationship types considered are the keys of weights ($rel_types).
+
+    Args:
+        ticker: Company ticker symbol
+        limit: Maximum number of results
+        weights: Optional custom weights for relationship types
+        min_score: Minimum composite score to include
+
+    Returns:
+        (query, parameters) for session.run(query, parameters)
+    """
+    if weights is None:
+        weights = DEFAULT_SIMILARITY_WEIGHTS
+
+    return TOP_SIMILAR_COMPANIES_EXTENDED.text, {
+        "ticker": ticker,
+        "limit": limit,
+        "rel_types": list(weights),
+        "weights": _resolved_weights(weights, _FALLBACK_WEIGHTS_EXTENDED),
+        "min_score": min_score,
+    }
+
+
+def get_composite_similar_companies_query() -> str:
+    """
+    Cypher query reading precomputed SIMILAR_COMPOSITE edges (see composite_index).
+
+    Parameters: $ticker, $limit, $min_score. Returns the same columns as
+    get_top_similar_companies_query with include_shared_tech=True.
+
+    Returns:
+        Cypher query string
+    """
+    return COMPOSITE_SIMILAR_COMPANIES.text
 
 
 def find_similar_companies(
@@ -253,12 +401,15 @@ def find_similar_companies(
     limit: int = 20,
     database: str | None = None,
     include_shared_tech: bool = True,
+    use_index: bool = True,
 ) -> list[dict]:
     """
     Find the most similar companies to a given ticker.
 
     This is a convenience function that executes the weighted similarity query
-    and returns results directly.
+    and returns results directly. When the composite index has been built
+    (scripts/build_composite_similarity_index.py), results are read from the
+    precomputed SIMILAR_COMPOSITE edges; otherwise the score is computed live.
 
     Args:
         driver: Neo4j driver instance
@@ -266,6 +417,8 @@ def find_similar_companies(
         limit: Maximum number of results (default: 20)
         database: Neo4j database name (optional)
         include_shared_tech: Include shared technologies via Domain path (default: True)
+        use_index: Read precomputed SIMILAR_COMPOSITE edges when available (default: True;
+            only used with include_shared_tech and limit <= COMPOSITE_INDEX_TOP_N)
 
     Returns:
         List of dictionaries with similar companies and their scores:
@@ -294,17 +447,131 @@ def find_similar_companies(
         PEP: 1.316
         ...
     """
-    query = get_top_similar_companies_query(
+    from public_company_graph.company.composite_index import COMPOSITE_INDEX_TOP_N
+
+    query, parameters = get_top_similar_companies_query(
         ticker=ticker,
         limit=limit,
         include_shared_tech=include_shared_tech,
     )
 
     with driver.session(database=database) as session:
-        result = session.run(query)
+        if use_index and include_shared_tech and limit <= COMPOSITE_INDEX_TOP_N:
+            result = COMPOSITE_SIMILAR_COMPANIES.run(
+                session, ticker=ticker, limit=limit, min_score=0.0
+            )
+            indexed = [dict(record) for record in result]
+            if indexed:
+                return indexed
+
+        result = session.run(query, parameters)
         return [dict(record) for record in result]
 
 
+def _similar_companies_chunk(
+    session,
+    tickers: list[str],
+    limit: int,
+    include_shared_tech: bool,
+    use_index: bool,
+) -> dict[str, list[dict]]:
+    """Peers of one chunk of tickers: index lookup first, one live query for the rest."""
+    from public_company_graph.company.composite_index import COMPOSITE_INDEX_TOP_N
+
+    peers: dict[str, list[dict]] = {ticker: [] for ticker in tickers}
+    remaining = tickers
+    if use_index and include_shared_tech and limit <= COMPOSITE_INDEX_TOP_N:
+        result = COMPOSITE_SIMILAR_COMPANIES_BATCH.run(
+            session, tickers=tickers, limit=limit, min_score=0.0
+        )
+        for record in result:
+            row = dict(record)
+            peers[row.pop("source")].append(row)
+        remaining = [ticker for ticker in tickers if not peers[ticker]]
+
+    if remaining:
+        parameters = {
+            "limit": limit,
+            "weights": _resolved_weights(None, _FALLBACK_WEIGHTS),
+            "min_score": 0.0,
+            "shared_tech_weight": SHARED_TECHNOLOGY_WEIGHT,
+        }
+        prepared = (
+            TOP_SIMILAR_COMPANIES_BATCH
+            if include_shared_tech
+            else TOP_SIMILAR_COMPANIES_NO_TECH_BATCH
+        )
+        for record in prepared.run(session, tickers=remaining, **parameters):
+            row = dict(record)
+            peers[row.pop("source")].append(row)
+    return peers
+
+
+def find_similar_companies_batch(
+    driver,
+    tickers: Iterable[str],
+    limit: int = 20,
+    database: str | None = None,
+    include_shared_tech: bool = True,
+    use_index: bool = True,
+    chunk_size: int = SIMILAR_BATCH_CHUNK_SIZE,
+    max_workers: int = 1,
+) -> dict[str, list[dict]]:
+    """
+    Find the most similar companies for many tickers at once.
+
+    Same results as calling find_similar_companies per ticker, but tickers are sent
+    as a $tickers list (UNWIND) in chunks of chunk_size, so a portfolio of hundreds
+    of tickers takes a handful of round-trips. Each chunk reads the composite index
+    first and computes the live score in a single query for tickers missing from it.
+
+    Args:
+        driver: Neo4j driver instance
+        tickers: Company ticker symbols (duplicates are queried once)
+        limit: Maximum number of results per ticker (default: 20)
+        database: Neo4j database name (optional)
+        include_shared_tech: Include shared technologies via Domain path (default: True)
+        use_index: Read precomputed SIMILAR_COMPOSITE edges when available (default: True)
+        chunk_size: Tickers per query
+        max_workers: Chunks queried concurrently, each in its own session from the
+            driver's connection pool (default: 1, sequential)
+
+    Returns:
+        Dictionary mapping each ticker to its ranked peers (the rows returned by
+        find_similar_companies); tickers with no peers map to an empty list
+
+    Example:
+        >>> peers = find_similar_companies_batch(driver, ["KO", "PEP", "MNST"], limit=5)
+        >>> [company["ticker"] for company in peers["KO"]]
+        ['COKE', 'MNST', 'PEP', ...]
+    """
+    unique_tickers = list(dict.fromkeys(tickers))
+    chunks = [
+        unique_tickers[start : start + chunk_size]
+        for start in range(0, len(unique_tickers), chunk_size)
+    ]
+
+    def query_chunk(chunk: list[str]) -> dict[str, list[dict]]:
+        with driver.session(database=database) as session:
+            return _similar_companies_chunk(session, chunk, limit, include_shared_tech, use_index)
+
+    peers: dict[str, list[dict]] = {}
+    if max_workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            peers.update(query_chunk(chunk))
+    else:
+        results = execute_parallel(
+            chunks, query_chunk, max_workers=max_workers, show_progress=False
+        )
+        for _, chunk_peers, error in results:
+            if error is not None:
+                raise error
+            if chunk_peers is not None:
+                peers.update(chunk_peers)
+
+    return {ticker: peers[ticker] for ticker in unique_tickers}
+
+
 def get_similarity_breakdown(
     driver,
     ticker1: str,
@@ -340,19 +607,19 @@ def get_similarity_breakdown(
         >>> print(f"Shared tech: {breakdown['shared_technologies']}")
         Shared tech: ['Google Tag Manager', 'HSTS']
     """
-    query = get_similarity_breakdown_query(ticker1, ticker2)
+    query, parameters = get_similarity_breakdown_query(ticker1, ticker2)
 
     from public_company_graph.neo4j.utils import safe_single
 
     with driver.session(database=database) as session:
-        result = session.run(query)
+        result = session.run(query, parameters)
         record = safe_single(result, default={})
         return dict(record) if record else {}
 
 
-def get_similarity_breakdown_query(ticker1: str, ticker2: str) -> str:
+def get_similarity_breakdown_query(ticker1: str, ticker2: str) -> tuple[str, dict]:
     """
-    Generate a Cypher query to see all similarity signals between two companies.
+    Cypher query and parameters to see all similarity signals between two companies.
 
     Shows:
     - Direct Company-Company relationships (SIMILAR_RISK, SIMILAR_DESCRIPTION, etc.)
@@ -363,21 +630,6 @@ def get_similarity_breakdown_query(ticker1: str, ticker2: str) -> str:
         ticker2: Second company ticker
 
     Returns:
-        Cypher query string
-    """
-    query = f"""
-    // Get direct Company-Company relationships
-    MATCH (c1:Company {{ticker: '{ticker1}'}}), (c2:Company {{ticker: '{ticker2}'}})
-    OPTIONAL MATCH (c1)-[r]-(c2)
-    WHERE type(r) STARTS WITH 'SIMILAR'
-       OR type(r) IN ['COMMON_EXECUTIVE', 'MERGED_OR_ACQUIRED']
-    WITH c1, c2, collect({{rel_type: type(r), score: r.score, method: r.method}}) AS rels
-    // Get shared technologies via Domain path
-    OPTIONAL MATCH (c1)-[:HAS_DOMAIN]->(:Domain)-[:USES]->(t:Technology)<-[:USES]-(:Domain)<-[:HAS_DOMAIN]-(c2)
-    WITH c1, c2, rels, collect(DISTINCT t.name) AS shared_technologies
-    RETURN c1.ticker AS company1, c2.ticker AS company2,
-           rels AS direct_relationships,
-           shared_technologies,
-           size(shared_technologies) AS shared_tech_count
+        (query, parameters) for session.run(query, parameters)
     """
-    return query
+    return SIMILARITY_BREAKDOWN.text, {"ticker1": ticker1, "ticker2": ticker2}
@@ -4,17 +4,138 @@ Company-to-company similarity computation.
 This module provides functions to compute various types of company similarity
 and create corresponding relationships in Neo4j.
 
+Industry and size similarity are "same bucket" relations, so they can be represented
+two ways:
+- pairs: (cik1, cik2, properties) tuples, emitted lazily; a per-company cap keeps the
+  count linear in the number of companies instead of quadratic in the bucket size
+- group membership: one row per (company, bucket), written as
+  Company-[:IN_INDUSTRY_GROUP]->IndustryGroup / Company-[:IN_SIZE_BUCKET]->SizeBucket
+
+Functions take a CompanyFrame (see public_company_graph.company.frame) or a list of
+company dicts; grouping and size bucketing run on the frame's columns.
+
 Reference: CompanyKG paper - Multiple relationship types for company similarity
 """
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+from public_company_graph.company.frame import SIZE_TIERS, CompanyFrame, as_company_frame
 
 logger = logging.getLogger(__name__)
 
+# Company property holding the classification for each industry method
+INDUSTRY_METHOD_FIELDS = {
+    "SIC": "sic_code",
+    "NAICS": "naics_code",
+    "SECTOR": "sector",
+    "INDUSTRY": "industry",
+}
+
+# Size metrics used by each size method
+SIZE_METHOD_METRICS = {
+    "COMPOSITE": ["revenue", "market_cap", "employees"],
+    "REVENUE": ["revenue"],
+    "MARKET_CAP": ["market_cap"],
+    "EMPLOYEES": ["employees"],
+}
+
+
+def _bucket_pairs(ciks: list[str], max_per_company: int | None = None) -> Iterator[tuple[str, str]]:
+    """
+    Yield (lower CIK, higher CIK) pairs of companies in one bucket.
+
+    Without a cap every pair is yielded. With a cap, each company is paired with its
+    max_per_company // 2 successors in the given order (so with at most max_per_company
+    neighbours in total); pass ciks ordered by closeness so those are the most similar.
+    """
+    window = len(ciks) if max_per_company is None else max(1, max_per_company // 2)
+    for i, cik1 in enumerate(ciks):
+        for cik2 in ciks[i + 1 : i + 1 + window]:
+            yield (cik1, cik2) if cik1 <= cik2 else (cik2, cik1)
+
+
+def unique_pairs(
+    pairs: Iterable[tuple[str, str, dict]], max_per_company: int | None = None
+) -> Iterator[tuple[str, str, dict]]:
+    """
+    Drop repeated (cik1, cik2) pairs, keeping the first, and cap pairs per company.
+
+    Memory is proportional to the pairs kept, so with a cap it is linear in the
+    number of companies.
+
+    Args:
+        pairs: (cik1, cik2, properties) tuples with cik1 <= cik2
+        max_per_company: Max pairs any company takes part in (None = unlimited)
+    """
+    seen: set[tuple[str, str]] = set()
+    degree: dict[str, int] = defaultdict(int)
+    for cik1, cik2, properties in pairs:
+        key = (cik1, cik2)
+        if key in seen:
+            continue
+        if max_per_company is not None and (
+            degree[cik1] >= max_per_company or degree[cik2] >= max_per_company
+        ):
+            continue
+        seen.add(key)
+        degree[cik1] += 1
+        degree[cik2] += 1
+        yield cik1, cik2, properties
+
+
+def group_companies_by_industry(
+    companies: CompanyFrame | list[dict], method: str = "SIC"
+) -> dict[str, list[str]]:
+    """
+    Group company CIKs by industry classification.
+
+    Args:
+        companies: CompanyFrame or list of company dictionaries with industry properties
+        method: Classification method ('SIC', 'NAICS', 'SECTOR', 'INDUSTRY')
+
+    Returns:
+        Dictionary mapping classification to list of company CIKs (input order)
+    """
+    field = INDUSTRY_METHOD_FIELDS.get(method)
+    if field is None:
+        return {}
+    frame = as_company_frame(companies)
+    return {key: frame.cik[rows].tolist() for key, rows in frame.group_by(field).items()}
+
+
+def iter_industry_similarity(
+    companies: CompanyFrame | list[dict], method: str = "SIC", max_per_company: int | None = None
+) -> Iterator[tuple[str, str, dict]]:
+    """
+    Lazily yield industry similarity pairs (see compute_industry_similarity).
+
+    Args:
+        companies: List of company dictionaries with industry properties
+        method: Classification method ('SIC', 'NAICS', 'SECTOR', 'INDUSTRY')
+        max_per_company: Max pairs per company within a group (None = all pairs)
+
+    Yields:
+        (company1_cik, company2_cik, properties) tuples
+    """
+    for classification, ciks in group_companies_by_industry(companies, method).items():
+        if len(ciks) < 2:
+            continue
+        if max_per_company is not None:
+            ciks = sorted(ciks)
+
+        properties = {
+            "method": method,
+            "classification": classification,
+            "score": 1.0,  # Same classification = perfect match
+        }
+        for cik1, cik2 in _bucket_pairs(ciks, max_per_company):
+            yield cik1, cik2, properties
+
 
 def compute_industry_similarity(
-    companies: list[dict], method: str = "SIC"
+    companies: CompanyFrame | list[dict], method: str = "SIC"
 ) -> list[tuple[str, str, dict]]:
     """
     Compute industry similarity between companies.
@@ -31,61 +152,55 @@ def compute_industry_similarity(
 
     Reference: CompanyKG C2 - industry sector similarity
     """
+    companies = as_company_frame(companies)
     if not companies:
         return []
 
-    # Group companies by the specified classification
-    groups: dict[str, list[str]] = defaultdict(list)
+    pairs = list(iter_industry_similarity(companies, method))
 
-    for company in companies:
-        cik = company.get("cik")
-        if not cik:
-            continue
+    logger.info(
+        f"Computed {len(pairs)} industry similarity pairs using {method} "
+        f"({len(group_companies_by_industry(companies, method))} groups)"
+    )
+    return pairs
 
-        # Ensure CIK is a string for consistent comparison
-        cik = str(cik)
-
-        classification = None
-        if method == "SIC":
-            classification = company.get("sic_code")
-        elif method == "NAICS":
-            classification = company.get("naics_code")
-        elif method == "SECTOR":
-            classification = company.get("sector")
-        elif method == "INDUSTRY":
-            classification = company.get("industry")
-
-        if classification:
-            groups[str(classification)].append(cik)
-
-    # Generate pairs within each group
-    pairs = []
-    for classification, ciks in groups.items():
-        if len(ciks) < 2:
-            continue
 
-        # Generate all pairs within the group
-        for i, cik1 in enumerate(ciks):
-            for cik2 in ciks[i + 1 :]:
-                # Ensure consistent ordering (lexicographic)
-                if cik1 > cik2:
-                    cik1, cik2 = cik2, cik1
+def industry_group_memberships(
+    companies: CompanyFrame | list[dict], methods: Iterable[str] = tuple(INDUSTRY_METHOD_FIELDS)
+) -> list[dict]:
+    """
+    One row per (company, industry group) for the group-membership representation.
 
-                properties = {
-                    "method": method,
-                    "classification": classification,
-                    "score": 1.0,  # Same classification = perfect match
-                }
-                pairs.append((cik1, cik2, properties))
+    Args:
+        companies: List of company dictionaries with industry properties
+        methods: Classification methods to include
 
-    logger.info(
-        f"Computed {len(pairs)} industry similarity pairs using {method} ({len(groups)} groups)"
-    )
-    return pairs
+    Returns:
+        List of {"cik", "key", "method", "classification"} dicts; key identifies the
+        IndustryGroup node (e.g. "SIC:7372")
+    """
+    companies = as_company_frame(companies)
+    rows: list[dict[str, str]] = []
+    for method in methods:
+        for classification, ciks in group_companies_by_industry(companies, method).items():
+            key = f"{method}:{classification}"
+            rows.extend(
+                {"cik": cik, "key": key, "method": method, "classification": classification}
+                for cik in ciks
+            )
+    return rows
+
+
+def _size_metrics(method: str) -> list[str]:
+    """Size metrics for a size method (unknown methods fall back to COMPOSITE)."""
+    if method not in SIZE_METHOD_METRICS:
+        logger.warning(f"Unknown size method: {method}, using COMPOSITE")
+        return SIZE_METHOD_METRICS["COMPOSITE"]
+    return SIZE_METHOD_METRICS[method]
 
 
 def bucket_companies_by_size(
-    companies: list[dict], metric: str = "revenue"
+    companies: CompanyFrame | list[dict], metric: str = "revenue"
 ) -> dict[str, list[str]]:
     """
     Bucket companies into size tiers.
@@ -101,56 +216,97 @@ def bucket_companies_by_size(
     - For revenue/market_cap: <$100M, $100M-$1B, $1B-$10B, >$10B
     - For employees: <100, 100-1000, 1000-10000, >10000
     """
-    buckets: dict[str, list[str]] = defaultdict(list)
+    return {
+        bucket: [cik for cik, _ in members]
+        for bucket, members in _size_buckets(companies, metric).items()
+    }
+
+
+def _size_buckets(
+    companies: CompanyFrame | list[dict], metric: str
+) -> dict[str, list[tuple[str, float]]]:
+    """Size tier -> list of (cik, metric value) in input order."""
+    if metric not in SIZE_TIERS:
+        return {}
+    frame = as_company_frame(companies)
+    values = frame.column(metric)
+    return {
+        bucket: list(zip(frame.cik[rows].tolist(), values[rows].tolist(), strict=True))
+        for bucket, rows in frame.group_by_size(metric).items()
+    }
+
+
+def iter_size_similarity(
+    companies: CompanyFrame | list[dict],
+    method: str = "COMPOSITE",
+    max_per_company: int | None = None,
+) -> Iterator[tuple[str, str, dict]]:
+    """
+    Lazily yield size similarity pairs (see compute_size_similarity).
 
-    for company in companies:
-        cik = company.get("cik")
-        if not cik:
-            continue
+    With max_per_company, companies in a bucket are ordered by the metric value and
+    paired with their nearest neighbours in that order, and no company takes part in
+    more than max_per_company pairs across all metrics.
+
+    Args:
+        companies: List of company dictionaries with size properties
+        method: Size metric ('REVENUE', 'MARKET_CAP', 'EMPLOYEES', 'COMPOSITE')
+        max_per_company: Max pairs per company (None = all pairs in each bucket)
 
-        # Ensure CIK is a string for consistent comparison
-        cik = str(cik)
+    Yields:
+        (company1_cik, company2_cik, properties) tuples, each pair once
+    """
+    companies = as_company_frame(companies)
+
+    def bucket_pairs() -> Iterator[tuple[str, str, dict]]:
+        for metric in _size_metrics(method):
+            for bucket, members in _size_buckets(companies, metric).items():
+                if len(members) < 2:
+                    continue
+                if max_per_company is None:
+                    ciks = sorted(cik for cik, _ in members)
+                else:
+                    ciks = [cik for cik, _ in sorted(members, key=lambda m: (m[1], m[0]))]
 
-        value = None
-        if metric == "revenue":
-            value = company.get("revenue")
-        elif metric == "market_cap":
-            value = company.get("market_cap")
-        elif metric == "employees":
-            value = company.get("employees")
+                properties = {
+                    "method": method,
+                    "metric": metric,
+                    "bucket": bucket,
+                    "score": 1.0,  # Same bucket = perfect match
+                }
+                for cik1, cik2 in _bucket_pairs(ciks, max_per_company):
+                    yield cik1, cik2, properties
 
-        # Skip if value is None (but allow 0 as valid value)
-        if value is None:
-            continue
+    yield from unique_pairs(bucket_pairs(), max_per_company)
 
-        # Determine bucket
-        if metric == "employees":
-            if value < 100:
-                bucket = "<100"
-            elif value < 1000:
-                bucket = "100-1000"
-            elif value < 10000:
-                bucket = "1000-10000"
-            else:
-                bucket = ">10000"
-        else:
-            # revenue or market_cap (in USD)
-            if value < 100_000_000:  # <$100M
-                bucket = "<$100M"
-            elif value < 1_000_000_000:  # <$1B
-                bucket = "$100M-$1B"
-            elif value < 10_000_000_000:  # <$10B
-                bucket = "$1B-$10B"
-            else:
-                bucket = ">$10B"
-
-        buckets[bucket].append(cik)
-
-    return dict(buckets)
+
+def size_bucket_memberships(
+    companies: CompanyFrame | list[dict], method: str = "COMPOSITE"
+) -> list[dict]:
+    """
+    One row per (company, size bucket) for the group-membership representation.
+
+    Args:
+        companies: List of company dictionaries with size properties
+        method: Size metric ('REVENUE', 'MARKET_CAP', 'EMPLOYEES', 'COMPOSITE')
+
+    Returns:
+        List of {"cik", "key", "metric", "bucket"} dicts; key identifies the SizeBucket
+        node (e.g. "revenue:>$10B")
+    """
+    companies = as_company_frame(companies)
+    rows: list[dict[str, str]] = []
+    for metric in _size_metrics(method):
+        for bucket, members in _size_buckets(companies, metric).items():
+            key = f"{metric}:{bucket}"
+            rows.extend(
+                {"cik": cik, "key": key, "metric": metric, "bucket": bucket} for cik, _ in members
+            )
+    return rows
 
 
 def compute_size_similarity(
-    companies: list[dict], method: str = "COMPOSITE"
+    companies: CompanyFrame | list[dict], method: str = "COMPOSITE"
 ) -> list[tuple[str, str, dict]]:
     """
     Compute size similarity between companies.
@@ -167,62 +323,14 @@ def compute_size_similarity(
 
     Reference: CompanyKG - Company size attributes (employees, revenue)
     """
+    companies = as_company_frame(companies)
     if not companies:
         return []
 
-    pairs = []
-    buckets_by_metric: dict[str, dict[str, list[str]]] = {}
-
-    if method == "COMPOSITE":
-        # Use all available metrics
-        metrics = ["revenue", "market_cap", "employees"]
-    elif method == "REVENUE":
-        metrics = ["revenue"]
-    elif method == "MARKET_CAP":
-        metrics = ["market_cap"]
-    elif method == "EMPLOYEES":
-        metrics = ["employees"]
-    else:
-        logger.warning(f"Unknown size method: {method}, using COMPOSITE")
-        metrics = ["revenue", "market_cap", "employees"]
-
-    # Bucket by each metric
-    for metric in metrics:
-        buckets = bucket_companies_by_size(companies, metric)
-        if buckets:
-            buckets_by_metric[metric] = buckets
-
-    # Generate pairs from buckets
-    seen_pairs = set()
-    for metric, buckets in buckets_by_metric.items():
-        for bucket, ciks in buckets.items():
-            if len(ciks) < 2:
-                continue
-
-            # Sort CIKs to ensure consistent pair generation order
-            # This doesn't affect which pairs are generated, but helps with debugging
-            sorted_ciks = sorted(ciks)
-
-            # Generate all pairs within the bucket
-            for i, cik1 in enumerate(sorted_ciks):
-                for cik2 in sorted_ciks[i + 1 :]:
-                    # Ensure consistent ordering (already sorted, but double-check)
-                    if cik1 > cik2:
-                        cik1, cik2 = cik2, cik1
-
-                    pair_key = (cik1, cik2)
-                    if pair_key not in seen_pairs:
-                        seen_pairs.add(pair_key)
-                        properties = {
-                            "method": method,
-                            "metric": metric,
-                            "bucket": bucket,
-                            "score": 1.0,  # Same bucket = perfect match
-                        }
-                        pairs.append((cik1, cik2, properties))
+    pairs = list(iter_size_similarity(companies, method))
 
     logger.info(
         f"Computed {len(pairs)} size similarity pairs using {method} "
-        f"({sum(len(b) for b in buckets_by_metric.values())} total buckets)"
+        f"({sum(len(_size_buckets(companies, m)) for m in _size_metrics(method))} total buckets)"
     )
     return pairs
@@ -49,6 +49,10 @@ class Settings(BaseSettings):
         default="",
         description="OpenAI API key for embeddings",
     )
+    openai_base_url: str | None = Field(
+        default=None,
+        description="OpenAI-compatible API base URL (optional, e.g. a local mock server)",
+    )
 
     # Finnhub Configuration
     finnhub_api_key: str | None = Field(
@@ -70,7 +74,7 @@ class Settings(BaseSettings):
             return v.strip()
         return v
 
-    @field_validator("finnhub_api_key", "datamule_api_key", mode="before")
+    @field_validator("finnhub_api_key", "datamule_api_key", "openai_base_url", mode="before")
     @classmethod
     def empty_string_to_none(cls, v: str | None) -> str | None:
         """Convert empty strings to None for optional fields."""
@@ -125,6 +129,11 @@ def get_openai_api_key() -> str:
     return key
 
 
+def get_openai_base_url() -> str | None:
+    """Get OpenAI base URL override from settings (None = api.openai.com)."""
+    return get_settings().openai_base_url
+
+
 def get_finnhub_api_key() -> str | None:
     """Get Finnhub API key from settings (optional)."""
     return get_settings().finnhub_api_key
@@ -8,6 +8,7 @@ Centralizes magic numbers and configuration defaults.
 BATCH_SIZE_SMALL = 1000  # For node creation
 BATCH_SIZE_LARGE = 5000  # For relationship creation
 BATCH_SIZE_DELETE = 10000  # For relationship deletion
+BULK_WRITE_WORKERS = 4  # Concurrent write transactions for bulk loads (BulkLoader)
 
 # GDS algorithm defaults
 DEFAULT_TOP_K = 50
@@ -39,12 +40,14 @@ SEC_EDGAR_LONG_DURATION_LIMIT = 5.0  # SEC EDGAR long-duration limit: 5 req/sec
 FINVIZ_RATE_LIMIT = 5.0  # Finviz: No official API, web scraping. 5 req/sec is safe.
 FINNHUB_RATE_LIMIT = 1.0  # Finnhub free tier: 60 req/min = 1 req/sec
 YFINANCE_RATE_LIMIT = 0.0  # yfinance: No explicit limit, library handles throttling
+YAHOO_FINANCE_RATE_LIMIT = 10.0  # Yahoo Finance quote lookups during enrichment (conservative)
 
 # Cache TTL (Time To Live) in days
 CACHE_TTL_COMPANY_DOMAINS = 30  # Company domain data cache TTL
 CACHE_TTL_COMPANY_PROPERTIES = 30  # Company properties cache TTL
 CACHE_TTL_10K_EXTRACTED = 365  # 10-K extracted data cache TTL (long-lived)
 CACHE_TTL_NEGATIVE_RESULT = 7  # Negative results (not found) cache TTL (shorter)
+CACHE_TTL_HTTP_RESPONSES = 30  # Raw HTTP responses kept for ETag/Last-Modified revalidation
 
 # Parallel processing defaults
 DEFAULT_WORKERS = 8  # Default number of parallel workers
@@ -0,0 +1,121 @@
+"""
+Dirty sets: which node keys changed since a downstream stage last ran.
+
+Producer stages (the incremental bootstrap, the Company loader) mark the Domain or
+Company keys they changed; consumer stages (embeddings, similarity) ask for the keys
+changed since their own last acknowledgement, recompute just those nodes, and then
+acknowledge. Each consumer keeps its own position, so one stage consuming the set
+does not hide it from the next:
+
+    dirty = DirtySet(get_cache(), "Company")
+    batch = dirty.pending("company_embeddings")
+    if batch.full:
+        ...  # No baseline yet: recompute everything
+    else:
+        ...  # Recompute batch.keys
+    dirty.acknowledge("company_embeddings", batch)
+
+State is one cache entry per label (namespace "dirty"), so it survives between
+pipeline runs.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from public_company_graph.cache import AppCache
+
+logger = logging.getLogger(__name__)
+
+DIRTY_NAMESPACE = "dirty"
+
+# Serializes read-modify-write of the state (pipeline stages share one process)
+_state_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class DirtyBatch:
+    """Keys a consumer has not processed yet, up to the time they were read."""
+
+    keys: frozenset[str] = field(default_factory=frozenset)
+    # Latest mark included; acknowledging up to it leaves later marks pending
+    upto: float = 0.0
+    # No baseline (first run, or reset by a full load): the consumer must recompute all
+    full: bool = False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class DirtySet:
+    """Changed keys of one node label, with a position per consumer stage."""
+
+    def __init__(self, cache: AppCache, label: str):
+        """
+        Args:
+            cache: AppCache instance holding the state
+            label: Node label the keys belong to (e.g. "Domain", "Company")
+        """
+        self.cache = cache
+        self.label = label
+
+    def _state(self) -> dict:
+        state = self.cache.get(DIRTY_NAMESPACE, self.label)
+        return state if state is not None else {"marks": {}, "consumers": {}}
+
+    def _save(self, state: dict) -> None:
+        self.cache.set(DIRTY_NAMESPACE, self.label, state)
+
+    def mark(self, keys) -> int:
+        """
+        Record keys as changed now.
+
+        Returns:
+            Number of keys marked
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+        with _state_lock:
+            state = self._state()
+            # Strictly after every earlier mark, so a batch's upto never covers a later one
+            marked_at = max(time.time(), state.get("clock", 0.0) + 1e-6)
+            state["clock"] = marked_at
+            for key in keys:
+                state["marks"][key] = marked_at
+            self._save(state)
+        return len(keys)
+
+    def pending(self, consumer: str) -> DirtyBatch:
+        """
+        Keys changed since the consumer last acknowledged.
+
+        Returns:
+            DirtyBatch; full=True if the consumer has no baseline yet (it has never
+            acknowledged, or the set was reset by a full load)
+        """
+        state = self._state()
+        since = state["consumers"].get(consumer)
+        if since is None:
+            marks = state["marks"]
+            return DirtyBatch(frozenset(marks), max(marks.values(), default=0.0), full=True)
+        marks = {key: at for key, at in state["marks"].items() if at > since}
+        return DirtyBatch(frozenset(marks), max(marks.values(), default=since))
+
+    def acknowledge(self, consumer: str, batch: DirtyBatch) -> None:
+        """
+        Record that the consumer has processed a batch from pending().
+
+        Marks every consumer has seen are dropped, so the state stays small.
+        """
+        with _state_lock:
+            state = self._state()
+            state["consumers"][consumer] = batch.upto
+            oldest = min(state["consumers"].values())
+            state["marks"] = {key: at for key, at in state["marks"].items() if at > oldest}
+            self._save(state)
+
+    def reset(self) -> None:
+        """Forget all marks and consumer positions (after a full reload)."""
+        self.cache.delete(DIRTY_NAMESPACE, self.label)
@@ -1,7 +1,10 @@
 """Embedding utilities for creating and caching embeddings."""
 
 from public_company_graph.constants import EMBEDDING_DIMENSION, EMBEDDING_MODEL
-from public_company_graph.embeddings.create import create_embeddings_for_nodes
+from public_company_graph.embeddings.create import (
+    create_embeddings_for_nodes,
+    invalidate_embeddings,
+)
 from public_company_graph.embeddings.openai_client import (
     create_embedding,
     get_openai_client,
@@ -10,6 +13,7 @@ from public_company_graph.embeddings.openai_client import (
 
 __all__ = [
     "create_embeddings_for_nodes",
+    "invalidate_embeddings",
     "create_embedding",
     "get_openai_client",
     "suppress_http_logging",
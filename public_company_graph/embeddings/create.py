@@ -82,6 +82,79 @@ def _validate_node_label(label: str) -> None:
         raise ValueError(f"Invalid node_label: '{label}'. Allowed labels: {ALLOWED_NODE_LABELS}")
 
 
+def invalidate_embeddings(
+    driver,
+    cache: AppCache,
+    node_label: str,
+    text_property: str,
+    key_property: str,
+    keys,
+    embedding_property: str = "description_embedding",
+    database: str | None = None,
+    batch_size: int = EMBEDDING_NEO4J_BATCH_SIZE_LARGE,
+    log: logging.Logger | None = None,
+) -> int:
+    """
+    Make create_embeddings_for_nodes recompute the embeddings of changed nodes.
+
+    create_embeddings_for_nodes only processes nodes without an embedding, and its
+    cache is keyed by node, not text. For each key, the node's embedding is removed,
+    and the cached embedding is dropped if it was created for a different text (an
+    unchanged text is then served from the cache without an API call).
+
+    Args:
+        driver: Neo4j driver
+        cache: AppCache instance (unified diskcache)
+        node_label: Neo4j node label (e.g., "Domain", "Company")
+        text_property: Property name containing the embedded text
+        key_property: Property name for unique key
+        keys: Keys of the changed nodes (e.g. a DirtyBatch's keys)
+        embedding_property: Property name storing the embedding
+        database: Neo4j database name
+        batch_size: Nodes per query
+        log: Logger instance for output
+
+    Returns:
+        Number of cached embeddings dropped because their text changed
+    """
+    _logger = log if log is not None else logger
+    _validate_node_label(node_label)
+    _validate_property_name(text_property, "text_property")
+    _validate_property_name(key_property, "key_property")
+    _validate_property_name(embedding_property, "embedding_property")
+
+    keys = sorted(keys)
+    stale = 0
+    for i in range(0, len(keys), batch_size):
+        batch = keys[i : i + batch_size]
+        with driver.session(database=database) as session:
+            result = session.run(
+                f"""
+                UNWIND $batch AS key
+                MATCH (n:{node_label} {{{key_property}: key}})
+                REMOVE n.{embedding_property}
+                RETURN key, n.{text_property} AS text
+                """,
+                batch=batch,
+            )
+            texts = {record["key"]: record["text"] for record in result}
+
+        cache_keys = [f"{key}:{text_property}" for key in texts]
+        cached = cache.get_many("embeddings", cache_keys)
+        for cache_key, data in cached.items():
+            node_key = cache_key.rsplit(":", 1)[0]
+            # Short texts are cached stripped, long ones as read
+            if (data.get("text") or "").strip() != (texts[node_key] or "").strip():
+                cache.delete("embeddings", cache_key)
+                stale += 1
+
+    _logger.info(
+        f"  ✓ Invalidated {len(keys):,} {node_label} {embedding_property} values "
+        f"({stale:,} with changed {text_property})"
+    )
+    return stale
+
+
 def create_embeddings_for_nodes(
     driver,
     cache: AppCache,
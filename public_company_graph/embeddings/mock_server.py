@@ -0,0 +1,375 @@
+"""
+Local OpenAI-compatible mock server for offline load testing.
+
+Serves the two endpoints the pipeline uses - /v1/embeddings and /v1/chat/completions -
+so embedding creation, embedding scoring, LLM verification and GraphRAG answers can be
+benchmarked end to end without spending money or hitting real rate limits.
+
+- Embeddings are deterministic: each vector is seeded from a hash of (model, text) and
+  L2-normalized, so repeated runs (and cache comparisons) see identical values.
+- Chat completions are canned. Verification prompts get a well-formed JSON verdict
+  (one per packed candidate), JSON-mode requests get a JSON object, and everything
+  else gets a fixed answer string.
+- Latency, a requests-per-minute budget (with x-ratelimit-* headers) and random 429
+  injection are configurable, so concurrency controllers can be exercised locally.
+
+Usage:
+    from openai import OpenAI
+
+    config = MockOpenAIConfig(latency_seconds=0.05, requests_per_minute=600)
+    with MockOpenAIServer(config) as server:
+        client = OpenAI(api_key="mock", base_url=server.base_url)
+        client.embeddings.create(model="text-embedding-3-small", input=["hello"])
+        print(server.stats)
+
+Or run standalone and point the pipeline at it (OPENAI_BASE_URL is read by
+get_openai_client() and get_async_openai_client()):
+    python -m public_company_graph.embeddings.mock_server --port 8089 --latency 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=mock python scripts/...
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import numpy as np
+
+from public_company_graph.constants import EMBEDDING_DIMENSION
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used for usage accounting
+CHARS_PER_TOKEN = 4
+
+# Packed verification prompts number their candidates "[0] Source --[HAS_X]--> Target"
+_CANDIDATE_PATTERN = re.compile(r"^\[(\d+)\][^\n]*--\[(\w+)\]-->", re.MULTILINE)
+_CLAIMED_PATTERN = re.compile(r"--\[(\w+)\]-->")
+
+
+@dataclass
+class MockOpenAIConfig:
+    """Behaviour of the mock server."""
+
+    embedding_dimension: int = EMBEDDING_DIMENSION
+    latency_seconds: float = 0.0  # Added to every request
+    latency_jitter_seconds: float = 0.0  # Uniform extra latency in [0, jitter]
+    requests_per_minute: int | None = None  # None = no request budget
+    error_rate: float = 0.0  # Probability of injecting a 429 regardless of budget
+    retry_after_seconds: float = 1.0  # Retry-After sent with injected 429s
+    completion_text: str | None = None  # Overrides the canned chat completions
+    seed: int = 0  # Seeds latency jitter and 429 injection
+
+
+@dataclass
+class MockOpenAIStats:
+    """Counters for load-test assertions and reports."""
+
+    requests: int = 0
+    rate_limited: int = 0
+    embedding_inputs: int = 0
+    chat_completions: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+def deterministic_embedding(text: str, model: str, dimension: int) -> list[float]:
+    """Unit-length embedding seeded from a hash of (model, text)."""
+    digest = hashlib.sha256(f"{model}\0{text}".encode()).digest()
+    rng = np.random.default_rng(int.from_bytes(digest[:8], "little"))
+    vector = rng.standard_normal(dimension)
+    vector /= np.linalg.norm(vector)
+    values: list[float] = vector.tolist()
+    return values
+
+
+def _count_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class MockOpenAIBackend:
+    """
+    Request handling shared by the HTTP server (and usable directly in tests).
+
+    handle() returns (status, headers, body) for a POST to an OpenAI API path.
+    """
+
+    def __init__(self, config: MockOpenAIConfig | None = None):
+        self.config = config or MockOpenAIConfig()
+        self.stats = MockOpenAIStats()
+        self._random = random.Random(self.config.seed)
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    def handle(self, path: str, body: dict[str, Any]) -> tuple[int, dict[str, str], dict]:
+        """Serve one request, applying latency and rate limiting."""
+        with self.stats._lock:
+            self.stats.requests += 1
+            self.stats.in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+            jitter = self._random.uniform(0, self.config.latency_jitter_seconds)
+            inject_error = self._random.random() < self.config.error_rate
+        try:
+            delay = self.config.latency_seconds + jitter
+            if delay > 0:
+                time.sleep(delay)
+
+            status, headers, payload = self._check_rate_limit(inject_error)
+            if status != 200:
+                return status, headers, payload
+
+            if path.endswith("/embeddings"):
+                return 200, headers, self._embeddings(body)
+            if path.endswith("/chat/completions"):
+                return 200, headers, self._chat_completion(body)
+            return 404, headers, _error_body(f"Unknown path: {path}", "not_found_error")
+        finally:
+            with self.stats._lock:
+                self.stats.in_flight -= 1
+
+    def _check_rate_limit(self, inject_error: bool) -> tuple[int, dict[str, str], dict]:
+        """Apply the per-minute request budget and any injected 429."""
+        with self.stats._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 60:
+                self._window_start = now
+                self._window_count = 0
+            reset = 60 - (now - self._window_start)
+            limit = self.config.requests_per_minute
+
+            headers: dict[str, str] = {}
+            over_budget = False
+            if limit is not None:
+                over_budget = self._window_count >= limit
+                if not over_budget:
+                    self._window_count += 1
+                headers = {
+                    "x-ratelimit-limit-requests": str(limit),
+                    "x-ratelimit-remaining-requests": str(max(0, limit - self._window_count)),
+                    "x-ratelimit-reset-requests": f"{reset:.3f}s",
+                }
+
+            if over_budget or inject_error:
+                self.stats.rate_limited += 1
+                retry_after = reset if over_budget else self.config.retry_after_seconds
+                headers["retry-after"] = f"{retry_after:.3f}"
+                return 429, headers, _error_body("Rate limit reached", "rate_limit_exceeded")
+        return 200, headers, {}
+
+    def _embeddings(self, body: dict[str, Any]) -> dict:
+        model = body.get("model", "")
+        inputs = body.get("input", [])
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        dimension = body.get("dimensions") or self.config.embedding_dimension
+
+        data = []
+        tokens = 0
+        for i, item in enumerate(inputs):
+            text = item if isinstance(item, str) else json.dumps(item)
+            vector = deterministic_embedding(text, model, dimension)
+            tokens += _count_tokens(text)
+            if body.get("encoding_format") == "base64":
+                encoded: Any = base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode()
+            else:
+                encoded = vector
+            data.append({"object": "embedding", "index": i, "embedding": encoded})
+
+        with self.stats._lock:
+            self.stats.embedding_inputs += len(inputs)
+        return {
+            "object": "list",
+            "data": data,
+            "model": model,
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    def _chat_completion(self, body: dict[str, Any]) -> dict:
+        messages = body.get("messages", [])
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        content = self.config.completion_text
+        if content is None:
+            content = _canned_completion(messages[-1].get("content", "") if messages else "", body)
+
+        with self.stats._lock:
+            self.stats.chat_completions += 1
+        prompt_tokens = _count_tokens(prompt)
+        completion_tokens = _count_tokens(content)
+        return {
+            "id": f"chatcmpl-mock-{self.stats.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", ""),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+def _canned_completion(prompt: str, body: dict[str, Any]) -> str:
+    """Well-formed answer for the prompt shapes the pipeline sends."""
+    candidates = _CANDIDATE_PATTERN.findall(prompt)
+    if candidates:
+        return json.dumps(
+            {
+                "results": [
+                    _canned_verdict(relationship, int(candidate_id))
+                    for candidate_id, relationship in candidates
+                ]
+            }
+        )
+
+    claimed = _CLAIMED_PATTERN.search(prompt)
+    if claimed or body.get("response_format", {}).get("type") == "json_object":
+        return json.dumps(_canned_verdict(claimed.group(1) if claimed else "NONE"))
+
+    return "This is a canned response from the mock OpenAI server."
+
+
+def _canned_verdict(relationship: str, candidate_id: int | None = None) -> dict:
+    verdict: dict[str, Any] = {} if candidate_id is None else {"id": candidate_id}
+    verdict.update(
+        {
+            "verified": True,
+            "confidence": 0.9,
+            "explanation": "Mock verification.",
+            "actual_relationship": relationship,
+        }
+    )
+    return verdict
+
+
+def _error_body(message: str, code: str) -> dict:
+    return {"error": {"message": message, "type": code, "code": code}}
+
+
+class MockOpenAIServer:
+    """
+    Threaded HTTP server exposing MockOpenAIBackend on localhost.
+
+    Use as a context manager; base_url is ready to pass to OpenAI(base_url=...).
+    """
+
+    def __init__(
+        self,
+        config: MockOpenAIConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,  # 0 = pick a free port
+    ):
+        self.backend = MockOpenAIBackend(config)
+        backend = self.backend
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802 - http.server naming
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    status, headers, payload = 400, {}, _error_body("Invalid JSON", "invalid")
+                else:
+                    status, headers, payload = backend.handle(self.path, body)
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):  # noqa: A002 - http.server signature
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host = self._server.server_address[0]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{self._server.server_port}/v1"
+
+    @property
+    def stats(self) -> MockOpenAIStats:
+        return self.backend.stats
+
+    def start(self) -> MockOpenAIServer:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock OpenAI server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Shut down the server and wait for the serving thread."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> MockOpenAIServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a local mock OpenAI-compatible server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random latency")
+    parser.add_argument("--rpm", type=int, default=None, help="Requests per minute budget")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 429s")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockOpenAIServer(
+        MockOpenAIConfig(
+            latency_seconds=args.latency,
+            latency_jitter_seconds=args.jitter,
+            requests_per_minute=args.rpm,
+            error_rate=args.error_rate,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"export OPENAI_BASE_URL={server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(server.stats)
@@ -17,7 +17,7 @@ from collections.abc import Callable
 
 from tqdm import tqdm
 
-from public_company_graph.config import get_openai_api_key
+from public_company_graph.config import get_openai_api_key, get_openai_base_url
 from public_company_graph.constants import EMBEDDING_MODEL
 
 # Try to import OpenAI
@@ -50,7 +50,7 @@ def get_openai_client() -> OpenAI:
     if not OPENAI_AVAILABLE:
         raise ImportError("openai not available. Install with: pip install openai")
     api_key = get_openai_api_key()  # Raises ValueError if not set
-    return OpenAI(api_key=api_key)
+    return OpenAI(api_key=api_key, base_url=get_openai_base_url())
 
 
 def count_tokens(text: str, model: str = EMBEDDING_MODEL) -> int:
@@ -9,7 +9,7 @@ import asyncio
 import logging
 from collections.abc import Callable
 
-from public_company_graph.config import get_openai_api_key
+from public_company_graph.config import get_openai_api_key, get_openai_base_url
 from public_company_graph.constants import EMBEDDING_MODEL
 from public_company_graph.embeddings.openai_client import (
     EMBEDDING_TRUNCATE_TOKENS,
@@ -32,7 +32,7 @@ def get_async_openai_client() -> AsyncOpenAI:
     if not ASYNC_OPENAI_AVAILABLE:
         raise ImportError("openai not available. Install with: pip install openai")
     api_key = get_openai_api_key()
-    return AsyncOpenAI(api_key=api_key)
+    return AsyncOpenAI(api_key=api_key, base_url=get_openai_base_url())
 
 
 async def create_embeddings_batch_async(
@@ -9,10 +9,18 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r"[.!?]\s+")
 
-@dataclass(frozen=True)
+# Maximum characters of containing sentence kept as candidate context
+_MAX_SENTENCE_LENGTH = 500
+
+
+@dataclass(frozen=True, slots=True)
 class Candidate:
     """A potential company mention extracted from text."""
 
@@ -23,6 +31,51 @@ class Candidate:
     sentence: str  # The containing sentence (for context)
 
 
+class SentenceIndex:
+    """
+    Precomputed sentence boundaries for one text.
+
+    Maps a character offset to its containing sentence by binary search over
+    the boundary offsets, instead of rescanning the text for every candidate.
+    Sentence strings are built once per sentence and shared by every
+    candidate in it.
+    """
+
+    __slots__ = ("text", "_starts", "_ends", "_sentences")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for match in _SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            self._starts.append(match.start())
+            self._ends.append(match.end())
+        self._sentences: dict[tuple[int, int], str] = {}
+
+    def sentence_at(self, position: int) -> str:
+        """Get the sentence containing the given position (at most 500 chars)."""
+        # Boundaries before position: the sentence starts after the last one.
+        # A boundary whose whitespace run contains position ends the previous
+        # sentence at position itself.
+        k = bisect_left(self._starts, position)
+        start = 0
+        j = k - 1
+        if j >= 0 and self._ends[j] > position and position - self._starts[j] < 2:
+            j -= 1
+        if j >= 0:
+            start = min(self._ends[j], position)
+
+        # First boundary at or after position ends the sentence
+        end = self._ends[k] if k < len(self._ends) else len(self.text)
+
+        key = (start, end)
+        sentence = self._sentences.get(key)
+        if sentence is None:
+            sentence = self.text[start:end].strip()[:_MAX_SENTENCE_LENGTH]
+            self._sentences[key] = sentence
+        return sentence
+
+
 class CandidateExtractor(ABC):
     """Abstract base class for candidate extraction strategies."""
 
@@ -31,6 +84,15 @@ class CandidateExtractor(ABC):
         """Extract candidates from text."""
         ...
 
+    def iter_candidates(self, text: str, sentences: SentenceIndex) -> Iterator[Candidate]:
+        """
+        Stream candidates from text using a shared sentence index.
+
+        Extractors override this to avoid per-candidate sentence scans; the
+        default falls back to extract().
+        """
+        yield from self.extract(text)
+
     @property
     @abstractmethod
     def pattern_name(self) -> str:
@@ -56,20 +118,20 @@ class CapitalizedWordExtractor(CandidateExtractor):
 
     def extract(self, text: str) -> list[Candidate]:
         """Extract capitalized word sequences."""
-        candidates = []
+        return list(self.iter_candidates(text, SentenceIndex(text)))
+
+    def iter_candidates(self, text: str, sentences: SentenceIndex) -> Iterator[Candidate]:
+        """Stream capitalized word sequences."""
         for match in self.PATTERN.finditer(text):
             candidate_text = match.group(1).strip()
             if len(candidate_text) >= 2:  # Minimum length
-                candidates.append(
-                    Candidate(
-                        text=candidate_text,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        source_pattern=self.pattern_name,
-                        sentence=_get_containing_sentence(text, match.start()),
-                    )
+                yield Candidate(
+                    text=candidate_text,
+                    start_pos=match.start(),
+                    end_pos=match.end(),
+                    source_pattern=self.pattern_name,
+                    sentence=sentences.sentence_at(match.start()),
                 )
-        return candidates
 
 
 class TickerExtractor(CandidateExtractor):
@@ -90,19 +152,18 @@ class TickerExtractor(CandidateExtractor):
 
     def extract(self, text: str) -> list[Candidate]:
         """Extract ticker-like sequences."""
-        candidates = []
+        return list(self.iter_candidates(text, SentenceIndex(text)))
+
+    def iter_candidates(self, text: str, sentences: SentenceIndex) -> Iterator[Candidate]:
+        """Stream ticker-like sequences."""
         for match in self.PATTERN.finditer(text):
-            candidate_text = match.group(1)
-            candidates.append(
-                Candidate(
-                    text=candidate_text,
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    source_pattern=self.pattern_name,
-                    sentence=_get_containing_sentence(text, match.start()),
-                )
+            yield Candidate(
+                text=match.group(1),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                source_pattern=self.pattern_name,
+                sentence=sentences.sentence_at(match.start()),
             )
-        return candidates
 
 
 class QuotedNameExtractor(CandidateExtractor):
@@ -122,55 +183,43 @@ class QuotedNameExtractor(CandidateExtractor):
 
     def extract(self, text: str) -> list[Candidate]:
         """Extract quoted strings that might be company names."""
-        candidates = []
+        return list(self.iter_candidates(text, SentenceIndex(text)))
+
+    def iter_candidates(self, text: str, sentences: SentenceIndex) -> Iterator[Candidate]:
+        """Stream quoted strings that might be company names."""
         for match in self.PATTERN.finditer(text):
             candidate_text = match.group(1).strip()
             # Only extract if it has at least one capital letter
             if candidate_text and any(c.isupper() for c in candidate_text):
-                candidates.append(
-                    Candidate(
-                        text=candidate_text,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        source_pattern=self.pattern_name,
-                        sentence=_get_containing_sentence(text, match.start()),
-                    )
+                yield Candidate(
+                    text=candidate_text,
+                    start_pos=match.start(),
+                    end_pos=match.end(),
+                    source_pattern=self.pattern_name,
+                    sentence=sentences.sentence_at(match.start()),
                 )
-        return candidates
 
 
 def _get_containing_sentence(text: str, position: int) -> str:
     """Get the sentence containing the given position."""
-    # Find sentence boundaries
-    sentence_pattern = re.compile(r"[.!?]\s+")
-
-    # Find start of sentence
-    start = 0
-    for match in sentence_pattern.finditer(text[:position]):
-        start = match.end()
+    return SentenceIndex(text).sentence_at(position)
 
-    # Find end of sentence
-    end = len(text)
-    sentence_end = sentence_pattern.search(text[position:])
-    if sentence_end:
-        end = position + sentence_end.end()
 
-    return text[start:end].strip()[:500]  # Limit context length
-
-
-def extract_candidates(
+def iter_unique_candidates(
     text: str,
     extractors: list[CandidateExtractor] | None = None,
-) -> list[Candidate]:
+) -> Iterator[Candidate]:
     """
-    Extract all candidate company mentions from text.
+    Stream candidate company mentions from text, deduplicated by text.
+
+    Sentence boundaries are computed once and shared across extractors.
 
     Args:
         text: Source text to extract from
         extractors: List of extractors to use (default: all standard extractors)
 
-    Returns:
-        List of unique candidates (deduplicated by text)
+    Yields:
+        The first occurrence of each unique candidate text (case-insensitive)
     """
     if extractors is None:
         extractors = [
@@ -178,16 +227,33 @@ def extract_candidates(
             TickerExtractor(),
         ]
 
-    all_candidates: dict[str, Candidate] = {}
+    sentences = SentenceIndex(text)
+    seen: set[str] = set()
 
     for extractor in extractors:
-        for candidate in extractor.extract(text):
+        for candidate in extractor.iter_candidates(text, sentences):
             # Keep the first occurrence of each unique text
             key = candidate.text.lower()
-            if key not in all_candidates:
-                all_candidates[key] = candidate
+            if key not in seen:
+                seen.add(key)
+                yield candidate
+
+
+def extract_candidates(
+    text: str,
+    extractors: list[CandidateExtractor] | None = None,
+) -> list[Candidate]:
+    """
+    Extract all candidate company mentions from text.
 
-    return list(all_candidates.values())
+    Args:
+        text: Source text to extract from
+        extractors: List of extractors to use (default: all standard extractors)
+
+    Returns:
+        List of unique candidates (deduplicated by text)
+    """
+    return list(iter_unique_candidates(text, extractors))
 
 
 # =============================================================================
@@ -214,12 +280,13 @@ def extract_candidates_with_stats(
 
     stats: dict[str, int] = {}
     all_candidates: dict[str, Candidate] = {}
+    sentences = SentenceIndex(text)
 
     for extractor in extractors:
         pattern_name = extractor.pattern_name
         stats[pattern_name] = 0
 
-        for candidate in extractor.extract(text):
+        for candidate in extractor.iter_candidates(text, sentences):
             stats[pattern_name] += 1
             key = candidate.text.lower()
             if key not in all_candidates:
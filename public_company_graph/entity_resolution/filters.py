@@ -31,7 +31,7 @@ class FilterReason(Enum):
     PLATFORM_DEPENDENCY = "platform_dependency"  # App store/OS distribution
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilterResult:
     """Result of filtering a candidate."""
 
@@ -25,7 +25,7 @@ class MatchType(Enum):
     ALIAS = "alias"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Result of attempting to match a candidate."""
 
@@ -74,6 +74,15 @@ class CandidateMatcher(ABC):
         """Priority (lower = tried first)."""
         ...
 
+    def could_match(self, candidate: Candidate, lookup: CompanyLookup) -> bool:
+        """
+        Cheap pre-check: False only if match() is certain to return NO_MATCH.
+
+        Lets the resolver reject candidates without allocating a MatchResult.
+        The default is conservative; lookup-based matchers override it.
+        """
+        return True
+
 
 # Import CompanyLookup for type hints
 from public_company_graph.parsing.business_relationship_extraction import (
@@ -97,6 +106,9 @@ class ExactTickerMatcher(CandidateMatcher):
     def priority(self) -> int:
         return 1
 
+    def could_match(self, candidate: Candidate, lookup: CompanyLookup) -> bool:
+        return candidate.text.upper().strip() in lookup.ticker_to_company
+
     def match(
         self,
         candidate: Candidate,
@@ -140,6 +152,9 @@ class ExactNameMatcher(CandidateMatcher):
     def priority(self) -> int:
         return 2
 
+    def could_match(self, candidate: Candidate, lookup: CompanyLookup) -> bool:
+        return candidate.text.lower().strip() in lookup.name_to_company
+
     def match(
         self,
         candidate: Candidate,
@@ -183,6 +198,9 @@ class NormalizedNameMatcher(CandidateMatcher):
     def priority(self) -> int:
         return 3
 
+    def could_match(self, candidate: Candidate, lookup: CompanyLookup) -> bool:
+        return _normalize_company_name(candidate.text) in lookup.name_to_company
+
     def match(
         self,
         candidate: Candidate,
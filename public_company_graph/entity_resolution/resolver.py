@@ -7,11 +7,14 @@ Orchestrates the full entity resolution pipeline:
 3. Match against lookup
 4. Score confidence
 
-Each step is testable independently.
+Each step is testable independently. Candidates are streamed through the
+pipeline, and candidates that no matcher can resolve are rejected before any
+per-stage result objects are allocated.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -21,6 +24,7 @@ from public_company_graph.entity_resolution.candidates import (
     CapitalizedWordExtractor,
     TickerExtractor,
     extract_candidates,
+    iter_unique_candidates,
 )
 from public_company_graph.entity_resolution.filters import (
     CandidateFilter,
@@ -49,7 +53,7 @@ from public_company_graph.parsing.business_relationship_extraction import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Complete result of entity resolution."""
 
@@ -119,11 +123,10 @@ class EntityResolver:
             LengthFilter(),
         ]
 
-        self.matchers = matchers or [
-            ExactTickerMatcher(),
-            ExactNameMatcher(),
-            NormalizedNameMatcher(),
-        ]
+        self.matchers = sorted(
+            matchers or [ExactTickerMatcher(), ExactNameMatcher(), NormalizedNameMatcher()],
+            key=lambda m: m.priority,
+        )
 
         self.scorer = scorer or RuleBasedScorer()
         self.min_confidence = min_confidence
@@ -145,13 +148,29 @@ class EntityResolver:
         Returns:
             List of ResolutionResult for each resolved entity
         """
-        results: list[ResolutionResult] = []
+        return list(self.iter_resolve(text, lookup, context))
+
+    def iter_resolve(
+        self,
+        text: str,
+        lookup: CompanyLookup,
+        context: dict | None = None,
+    ) -> Iterator[ResolutionResult]:
+        """
+        Stream resolved company mentions from text.
+
+        Same results as resolve(), yielded as they are found.
+        """
         seen_ciks: set[str] = set()
+        self_cik = context.get("self_cik") if context else None
 
         # 1. Extract candidates
-        candidates = extract_candidates(text, self.extractors)
+        for candidate in iter_unique_candidates(text, self.extractors):
+            # Most candidates ("The", "Our", ...) are not in the lookup at all;
+            # reject them before running filters or allocating results
+            if not any(m.could_match(candidate, lookup) for m in self.matchers):
+                continue
 
-        for candidate in candidates:
             # 2. Filter
             filter_result = filter_candidate(candidate, self.filters, context)
             if not filter_result.passed:
@@ -163,7 +182,6 @@ class EntityResolver:
                 continue
 
             # Skip self-references
-            self_cik = context.get("self_cik") if context else None
             if self_cik and match_result.cik == self_cik:
                 continue
 
@@ -180,24 +198,20 @@ class EntityResolver:
 
             seen_ciks.add(match_result.cik)  # type: ignore
 
-            results.append(
-                ResolutionResult(
-                    raw_text=candidate.text,
-                    sentence=candidate.sentence,
-                    matched=True,
-                    cik=match_result.cik,
-                    ticker=match_result.ticker,
-                    name=match_result.name,
-                    confidence=confidence_result.final_confidence,
-                    candidate=candidate,
-                    filter_result=filter_result,
-                    match_result=match_result,
-                    confidence_result=confidence_result,
-                )
+            yield ResolutionResult(
+                raw_text=candidate.text,
+                sentence=candidate.sentence,
+                matched=True,
+                cik=match_result.cik,
+                ticker=match_result.ticker,
+                name=match_result.name,
+                confidence=confidence_result.final_confidence,
+                candidate=candidate,
+                filter_result=filter_result,
+                match_result=match_result,
+                confidence_result=confidence_result,
             )
 
-        return results
-
     def resolve_with_stats(
         self,
         text: str,
@@ -14,7 +14,7 @@ from public_company_graph.entity_resolution.candidates import Candidate
 from public_company_graph.entity_resolution.matchers import MatchResult, MatchType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoringFactors:
     """Individual factors that contribute to confidence score."""
 
@@ -25,7 +25,7 @@ class ScoringFactors:
     semantic_similarity: float  # Semantic match quality (0-1)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfidenceResult:
     """Result of confidence scoring."""
 
@@ -2,36 +2,58 @@
 Graph Data Science utilities.
 
 This module provides GDS algorithm implementations:
-- Technology adoption prediction (Personalized PageRank)
+- Technology adoption prediction (Personalized PageRank, GDS or in-process sparse)
 - Technology affinity bundling (Node Similarity)
 - Company description similarity (Cosine similarity on embeddings)
-- Company technology similarity (Jaccard on technology sets)
+- Company technology similarity (Jaccard on technology sets, GDS or in-process sparse)
+- Competitive network analytics (PageRank, Louvain, degree, betweenness; GDS or
+  in-process sparse)
 """
 
 from public_company_graph.gds.company_similarity import compute_company_description_similarity
-from public_company_graph.gds.company_tech import compute_company_technology_similarity
+from public_company_graph.gds.company_tech import (
+    compute_company_technology_similarity,
+    compute_company_technology_similarity_sparse,
+)
 from public_company_graph.gds.competitive_analytics import (
     compute_all_competitive_analytics,
+    compute_all_competitive_analytics_sparse,
     compute_betweenness_centrality,
     compute_competitive_communities,
     compute_competitive_pagerank,
     compute_degree_centrality,
 )
-from public_company_graph.gds.tech_adoption import compute_tech_adoption_prediction
+from public_company_graph.gds.tech_adoption import (
+    compute_tech_adoption_prediction,
+    compute_tech_adoption_prediction_sparse,
+)
 from public_company_graph.gds.tech_affinity import compute_tech_affinity_bundling
-from public_company_graph.gds.utils import cleanup_leftover_graphs, get_gds_client, safe_drop_graph
+from public_company_graph.gds.utils import (
+    GraphProjectionManager,
+    ProjectionSpec,
+    cleanup_leftover_graphs,
+    get_gds_client,
+    safe_drop_graph,
+    write_relationships,
+)
 
 __all__ = [
     "compute_tech_adoption_prediction",
+    "compute_tech_adoption_prediction_sparse",
     "compute_tech_affinity_bundling",
     "compute_company_description_similarity",
     "compute_company_technology_similarity",
+    "compute_company_technology_similarity_sparse",
     "compute_competitive_pagerank",
     "compute_competitive_communities",
     "compute_degree_centrality",
     "compute_betweenness_centrality",
     "compute_all_competitive_analytics",
+    "compute_all_competitive_analytics_sparse",
     "get_gds_client",
     "safe_drop_graph",
     "cleanup_leftover_graphs",
+    "GraphProjectionManager",
+    "ProjectionSpec",
+    "write_relationships",
 ]
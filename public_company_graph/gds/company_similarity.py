@@ -6,14 +6,20 @@ Example: Companies in similar industries, with similar business models.
 """
 
 import logging
+from collections.abc import Iterable
+
+import numpy as np
 
 from public_company_graph.constants import (
     DEFAULT_SIMILARITY_THRESHOLD,
     DEFAULT_TOP_K,
     MIN_DESCRIPTION_LENGTH_FOR_SIMILARITY,
 )
-from public_company_graph.neo4j.utils import safe_single
-from public_company_graph.similarity.cosine import find_top_k_similar_pairs
+from public_company_graph.gds.utils import write_relationships
+from public_company_graph.similarity.cosine import (
+    delete_similarity_relationships,
+    find_top_k_similar_pairs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +31,18 @@ def compute_company_description_similarity(
     database: str | None = None,
     execute: bool = True,
     logger: logging.Logger | None = None,
+    keys: Iterable[str] | None = None,
 ) -> int:
     """
     Company Description Similarity.
 
     Find companies with similar descriptions using cosine similarity on embeddings.
 
+    With keys (e.g. the companies whose embeddings changed), only their top-k lists
+    are recomputed against all companies and only their edges are replaced. An edge
+    from an unchanged company into a changed one is kept only if it is also in the
+    changed company's top-k; a full run restores the exact result.
+
     Args:
         driver: Neo4j driver instance
         similarity_threshold: Minimum cosine similarity
@@ -38,6 +50,7 @@ def compute_company_description_similarity(
         database: Neo4j database name
         execute: If False, only print plan
         logger: Optional logger instance
+        keys: Only recompute these companies' relationships (None recomputes all)
 
     Returns:
         Number of SIMILAR_DESCRIPTION relationships created
@@ -66,21 +79,22 @@ def compute_company_description_similarity(
     relationships_written = 0
 
     try:
-        # Delete existing relationships
+        if keys is not None:
+            keys = set(keys)
+            logger.info(f"   Incremental: recomputing {len(keys)} changed companies")
+        # Delete existing relationships (all, or those of the changed companies)
         logger.info("   Deleting existing SIMILAR_DESCRIPTION relationships (Company-Company)...")
-        with driver.session(database=database) as session:
-            result = session.run(
-                """
-                MATCH (c1:Company)-[r:SIMILAR_DESCRIPTION]->(c2:Company)
-                DELETE r
-                RETURN count(r) AS deleted
-                """
-            )
-            deleted = safe_single(result, default=0, key="deleted")
-            if deleted > 0:
-                logger.info(f"   ✓ Deleted {deleted} existing relationships")
-            else:
-                logger.info("   ✓ No existing relationships to delete")
+        deleted = delete_similarity_relationships(
+            driver,
+            "Company",
+            "cik",
+            "SIMILAR_DESCRIPTION",
+            keys=keys,
+            database=database,
+            logger_instance=logger,
+        )
+        if deleted == 0:
+            logger.info("   ✓ No existing relationships to delete")
 
         with driver.session(database=database) as session:
             # Load companies with embeddings and meaningful descriptions
@@ -122,57 +136,33 @@ def compute_company_description_similarity(
                 embeddings=embeddings,
                 similarity_threshold=similarity_threshold,
                 top_k=top_k,
+                rows=keys,
             )
 
             logger.info(f"   Found {len(pairs)} unique similar pairs")
 
             # Write relationships (bidirectional - both directions for symmetric similarity)
             logger.info("   Writing SIMILAR_DESCRIPTION relationships (bidirectional)...")
-            batch = []
-
-            for (cik1, cik2), score in pairs.items():
-                batch.append({"cik1": cik1, "cik2": cik2, "score": score})
-
-                if len(batch) >= 1000:
-                    session.run(
-                        """
-                        UNWIND $batch AS rel
-                        MATCH (c1:Company {cik: rel.cik1})
-                        MATCH (c2:Company {cik: rel.cik2})
-                        WHERE c1 <> c2
-                        MERGE (c1)-[r1:SIMILAR_DESCRIPTION]->(c2)
-                        SET r1.score = rel.score,
-                            r1.metric = 'COSINE',
-                            r1.computed_at = datetime()
-                        MERGE (c2)-[r2:SIMILAR_DESCRIPTION]->(c1)
-                        SET r2.score = rel.score,
-                            r2.metric = 'COSINE',
-                            r2.computed_at = datetime()
-                        """,
-                        batch=batch,
-                    )
-                    relationships_written += len(batch) * 2  # Both directions
-                    batch = []
-
-            if batch:
-                session.run(
-                    """
-                    UNWIND $batch AS rel
-                    MATCH (c1:Company {cik: rel.cik1})
-                    MATCH (c2:Company {cik: rel.cik2})
-                    WHERE c1 <> c2
-                    MERGE (c1)-[r1:SIMILAR_DESCRIPTION]->(c2)
-                    SET r1.score = rel.score,
-                        r1.metric = 'COSINE',
-                        r1.computed_at = datetime()
-                    MERGE (c2)-[r2:SIMILAR_DESCRIPTION]->(c1)
-                    SET r2.score = rel.score,
-                        r2.metric = 'COSINE',
-                        r2.computed_at = datetime()
-                    """,
-                    batch=batch,
-                )
-                relationships_written += len(batch) * 2  # Both directions
+            cik_pairs = list(pairs)
+            relationships_written = write_relationships(
+                driver,
+                "SIMILAR_DESCRIPTION",
+                "Company",
+                "Company",
+                {
+                    "source": np.array([cik1 for cik1, _ in cik_pairs], dtype=object),
+                    "target": np.array([cik2 for _, cik2 in cik_pairs], dtype=object),
+                    "score": np.fromiter(pairs.values(), dtype=np.float64, count=len(pairs)),
+                },
+                source_key="cik",
+                target_key="cik",
+                fresh=True,  # every pair's existing relationships were deleted above
+                bidirectional=True,
+                expressions={"metric": "'COSINE'", "computed_at": "datetime()"},
+                database=database,
+                batch_size=1000,
+                logger=logger,
+            )
 
             logger.info(f"   ✓ Created {relationships_written} SIMILAR_DESCRIPTION relationships")
             logger.info("   ✓ Complete")
@@ -182,5 +172,7 @@ def compute_company_description_similarity(
         import traceback
 
         logger.error(traceback.format_exc())
+        # Callers tracking changed companies must not treat them as processed
+        raise
 
     return relationships_written
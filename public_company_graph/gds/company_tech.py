@@ -2,11 +2,14 @@
 Company Technology Similarity using GDS Node Similarity (Jaccard).
 
 Finds companies with similar technology stacks by creating a Company-Technology
-bipartite graph and running GDS Node Similarity (Jaccard) on Company nodes.
+bipartite graph and running GDS Node Similarity (Jaccard) on Company nodes, or the
+same computation in-process with sparse matrices when GDS is unavailable.
 """
 
 import logging
+import time
 
+import numpy as np
 import pandas as pd
 
 from public_company_graph.constants import (
@@ -14,11 +17,39 @@ from public_company_graph.constants import (
     DEFAULT_JACCARD_THRESHOLD,
     DEFAULT_TOP_K,
 )
-from public_company_graph.gds.utils import safe_drop_graph
+from public_company_graph.gds.sparse import BipartiteGraph, jaccard_top_k, jaccard_top_k_lsh
+from public_company_graph.gds.utils import (
+    GraphProjectionManager,
+    ProjectionSpec,
+    similarity_result_columns,
+    write_relationships,
+)
 from public_company_graph.neo4j.utils import safe_single
 
 logger = logging.getLogger(__name__)
 
+# Company count from which the sparse backend switches from exact sparse products to
+# MinHash/LSH candidates (the exact product grows with pairs sharing any technology)
+LSH_MIN_COMPANIES = 50_000
+
+# Bipartite Company-Technology graph (through Domain, so a Cypher projection)
+COMPANY_TECH_PROJECTION = ProjectionSpec(
+    name="company_tech_graph",
+    labels=("Company", "Technology", "Domain"),
+    relationship_types=("HAS_DOMAIN", "USES"),
+    node_query="""
+        MATCH (c:Company)
+        RETURN id(c) AS id
+        UNION
+        MATCH (t:Technology)
+        RETURN id(t) AS id
+        """,
+    relationship_query="""
+        MATCH (c:Company)-[:HAS_DOMAIN]->(d:Domain)-[:USES]->(t:Technology)
+        RETURN id(c) AS source, id(t) AS target
+        """,
+)
+
 
 def compute_company_technology_similarity(
     gds,
@@ -28,6 +59,7 @@ def compute_company_technology_similarity(
     database: str | None = None,
     execute: bool = True,
     batch_size: int = BATCH_SIZE_LARGE,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -43,6 +75,7 @@ def compute_company_technology_similarity(
         database: Neo4j database name
         execute: If False, only print plan
         batch_size: Batch size for writing relationships
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -72,44 +105,13 @@ def compute_company_technology_similarity(
     relationships_written = 0
 
     try:
-        # Delete existing relationships
-        logger.info("   Deleting existing SIMILAR_TECHNOLOGY relationships...")
-        with driver.session(database=database) as session:
-            result = session.run(
-                """
-                MATCH (c1:Company)-[r:SIMILAR_TECHNOLOGY]->(c2:Company)
-                DELETE r
-                RETURN count(r) AS deleted
-                """
-            )
-            deleted = safe_single(result, default=0, key="deleted")
-            if deleted > 0:
-                logger.info(f"   ✓ Deleted {deleted} existing relationships")
-            else:
-                logger.info("   ✓ No existing relationships to delete")
+        _delete_existing_similarities(driver, database, logger)
 
         # Create bipartite Company-Technology projection
+        if projections is None:
+            projections = GraphProjectionManager(gds, database, keep_alive=False, logger=logger)
         logger.info("   Creating bipartite Company-Technology graph...")
-        graph_name = f"company_tech_graph_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
-        G_company_tech, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (c:Company)
-            RETURN id(c) AS id
-            UNION
-            MATCH (t:Technology)
-            RETURN id(t) AS id
-            """,
-            """
-            MATCH (c:Company)-[:HAS_DOMAIN]->(d:Domain)-[:USES]->(t:Technology)
-            RETURN id(c) AS source, id(t) AS target
-            """,
-        )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created bipartite graph: {node_count} nodes, {rel_count} relationships")
+        G_company_tech, _ = projections.get(COMPANY_TECH_PROJECTION)
 
         # Run Node Similarity
         logger.info("   Computing Node Similarity (Jaccard) using GDS...")
@@ -122,87 +124,44 @@ def compute_company_technology_similarity(
             topK=top_k,
         )
 
+        node_id1, node_id2, similarity = similarity_result_columns(similarity_result, logger)
+
         # Filter to Company-Company pairs only
         logger.info("   Filtering results to Company-Company pairs only...")
 
         with driver.session(database=database) as session:
             result = session.run("MATCH (c:Company) RETURN collect(id(c)) AS company_ids")
             record = safe_single(result, default={})
-            company_ids = set(record.get("company_ids", [])) if record else set()
+            company_ids = np.asarray(
+                record.get("company_ids", []) if record else [], dtype=np.int64
+            )
 
-        if isinstance(similarity_result, pd.DataFrame):
-            col1, col2 = _identify_node_columns(similarity_result)
-            if col1 and col2:
-                similarity_result = similarity_result[
-                    (similarity_result[col1].isin(company_ids))
-                    & (similarity_result[col2].isin(company_ids))
-                ]
-                logger.info(f"   Filtered to {len(similarity_result)} Company-Company similarities")
+        is_company_pair = np.isin(node_id1, company_ids) & np.isin(node_id2, company_ids)
+        node_id1, node_id2, similarity = (
+            node_id1[is_company_pair],
+            node_id2[is_company_pair],
+            similarity[is_company_pair],
+        )
+        logger.info(f"   Filtered to {len(similarity)} Company-Company similarities")
 
         # Write results
         logger.info("   Writing SIMILAR_TECHNOLOGY relationships in batches...")
 
         with driver.session(database=database) as session:
-            batch = _build_batch(similarity_result, logger)
-
             # Get CIK mapping
-            cik_map = {}
             result = session.run("MATCH (c:Company) RETURN id(c) AS node_id, c.cik AS cik")
-            for record in result:
-                cik_map[record["node_id"]] = record["cik"]
+            cik_by_node = pd.Series(
+                {record["node_id"]: record["cik"] for record in result}, dtype=object
+            )
 
             # Ensure consistent direction
             logger.info("   Ensuring consistent relationship direction...")
-            directed_batch: dict[tuple[str, str], dict[str, str | float]] = {}
-            for rel in batch:
-                cik1 = cik_map.get(rel["node_id1"])
-                cik2 = cik_map.get(rel["node_id2"])
-
-                if cik1 and cik2:
-                    if cik1 > cik2:
-                        cik1, cik2 = cik2, cik1
-
-                    pair_key = (cik1, cik2)
-                    if (
-                        pair_key not in directed_batch
-                        or rel["similarity"] > directed_batch[pair_key]["similarity"]
-                    ):
-                        directed_batch[pair_key] = {
-                            "cik1": cik1,
-                            "cik2": cik2,
-                            "similarity": rel["similarity"],
-                        }
-
-            batch = list(directed_batch.values())
-
-            # Write in batches
-            logger.info(f"   Writing {len(batch)} relationships in batches of {batch_size}...")
-            for i in range(0, len(batch), batch_size):
-                batch_chunk = batch[i : i + batch_size]
-                result = session.run(
-                    """
-                    UNWIND $batch AS rel
-                    MATCH (c1:Company {cik: rel.cik1})
-                    MATCH (c2:Company {cik: rel.cik2})
-                    WHERE c1 <> c2
-                    MERGE (c1)-[r:SIMILAR_TECHNOLOGY]->(c2)
-                    SET r.score = rel.similarity,
-                        r.metric = 'JACCARD',
-                        r.computed_at = datetime()
-                    RETURN count(r) AS created
-                    """,
-                    batch=batch_chunk,
-                )
-                created = safe_single(result, default=0, key="created")
-                if created:
-                    relationships_written += created
-
-                if (i + batch_size) % (batch_size * 10) == 0 or i + batch_size >= len(batch):
-                    progress = min(i + batch_size, len(batch))
-                    logger.info(f"   Progress: {progress}/{len(batch)} written...")
+            pairs = _directed_cik_pairs(cik_by_node, node_id1, node_id2, similarity)
+
+        relationships_written = _write_similarities(driver, database, pairs, batch_size, logger)
 
         logger.info(f"   ✓ Created {relationships_written} SIMILAR_TECHNOLOGY relationships")
-        G_company_tech.drop()
+        projections.release(COMPANY_TECH_PROJECTION)
         logger.info("   ✓ Complete")
 
     except Exception as e:
@@ -214,59 +173,182 @@ def compute_company_technology_similarity(
     return relationships_written
 
 
-def _identify_node_columns(df: pd.DataFrame):
-    """Identify node ID columns in a DataFrame."""
-    col1 = col2 = None
-    for col in df.columns:
-        col_lower = col.lower()
-        if col_lower in ["nodeid1", "node1", "source"]:
-            col1 = col
-        elif col_lower in ["nodeid2", "node2", "target"]:
-            col2 = col
-    return col1, col2
-
-
-def _build_batch(similarity_result, logger):
-    """Build batch list from similarity result."""
-    batch = []
-
-    if isinstance(similarity_result, pd.DataFrame):
-        col1, col2 = _identify_node_columns(similarity_result)
-        sim_col = None
-        for col in similarity_result.columns:
-            if col.lower() in ["similarity", "score", "weight"]:
-                sim_col = col
-                break
-
-        if col1 and col2 and sim_col:
-            logger.info(f"   Using columns: {col1}, {col2}, {sim_col}")
-            for _, row in similarity_result.iterrows():
-                batch.append(
-                    {
-                        "node_id1": int(row[col1]),
-                        "node_id2": int(row[col2]),
-                        "similarity": float(row[sim_col]),
-                    }
-                )
+def compute_company_technology_similarity_sparse(
+    driver,
+    similarity_threshold: float = DEFAULT_JACCARD_THRESHOLD,
+    top_k: int = DEFAULT_TOP_K,
+    database: str | None = None,
+    execute: bool = True,
+    batch_size: int = BATCH_SIZE_LARGE,
+    lsh_min_companies: int = LSH_MIN_COMPANIES,
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Company Technology Similarity using in-process sparse Jaccard (no GDS).
+
+    Exports the Company×Technology incidence once (a company uses a technology if any
+    of its domains does) into a CSR matrix and computes each company's top_k Jaccard
+    neighbours with sparse products. From lsh_min_companies companies on, candidates
+    come from MinHash/LSH banding instead and are re-scored exactly. Results are
+    written exactly like the GDS backend.
+
+    Args:
+        driver: Neo4j driver instance
+        similarity_threshold: Minimum Jaccard similarity
+        top_k: Max similar companies per company
+        database: Neo4j database name
+        execute: If False, only print plan
+        batch_size: Batch size for writing relationships
+        lsh_min_companies: Company count from which MinHash/LSH is used
+        logger: Optional logger instance
+
+    Returns:
+        Number of SIMILAR_TECHNOLOGY relationships created
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    if not execute:
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("4. Company Technology Similarity (Dry Run)")
+        logger.info("=" * 70)
+        logger.info("   Use case: Find companies with similar technology stacks")
+        logger.info("   Relationship: Company-[SIMILAR_TECHNOLOGY {score}]->Company")
+        logger.info("   Algorithm: Jaccard (in-process sparse backend)")
+        return 0
+
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("4. Company Technology Similarity")
+    logger.info("=" * 70)
+    logger.info("   Use case: Find companies with similar technology stacks")
+    logger.info("   Relationship: Company-[SIMILAR_TECHNOLOGY {score}]->Company")
+    logger.info("   Algorithm: Jaccard (in-process sparse backend)")
+
+    start_time = time.perf_counter()
+    with driver.session(database=database) as session:
+        result = session.run(
+            """
+            MATCH (c:Company)-[:HAS_DOMAIN]->(:Domain)-[:USES]->(t:Technology)
+            WHERE c.cik IS NOT NULL
+            RETURN DISTINCT c.cik AS cik, id(t) AS tech_id
+            """
+        )
+        ciks, tech_ids = [], []
+        for record in result:
+            ciks.append(record["cik"])
+            tech_ids.append(record["tech_id"])
+
+    if not ciks:
+        logger.info("   ⚠ No Company-Technology edges found - skipping")
+        return 0
+
+    graph = BipartiteGraph.from_edges(ciks, tech_ids)
+    n_companies = len(graph.left_ids)
+    logger.info(
+        f"   ✓ Exported {graph.matrix.nnz} Company-Technology pairs "
+        f"({n_companies} companies, {len(graph.right_ids)} technologies) "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+    logger.info(f"   Threshold: {similarity_threshold}, Top-K: {top_k}")
+
+    if n_companies >= lsh_min_companies and similarity_threshold > 0:
+        logger.info("   Generating candidates with MinHash/LSH...")
+        rows, cols, similarity = jaccard_top_k_lsh(graph.matrix, top_k, similarity_threshold)
     else:
-        for row in similarity_result:
-            if isinstance(row, dict):
-                batch.append(
-                    {
-                        "node_id1": int(row.get("nodeId1", row.get("node1", row.get("source")))),
-                        "node_id2": int(row.get("nodeId2", row.get("node2", row.get("target")))),
-                        "similarity": float(
-                            row.get("similarity", row.get("score", row.get("weight")))
-                        ),
-                    }
-                )
-            else:
-                batch.append(
-                    {
-                        "node_id1": int(row[0]),
-                        "node_id2": int(row[1]),
-                        "similarity": float(row[2]),
-                    }
-                )
-
-    return batch
+        rows, cols, similarity = jaccard_top_k(graph.matrix, top_k, similarity_threshold)
+    pairs = _canonical_cik_pairs(graph.left_ids[rows], graph.left_ids[cols], similarity)
+    logger.info(
+        f"   ✓ Computed {len(pairs)} similar pairs in {time.perf_counter() - start_time:.1f}s"
+    )
+
+    _delete_existing_similarities(driver, database, logger)
+    relationships_written = _write_similarities(driver, database, pairs, batch_size, logger)
+
+    logger.info(f"   ✓ Created {relationships_written} SIMILAR_TECHNOLOGY relationships")
+    logger.info("   ✓ Complete")
+    return relationships_written
+
+
+def _delete_existing_similarities(driver, database: str | None, logger: logging.Logger) -> None:
+    """Delete all SIMILAR_TECHNOLOGY relationships before a full recompute."""
+    logger.info("   Deleting existing SIMILAR_TECHNOLOGY relationships...")
+    with driver.session(database=database) as session:
+        result = session.run(
+            """
+            MATCH (c1:Company)-[r:SIMILAR_TECHNOLOGY]->(c2:Company)
+            DELETE r
+            RETURN count(r) AS deleted
+            """
+        )
+        deleted = safe_single(result, default=0, key="deleted")
+        if deleted > 0:
+            logger.info(f"   ✓ Deleted {deleted} existing relationships")
+        else:
+            logger.info("   ✓ No existing relationships to delete")
+
+
+def _write_similarities(
+    driver, database: str | None, pairs: pd.DataFrame, batch_size: int, logger
+) -> int:
+    """CREATE (cik1)-[:SIMILAR_TECHNOLOGY]->(cik2) for each row (existing ones are deleted)."""
+    logger.info(f"   Writing {len(pairs)} relationships in batches of {batch_size}...")
+    return write_relationships(
+        driver,
+        "SIMILAR_TECHNOLOGY",
+        "Company",
+        "Company",
+        {
+            "source": pairs["cik1"].to_numpy(),
+            "target": pairs["cik2"].to_numpy(),
+            "score": pairs["similarity"].to_numpy(),
+        },
+        source_key="cik",
+        target_key="cik",
+        fresh=True,
+        expressions={"metric": "'JACCARD'", "computed_at": "datetime()"},
+        database=database,
+        batch_size=batch_size,
+        logger=logger,
+    )
+
+
+def _directed_cik_pairs(
+    cik_by_node: pd.Series,
+    node_id1: np.ndarray,
+    node_id2: np.ndarray,
+    similarity: np.ndarray,
+) -> pd.DataFrame:
+    """Map node id pairs to CIK pairs (see _canonical_cik_pairs)."""
+    return _canonical_cik_pairs(
+        cik_by_node.reindex(node_id1).to_numpy(),
+        cik_by_node.reindex(node_id2).to_numpy(),
+        similarity,
+    )
+
+
+def _canonical_cik_pairs(
+    cik1: np.ndarray, cik2: np.ndarray, similarity: np.ndarray
+) -> pd.DataFrame:
+    """
+    Turn CIK pairs into (lower CIK, higher CIK) pairs, keeping the max similarity.
+
+    Node Similarity returns both (a, b) and (b, a); one undirected edge is kept per pair.
+    Pairs missing a CIK are dropped.
+    """
+    pairs = pd.DataFrame({"cik1": cik1, "cik2": cik2, "similarity": similarity})
+    has_ciks = pairs["cik1"].fillna("").astype(bool) & pairs["cik2"].fillna("").astype(bool)
+    pairs = pairs[has_ciks]
+    if pairs.empty:
+        return pairs
+
+    swap = (pairs["cik1"] > pairs["cik2"]).to_numpy()
+    low = np.where(swap, pairs["cik2"], pairs["cik1"])
+    high = np.where(swap, pairs["cik1"], pairs["cik2"])
+    pairs = pairs.assign(cik1=low, cik2=high)
+    return (
+        pairs.sort_values("similarity", ascending=False, kind="stable")
+        .drop_duplicates(["cik1", "cik2"])
+        .sort_index()
+    )
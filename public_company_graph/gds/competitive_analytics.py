@@ -6,15 +6,74 @@ Computes:
 - Louvain: Competitive communities/clusters
 - Degree Centrality: Most threatened/threatening companies
 - Betweenness Centrality: Bridge companies connecting industries
+
+compute_all_competitive_analytics shares one projection across all four algorithms
+(mutate mode, then a single write); compute_all_competitive_analytics_sparse computes
+the same properties in-process with NumPy/SciPy when GDS is unavailable.
 """
 
 import logging
-
-from public_company_graph.gds.utils import safe_drop_graph
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from public_company_graph.constants import (
+    BATCH_SIZE_LARGE,
+    DEFAULT_DAMPING_FACTOR,
+    DEFAULT_MAX_ITERATIONS,
+)
+from public_company_graph.gds.sparse import betweenness_centrality, louvain_communities, pagerank
+from public_company_graph.gds.utils import (
+    GraphProjectionManager,
+    ProjectionSpec,
+    write_unwind_batches,
+)
 from public_company_graph.neo4j.utils import safe_single
 
 logger = logging.getLogger(__name__)
 
+# Company properties written by the competitive analytics
+PAGERANK_PROPERTY = "competitive_pagerank"
+COMMUNITY_PROPERTY = "competitive_community"
+IN_DEGREE_PROPERTY = "competitive_in_degree"
+OUT_DEGREE_PROPERTY = "competitive_out_degree"
+BETWEENNESS_PROPERTY = "competitive_betweenness"
+
+
+# All companies and HAS_COMPETITOR edges (natural direction), projected natively
+COMPETITIVE_PROJECTION = ProjectionSpec(
+    name="competitive_graph",
+    labels=("Company",),
+    relationship_types=("HAS_COMPETITOR",),
+    node_projection="Company",
+    relationship_projection="HAS_COMPETITOR",
+)
+
+
+def _project_competitive_graph(
+    gds,
+    driver,
+    database: str | None,
+    projections: GraphProjectionManager | None,
+    logger: logging.Logger,
+):
+    """Competitive projection; returns (manager, graph, node count)."""
+    if projections is None:
+        projections = GraphProjectionManager(gds, database, keep_alive=False, logger=logger)
+    logger.info("   Creating competitive graph projection...")
+    G_comp, counts = projections.get(COMPETITIVE_PROJECTION)
+    return projections, G_comp, counts["nodeCount"]
+
+
+def _result_value(result, key: str, default):
+    """Value of a GDS result row (Series or dict), or default if absent."""
+    if hasattr(result, "get"):
+        value = result.get(key, default)
+        return default if value is None else value
+    return default
+
 
 def compute_competitive_pagerank(
     gds,
@@ -22,6 +81,7 @@ def compute_competitive_pagerank(
     database: str | None = None,
     max_iterations: int = 20,
     damping_factor: float = 0.85,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -36,6 +96,7 @@ def compute_competitive_pagerank(
         database: Neo4j database name
         max_iterations: Max PageRank iterations
         damping_factor: PageRank damping factor
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -52,25 +113,9 @@ def compute_competitive_pagerank(
     logger.info("   Property: Company.competitive_pagerank")
 
     try:
-        # Create competitive graph projection
-        graph_name = f"competitive_graph_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
-        logger.info("   Creating competitive graph projection...")
-        G_comp, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (c:Company)
-            RETURN id(c) AS id
-            """,
-            """
-            MATCH (a:Company)-[:HAS_COMPETITOR]->(b:Company)
-            RETURN id(a) AS source, id(b) AS target
-            """,
+        projections, G_comp, node_count = _project_competitive_graph(
+            gds, driver, database, projections, logger
         )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created graph: {node_count} nodes, {rel_count} relationships")
 
         # Compute PageRank
         logger.info("   Computing PageRank...")
@@ -78,7 +123,7 @@ def compute_competitive_pagerank(
             G_comp,
             maxIterations=max_iterations,
             dampingFactor=damping_factor,
-            writeProperty="competitive_pagerank",
+            writeProperty=PAGERANK_PROPERTY,
         )
         # Result is a Series - get the value
         if hasattr(result, "get"):
@@ -90,7 +135,7 @@ def compute_competitive_pagerank(
         logger.info(f"   ✓ Computed PageRank for {nodes_written} companies")
 
         # Clean up
-        G_comp.drop()
+        projections.release(COMPETITIVE_PROJECTION)
         logger.info("   ✓ Complete")
 
         return nodes_written
@@ -109,6 +154,7 @@ def compute_competitive_communities(
     database: str | None = None,
     max_levels: int = 10,
     max_iterations: int = 10,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -122,6 +168,7 @@ def compute_competitive_communities(
         database: Neo4j database name
         max_levels: Max Louvain levels
         max_iterations: Max iterations per level
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -138,25 +185,9 @@ def compute_competitive_communities(
     logger.info("   Property: Company.competitive_community")
 
     try:
-        # Create competitive graph projection
-        graph_name = f"competitive_graph_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
-        logger.info("   Creating competitive graph projection...")
-        G_comp, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (c:Company)
-            RETURN id(c) AS id
-            """,
-            """
-            MATCH (a:Company)-[:HAS_COMPETITOR]->(b:Company)
-            RETURN id(a) AS source, id(b) AS target
-            """,
+        projections, G_comp, node_count = _project_competitive_graph(
+            gds, driver, database, projections, logger
         )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created graph: {node_count} nodes, {rel_count} relationships")
 
         # Compute Louvain communities
         logger.info("   Computing Louvain communities...")
@@ -164,7 +195,7 @@ def compute_competitive_communities(
             G_comp,
             maxLevels=max_levels,
             maxIterations=max_iterations,
-            writeProperty="competitive_community",
+            writeProperty=COMMUNITY_PROPERTY,
         )
         # Result is a Series - get the values
         if hasattr(result, "get"):
@@ -179,7 +210,7 @@ def compute_competitive_communities(
         logger.info(f"   ✓ Found {communities} communities across {nodes_written} companies")
 
         # Clean up
-        G_comp.drop()
+        projections.release(COMPETITIVE_PROJECTION)
         logger.info("   ✓ Complete")
 
         return communities
@@ -192,6 +223,42 @@ def compute_competitive_communities(
         return 0
 
 
+def _write_degrees(driver, database: str | None, logger: logging.Logger) -> int:
+    """
+    Set integer in/out-degree on companies with HAS_COMPETITOR edges in that direction.
+
+    Companies without such edges are left untouched, so the properties stay absent
+    rather than 0.
+    """
+    with driver.session(database=database) as session:
+        # Compute in-degree (cited as competitor)
+        logger.info("   Computing in-degree (threatened)...")
+        result = session.run(
+            """
+            MATCH (c:Company)<-[:HAS_COMPETITOR]-(:Company)
+            WITH c, count(*) as in_degree
+            SET c.competitive_in_degree = in_degree
+            RETURN count(c) as updated
+            """
+        )
+        in_degree_count = safe_single(result, default=0, key="updated")
+        logger.info(f"   ✓ Updated in-degree for {in_degree_count} companies")
+
+        # Compute out-degree (cites competitors)
+        logger.info("   Computing out-degree (threatening)...")
+        result = session.run(
+            """
+            MATCH (c:Company)-[:HAS_COMPETITOR]->(:Company)
+            WITH c, count(*) as out_degree
+            SET c.competitive_out_degree = out_degree
+            RETURN count(c) as updated
+            """
+        )
+        out_degree_count = safe_single(result, default=0, key="updated")
+        logger.info(f"   ✓ Updated out-degree for {out_degree_count} companies")
+    return max(in_degree_count, out_degree_count)
+
+
 def compute_degree_centrality(
     driver,
     database: str | None = None,
@@ -222,35 +289,9 @@ def compute_degree_centrality(
     logger.info("   Properties: Company.competitive_in_degree, Company.competitive_out_degree")
 
     try:
-        with driver.session(database=database) as session:
-            # Compute in-degree (cited as competitor)
-            logger.info("   Computing in-degree (threatened)...")
-            result = session.run(
-                """
-                MATCH (c:Company)<-[:HAS_COMPETITOR]-(:Company)
-                WITH c, count(*) as in_degree
-                SET c.competitive_in_degree = in_degree
-                RETURN count(c) as updated
-                """
-            )
-            in_degree_count = safe_single(result, default=0, key="updated")
-            logger.info(f"   ✓ Updated in-degree for {in_degree_count} companies")
-
-            # Compute out-degree (cites competitors)
-            logger.info("   Computing out-degree (threatening)...")
-            result = session.run(
-                """
-                MATCH (c:Company)-[:HAS_COMPETITOR]->(:Company)
-                WITH c, count(*) as out_degree
-                SET c.competitive_out_degree = out_degree
-                RETURN count(c) as updated
-                """
-            )
-            out_degree_count = safe_single(result, default=0, key="updated")
-            logger.info(f"   ✓ Updated out-degree for {out_degree_count} companies")
-
+        count = _write_degrees(driver, database, logger)
         logger.info("   ✓ Complete")
-        return max(in_degree_count, out_degree_count)
+        return count
 
     except Exception as e:
         logger.error(f"   ✗ Error: {e}")
@@ -264,6 +305,7 @@ def compute_betweenness_centrality(
     gds,
     driver,
     database: str | None = None,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -275,6 +317,7 @@ def compute_betweenness_centrality(
         gds: GDS client instance
         driver: Neo4j driver instance
         database: Neo4j database name
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -291,31 +334,15 @@ def compute_betweenness_centrality(
     logger.info("   Property: Company.competitive_betweenness")
 
     try:
-        # Create competitive graph projection
-        graph_name = f"competitive_graph_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
-        logger.info("   Creating competitive graph projection...")
-        G_comp, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (c:Company)
-            RETURN id(c) AS id
-            """,
-            """
-            MATCH (a:Company)-[:HAS_COMPETITOR]->(b:Company)
-            RETURN id(a) AS source, id(b) AS target
-            """,
+        projections, G_comp, node_count = _project_competitive_graph(
+            gds, driver, database, projections, logger
         )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created graph: {node_count} nodes, {rel_count} relationships")
 
         # Compute betweenness centrality
         logger.info("   Computing betweenness centrality...")
         result = gds.betweenness.write(
             G_comp,
-            writeProperty="competitive_betweenness",
+            writeProperty=BETWEENNESS_PROPERTY,
         )
         # Result is a Series - get the value
         if hasattr(result, "get"):
@@ -327,7 +354,7 @@ def compute_betweenness_centrality(
         logger.info(f"   ✓ Computed betweenness for {nodes_written} companies")
 
         # Clean up
-        G_comp.drop()
+        projections.release(COMPETITIVE_PROJECTION)
         logger.info("   ✓ Complete")
 
         return nodes_written
@@ -344,15 +371,31 @@ def compute_all_competitive_analytics(
     gds,
     driver,
     database: str | None = None,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    damping_factor: float = DEFAULT_DAMPING_FACTOR,
+    max_levels: int = 10,
+    louvain_max_iterations: int = 10,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> dict:
     """
     Compute all competitive graph analytics.
 
+    Projects the competitive graph once, runs PageRank, Louvain and betweenness in
+    mutate mode on that projection and writes them back in a single
+    nodeProperties.write call; in/out-degree are then set with Cypher (integers,
+    only on companies with edges in that direction). The mutated projection is
+    dropped afterwards, even when it came from a shared manager.
+
     Args:
         gds: GDS client instance
         driver: Neo4j driver instance
         database: Neo4j database name
+        max_iterations: Max PageRank iterations
+        damping_factor: PageRank damping factor
+        max_levels: Max Louvain levels
+        louvain_max_iterations: Max iterations per Louvain level
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -366,26 +409,70 @@ def compute_all_competitive_analytics(
     logger.info("Computing All Competitive Graph Analytics")
     logger.info("=" * 70)
 
-    results = {}
+    results = {"pagerank": 0, "communities": 0, "degree": 0, "betweenness": 0}
+    G_comp = None
+    try:
+        projections, G_comp, node_count = _project_competitive_graph(
+            gds, driver, database, projections, logger
+        )
 
-    # PageRank
-    results["pagerank"] = compute_competitive_pagerank(
-        gds, driver, database=database, logger=logger
-    )
+        logger.info("   Computing PageRank...")
+        result = gds.pageRank.mutate(
+            G_comp,
+            maxIterations=max_iterations,
+            dampingFactor=damping_factor,
+            mutateProperty=PAGERANK_PROPERTY,
+        )
+        pagerank_count = _result_value(result, "nodePropertiesWritten", node_count)
 
-    # Louvain communities
-    results["communities"] = compute_competitive_communities(
-        gds, driver, database=database, logger=logger
-    )
+        logger.info("   Computing Louvain communities...")
+        result = gds.louvain.mutate(
+            G_comp,
+            maxLevels=max_levels,
+            maxIterations=louvain_max_iterations,
+            mutateProperty=COMMUNITY_PROPERTY,
+        )
+        communities = _result_value(result, "communityCount", 0)
 
-    # Degree centrality
-    results["degree"] = compute_degree_centrality(driver, database=database, logger=logger)
+        logger.info("   Computing betweenness centrality...")
+        result = gds.betweenness.mutate(G_comp, mutateProperty=BETWEENNESS_PROPERTY)
+        betweenness_count = _result_value(result, "nodePropertiesWritten", node_count)
+
+        logger.info("   Writing all properties...")
+        gds.graph.nodeProperties.write(
+            G_comp,
+            [
+                PAGERANK_PROPERTY,
+                COMMUNITY_PROPERTY,
+                BETWEENNESS_PROPERTY,
+            ],
+        )
+
+        # Degrees go through Cypher: gds.degree writes floats on every projected node
+        logger.info("   Computing degree centrality...")
+        degree_count = _write_degrees(driver, database, logger)
+        results = {
+            "pagerank": pagerank_count,
+            "communities": communities,
+            "degree": degree_count,
+            "betweenness": betweenness_count,
+        }
+    except Exception as e:
+        logger.error(f"   ✗ Error: {e}")
+        import traceback
+
+        logger.error(traceback.format_exc())
+    finally:
+        # The projection now carries mutated properties, so it is never reused
+        if projections is not None and G_comp is not None:
+            projections.drop(COMPETITIVE_PROJECTION)
+
+    _log_summary(results, logger)
+    return results
 
-    # Betweenness centrality
-    results["betweenness"] = compute_betweenness_centrality(
-        gds, driver, database=database, logger=logger
-    )
 
+def _log_summary(results: dict, logger: logging.Logger) -> None:
+    """Log the per-metric counts of a competitive analytics run."""
     logger.info("")
     logger.info("=" * 70)
     logger.info("Competitive Analytics Complete!")
@@ -395,4 +482,150 @@ def compute_all_competitive_analytics(
     logger.info(f"Degree Centrality: {results['degree']} companies")
     logger.info(f"Betweenness Centrality: {results['betweenness']} companies")
 
+
+def compute_all_competitive_analytics_sparse(
+    driver,
+    database: str | None = None,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    damping_factor: float = DEFAULT_DAMPING_FACTOR,
+    max_levels: int = 10,
+    louvain_max_iterations: int = 10,
+    betweenness_samples: int | None = None,
+    warm_start: bool = True,
+    batch_size: int = BATCH_SIZE_LARGE,
+    logger: logging.Logger | None = None,
+) -> dict:
+    """
+    Compute all competitive graph analytics in-process (no GDS).
+
+    Exports HAS_COMPETITOR once into a CSR adjacency matrix and computes PageRank,
+    degree, Louvain (on the undirected view) and Brandes betweenness with
+    NumPy/SciPy, then writes all properties in one UNWIND pass.
+
+    With warm_start, PageRank starts from the stored competitive_pagerank scores, so
+    a rerun after a few edge changes converges in a handful of iterations.
+
+    Args:
+        driver: Neo4j driver instance
+        database: Neo4j database name
+        max_iterations: Max PageRank iterations
+        damping_factor: PageRank damping factor
+        max_levels: Max Louvain levels
+        louvain_max_iterations: Max iterations per Louvain level
+        betweenness_samples: Sampled source nodes for betweenness (None = exact)
+        warm_start: Start PageRank from the previously stored scores
+        batch_size: Companies per write transaction
+        logger: Optional logger instance
+
+    Returns:
+        Dictionary with counts of computed metrics
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("Computing All Competitive Graph Analytics (in-process sparse backend)")
+    logger.info("=" * 70)
+
+    start_time = time.perf_counter()
+    with driver.session(database=database) as session:
+        result = session.run(
+            f"""
+            MATCH (c:Company)
+            RETURN id(c) AS id, c.{PAGERANK_PROPERTY} AS pagerank
+            """
+        )
+        nodes = pd.DataFrame([dict(record) for record in result], columns=["id", "pagerank"])
+        result = session.run(
+            """
+            MATCH (a:Company)-[:HAS_COMPETITOR]->(b:Company)
+            RETURN id(a) AS source, id(b) AS target
+            """
+        )
+        edges = pd.DataFrame([dict(record) for record in result], columns=["source", "target"])
+
+    results = {"pagerank": 0, "communities": 0, "degree": 0, "betweenness": 0}
+    n = len(nodes)
+    if not n:
+        logger.info("   ⚠ No companies found - skipping")
+        return results
+
+    index = pd.Index(nodes["id"])
+    adjacency = sparse.csr_matrix(
+        (
+            np.ones(len(edges)),
+            (index.get_indexer(edges["source"]), index.get_indexer(edges["target"])),
+        ),
+        shape=(n, n),
+    )
+    logger.info(
+        f"   ✓ Exported {n} companies and {len(edges)} HAS_COMPETITOR edges "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+
+    initial = None
+    if warm_start:
+        initial = pd.to_numeric(nodes["pagerank"], errors="coerce").to_numpy(dtype=np.float64)
+        if np.isnan(initial).all():
+            initial = None
+    logger.info(f"   Computing PageRank{' (warm start)' if initial is not None else ''}...")
+    pagerank_scores = pagerank(
+        adjacency,
+        damping_factor=damping_factor,
+        max_iterations=max_iterations,
+        initial=initial,
+    )
+
+    logger.info("   Computing degree centrality...")
+    in_degree = np.asarray(adjacency.sum(axis=0)).ravel().astype(np.int64)
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel().astype(np.int64)
+
+    logger.info("   Computing Louvain communities...")
+    communities = louvain_communities(
+        adjacency, max_levels=max_levels, max_iterations=louvain_max_iterations
+    )
+
+    logger.info(
+        "   Computing betweenness centrality"
+        f"{f' ({betweenness_samples} sampled sources)' if betweenness_samples else ''}..."
+    )
+    betweenness = betweenness_centrality(adjacency, samples=betweenness_samples)
+
+    logger.info("   Writing all properties...")
+    with driver.session(database=database) as session:
+        written = write_unwind_batches(
+            session,
+            f"""
+            UNWIND $batch AS row
+            MATCH (c:Company) WHERE id(c) = row.id
+            SET c.{PAGERANK_PROPERTY} = row.pagerank,
+                c.{COMMUNITY_PROPERTY} = row.community,
+                c.{IN_DEGREE_PROPERTY} = CASE WHEN row.in_degree > 0
+                    THEN row.in_degree ELSE c.{IN_DEGREE_PROPERTY} END,
+                c.{OUT_DEGREE_PROPERTY} = CASE WHEN row.out_degree > 0
+                    THEN row.out_degree ELSE c.{OUT_DEGREE_PROPERTY} END,
+                c.{BETWEENNESS_PROPERTY} = row.betweenness
+            RETURN count(c) AS created
+            """,
+            {
+                "id": nodes["id"].to_numpy(dtype=np.int64),
+                "pagerank": pagerank_scores,
+                "community": communities,
+                "in_degree": in_degree,
+                "out_degree": out_degree,
+                "betweenness": betweenness,
+            },
+            batch_size=batch_size,
+            logger=logger,
+        )
+
+    results = {
+        "pagerank": written,
+        "communities": int(communities.max()) + 1,
+        "degree": written,
+        "betweenness": written,
+    }
+    logger.info(f"   ✓ Complete in {time.perf_counter() - start_time:.1f}s")
+    _log_summary(results, logger)
     return results
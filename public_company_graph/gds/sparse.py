@@ -0,0 +1,685 @@
+"""
+In-process sparse-matrix graph algorithms (SciPy/NumPy).
+
+Alternative to GDS projections for bipartite graphs small enough to hold in memory
+(Domain-USES-Technology has ~10^5-10^6 edges). The graph is exported from Neo4j once
+into a CSR incidence matrix B (left × right); everything else is matrix algebra:
+
+- co-occurrence of right nodes is BᵀB with the diagonal removed, applied in factored
+  form (Bᵀ(B·X)) so the much denser co-occurrence matrix is never materialized
+- personalized PageRank runs for a whole block of source nodes at once as power
+  iteration over a dense (nodes × sources) matrix of teleport vectors
+- per-row aggregates over B (e.g. max of a score over a domain's technologies) are
+  segment reductions over the CSR row pointer
+
+No GDS plugin is required.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator
+
+from public_company_graph.constants import DEFAULT_DAMPING_FACTOR, DEFAULT_MAX_ITERATIONS
+
+logger = logging.getLogger(__name__)
+
+# GDS PageRank default convergence tolerance (max per-node score change)
+DEFAULT_TOLERANCE = 1e-7
+
+
+@dataclass
+class BipartiteGraph:
+    """
+    Bipartite graph as a CSR incidence matrix.
+
+    matrix[i, j] == 1 iff left node left_ids[i] links to right node right_ids[j].
+    Node ids are whatever identifies the nodes in Neo4j (id(), elementId, key property).
+    Values are float32: counts stay exact below 2^24 and products run twice as fast.
+    """
+
+    left_ids: np.ndarray
+    right_ids: np.ndarray
+    matrix: sparse.csr_matrix
+
+    @classmethod
+    def from_edges(cls, left: list, right: list) -> BipartiteGraph:
+        """Build from parallel lists of edge endpoints (duplicates collapse to 1)."""
+        left_ids, rows = np.unique(np.asarray(left), return_inverse=True)
+        right_ids, cols = np.unique(np.asarray(right), return_inverse=True)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(left_ids), len(right_ids)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1.0
+        return cls(left_ids=left_ids, right_ids=right_ids, matrix=matrix)
+
+    @property
+    def left_degree(self) -> np.ndarray:
+        """Number of right neighbours of each left node."""
+        return np.diff(self.matrix.indptr)
+
+    @property
+    def right_degree(self) -> np.ndarray:
+        """Number of left neighbours of each right node."""
+        return np.bincount(self.matrix.indices, minlength=len(self.right_ids))
+
+
+def cooccurrence_matrix(graph: BipartiteGraph) -> sparse.csr_matrix:
+    """
+    Right-node co-occurrence counts: C[a, b] = number of left nodes linked to both.
+
+    Equivalent to counting DISTINCT d in (a)<-(d)->(b) with a <> b.
+    """
+    incidence = graph.matrix
+    cooccurrence = (incidence.T @ incidence).tocsr()
+    cooccurrence.setdiag(0)
+    cooccurrence.eliminate_zeros()
+    return cooccurrence
+
+
+def cooccurrence_operator(graph: BipartiteGraph) -> LinearOperator:
+    """
+    Co-occurrence matrix BᵀB - diag(BᵀB) as a symmetric linear operator.
+
+    Multiplying by it costs two passes over B's edges instead of one pass over the
+    co-occurrence pairs, which grow quadratically with technologies per domain.
+    """
+    incidence = graph.matrix
+    incidence_t = incidence.T.tocsr()
+    self_counts = graph.right_degree.astype(incidence.dtype)
+    n = incidence.shape[1]
+
+    def matmat(x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=incidence.dtype).reshape(n, -1)
+        return np.asarray(incidence_t @ (incidence @ x) - self_counts[:, None] * x)
+
+    def matvec(x: np.ndarray) -> np.ndarray:
+        return matmat(x).ravel()
+
+    return LinearOperator(
+        (n, n), matvec=matvec, rmatvec=matvec, matmat=matmat, rmatmat=matmat, dtype=incidence.dtype
+    )
+
+
+def personalized_pagerank(
+    weights: sparse.csr_matrix | LinearOperator,
+    sources: np.ndarray,
+    damping_factor: float = DEFAULT_DAMPING_FACTOR,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> np.ndarray:
+    """
+    Weighted personalized PageRank for several source nodes at once.
+
+    Follows GDS semantics: each source gets a separate teleport vector with mass
+    (1 - damping) on the source, a node passes its score to neighbours in proportion
+    to edge weight, and dangling nodes do not redistribute their score.
+    Scores use the dtype of weights.
+
+    Args:
+        weights: Square (n × n) weighted adjacency, weights[u, v] for edge u→v
+            (sparse matrix or LinearOperator)
+        sources: Node indices to personalize on (one result column per source)
+        damping_factor: PageRank damping factor
+        max_iterations: Max power iterations
+        tolerance: Stop when no score changes by more than this
+
+    Returns:
+        Dense (n × len(sources)) array; column j holds the scores for sources[j]
+    """
+    n = weights.shape[0]
+    dtype = weights.dtype
+    out_weight = np.asarray(weights @ np.ones(n, dtype=dtype)).ravel()
+    inverse_out = np.divide(1.0, out_weight, out=np.zeros(n, dtype=dtype), where=out_weight > 0)
+    # new[v] = sum_u weights[u, v] * scores[u] / out_weight[u]
+    propagate = weights.T
+
+    teleport = np.zeros((n, len(sources)), dtype=dtype)
+    teleport[np.asarray(sources), np.arange(len(sources))] = 1.0 - damping_factor
+
+    scores = teleport.copy()
+    for _ in range(max_iterations):
+        updated = teleport + damping_factor * (propagate @ (inverse_out[:, None] * scores))
+        delta = np.abs(updated - scores).max() if scores.size else 0.0
+        scores = updated
+        if delta < tolerance:
+            break
+    return scores
+
+
+def iter_personalized_pagerank(
+    weights: sparse.csr_matrix | LinearOperator,
+    sources: np.ndarray,
+    block_size: int = 256,
+    **kwargs,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Personalized PageRank in blocks of sources to bound memory.
+
+    Yields:
+        (source_block, scores) with scores shaped (n × len(source_block))
+    """
+    sources = np.asarray(sources)
+    for start in range(0, len(sources), block_size):
+        block = sources[start : start + block_size]
+        yield block, personalized_pagerank(weights, block, **kwargs)
+
+
+def segment_max(incidence: sparse.csr_matrix, values: np.ndarray) -> np.ndarray:
+    """
+    Per-row max of values over each row's nonzero columns.
+
+    Rows are sorted by degree so that the rows with a j-th entry form a prefix; the
+    max is then taken one entry position at a time over whole (rows × k) slabs,
+    which is far faster than np.maximum.reduceat along axis 0.
+
+    Args:
+        incidence: CSR matrix (rows × n); every row must have at least one entry
+        values: Dense (n × k) array of column values
+
+    Returns:
+        Dense (rows × k) array: out[i, j] = max(values[c, j] for c in row i)
+    """
+    degree = np.diff(incidence.indptr)
+    if np.any(degree == 0):
+        raise ValueError("segment_max requires every row to have at least one entry")
+    if len(degree) == 0:
+        return np.empty((0, values.shape[1]), dtype=values.dtype)
+
+    order = np.argsort(-degree, kind="stable")
+    starts = incidence.indptr[:-1][order]
+    descending_degree = -degree[order]
+
+    result = np.asarray(values[incidence.indices[starts]])
+    for position in range(1, -int(descending_degree[0])):
+        active = np.searchsorted(descending_degree, -position, side="left")
+        np.maximum(
+            result[:active],
+            values[incidence.indices[starts[:active] + position]],
+            out=result[:active],
+        )
+
+    unsorted = np.empty_like(result)
+    unsorted[order] = result
+    return unsorted
+
+
+def top_k_per_column(scores: np.ndarray, top_k: int) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Indices of the top_k positive scores in each column, best first.
+
+    Yields:
+        (column, row_indices)
+    """
+    n_rows = scores.shape[0]
+    k = min(top_k, n_rows)
+    if k == 0:
+        return
+    if k < n_rows:
+        candidates = np.argpartition(-scores, k - 1, axis=0)[:k]
+    else:
+        candidates = np.broadcast_to(np.arange(n_rows)[:, None], scores.shape)
+    for column in range(scores.shape[1]):
+        rows = candidates[:, column]
+        column_scores = scores[rows, column]
+        order = np.argsort(-column_scores, kind="stable")
+        rows = rows[order]
+        yield column, rows[scores[rows, column] > 0]
+
+
+def _top_k_pairs(
+    rows: np.ndarray, cols: np.ndarray, scores: np.ndarray, top_k: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Keep the top_k highest-scoring (row, col) pairs per row, best first (ties by col)."""
+    order = np.lexsort((cols, -scores, rows))
+    rows, cols, scores = rows[order], cols[order], scores[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else rows
+    rank = np.arange(len(rows)) - np.repeat(starts, np.diff(np.r_[starts, len(rows)]))
+    keep = rank < top_k
+    return rows[keep], cols[keep], scores[keep]
+
+
+def shared_counts(
+    incidence: sparse.csr_matrix, left: np.ndarray, right: np.ndarray, chunk_size: int = 500_000
+) -> np.ndarray:
+    """Number of columns shared by the row pairs (left[i], right[i])."""
+    counts = np.empty(len(left), dtype=np.float64)
+    for start in range(0, len(left), chunk_size):
+        a = left[start : start + chunk_size]
+        b = right[start : start + chunk_size]
+        counts[start : start + chunk_size] = np.asarray(
+            incidence[a].multiply(incidence[b]).sum(axis=1)
+        ).ravel()
+    return counts
+
+
+def _jaccard_of_pairs(
+    incidence: sparse.csr_matrix, left: np.ndarray, right: np.ndarray
+) -> np.ndarray:
+    """Exact Jaccard similarity of the row pairs (left[i], right[i])."""
+    degree = np.diff(incidence.indptr).astype(np.float64)
+    intersection = shared_counts(incidence, left, right)
+    return np.asarray(intersection / (degree[left] + degree[right] - intersection))
+
+
+def jaccard_top_k(
+    incidence: sparse.csr_matrix,
+    top_k: int,
+    cutoff: float = 0.0,
+    block_size: int = 1024,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact top-k Jaccard neighbours of every row (GDS Node Similarity semantics).
+
+    Intersections for a block of rows come from one sparse product B[block] · Bᵀ,
+    unions from the row degrees: |A ∪ B| = |A| + |B| - |A ∩ B|. Only pairs sharing
+    at least one column are ever materialized.
+
+    Args:
+        incidence: CSR (rows × columns) 0/1 matrix, e.g. BipartiteGraph.matrix
+        top_k: Max neighbours per row
+        cutoff: Minimum similarity to keep
+        block_size: Rows per sparse product (bounds memory)
+
+    Returns:
+        (row, neighbour, similarity) arrays; each row's neighbours are best first,
+        and both (a, b) and (b, a) appear when each is in the other's top_k
+    """
+    degree = np.diff(incidence.indptr).astype(np.float64)
+    incidence_t = incidence.T.tocsr()
+    parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for start in range(0, incidence.shape[0], block_size):
+        intersections = (incidence[start : start + block_size] @ incidence_t).tocoo()
+        rows = intersections.row.astype(np.int64) + start
+        cols = intersections.col.astype(np.int64)
+        inter = intersections.data.astype(np.float64)
+        similarity = inter / (degree[rows] + degree[cols] - inter)
+        keep = (rows != cols) & (similarity >= cutoff) & (similarity > 0)
+        parts.append(_top_k_pairs(rows[keep], cols[keep], similarity[keep], top_k))
+
+    if not parts:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float64)
+    rows, cols, similarity = (np.concatenate(column) for column in zip(*parts, strict=True))
+    return rows, cols, similarity
+
+
+# Mersenne prime for universal hashing of column indices: h(x) = (a·x + b) mod p
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+def minhash_signatures(
+    incidence: sparse.csr_matrix,
+    num_perm: int = 128,
+    seed: int = 42,
+    chunk_size: int = 16,
+) -> np.ndarray:
+    """
+    MinHash signature of each row's column set.
+
+    Two rows agree on a signature position with probability equal to their Jaccard
+    similarity. Each position is the minimum of a random universal hash over the row's
+    columns, computed as a segment min over the CSR row pointer.
+
+    Args:
+        incidence: CSR (rows × columns) matrix; every row must have at least one entry
+        num_perm: Signature length (number of hash functions)
+        seed: Random seed for the hash functions
+        chunk_size: Hash functions evaluated per pass (bounds memory to chunk_size × nnz)
+
+    Returns:
+        (rows × num_perm) uint32 array
+    """
+    degree = np.diff(incidence.indptr)
+    if np.any(degree == 0):
+        raise ValueError("minhash_signatures requires every row to have at least one entry")
+    n_rows = incidence.shape[0]
+    signatures = np.empty((n_rows, num_perm), dtype=np.uint32)
+    if n_rows == 0:
+        return signatures
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.int64)
+    b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.int64)
+    columns = incidence.indices.astype(np.int64)
+    for start in range(0, num_perm, chunk_size):
+        stop = min(start + chunk_size, num_perm)
+        hashes = (a[start:stop, None] * columns[None, :] + b[start:stop, None]) % _MINHASH_PRIME
+        signatures[:, start:stop] = np.minimum.reduceat(hashes, incidence.indptr[:-1], axis=1).T
+    return signatures
+
+
+def lsh_band_rows(num_perm: int, threshold: float) -> int:
+    """
+    Rows per LSH band so that pairs at the similarity threshold are very likely found.
+
+    With b bands of r rows, a pair of similarity s becomes a candidate with probability
+    1 - (1 - s^r)^b, whose steep part sits near (1/b)^(1/r). The largest r whose
+    midpoint is still below 0.8 × threshold is chosen: fewer false candidates, yet
+    recall at the threshold itself stays close to 1.
+    """
+    best = 1
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= 0.8 * threshold:
+            best = rows
+    return best
+
+
+def _pairs_within_groups(members: np.ndarray, group_ends: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    All (members[i], members[j]) with i < j in the same group.
+
+    members is grouped contiguously and group_ends[i] is the exclusive end of i's group;
+    the loop runs once per offset while only positions with a partner that far away stay
+    active, so the cost is proportional to the number of pairs produced.
+    """
+    positions = np.arange(len(members))
+    left_parts, right_parts = [], []
+    offset = 1
+    active = positions[positions + 1 < group_ends]
+    while len(active):
+        left_parts.append(members[active])
+        right_parts.append(members[active + offset])
+        offset += 1
+        active = active[active + offset < group_ends[active]]
+    if not left_parts:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(left_parts), np.concatenate(right_parts)
+
+
+def lsh_candidate_pairs(
+    signatures: np.ndarray,
+    band_rows: int,
+    max_bucket_size: int = 500,
+    seed: int = 42,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate row pairs that collide in at least one LSH band.
+
+    Buckets larger than max_bucket_size (large groups of near-identical rows) are split
+    at random into chunks of that size, so a single popular signature cannot produce a
+    quadratic number of pairs; members still see max_bucket_size - 1 candidates each.
+
+    Returns:
+        (left, right) row indices with left < right, without duplicates
+    """
+    n_rows, num_perm = map(int, signatures.shape)
+    rng = np.random.default_rng(seed)
+    left_parts, right_parts = [], []
+    for start in range(0, num_perm - band_rows + 1, band_rows):
+        band = np.ascontiguousarray(signatures[:, start : start + band_rows])
+        _, bucket = np.unique(band.view(f"V{band.dtype.itemsize * band_rows}"), return_inverse=True)
+        bucket = bucket.ravel()
+        order = np.lexsort((rng.random(n_rows), bucket))
+        sorted_bucket = bucket[order]
+        boundaries = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+        sizes = np.diff(np.r_[boundaries, n_rows])
+        group_starts = np.repeat(boundaries, sizes)
+        position_in_bucket = np.arange(n_rows) - group_starts
+        chunk_start = group_starts + (position_in_bucket // max_bucket_size) * max_bucket_size
+        group_ends = np.minimum(chunk_start + max_bucket_size, np.repeat(boundaries + sizes, sizes))
+        left, right = _pairs_within_groups(order, group_ends)
+        left_parts.append(np.minimum(left, right))
+        right_parts.append(np.maximum(left, right))
+
+    if not left_parts:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    # sort + adjacent compare: much faster than np.unique's hash path on large int arrays
+    keys = np.concatenate(left_parts).astype(np.int64) * n_rows + np.concatenate(right_parts)
+    keys.sort()
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+    return keys // n_rows, keys % n_rows
+
+
+def jaccard_top_k_lsh(
+    incidence: sparse.csr_matrix,
+    top_k: int,
+    cutoff: float,
+    num_perm: int = 128,
+    max_bucket_size: int = 500,
+    seed: int = 42,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Approximate top-k Jaccard neighbours using MinHash/LSH candidate generation.
+
+    Candidates come from LSH banding tuned to cutoff (see lsh_band_rows); each candidate
+    is then scored with its exact Jaccard similarity, so results never contain false
+    positives, only (rare) misses. Use instead of jaccard_top_k when rows sharing a
+    popular column make the exact sparse product too dense.
+
+    Returns:
+        Same layout as jaccard_top_k
+    """
+    if cutoff <= 0:
+        raise ValueError("jaccard_top_k_lsh requires a positive similarity cutoff")
+    signatures = minhash_signatures(incidence, num_perm=num_perm, seed=seed)
+    left, right = lsh_candidate_pairs(
+        signatures, lsh_band_rows(num_perm, cutoff), max_bucket_size=max_bucket_size, seed=seed
+    )
+    similarity = _jaccard_of_pairs(incidence, left, right)
+    keep = similarity >= cutoff
+    left, right, similarity = left[keep], right[keep], similarity[keep]
+    return _top_k_pairs(
+        np.concatenate([left, right]),
+        np.concatenate([right, left]),
+        np.concatenate([similarity, similarity]),
+        top_k,
+    )
+
+
+def pagerank(
+    adjacency: sparse.csr_matrix,
+    damping_factor: float = DEFAULT_DAMPING_FACTOR,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    tolerance: float = DEFAULT_TOLERANCE,
+    initial: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Global PageRank with GDS semantics (scores start at and teleport 1 - damping).
+
+    Dangling nodes do not redistribute their score, so scores are on the GDS scale
+    (not normalized to sum to 1). Passing the previous scores as initial warm-starts
+    the power iteration, which converges in a few iterations after small edge changes.
+
+    Args:
+        adjacency: Square (n × n) adjacency, adjacency[u, v] = weight of edge u→v
+        damping_factor: PageRank damping factor
+        max_iterations: Max power iterations
+        tolerance: Stop when no score changes by more than this
+        initial: Optional starting scores (length n; NaN entries use the default)
+
+    Returns:
+        Array of n scores
+    """
+    n = adjacency.shape[0]
+    teleport = np.full(n, 1.0 - damping_factor)
+    scores = teleport.copy()
+    if initial is not None:
+        initial = np.asarray(initial, dtype=np.float64)
+        scores = np.where(np.isnan(initial), teleport, initial)
+
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    inverse_out = np.divide(1.0, out_weight, out=np.zeros(n), where=out_weight > 0)
+    propagate = adjacency.T.tocsr()
+    for _ in range(max_iterations):
+        updated = teleport + damping_factor * (propagate @ (inverse_out * scores))
+        delta = np.abs(updated - scores).max() if n else 0.0
+        scores = updated
+        if delta < tolerance:
+            break
+    return scores
+
+
+def _expand(adjacency: sparse.csr_matrix, frontier: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(parent, child) arrays of all out-edges of the frontier nodes."""
+    starts = adjacency.indptr[frontier]
+    counts = adjacency.indptr[frontier + 1] - starts
+    parents = np.repeat(frontier, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return parents, adjacency.indices[np.repeat(starts, counts) + offsets]
+
+
+def _source_dependencies(adjacency: sparse.csr_matrix, source: int) -> np.ndarray:
+    """Brandes dependency of source on every node (unweighted shortest paths)."""
+    n = adjacency.shape[0]
+    distance = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    distance[source] = 0
+    sigma[source] = 1.0
+
+    # Forward: level-synchronous BFS counting shortest paths
+    levels = [np.array([source])]
+    while True:
+        parents, children = _expand(adjacency, levels[-1])
+        depth = len(levels)
+        unseen = children[distance[children] < 0]
+        if not len(unseen):
+            break
+        reached = np.unique(unseen)
+        distance[reached] = depth
+        on_path = distance[children] == depth
+        np.add.at(sigma, children[on_path], sigma[parents[on_path]])
+        levels.append(reached)
+
+    # Backward: accumulate dependencies from the deepest level up
+    delta = np.zeros(n)
+    for depth in range(len(levels) - 1, 0, -1):
+        parents, children = _expand(adjacency, levels[depth - 1])
+        on_path = distance[children] == depth
+        parents, children = parents[on_path], children[on_path]
+        np.add.at(delta, parents, sigma[parents] / sigma[children] * (1.0 + delta[children]))
+    delta[source] = 0.0
+    return delta
+
+
+def betweenness_centrality(
+    adjacency: sparse.csr_matrix,
+    samples: int | None = None,
+    seed: int = 42,
+) -> np.ndarray:
+    """
+    Betweenness centrality of a directed, unweighted graph (Brandes).
+
+    Each BFS is vectorized over its frontier. With samples, only that many random
+    source nodes are expanded and the sum is scaled by n / samples, an unbiased
+    estimate of the exact score at a fraction of the O(n·m) cost.
+
+    Args:
+        adjacency: Square (n × n) adjacency (edge u→v where adjacency[u, v] != 0)
+        samples: Number of sampled sources (None or >= n = exact)
+        seed: Random seed for source sampling
+
+    Returns:
+        Array of n scores
+    """
+    n = adjacency.shape[0]
+    adjacency = adjacency.tocsr()
+    if samples is None or samples >= n:
+        sources, scale = np.arange(n), 1.0
+    else:
+        sources = np.random.default_rng(seed).choice(n, size=samples, replace=False)
+        scale = n / samples
+
+    scores = np.zeros(n)
+    for source in sources:
+        scores += _source_dependencies(adjacency, int(source))
+    return scores * scale
+
+
+def _louvain_level(
+    weights: sparse.csr_matrix,
+    max_iterations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """One Louvain local-moving phase; returns a community index per node."""
+    n = weights.shape[0]
+    strength = np.asarray(weights.sum(axis=1)).ravel().tolist()
+    total_weight = float(sum(strength))
+    # Per-node moves are inherently sequential; plain lists beat tiny NumPy calls here
+    indptr = weights.indptr.tolist()
+    indices = weights.indices.tolist()
+    data = weights.data.tolist()
+    community = list(range(n))
+    community_strength = list(strength)
+
+    for _ in range(max_iterations):
+        moved = False
+        for node in rng.permutation(n).tolist():
+            links: dict[int, float] = {}
+            for position in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[position]
+                if neighbor != node:
+                    target = community[neighbor]
+                    links[target] = links.get(target, 0.0) + data[position]
+
+            current = community[node]
+            node_strength = strength[node]
+            community_strength[current] -= node_strength
+            # Modularity gain of joining each community (constant factors dropped)
+            best = current
+            best_gain = links.get(current, 0.0) - (
+                community_strength[current] * node_strength / total_weight
+            )
+            for target, weight in links.items():
+                gain = weight - community_strength[target] * node_strength / total_weight
+                if gain > best_gain + 1e-12:
+                    best, best_gain = target, gain
+            community[node] = best
+            community_strength[best] += node_strength
+            moved |= best != current
+        if not moved:
+            break
+
+    _, labels = np.unique(np.asarray(community), return_inverse=True)
+    return labels
+
+
+def louvain_communities(
+    adjacency: sparse.csr_matrix,
+    max_levels: int = 10,
+    max_iterations: int = 10,
+    seed: int = 42,
+) -> np.ndarray:
+    """
+    Louvain community detection on the undirected view of a graph.
+
+    Edge directions are dropped (A + Aᵀ). Each level greedily moves nodes to the
+    neighbouring community with the largest modularity gain, then collapses every
+    community into one node of a CSR graph whose edge weights sum the links between
+    communities; levels stop when no node moves.
+
+    Args:
+        adjacency: Square (n × n) adjacency
+        max_levels: Max aggregation levels
+        max_iterations: Max local-moving passes per level
+        seed: Random seed for node visiting order
+
+    Returns:
+        Array of n community ids (0 .. communities - 1)
+    """
+    n = adjacency.shape[0]
+    rng = np.random.default_rng(seed)
+    weights = (adjacency + adjacency.T).tocsr().astype(np.float64)
+    membership = np.arange(n)
+    if weights.nnz == 0:
+        return membership
+
+    for _ in range(max_levels):
+        community = _louvain_level(weights, max_iterations, rng)
+        communities = community.max() + 1 if len(community) else 0
+        if communities == weights.shape[0]:
+            break
+        membership = community[membership]
+        assignment = sparse.csr_matrix(
+            (np.ones(len(community)), (np.arange(len(community)), community)),
+            shape=(len(community), communities),
+        )
+        weights = (assignment.T @ weights @ assignment).tocsr()
+    return membership
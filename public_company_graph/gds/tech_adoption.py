@@ -3,18 +3,37 @@ Technology Adoption Prediction using Personalized PageRank.
 
 For each technology, predicts which domains are most likely to adopt it.
 This is valuable for software companies finding customers for their product.
+
+Two backends compute the same predictions:
+- compute_tech_adoption_prediction: GDS projection + pageRank.write per batch
+- compute_tech_adoption_prediction_sparse: in-process SciPy matrices, no GDS plugin
 """
 
 import logging
+import time
 from datetime import UTC, datetime
 
+import numpy as np
+
 from public_company_graph.constants import (
     BATCH_SIZE_DELETE,
+    BATCH_SIZE_LARGE,
     DEFAULT_DAMPING_FACTOR,
     DEFAULT_MAX_ITERATIONS,
     DEFAULT_TOP_K,
 )
-from public_company_graph.gds.utils import safe_drop_graph
+from public_company_graph.gds.sparse import (
+    BipartiteGraph,
+    cooccurrence_operator,
+    iter_personalized_pagerank,
+    segment_max,
+    top_k_per_column,
+)
+from public_company_graph.gds.utils import (
+    TECH_COOCCURRENCE_PROJECTION,
+    GraphProjectionManager,
+    write_relationships,
+)
 from public_company_graph.neo4j import delete_relationships_in_batches
 from public_company_graph.neo4j.utils import safe_single
 
@@ -29,6 +48,7 @@ def compute_tech_adoption_prediction(
     damping_factor: float = DEFAULT_DAMPING_FACTOR,
     top_k: int = DEFAULT_TOP_K,
     batch_size: int = 20,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -45,6 +65,7 @@ def compute_tech_adoption_prediction(
         damping_factor: PageRank damping factor
         top_k: Number of predictions per technology
         batch_size: Technologies to process per PageRank run
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -64,27 +85,11 @@ def compute_tech_adoption_prediction(
     predictions_written = 0
 
     try:
-        # Create Technology-Technology projection
-        graph_name = f"tech_cooccurrence_for_adoption_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
+        # Technology-Technology co-occurrence projection
+        if projections is None:
+            projections = GraphProjectionManager(gds, database, keep_alive=False, logger=logger)
         logger.info("   Creating Technology-Technology co-occurrence graph...")
-        G_tech, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (t:Technology)
-            RETURN id(t) AS id
-            """,
-            """
-            MATCH (t1:Technology)<-[:USES]-(d:Domain)-[:USES]->(t2:Technology)
-            WHERE t1 <> t2
-            WITH t1, t2, count(DISTINCT d) AS co_occurrence_count
-            RETURN id(t1) AS source, id(t2) AS target, co_occurrence_count AS weight
-            """,
-        )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created graph: {node_count} nodes, {rel_count} relationships")
+        G_tech, _ = projections.get(TECH_COOCCURRENCE_PROJECTION)
 
         # Delete existing LIKELY_TO_ADOPT relationships for idempotency
         delete_relationships_in_batches(
@@ -204,7 +209,7 @@ def compute_tech_adoption_prediction(
 
             logger.info(f"   ✓ Created {predictions_written} LIKELY_TO_ADOPT relationships")
 
-        G_tech.drop()
+        projections.release(TECH_COOCCURRENCE_PROJECTION)
         logger.info("   ✓ Complete")
 
     except Exception as e:
@@ -214,3 +219,139 @@ def compute_tech_adoption_prediction(
         logger.error(traceback.format_exc())
 
     return predictions_written
+
+
+# Technologies used by more than this share of domains are too common to predict
+MAX_ADOPTION_SHARE = 0.5
+
+
+def compute_tech_adoption_prediction_sparse(
+    driver,
+    database: str | None = None,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    damping_factor: float = DEFAULT_DAMPING_FACTOR,
+    top_k: int = DEFAULT_TOP_K,
+    block_size: int = 256,
+    batch_size: int = BATCH_SIZE_LARGE,
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Technology Adopter Prediction using in-process sparse matrices (no GDS).
+
+    Exports Domain-USES-Technology once into a CSR matrix B, builds the co-occurrence
+    graph as BᵀB, runs personalized PageRank for a block of technologies at a time,
+    and scores every domain with the same formula as the GDS backend:
+    max PPR score over the domain's technologies × (1 + ln(technology count + 1)).
+    Domains already using the technology are skipped, as are zero scores.
+    The top_k domains per technology are bulk-written as LIKELY_TO_ADOPT.
+
+    Args:
+        driver: Neo4j driver instance
+        database: Neo4j database name
+        max_iterations: Max PageRank iterations
+        damping_factor: PageRank damping factor
+        top_k: Number of predictions per technology
+        block_size: Technologies per PageRank block (bounds memory)
+        batch_size: Relationships per write transaction
+        logger: Optional logger instance
+
+    Returns:
+        Number of LIKELY_TO_ADOPT relationships created
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("1. Technology Adopter Prediction (Technology → Domain)")
+    logger.info("=" * 70)
+    logger.info("   Use case: Sales targeting for specific technologies")
+    logger.info("   Relationship: Domain-[LIKELY_TO_ADOPT {score}]->Technology")
+    logger.info("   Algorithm: Personalized PageRank (in-process sparse backend)")
+
+    start_time = time.perf_counter()
+    with driver.session(database=database) as session:
+        result = session.run(
+            """
+            MATCH (d:Domain)-[:USES]->(t:Technology)
+            RETURN id(d) AS domain_id, id(t) AS tech_id
+            """
+        )
+        domain_ids, tech_ids = [], []
+        for record in result:
+            domain_ids.append(record["domain_id"])
+            tech_ids.append(record["tech_id"])
+        total_domains = safe_single(
+            session.run("MATCH (d:Domain) RETURN count(d) AS total"), default=0, key="total"
+        )
+
+    if not domain_ids or not total_domains:
+        logger.info("   ⚠ No Domain-USES-Technology edges found - skipping")
+        return 0
+
+    graph = BipartiteGraph.from_edges(domain_ids, tech_ids)
+    cooccurrence = cooccurrence_operator(graph)
+    logger.info(
+        f"   ✓ Exported {graph.matrix.nnz} USES edges "
+        f"({len(graph.left_ids)} domains, {len(graph.right_ids)} technologies) "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+
+    targets = np.flatnonzero(graph.right_degree / total_domains <= MAX_ADOPTION_SHARE)
+    logger.info(f"   Scoring {len(targets)} non-ubiquitous technologies...")
+
+    incidence_by_tech = graph.matrix.tocsc()
+    degree_boost = 1.0 + np.log(graph.left_degree + 1.0)
+    domain_blocks: list[np.ndarray] = []
+    tech_blocks: list[np.ndarray] = []
+    score_blocks: list[np.ndarray] = []
+    for block, ppr in iter_personalized_pagerank(
+        cooccurrence,
+        targets,
+        block_size=block_size,
+        damping_factor=damping_factor,
+        max_iterations=max_iterations,
+    ):
+        scores = segment_max(graph.matrix, ppr) * degree_boost[:, None]
+        for column, tech in enumerate(block):
+            users = incidence_by_tech.indices[
+                incidence_by_tech.indptr[tech] : incidence_by_tech.indptr[tech + 1]
+            ]
+            scores[users, column] = 0.0
+        for column, domains in top_k_per_column(scores, top_k):
+            domain_blocks.append(graph.left_ids[domains])
+            tech_blocks.append(np.full(len(domains), graph.right_ids[block[column]]))
+            score_blocks.append(scores[domains, column])
+    columns = {
+        "source": np.concatenate(domain_blocks) if domain_blocks else np.array([], dtype=np.int64),
+        "target": np.concatenate(tech_blocks) if tech_blocks else np.array([], dtype=np.int64),
+        "score": np.concatenate(score_blocks) if score_blocks else np.array([]),
+    }
+    logger.info(
+        f"   ✓ Computed {len(columns['source'])} predictions "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+
+    delete_relationships_in_batches(
+        driver,
+        "LIKELY_TO_ADOPT",
+        batch_size=BATCH_SIZE_DELETE,
+        database=database,
+        logger=logger,
+    )
+
+    # LIKELY_TO_ADOPT was just deleted, so CREATE skips MERGE's existing-edge check
+    predictions_written = write_relationships(
+        driver,
+        "LIKELY_TO_ADOPT",
+        "Domain",
+        "Technology",
+        columns,
+        fresh=True,
+        expressions={"algorithm": "'PERSONALIZED_PAGERANK'", "computed_at": "datetime()"},
+        database=database,
+        batch_size=batch_size,
+        logger=logger,
+    )
+    logger.info("   ✓ Complete")
+    return predictions_written
@@ -7,15 +7,17 @@ Example: WordPress + MySQL, Google Analytics + Google Tag Manager.
 
 import logging
 
-import pandas as pd
-
 from public_company_graph.constants import (
     BATCH_SIZE_LARGE,
     DEFAULT_SIMILARITY_CUTOFF,
     DEFAULT_TOP_K,
 )
-from public_company_graph.gds.utils import safe_drop_graph
-from public_company_graph.neo4j.utils import safe_single
+from public_company_graph.gds.utils import (
+    TECH_COOCCURRENCE_PROJECTION,
+    GraphProjectionManager,
+    similarity_result_columns,
+    write_relationships,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,7 @@ def compute_tech_affinity_bundling(
     similarity_cutoff: float = DEFAULT_SIMILARITY_CUTOFF,
     top_k: int = DEFAULT_TOP_K,
     batch_size: int = BATCH_SIZE_LARGE,
+    projections: GraphProjectionManager | None = None,
     logger: logging.Logger | None = None,
 ) -> int:
     """
@@ -41,6 +44,7 @@ def compute_tech_affinity_bundling(
         similarity_cutoff: Minimum Jaccard similarity
         top_k: Max similar technologies per technology
         batch_size: Batch size for writing relationships
+        projections: Shared projection manager (default: project and drop here)
         logger: Optional logger instance
 
     Returns:
@@ -60,102 +64,35 @@ def compute_tech_affinity_bundling(
     relationships_written = 0
 
     try:
+        if projections is None:
+            projections = GraphProjectionManager(gds, database, keep_alive=False, logger=logger)
         logger.info("   Creating Technology-Technology co-occurrence graph...")
-        graph_name = f"tech_co_occurrence_graph_{database or 'default'}"
-        safe_drop_graph(gds, graph_name)
-
-        G_tech, result = gds.graph.project.cypher(
-            graph_name,
-            """
-            MATCH (t:Technology)
-            RETURN id(t) AS id
-            """,
-            """
-            MATCH (t1:Technology)<-[:USES]-(d:Domain)-[:USES]->(t2:Technology)
-            WHERE t1 <> t2
-            RETURN id(t1) AS source, id(t2) AS target
-            """,
-        )
-        node_count = result["nodeCount"]
-        rel_count = result["relationshipCount"]
-        logger.info(f"   ✓ Created graph: {node_count} nodes, {rel_count} relationships")
+        G_tech, _ = projections.get(TECH_COOCCURRENCE_PROJECTION)
 
-        # Run Node Similarity
+        # Run Node Similarity (unweighted: Jaccard over co-occurring technology sets)
         logger.info("   Computing Node Similarity (Jaccard) using GDS...")
         similarity_result = gds.nodeSimilarity.stream(
             G_tech, similarityMetric="JACCARD", similarityCutoff=similarity_cutoff, topK=top_k
         )
 
         # Write results
-        logger.info("   Writing CO_OCCURS_WITH relationships in batches...")
-
-        with driver.session(database=database) as session:
-            batch = []
-
-            if isinstance(similarity_result, pd.DataFrame):
-                col1, col2, sim_col = _identify_columns(similarity_result, logger)
-                if not (col1 and col2 and sim_col):
-                    raise ValueError(f"Unexpected columns: {list(similarity_result.columns)}")
-
-                logger.info(f"   Using columns: {col1}, {col2}, {sim_col}")
-
-                for _, row in similarity_result.iterrows():
-                    batch.append(
-                        {
-                            "node_id1": int(row[col1]),
-                            "node_id2": int(row[col2]),
-                            "similarity": float(row[sim_col]),
-                        }
-                    )
-            else:
-                for row in similarity_result:
-                    if isinstance(row, dict):
-                        node_id1 = row.get("nodeId1") or row.get("node1") or row.get("source")
-                        node_id2 = row.get("nodeId2") or row.get("node2") or row.get("target")
-                        sim_val = row.get("similarity") or row.get("score") or row.get("weight")
-                        batch.append(
-                            {
-                                "node_id1": int(node_id1) if node_id1 is not None else 0,
-                                "node_id2": int(node_id2) if node_id2 is not None else 0,
-                                "similarity": float(sim_val) if sim_val is not None else 0.0,
-                            }
-                        )
-                    else:
-                        batch.append(
-                            {
-                                "node_id1": int(row[0]),
-                                "node_id2": int(row[1]),
-                                "similarity": float(row[2]),
-                            }
-                        )
-
-            # Write in batches
-            logger.info(f"   Writing {len(batch)} relationships in batches of {batch_size}...")
-            for i in range(0, len(batch), batch_size):
-                batch_chunk = batch[i : i + batch_size]
-                result = session.run(
-                    """
-                    UNWIND $batch AS rel
-                    MATCH (t1:Technology), (t2:Technology)
-                    WHERE id(t1) = rel.node_id1 AND id(t2) = rel.node_id2
-                    MERGE (t1)-[r:CO_OCCURS_WITH]->(t2)
-                    SET r.similarity = rel.similarity,
-                        r.metric = 'JACCARD',
-                        r.computed_at = datetime()
-                    RETURN count(r) AS created
-                    """,
-                    batch=batch_chunk,
-                )
-                created = safe_single(result, default=0, key="created")
-                if created:
-                    relationships_written += created
-
-                if (i + batch_size) % (batch_size * 10) == 0 or i + batch_size >= len(batch):
-                    progress = min(i + batch_size, len(batch))
-                    logger.info(f"   Progress: {progress}/{len(batch)} written...")
+        node_id1, node_id2, similarity = similarity_result_columns(similarity_result, logger)
+        logger.info(f"   Writing {len(similarity)} CO_OCCURS_WITH relationships...")
+
+        relationships_written = write_relationships(
+            driver,
+            "CO_OCCURS_WITH",
+            "Technology",
+            "Technology",
+            {"source": node_id1, "target": node_id2, "similarity": similarity},
+            expressions={"metric": "'JACCARD'", "computed_at": "datetime()"},
+            database=database,
+            batch_size=batch_size,
+            logger=logger,
+        )
 
         logger.info(f"   ✓ Created {relationships_written} CO_OCCURS_WITH relationships")
-        G_tech.drop()
+        projections.release(TECH_COOCCURRENCE_PROJECTION)
         logger.info("   ✓ Complete")
 
     except Exception as e:
@@ -165,22 +102,3 @@ def compute_tech_affinity_bundling(
         logger.error(traceback.format_exc())
 
     return relationships_written
-
-
-def _identify_columns(df: pd.DataFrame, logger: logging.Logger):
-    """Identify column names in a GDS similarity result DataFrame."""
-    col1 = col2 = sim_col = None
-
-    for col in df.columns:
-        col_lower = col.lower()
-        if col_lower in ["nodeid1", "node1", "source"]:
-            col1 = col
-        elif col_lower in ["nodeid2", "node2", "target"]:
-            col2 = col
-        elif col_lower in ["similarity", "score", "weight"]:
-            sim_col = col
-
-    if not (col1 and col2 and sim_col):
-        logger.error(f"   ✗ Error: Could not identify columns. Available: {list(df.columns)}")
-
-    return col1, col2, sim_col
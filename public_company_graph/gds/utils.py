@@ -1,15 +1,35 @@
 """
 GDS utility functions.
 
-Provides helper functions for Graph Data Science operations.
+Provides helper functions for Graph Data Science operations, including a result
+sink that turns algorithm stream output into UNWIND write batches without
+per-row Python work (no DataFrame.iterrows, no per-value int()/float() casts),
+and a projection manager that shares graph projections between features.
 """
 
 import logging
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from public_company_graph.neo4j.utils import safe_single
+
 logger = logging.getLogger(__name__)
 
+# Target size of one UNWIND payload. Rows per transaction are derived from the
+# column types so wide rows (string keys) get smaller batches than id/score rows.
+UNWIND_BATCH_MAX_BYTES = 4 * 1024 * 1024
+
+# Column names GDS (and older client versions) use for similarity stream output
+_NODE1_COLUMNS = ("nodeid1", "node1", "source")
+_NODE2_COLUMNS = ("nodeid2", "node2", "target")
+_SCORE_COLUMNS = ("similarity", "score", "weight")
+
 
 def safe_drop_graph(gds, graph_name: str) -> bool:
     """
@@ -60,6 +80,183 @@ def cleanup_leftover_graphs(
         logger.warning(f"⚠ Warning: Could not clean up leftover graphs: {e}")
 
 
+@dataclass(frozen=True)
+class ProjectionSpec:
+    """
+    Definition of a GDS graph projection.
+
+    A native projection (node_projection + relationship_projection, passed to
+    gds.graph.project) is used when given; it loads straight from the store and is
+    much faster than a Cypher projection, which is the fallback for graphs derived
+    from multi-hop patterns (e.g. co-occurrence through Domain).
+
+    GraphProjectionManager.invalidate() matches on the labels and relationship
+    types the projection reads, so list every one the queries touch.
+    """
+
+    name: str
+    labels: tuple[str, ...]
+    relationship_types: tuple[str, ...]
+    node_query: str | None = None
+    relationship_query: str | None = None
+    node_projection: str | list | dict | None = None
+    relationship_projection: str | list | dict | None = None
+
+    def graph_name(self, database: str | None) -> str:
+        """Catalog name (suffixed with the database, as cleanup_leftover_graphs expects)."""
+        return f"{self.name}_{database or 'default'}"
+
+
+# Technology-Technology co-occurrence through Domain; weight = number of shared domains.
+# Shared by adoption prediction (weighted PageRank) and affinity (unweighted Jaccard).
+TECH_COOCCURRENCE_PROJECTION = ProjectionSpec(
+    name="tech_cooccurrence",
+    labels=("Technology", "Domain"),
+    relationship_types=("USES",),
+    node_query="""
+        MATCH (t:Technology)
+        RETURN id(t) AS id
+        """,
+    relationship_query="""
+        MATCH (t1:Technology)<-[:USES]-(d:Domain)-[:USES]->(t2:Technology)
+        WHERE t1 <> t2
+        WITH t1, t2, count(DISTINCT d) AS co_occurrence_count
+        RETURN id(t1) AS source, id(t2) AS target, co_occurrence_count AS weight
+        """,
+)
+
+
+class GraphProjectionManager:
+    """
+    Catalog of GDS projections shared across features in one run.
+
+    get() returns the live projection of a spec when this manager already made
+    one and projects it otherwise. Projections are not re-checked against the
+    database: whoever rewrites a label or relationship type a projection reads
+    calls invalidate() with it. With keep_alive=False (what a feature uses when
+    it is not given a manager), release() drops the projection right away; a
+    shared manager keeps projections until drop_all(), which also runs on
+    leaving a `with` block.
+    """
+
+    def __init__(
+        self,
+        gds,
+        database: str | None = None,
+        keep_alive: bool = True,
+        logger: logging.Logger | None = None,
+    ):
+        self.gds = gds
+        self.database = database
+        self.keep_alive = keep_alive
+        self.logger = logger or logging.getLogger(__name__)
+        # graph name -> (spec, graph, projection counts)
+        self._graphs: dict[str, tuple[ProjectionSpec, Any, dict]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GraphProjectionManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.drop_all()
+
+    def get(self, spec: ProjectionSpec) -> tuple[object, dict]:
+        """
+        Live projection for spec, projecting only if missing.
+
+        Returns:
+            (graph, {"nodeCount", "relationshipCount"}) like gds.graph.project
+        """
+        with self._lock:
+            graph_name = spec.graph_name(self.database)
+            cached = self._graphs.get(graph_name)
+            if cached is not None:
+                _, graph, counts = cached
+                if self._exists(graph_name):
+                    self.logger.info(
+                        f"   ✓ Reusing graph projection {graph_name}: "
+                        f"{counts['nodeCount']} nodes, {counts['relationshipCount']} relationships"
+                    )
+                    return graph, counts
+                self.logger.info(f"   Graph projection {graph_name} is gone - re-projecting")
+
+            safe_drop_graph(self.gds, graph_name)
+            start_time = time.perf_counter()
+            if spec.node_projection is not None and spec.relationship_projection is not None:
+                graph, result = self.gds.graph.project(
+                    graph_name, spec.node_projection, spec.relationship_projection
+                )
+            else:
+                graph, result = self.gds.graph.project.cypher(
+                    graph_name, spec.node_query, spec.relationship_query
+                )
+            counts = {
+                "nodeCount": result["nodeCount"],
+                "relationshipCount": result["relationshipCount"],
+            }
+            self.logger.info(
+                f"   ✓ Created graph: {counts['nodeCount']} nodes, "
+                f"{counts['relationshipCount']} relationships "
+                f"in {time.perf_counter() - start_time:.1f}s"
+            )
+            self._graphs[graph_name] = (spec, graph, counts)
+            return graph, counts
+
+    def invalidate(self, *names: str) -> int:
+        """
+        Drop every projection that reads one of the given labels or relationship types.
+
+        Call after writing those types so the next get() projects fresh data.
+
+        Returns:
+            Number of projections dropped
+        """
+        wanted = set(names)
+        with self._lock:
+            stale = [
+                graph_name
+                for graph_name, (spec, _, _) in self._graphs.items()
+                if wanted & (set(spec.labels) | set(spec.relationship_types))
+            ]
+            for graph_name in stale:
+                self.logger.info(f"   Graph data changed - dropping projection {graph_name}")
+                self._drop(graph_name)
+        return len(stale)
+
+    def _exists(self, graph_name: str) -> bool:
+        """Whether the projection is still in the GDS catalog."""
+        try:
+            return bool(self.gds.graph.exists(graph_name)["exists"])
+        except Exception:
+            return False
+
+    def drop(self, spec: ProjectionSpec) -> None:
+        """Drop spec's projection (e.g. after mutating it)."""
+        with self._lock:
+            self._drop(spec.graph_name(self.database))
+
+    def _drop(self, graph_name: str) -> None:
+        cached = self._graphs.pop(graph_name, None)
+        if cached is None:
+            safe_drop_graph(self.gds, graph_name)
+            return
+        try:
+            cached[1].drop()
+        except Exception:
+            safe_drop_graph(self.gds, graph_name)
+
+    def release(self, spec: ProjectionSpec) -> None:
+        """Signal a feature is done with spec; drops it unless the manager keeps projections."""
+        if not self.keep_alive:
+            self.drop(spec)
+
+    def drop_all(self) -> None:
+        """Drop every projection this manager created."""
+        with self._lock:
+            for graph_name in list(self._graphs):
+                self._drop(graph_name)
+
+
 def get_gds_client(driver, database: str | None = None):
     """
     Get GraphDataScience client connection from existing driver.
@@ -92,3 +289,299 @@ def get_gds_client(driver, database: str | None = None):
     password = get_neo4j_password()
     gds = GraphDataScience(uri, auth=(user, password), database=database)
     return gds
+
+
+def _first_present(row: dict, names: tuple[str, ...]):
+    for name in row:
+        if name.lower() in names and row[name] is not None:
+            return row[name]
+    return None
+
+
+def similarity_result_columns(
+    similarity_result, logger: logging.Logger | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract (node_id1, node_id2, similarity) arrays from a GDS similarity stream.
+
+    DataFrames (the normal case) are converted column-wise with NumPy. Iterables of
+    dicts or tuples, returned by some client versions, are converted row by row.
+
+    Args:
+        similarity_result: DataFrame or iterable from gds.<algorithm>.stream()
+        logger: Optional logger instance
+
+    Returns:
+        Tuple of int64 node id arrays and a float64 similarity array
+
+    Raises:
+        ValueError: If a DataFrame has no recognizable node/score columns
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    if isinstance(similarity_result, pd.DataFrame):
+        by_name = {col.lower(): col for col in similarity_result.columns}
+        col1 = next((by_name[c] for c in _NODE1_COLUMNS if c in by_name), None)
+        col2 = next((by_name[c] for c in _NODE2_COLUMNS if c in by_name), None)
+        sim_col = next((by_name[c] for c in _SCORE_COLUMNS if c in by_name), None)
+        if not (col1 and col2 and sim_col):
+            raise ValueError(f"Unexpected columns: {list(similarity_result.columns)}")
+        logger.info(f"   Using columns: {col1}, {col2}, {sim_col}")
+        return (
+            similarity_result[col1].to_numpy(dtype=np.int64),
+            similarity_result[col2].to_numpy(dtype=np.int64),
+            similarity_result[sim_col].to_numpy(dtype=np.float64),
+        )
+
+    node_ids1, node_ids2, similarities = [], [], []
+    for row in similarity_result:
+        if isinstance(row, dict):
+            node_ids1.append(_first_present(row, _NODE1_COLUMNS) or 0)
+            node_ids2.append(_first_present(row, _NODE2_COLUMNS) or 0)
+            similarities.append(_first_present(row, _SCORE_COLUMNS) or 0.0)
+        else:
+            node_ids1.append(row[0])
+            node_ids2.append(row[1])
+            similarities.append(row[2])
+    return (
+        np.asarray(node_ids1, dtype=np.int64),
+        np.asarray(node_ids2, dtype=np.int64),
+        np.asarray(similarities, dtype=np.float64),
+    )
+
+
+def _estimated_row_bytes(columns: dict[str, np.ndarray]) -> int:
+    """Rough Bolt-encoded size of one UNWIND row (map keys + values)."""
+    total = 0
+    for name, values in columns.items():
+        total += len(name) + 2
+        if values.dtype.kind in "iufb":
+            total += 9
+        elif len(values):
+            sample = values[: min(len(values), 1000)]
+            total += int(np.mean([len(str(v)) for v in sample])) + 3
+    return max(total, 1)
+
+
+def iter_unwind_batches(
+    columns: dict[str, np.ndarray],
+    max_rows: int,
+    max_bytes: int = UNWIND_BATCH_MAX_BYTES,
+) -> Iterator[list[dict]]:
+    """
+    Slice parallel column arrays into UNWIND payloads (lists of row dicts).
+
+    Each slice is converted with ndarray.tolist(), which yields native Python
+    ints/floats/strs in C, so no per-value casting happens in Python.
+
+    Args:
+        columns: Parameter name -> array; all arrays have the same length
+        max_rows: Upper bound on rows per batch
+        max_bytes: Approximate upper bound on payload size per batch
+
+    Yields:
+        Lists of {name: value} dicts
+    """
+    names = list(columns)
+    if not names:
+        return
+    total = len(columns[names[0]])
+    rows_per_batch = max(1, min(max_rows, max_bytes // _estimated_row_bytes(columns)))
+    for start in range(0, total, rows_per_batch):
+        end = start + rows_per_batch
+        sliced = [columns[name][start:end].tolist() for name in names]
+        yield [dict(zip(names, values, strict=True)) for values in zip(*sliced, strict=True)]
+
+
+def write_unwind_batches(
+    session,
+    query: str,
+    columns: dict[str, np.ndarray],
+    batch_size: int,
+    max_bytes: int = UNWIND_BATCH_MAX_BYTES,
+    count_key: str | None = "created",
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Run an `UNWIND $batch AS rel ...` write query over column arrays.
+
+    Args:
+        session: Open Neo4j session
+        query: Cypher taking a $batch list parameter
+        columns: Parameter name -> array (see iter_unwind_batches)
+        batch_size: Max rows per transaction
+        max_bytes: Approximate max payload bytes per transaction
+        count_key: Key of the query's count column, or None to count rows sent
+        logger: Optional logger instance
+
+    Returns:
+        Total of count_key over all batches (or rows sent if count_key is None)
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    total_rows = len(next(iter(columns.values()))) if columns else 0
+    written = sent = 0
+    start_time = time.perf_counter()
+    for batch_number, batch in enumerate(
+        iter_unwind_batches(columns, batch_size, max_bytes), start=1
+    ):
+        result = session.run(query, batch=batch)
+        sent += len(batch)
+        if count_key is None:
+            written += len(batch)
+        else:
+            written += safe_single(result, default=0, key=count_key) or 0
+        if batch_number % 10 == 0 or sent >= total_rows:
+            logger.info(f"   Progress: {sent}/{total_rows} written...")
+
+    elapsed = time.perf_counter() - start_time
+    if total_rows and elapsed > 0:
+        logger.info(f"   Wrote {total_rows} rows in {elapsed:.1f}s ({total_rows / elapsed:,.0f}/s)")
+    return written
+
+
+def _node_match(variable: str, label: str, key: str | None, column: str) -> str:
+    """MATCH clause seeking one node by internal id (key None) or by a key property."""
+    if key is None:
+        return f"MATCH ({variable}:{label}) WHERE id({variable}) = row.{column}"
+    return f"MATCH ({variable}:{label} {{{key}: row.{column}}})"
+
+
+def relationship_write_query(
+    rel_type: str,
+    source_label: str,
+    target_label: str,
+    properties: list[str] | tuple[str, ...] = (),
+    source_key: str | None = None,
+    target_key: str | None = None,
+    fresh: bool = False,
+    bidirectional: bool = False,
+    expressions: dict[str, str] | None = None,
+) -> str:
+    """
+    Cypher writing one relationship (or a symmetric pair) per `row` of $batch.
+
+    Each endpoint gets its own MATCH, so the planner seeks it by internal id
+    (NodeByIdSeek) or by the key property index instead of planning a cartesian
+    product. fresh=True uses CREATE, which skips MERGE's existing-edge check; use it
+    only after the relationship type was deleted.
+
+    Args:
+        rel_type: Relationship type
+        source_label: Label of the start node (row.source)
+        target_label: Label of the end node (row.target)
+        properties: Row fields copied onto the relationship
+        source_key: Key property matched against row.source (None = internal id)
+        target_key: Key property matched against row.target (None = internal id)
+        fresh: CREATE instead of MERGE
+        bidirectional: Also write (target)-[:rel_type]->(source)
+        expressions: Extra relationship properties as Cypher expressions
+            (e.g. {"metric": "'JACCARD'", "computed_at": "datetime()"})
+
+    Returns:
+        Query returning the relationships written as `created`
+    """
+    write = "CREATE" if fresh else "MERGE"
+    assignments = [f"row.{name}" for name in properties]
+    names = list(properties)
+    for name, expression in (expressions or {}).items():
+        names.append(name)
+        assignments.append(expression)
+
+    def write_clause(variable: str, start: str, end: str) -> str:
+        clause = f"{write} ({start})-[{variable}:{rel_type}]->({end})"
+        if names:
+            sets = ",\n    ".join(
+                f"{variable}.{name} = {value}"
+                for name, value in zip(names, assignments, strict=True)
+            )
+            clause += f"\nSET {sets}"
+        return clause
+
+    lines = [
+        "UNWIND $batch AS row",
+        _node_match("a", source_label, source_key, "source"),
+        _node_match("b", target_label, target_key, "target"),
+        "WITH a, b, row WHERE a <> b",
+        write_clause("r", "a", "b"),
+    ]
+    if bidirectional:
+        lines.append(write_clause("r2", "b", "a"))
+    lines.append(f"RETURN count(*){' * 2' if bidirectional else ''} AS created")
+    return "\n".join(lines)
+
+
+def write_relationships(
+    driver,
+    rel_type: str,
+    source_label: str,
+    target_label: str,
+    columns: dict[str, np.ndarray],
+    source_key: str | None = None,
+    target_key: str | None = None,
+    fresh: bool = False,
+    bidirectional: bool = False,
+    expressions: dict[str, str] | None = None,
+    database: str | None = None,
+    batch_size: int = 5000,
+    max_bytes: int = UNWIND_BATCH_MAX_BYTES,
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Bulk-write relationships from column arrays (see relationship_write_query).
+
+    columns holds "source" and "target" arrays (internal ids or key values) plus one
+    array per relationship property.
+
+    Args:
+        driver: Neo4j driver instance
+        rel_type: Relationship type
+        source_label: Label of the start nodes
+        target_label: Label of the end nodes
+        columns: "source", "target" and property name -> array
+        source_key: Key property of the start nodes (None = internal id)
+        target_key: Key property of the end nodes (None = internal id)
+        fresh: CREATE instead of MERGE (the type must have been deleted first)
+        bidirectional: Write both directions of each row
+        expressions: Extra relationship properties as Cypher expressions
+        database: Neo4j database name
+        batch_size: Max rows per transaction
+        max_bytes: Approximate max payload bytes per transaction
+        logger: Optional logger instance
+
+    Returns:
+        Number of relationships written
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    query = relationship_write_query(
+        rel_type,
+        source_label,
+        target_label,
+        properties=[name for name in columns if name not in ("source", "target")],
+        source_key=source_key,
+        target_key=target_key,
+        fresh=fresh,
+        bidirectional=bidirectional,
+        expressions=expressions,
+    )
+    total_rows = len(columns["source"])
+    if not total_rows:
+        return 0
+
+    start_time = time.perf_counter()
+    with driver.session(database=database) as session:
+        written = write_unwind_batches(
+            session, query, columns, batch_size, max_bytes=max_bytes, logger=logger
+        )
+
+    elapsed = time.perf_counter() - start_time
+    rate = written / elapsed if elapsed > 0 else 0
+    logger.info(
+        f"   ✓ Wrote {written} {rel_type} relationships "
+        f"({'CREATE' if fresh else 'MERGE'}, {rate:,.0f} rows/s)"
+    )
+    return written
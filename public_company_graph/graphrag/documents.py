@@ -20,6 +20,16 @@ from public_company_graph.neo4j.utils import safe_single
 logger = logging.getLogger(__name__)
 
 
+def document_id(company_cik: str, section_type: str, filing_year: int | None) -> str:
+    """Deterministic Document ID: company_cik + section_type + filing_year."""
+    return f"{company_cik}_{section_type}_{filing_year or 'unknown'}"
+
+
+def chunk_id(doc_id: str, chunk_index: int) -> str:
+    """Deterministic Chunk ID: doc_id + chunk_index."""
+    return f"{doc_id}_chunk_{chunk_index}"
+
+
 def create_documents_and_chunks(
     driver: Driver,
     chunks: list[DocumentChunk],
@@ -79,8 +89,7 @@ def create_documents_and_chunks(
         # Create Document nodes (one per filing)
         documents = []
         for (company_cik, section_type, filing_year), doc_chunks in chunks_by_document.items():
-            # Deterministic document ID: company_cik + section_type + filing_year
-            doc_id = f"{company_cik}_{section_type}_{filing_year or 'unknown'}"
+            doc_id = document_id(company_cik, section_type, filing_year)
 
             # Use first chunk's metadata for document-level info
             first_chunk = doc_chunks[0]
@@ -126,11 +135,10 @@ def create_documents_and_chunks(
         all_relationships = []
 
         for (company_cik, section_type, filing_year), doc_chunks in chunks_by_document.items():
-            doc_id = f"{company_cik}_{section_type}_{filing_year or 'unknown'}"
+            doc_id = document_id(company_cik, section_type, filing_year)
 
             for idx, chunk in enumerate(doc_chunks):
-                # Deterministic chunk ID: doc_id + chunk_index
-                chunk_id = f"{doc_id}_chunk_{chunk.chunk_index}"
+                current_id = chunk_id(doc_id, chunk.chunk_index)
 
                 # Serialize metadata as JSON string
                 import json
@@ -139,7 +147,7 @@ def create_documents_and_chunks(
 
                 all_chunk_data.append(
                     {
-                        "chunk_id": chunk_id,
+                        "chunk_id": current_id,
                         "doc_id": doc_id,
                         "text": chunk.text,
                         "chunk_index": chunk.chunk_index,
@@ -150,9 +158,9 @@ def create_documents_and_chunks(
                 # Track relationships to create later
                 all_relationships.append(
                     {
-                        "chunk_id": chunk_id,
+                        "chunk_id": current_id,
                         "doc_id": doc_id,
-                        "next_chunk_id": f"{doc_id}_chunk_{doc_chunks[idx + 1].chunk_index}"
+                        "next_chunk_id": chunk_id(doc_id, doc_chunks[idx + 1].chunk_index)
                         if idx + 1 < len(doc_chunks)
                         else None,
                     }
@@ -1,22 +1,46 @@
 """ETL modules for loading data into Neo4j."""
 
-from public_company_graph.ingest.loaders import load_domains, load_technologies
+from public_company_graph.ingest.admin_import import AdminImportExport, export_admin_import
+from public_company_graph.ingest.cache_readers import read_companies
+from public_company_graph.ingest.incremental import (
+    IngestWatermark,
+    current_watermark,
+    ingest_incremental,
+    read_watermark,
+    write_watermark,
+)
+from public_company_graph.ingest.loaders import (
+    load_domain_batches,
+    load_domains,
+    load_technologies,
+)
 from public_company_graph.ingest.sqlite_readers import (
     get_domain_count,
     get_domain_metadata_counts,
     get_technology_count,
     get_uses_relationship_count,
+    iter_domain_batches,
     read_domains,
     read_technologies,
 )
 
 __all__ = [
     "read_domains",
+    "iter_domain_batches",
     "read_technologies",
     "load_domains",
+    "load_domain_batches",
     "load_technologies",
     "get_domain_count",
     "get_technology_count",
     "get_uses_relationship_count",
     "get_domain_metadata_counts",
+    "read_companies",
+    "AdminImportExport",
+    "export_admin_import",
+    "IngestWatermark",
+    "current_watermark",
+    "read_watermark",
+    "write_watermark",
+    "ingest_incremental",
 ]
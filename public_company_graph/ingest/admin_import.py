@@ -0,0 +1,415 @@
+"""
+Offline bulk import files for `neo4j-admin database import full`.
+
+A from-scratch rebuild through transactional Cypher writes every node and
+relationship through MERGE. neo4j-admin instead builds the store files directly from
+CSV, so the cold-rebuild path exports:
+
+- Domain, Technology and USES from the SQLite domain status database
+- Company and HAS_DOMAIN from the 10-K cache (see cache_readers.read_companies)
+- optionally Document, Chunk, HAS, PART_OF_DOCUMENT and NEXT_CHUNK from filing chunks
+- the IngestState high-water mark of the SQLite source, so incremental bootstraps
+  after the import only load rows added since the export
+
+Each file has a header row in the neo4j-admin format (`cik:ID(Company)`,
+`filing_year:int`, `:START_ID(Domain)`, ...). The export also writes import.sh with
+the neo4j-admin command and constraints.cypher, which is applied once the imported
+database is started (neo4j-admin import does not create constraints or indexes).
+"""
+
+import csv
+import json
+import logging
+import shlex
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from public_company_graph.ingest.incremental import (
+    DOMAIN_STATUS_SOURCE,
+    IngestWatermark,
+    current_watermark,
+)
+from public_company_graph.ingest.sqlite_readers import (
+    domain_field_names,
+    iter_domain_batches,
+    read_technologies,
+)
+from public_company_graph.neo4j.constraints import ALL_CONSTRAINTS
+
+if TYPE_CHECKING:
+    from public_company_graph.graphrag.chunking import DocumentChunk
+
+logger = logging.getLogger(__name__)
+
+# Domain properties with a non-string type (everything else is a string)
+_DOMAIN_TYPES = {
+    "http_status": "int",
+    "status": "int",
+    "response_time_seconds": "float",
+    "response_time": "float",
+    "observed_at_ms": "long",
+    "creation_date_ms": "long",
+    "expiration_date_ms": "long",
+    "is_mobile_friendly": "int",
+}
+
+# Company properties in file order, with neo4j-admin types
+_COMPANY_FIELDS = (
+    ("ticker", None),
+    ("name", None),
+    ("description", None),
+    ("description_source", None),
+    ("risk_factors", None),
+    ("filing_date", "date"),
+    ("filing_year", "int"),
+    ("accession_number", None),
+    ("fiscal_year_end", "date"),
+    ("sec_filing_url", None),
+)
+
+
+def _header(name: str, kind: str | None) -> str:
+    return f"{name}:{kind}" if kind else name
+
+
+@dataclass
+class ImportFile:
+    """One CSV file of the import: nodes of a label or relationships of a type."""
+
+    kind: str  # "nodes" or "relationships"
+    name: str  # Label or relationship type
+    path: Path
+    rows: int
+
+
+@dataclass
+class AdminImportExport:
+    """
+    Writer for a directory of neo4j-admin import files.
+
+    Files are written with the csv module (fields with commas, quotes or newlines
+    are quoted, quotes doubled), so the import runs with --multiline-fields=true.
+    """
+
+    output_dir: Path
+    files: list[ImportFile] = field(default_factory=list)
+    # Timestamp stored as loaded_at/created_at, like datetime() in the Cypher loaders
+    loaded_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def __post_init__(self):
+        self.output_dir = Path(self.output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(
+        self, kind: str, name: str, filename: str, header: Sequence[str], rows: Iterable[Sequence]
+    ) -> ImportFile:
+        """
+        Write one header-plus-rows CSV file.
+
+        Args:
+            kind: "nodes" or "relationships"
+            name: Label (nodes) or relationship type (relationships)
+            filename: File name within output_dir
+            header: neo4j-admin header fields (e.g. "cik:ID(Company)", "year:int")
+            rows: Value sequences matching the header; None is written as an empty
+                field, which neo4j-admin treats as a missing property
+
+        Returns:
+            The ImportFile entry (also appended to files)
+        """
+        path = self.output_dir / filename
+        count = 0
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        import_file = ImportFile(kind=kind, name=name, path=path, rows=count)
+        self.files.append(import_file)
+        logger.info(f"   ✓ Wrote {count:,} {name} {kind} to {path.name}")
+        return import_file
+
+    def command(self, database: str = "neo4j") -> list[str]:
+        """neo4j-admin argv importing every written file into database."""
+        argv = ["neo4j-admin", "database", "import", "full"]
+        for import_file in self.files:
+            argv.append(f"--{import_file.kind}={import_file.name}={import_file.path.resolve()}")
+        argv += [
+            "--multiline-fields=true",
+            "--skip-duplicate-nodes=true",
+            "--skip-bad-relationships=true",
+            "--overwrite-destination=true",
+            database,
+        ]
+        return argv
+
+    def write_scripts(self, database: str = "neo4j") -> tuple[Path, Path]:
+        """
+        Write import.sh (the neo4j-admin command) and constraints.cypher.
+
+        Returns:
+            (import script path, constraints file path)
+        """
+        script = self.output_dir / "import.sh"
+        script.write_text(
+            "#!/bin/sh\n"
+            "# Run with the database stopped, then start it and apply constraints.cypher\n"
+            "set -e\n" + shlex.join(self.command(database)) + "\n",
+            encoding="utf-8",
+        )
+        script.chmod(0o755)
+        constraints = self.output_dir / "constraints.cypher"
+        constraints.write_text(
+            "".join(f"{statement};\n" for statement in ALL_CONSTRAINTS), encoding="utf-8"
+        )
+        return script, constraints
+
+
+def export_domains(export: AdminImportExport, db_path: Path, batch_size: int = 10000) -> set[str]:
+    """
+    Write Domain nodes from SQLite, streaming the url_status/url_whois join.
+
+    The first row of each final_domain is kept (the import has no MERGE).
+
+    Returns:
+        Set of exported final_domain values (for filtering relationships)
+    """
+    properties = [name for name in domain_field_names() if name != "final_domain"]
+    header = ["final_domain:ID(Domain)"]
+    header += [_header(name, _DOMAIN_TYPES.get(name)) for name in properties]
+    header.append("loaded_at:datetime")
+    seen: set[str] = set()
+
+    def rows():
+        for batch in iter_domain_batches(db_path, batch_size=batch_size):
+            for domain in batch:
+                key = domain["final_domain"]
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield [key, *(domain.get(name) for name in properties), export.loaded_at]
+
+    export.write("nodes", "Domain", "domains.csv", header, rows())
+    return seen
+
+
+def export_technologies(export: AdminImportExport, db_path: Path, domains: set[str]) -> None:
+    """Write Technology nodes and USES relationships (one per domain/technology)."""
+    categories: dict[str, str | None] = {}
+    uses: dict[tuple[str, str], None] = {}
+    for row in read_technologies(db_path):
+        name = row["technology_name"]
+        if not name or not name.strip():
+            continue
+        categories.setdefault(name, row["technology_category"] or None)
+        if row["final_domain"] in domains:
+            uses[(row["final_domain"], name)] = None
+
+    export.write(
+        "nodes",
+        "Technology",
+        "technologies.csv",
+        ["name:ID(Technology)", "category", "loaded_at:datetime"],
+        ([name, category, export.loaded_at] for name, category in categories.items()),
+    )
+    export.write(
+        "relationships",
+        "USES",
+        "uses.csv",
+        [":START_ID(Domain)", ":END_ID(Technology)", "loaded_at:datetime"],
+        ([domain, name, export.loaded_at] for domain, name in uses),
+    )
+
+
+def export_ingest_state(export: AdminImportExport, watermark: IngestWatermark) -> None:
+    """Write the IngestState node read by read_watermark (see ingest.incremental)."""
+    export.write(
+        "nodes",
+        "IngestState",
+        "ingest_state.csv",
+        ["source:ID(IngestState)", "observed_at_ms:long", "row_id:long", "updated_at:datetime"],
+        [[DOMAIN_STATUS_SOURCE, watermark.observed_at_ms, watermark.row_id, export.loaded_at]],
+    )
+
+
+def _sec_filing_url(company: dict) -> str | None:
+    """SEC EDGAR folder URL of the filing (strip leading zeros from CIK)."""
+    accession = company.get("accession_number")
+    if not accession or not str(company["cik"]).isdigit():
+        return None
+    return (
+        f"https://www.sec.gov/Archives/edgar/data/{int(company['cik'])}/"
+        f"{accession.replace('-', '')}/"
+    )
+
+
+def export_companies(
+    export: AdminImportExport, companies: list[dict], domains: set[str]
+) -> set[str]:
+    """
+    Write Company nodes and HAS_DOMAIN relationships to exported domains.
+
+    Args:
+        export: Export being written
+        companies: Company dicts from cache_readers.read_companies
+        domains: Exported final_domain values
+
+    Returns:
+        Set of exported CIKs
+    """
+    ciks: set[str] = set()
+    rows = []
+    for company in companies:
+        if company["cik"] in ciks:
+            continue
+        ciks.add(company["cik"])
+        values = {**company, "sec_filing_url": _sec_filing_url(company)}
+        rows.append(
+            [company["cik"], *(values.get(name) for name, _ in _COMPANY_FIELDS), export.loaded_at]
+        )
+
+    header = ["cik:ID(Company)"]
+    header += [_header(name, kind) for name, kind in _COMPANY_FIELDS]
+    header.append("loaded_at:datetime")
+    export.write("nodes", "Company", "companies.csv", header, rows)
+    export.write(
+        "relationships",
+        "HAS_DOMAIN",
+        "has_domain.csv",
+        [":START_ID(Company)", ":END_ID(Domain)", "loaded_at:datetime"],
+        (
+            [company["cik"], company["domain"], export.loaded_at]
+            for company in companies
+            if company.get("domain") in domains
+        ),
+    )
+    return ciks
+
+
+def export_documents(
+    export: AdminImportExport, chunks: Iterable["DocumentChunk"], ciks: set[str]
+) -> None:
+    """
+    Write Document/Chunk nodes and their HAS, PART_OF_DOCUMENT and NEXT_CHUNK links.
+
+    IDs follow create_documents_and_chunks, so a later incremental GraphRAG run
+    merges onto the imported nodes.
+    """
+    from public_company_graph.graphrag.documents import chunk_id, document_id
+
+    by_document: dict[str, list] = {}
+    for chunk in chunks:
+        doc_id = document_id(chunk.company_cik, chunk.section_type, chunk.filing_year)
+        by_document.setdefault(doc_id, []).append(chunk)
+
+    documents: list[list] = []
+    chunk_rows: list[list] = []
+    part_of: list[list[str]] = []
+    next_chunk: list[list[str]] = []
+    for doc_id, doc_chunks in by_document.items():
+        doc_chunks.sort(key=lambda c: c.chunk_index)
+        first = doc_chunks[0]
+        documents.append(
+            [
+                doc_id,
+                first.company_cik,
+                first.company_ticker,
+                first.company_name,
+                first.section_type,
+                first.filing_year,
+                len(doc_chunks),
+                export.loaded_at,
+            ]
+        )
+        ids = [chunk_id(doc_id, chunk.chunk_index) for chunk in doc_chunks]
+        for current_id, chunk in zip(ids, doc_chunks, strict=True):
+            metadata = json.dumps(chunk.metadata) if chunk.metadata else "{}"
+            chunk_rows.append(
+                [current_id, chunk.text, chunk.chunk_index, metadata, export.loaded_at]
+            )
+            part_of.append([current_id, doc_id])
+        next_chunk.extend([a, b] for a, b in zip(ids, ids[1:], strict=False))
+
+    export.write(
+        "nodes",
+        "Document",
+        "documents.csv",
+        [
+            "doc_id:ID(Document)",
+            "company_cik",
+            "company_ticker",
+            "company_name",
+            "section_type",
+            "filing_year:int",
+            "chunk_count:int",
+            "created_at:datetime",
+        ],
+        documents,
+    )
+    export.write(
+        "nodes",
+        "Chunk",
+        "chunks.csv",
+        ["chunk_id:ID(Chunk)", "text", "chunk_index:int", "metadata", "created_at:datetime"],
+        chunk_rows,
+    )
+    export.write(
+        "relationships",
+        "HAS",
+        "has_document.csv",
+        [":START_ID(Company)", ":END_ID(Document)"],
+        ([row[1], row[0]] for row in documents if row[1] in ciks),
+    )
+    export.write(
+        "relationships",
+        "PART_OF_DOCUMENT",
+        "part_of_document.csv",
+        [":START_ID(Chunk)", ":END_ID(Document)"],
+        part_of,
+    )
+    export.write(
+        "relationships",
+        "NEXT_CHUNK",
+        "next_chunk.csv",
+        [":START_ID(Chunk)", ":END_ID(Chunk)"],
+        next_chunk,
+    )
+
+
+def export_admin_import(
+    output_dir: Path,
+    db_path: Path,
+    companies: list[dict] | None = None,
+    chunks: Iterable["DocumentChunk"] | None = None,
+    database: str = "neo4j",
+) -> AdminImportExport:
+    """
+    Export the bootstrap graph as neo4j-admin import files.
+
+    Args:
+        output_dir: Directory for the CSV files, import.sh and constraints.cypher
+        db_path: SQLite domain status database
+        companies: Company dicts from the 10-K cache (None skips Company/HAS_DOMAIN)
+        chunks: Filing chunks (None skips the GraphRAG layer)
+        database: Target database name in import.sh
+
+    Returns:
+        The finished export (files and row counts)
+    """
+    export = AdminImportExport(output_dir)
+    # Taken before reading, so rows added during the export are loaded incrementally
+    watermark = current_watermark(db_path)
+    domains = export_domains(export, db_path)
+    export_technologies(export, db_path, domains)
+    export_ingest_state(export, watermark)
+    ciks: set[str] = set()
+    if companies is not None:
+        ciks = export_companies(export, companies, domains)
+    if chunks is not None:
+        export_documents(export, chunks, ciks)
+    export.write_scripts(database)
+    return export
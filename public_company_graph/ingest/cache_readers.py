@@ -0,0 +1,80 @@
+"""
+10-K cache readers.
+
+This module reads the company records extracted by parse_10k_filings.py from the
+unified cache (namespace 10k_extracted) into the structure the Company loaders use.
+"""
+
+# Upper bound on companies read from the cache
+MAX_CACHED_COMPANIES = 20000
+
+
+def company_record(cik: str, ten_k_data: dict) -> dict:
+    """
+    Company dict of one cached 10-K extraction (None for empty values).
+
+    Args:
+        cik: Company CIK (cache key)
+        ten_k_data: Cached 10k_extracted value
+
+    Returns:
+        Dictionary with cik, ticker, name, description, description_source,
+        risk_factors, domain and filing metadata
+    """
+    # Get website from 10-K
+    domain = ten_k_data.get("website")
+    if domain:
+        domain = domain.lower().replace("www.", "").strip()
+
+    # Extract filing metadata
+    filing_date = ten_k_data.get("filing_date")
+    accession_number = ten_k_data.get("accession_number")
+    fiscal_year_end = ten_k_data.get("fiscal_year_end")
+    filing_year = ten_k_data.get("filing_year")
+
+    # Fallback: Get from filing_metadata dict if present
+    if not filing_date and ten_k_data.get("filing_metadata"):
+        metadata = ten_k_data["filing_metadata"]
+        filing_date = metadata.get("filing_date")
+        accession_number = metadata.get("accession_number") or accession_number
+        fiscal_year_end = metadata.get("fiscal_year_end") or fiscal_year_end
+        filing_year = metadata.get("filing_year") or filing_year
+
+    # Build company dict, using None for empty values (will be cleaned later)
+    ticker_val = ten_k_data.get("ticker", "").upper().strip()
+    name_val = ten_k_data.get("name", "").strip()
+    desc_val = ten_k_data.get("business_description", "").strip()
+    risk_val = ten_k_data.get("risk_factors", "").strip()
+
+    return {
+        "cik": str(cik),
+        "ticker": ticker_val or None,
+        "name": name_val or None,
+        "description": desc_val or None,
+        "description_source": "10k" if desc_val else None,
+        "risk_factors": risk_val or None,
+        "domain": domain or None,
+        "filing_date": filing_date or None,
+        "accession_number": accession_number or None,
+        "fiscal_year_end": fiscal_year_end or None,
+        "filing_year": filing_year or None,
+    }
+
+
+def read_companies(cache, limit: int = MAX_CACHED_COMPANIES) -> list[dict]:
+    """
+    Read Company records from the 10k_extracted cache namespace.
+
+    Args:
+        cache: AppCache instance
+        limit: Max cache keys to read
+
+    Returns:
+        List of company dictionaries (see company_record); empty if nothing is cached
+    """
+    companies = []
+    for cik in cache.keys(namespace="10k_extracted", limit=limit) or []:
+        ten_k_data = cache.get("10k_extracted", cik)
+        if ten_k_data:
+            companies.append(company_record(cik, ten_k_data))
+    return companies
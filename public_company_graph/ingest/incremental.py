@@ -0,0 +1,244 @@
+"""
+Incremental (change-data-capture) ingest from the domain_status SQLite database.
+
+A full bootstrap re-reads url_status and re-MERGEs every domain. The incremental
+mode keeps a high-water mark of url_status (largest observed_at_ms and row id) on an
+IngestState node in the graph, and on the next run only touches domains with rows
+past the mark:
+
+- their Domain properties are rewritten,
+- their technology sets are diffed against the graph, so only new USES edges are
+  created and only dropped ones deleted,
+- they are marked in the Domain DirtySet, so embedding and similarity jobs can
+  recompute just those nodes.
+
+The mark is stored in the graph rather than on disk, so a wiped database (no mark)
+falls back to a full load instead of silently skipping everything.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from public_company_graph.dirty import DirtySet
+from public_company_graph.ingest.loaders import load_domain_batches, load_technologies
+from public_company_graph.ingest.sqlite_readers import (
+    get_domain_watermark,
+    iter_domain_batches,
+    read_changed_domain_names,
+    read_technologies,
+)
+from public_company_graph.neo4j.bulk import BulkLoader
+
+logger = logging.getLogger(__name__)
+
+# IngestState.source of the domain_status high-water mark
+DOMAIN_STATUS_SOURCE = "domain_status"
+
+
+@dataclass(frozen=True)
+class IngestWatermark:
+    """Position in url_status up to which rows have been loaded."""
+
+    observed_at_ms: int = 0
+    row_id: int = 0
+
+
+@dataclass
+class IncrementalIngestResult:
+    """Outcome of one incremental ingest run."""
+
+    domains: set[str] = field(default_factory=set)
+    uses_added: int = 0
+    uses_removed: int = 0
+    watermark: IngestWatermark = field(default_factory=IngestWatermark)
+
+
+def current_watermark(db_path: Path) -> IngestWatermark:
+    """High-water mark of the SQLite source as it is now."""
+    return IngestWatermark(*get_domain_watermark(db_path))
+
+
+def read_watermark(
+    driver, source: str = DOMAIN_STATUS_SOURCE, database: str | None = None
+) -> IngestWatermark | None:
+    """
+    Stored high-water mark of a source.
+
+    Returns:
+        The mark, or None if the graph has never been loaded from the source
+    """
+    with driver.session(database=database) as session:
+        record = session.run(
+            """
+            MATCH (s:IngestState {source: $source})
+            RETURN s.observed_at_ms AS observed_at_ms, s.row_id AS row_id
+            """,
+            source=source,
+        ).single()
+    if record is None:
+        return None
+    return IngestWatermark(int(record["observed_at_ms"] or 0), int(record["row_id"] or 0))
+
+
+def write_watermark(
+    driver,
+    watermark: IngestWatermark,
+    source: str = DOMAIN_STATUS_SOURCE,
+    database: str | None = None,
+) -> None:
+    """Store the high-water mark of a source (after its rows are loaded)."""
+    with driver.session(database=database) as session:
+        session.run(
+            """
+            MERGE (s:IngestState {source: $source})
+            SET s.observed_at_ms = $observed_at_ms,
+                s.row_id = $row_id,
+                s.updated_at = datetime()
+            """,
+            source=source,
+            observed_at_ms=watermark.observed_at_ms,
+            row_id=watermark.row_id,
+        ).consume()
+
+
+def read_graph_technologies(
+    driver, domains: set[str], batch_size: int = 1000, database: str | None = None
+) -> dict[str, set[str]]:
+    """
+    Technologies each domain currently USES in the graph.
+
+    Returns:
+        Mapping of final_domain -> technology names (domains without USES are absent)
+    """
+    names = sorted(domains)
+    existing: dict[str, set[str]] = {}
+    with driver.session(database=database) as session:
+        for i in range(0, len(names), batch_size):
+            result = session.run(
+                """
+                UNWIND $batch AS name
+                MATCH (:Domain {final_domain: name})-[:USES]->(t:Technology)
+                RETURN name AS final_domain, t.name AS technology_name
+                """,
+                batch=names[i : i + batch_size],
+            )
+            for record in result:
+                existing.setdefault(record["final_domain"], set()).add(record["technology_name"])
+    return existing
+
+
+def diff_technologies(
+    tech_mappings: list[dict], existing: dict[str, set[str]], domains: set[str]
+) -> tuple[list[dict], list[dict]]:
+    """
+    Split the changed domains' technology sets into USES edges to add and remove.
+
+    Args:
+        tech_mappings: Current mappings of the changed domains (read_technologies)
+        existing: Technologies the domains USE in the graph (read_graph_technologies)
+        domains: The changed domains (a domain with no current mappings loses all)
+
+    Returns:
+        (mappings to add, {final_domain, technology_name} rows to remove)
+    """
+    current: dict[str, set[str]] = {}
+    added = []
+    for row in tech_mappings:
+        names = current.setdefault(row["final_domain"], set())
+        if row["technology_name"] in names:
+            continue
+        names.add(row["technology_name"])
+        if row["technology_name"] not in existing.get(row["final_domain"], set()):
+            added.append(row)
+
+    removed = [
+        {"final_domain": domain, "technology_name": name}
+        for domain in sorted(domains)
+        for name in sorted(existing.get(domain, set()) - current.get(domain, set()))
+    ]
+    return added, removed
+
+
+def ingest_incremental(
+    driver,
+    db_path: Path,
+    since: IngestWatermark,
+    cache=None,
+    batch_size: int = 1000,
+    workers: int = 1,
+    database: str | None = None,
+    log: logging.Logger | None = None,
+) -> IncrementalIngestResult:
+    """
+    Load only the url_status changes past a high-water mark.
+
+    The new mark is taken before reading and stored only after every write
+    succeeded, so rows arriving mid-run, or a failed run, are picked up next time.
+
+    Args:
+        driver: Neo4j driver instance
+        db_path: Path to SQLite database
+        since: Stored high-water mark (read_watermark)
+        cache: AppCache holding the Domain DirtySet (None skips the marking)
+        batch_size: Rows per write transaction
+        workers: Concurrent writers
+        database: Neo4j database name
+        log: Optional logger instance (uses module logger if not provided)
+
+    Returns:
+        IncrementalIngestResult with the changed domains and USES edge counts
+    """
+    _logger = log or logger
+    watermark = current_watermark(db_path)
+    domains = read_changed_domain_names(db_path, since.observed_at_ms, since.row_id)
+    result = IncrementalIngestResult(domains=domains, watermark=watermark)
+    _logger.info(f"  {len(domains):,} domains changed since the last load")
+
+    if domains:
+        load_domain_batches(
+            driver,
+            iter_domain_batches(db_path, batch_size=batch_size, domains=domains),
+            total=len(domains),
+            batch_size=batch_size,
+            workers=workers,
+            database=database,
+            log=_logger,
+        )
+
+        tech_mappings = read_technologies(db_path, domains=domains)
+        existing = read_graph_technologies(driver, domains, batch_size, database)
+        added, removed = diff_technologies(tech_mappings, existing, domains)
+        if added:
+            load_technologies(
+                driver,
+                added,
+                batch_size=batch_size,
+                workers=workers,
+                database=database,
+                log=_logger,
+            )
+        if removed:
+            loader = BulkLoader(
+                driver, database=database, workers=workers, batch_size=batch_size, logger=_logger
+            )
+            loader.load(
+                """
+                UNWIND $batch AS row
+                MATCH (:Domain {final_domain: row.final_domain})
+                      -[r:USES]->(:Technology {name: row.technology_name})
+                DELETE r
+                """,
+                removed,
+                key="final_domain",
+                description="removed USES relationships",
+                total=len(removed),
+            )
+        result.uses_added, result.uses_removed = len(added), len(removed)
+        _logger.info(f"  ✓ USES: +{len(added):,} / -{len(removed):,}")
+
+        if cache is not None:
+            DirtySet(cache, "Domain").mark(domains)
+
+    write_watermark(driver, watermark, database=database)
+    return result
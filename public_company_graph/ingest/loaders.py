@@ -5,12 +5,79 @@ This module provides functions to load data structures into Neo4j.
 """
 
 import logging
+from collections.abc import Iterable, Iterator
 
+from public_company_graph.neo4j.bulk import BulkLoader
 from public_company_graph.neo4j.utils import clean_properties_batch
 
 logger = logging.getLogger(__name__)
 
 
+_DOMAIN_WRITE_QUERY = """
+UNWIND $batch AS row
+MERGE (d:Domain {final_domain: row.final_domain})
+SET d += row,
+    d.loaded_at = datetime()
+"""
+
+
+def _validated_domains(batches: Iterable[list[dict]]) -> Iterator[dict]:
+    """Flatten batches, failing fast on a row without final_domain."""
+    index = 0
+    for batch in batches:
+        for domain in batch:
+            if domain.get("final_domain") is None:
+                raise ValueError(
+                    f"Domain at index {index} missing required field 'final_domain'. "
+                    f"Got keys: {list(domain.keys())}"
+                )
+            index += 1
+            yield domain
+
+
+def load_domain_batches(
+    driver,
+    batches: Iterable[list[dict]],
+    total: int | None = None,
+    batch_size: int = 1000,
+    workers: int = 1,
+    database: str | None = None,
+    log: logging.Logger | None = None,
+) -> int:
+    """
+    Load Domain nodes from a stream of cleaned batches.
+
+    Rows are written by BulkLoader writer threads while the next batch is read, so
+    reading (e.g. iter_domain_batches over SQLite) overlaps with Neo4j round-trips.
+    Only a few batches per worker are held at a time, so memory stays flat regardless
+    of the number of domains.
+
+    Args:
+        driver: Neo4j driver instance
+        batches: Lists of domain dictionaries without empty values
+            (iter_domain_batches, or clean_properties_batch output)
+        total: Expected number of domains, for progress/ETA logging
+        batch_size: Domains per write transaction
+        workers: Concurrent writers (domains are sharded by final_domain)
+        database: Neo4j database name
+        log: Optional logger instance (uses module logger if not provided)
+
+    Returns:
+        Number of domains written
+    """
+    loader = BulkLoader(
+        driver, database=database, workers=workers, batch_size=batch_size, logger=log or logger
+    )
+    stats = loader.load(
+        _DOMAIN_WRITE_QUERY,
+        _validated_domains(batches),
+        key="final_domain",
+        description="Domain nodes",
+        total=total,
+    )
+    return stats.rows
+
+
 def load_domains(
     driver,
     domains: list[dict],
@@ -28,60 +95,22 @@ def load_domains(
         database: Neo4j database name
         log: Optional logger instance (uses module logger if not provided)
     """
-    import time
-
-    _logger = log or logger
-    total = len(domains)
-    start_time = time.time()
-    last_log_time = start_time
-
-    with driver.session(database=database) as session:
-        for i in range(0, len(domains), batch_size):
-            batch = domains[i : i + batch_size]
-
-            # Validate required field: final_domain (fail fast)
-            for idx, domain in enumerate(batch):
-                if "final_domain" not in domain or domain.get("final_domain") is None:
-                    raise ValueError(
-                        f"Domain at index {i + idx} missing required field 'final_domain'. "
-                        f"Got keys: {list(domain.keys())}"
-                    )
-
-            # Clean empty strings and None values from properties
-            # Neo4j doesn't store nulls; empty strings are semantically equivalent
-            cleaned_batch = clean_properties_batch(batch)
-
-            # Use SET d += row.props to merge only non-empty properties
-            # The loaded_at is set separately to ensure it's always updated
-            query = """
-            UNWIND $batch AS row
-            MERGE (d:Domain {final_domain: row.final_domain})
-            SET d += row,
-                d.loaded_at = datetime()
-            """
-
-            session.run(query, batch=cleaned_batch)
-            processed = i + len(batch)
-
-            # Time-based progress logging (every 30 seconds) or at completion
-            current_time = time.time()
-            if current_time - last_log_time >= 30 or processed >= total:
-                elapsed = current_time - start_time
-                rate = processed / elapsed if elapsed > 0 else 0
-                remaining = (total - processed) / rate if rate > 0 else 0
-                pct = (processed / total * 100) if total > 0 else 0
-                if processed < total:  # Not at the end
-                    _logger.info(
-                        f"  Progress: {processed:,}/{total:,} ({pct:.1f}%) | "
-                        f"Rate: {rate:.1f}/sec | ETA: {remaining / 60:.1f}min"
-                    )
-                last_log_time = current_time
+    # Clean empty strings and None values from properties
+    # Neo4j doesn't store nulls; empty strings are semantically equivalent
+    batches = (
+        clean_properties_batch(domains[i : i + batch_size])
+        for i in range(0, len(domains), batch_size)
+    )
+    load_domain_batches(
+        driver, batches, total=len(domains), batch_size=batch_size, database=database, log=log
+    )
 
 
 def load_technologies(
     driver,
     tech_mappings: list[dict],
     batch_size: int = 1000,
+    workers: int = 1,
     database: str | None = None,
     log: logging.Logger | None = None,
 ):
@@ -92,11 +121,10 @@ def load_technologies(
         driver: Neo4j driver instance
         tech_mappings: List of technology mappings from read_technologies()
         batch_size: Number of relationships to process per batch
+        workers: Concurrent USES writers (sharded by domain)
         database: Neo4j database name
         log: Optional logger instance (uses module logger if not provided)
     """
-    import time
-
     _logger = log or logger
 
     # Extract unique technologies (filter out empty names/categories)
@@ -125,35 +153,21 @@ def load_technologies(
         session.run(query, techs=cleaned_tech_data)
         _logger.info(f"  ✓ Created {len(unique_techs)} Technology nodes")
 
-        # Create USES relationships
-        total = len(tech_mappings)
-        start_time = time.time()
-        last_log_time = start_time
-
-        for i in range(0, len(tech_mappings), batch_size):
-            batch = tech_mappings[i : i + batch_size]
-
-            query = """
-            UNWIND $batch AS row
-            MATCH (d:Domain {final_domain: row.final_domain})
-            MATCH (t:Technology {name: row.technology_name})
-            MERGE (d)-[r:USES]->(t)
-            SET r.loaded_at = datetime()
-            """
-
-            session.run(query, batch=batch)
-            processed = i + len(batch)
-
-            # Time-based progress logging (every 30 seconds) or at completion
-            current_time = time.time()
-            if current_time - last_log_time >= 30 or processed >= total:
-                elapsed = current_time - start_time
-                rate = processed / elapsed if elapsed > 0 else 0
-                remaining = (total - processed) / rate if rate > 0 else 0
-                pct = (processed / total * 100) if total > 0 else 0
-                if processed < total:  # Not at the end
-                    _logger.info(
-                        f"  Progress: {processed:,}/{total:,} ({pct:.1f}%) | "
-                        f"Rate: {rate:.1f}/sec | ETA: {remaining / 60:.1f}min"
-                    )
-                last_log_time = current_time
+    # Create USES relationships; shards are disjoint by domain, and lock conflicts
+    # on technologies shared between shards are retried by the loader
+    loader = BulkLoader(
+        driver, database=database, workers=workers, batch_size=batch_size, logger=_logger
+    )
+    loader.load(
+        """
+        UNWIND $batch AS row
+        MATCH (d:Domain {final_domain: row.final_domain})
+        MATCH (t:Technology {name: row.technology_name})
+        MERGE (d)-[r:USES]->(t)
+        SET r.loaded_at = datetime()
+        """,
+        tech_mappings,
+        key="final_domain",
+        description="USES relationships",
+        total=len(tech_mappings),
+    )
@@ -6,15 +6,164 @@ and return structured data that can be loaded into Neo4j.
 """
 
 import sqlite3
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import closing
 from datetime import UTC, datetime
 from pathlib import Path
 
+_DOMAIN_QUERY = """
+    SELECT DISTINCT
+        us.final_domain,
+        us.initial_domain,
+        us.http_status,
+        us.http_status_text,
+        us.response_time_seconds,
+        us.observed_at_ms,
+        us.is_mobile_friendly,
+        us.spf_record,
+        us.dmarc_record,
+        us.title,
+        us.keywords,
+        us.description,
+        w.creation_date_ms,
+        w.expiration_date_ms,
+        w.registrar,
+        w.registrant_country,
+        w.registrant_org
+    FROM url_status us
+    LEFT JOIN url_whois w ON us.id = w.url_status_id
+    WHERE us.final_domain IS NOT NULL
+"""
+
+# Column names of _DOMAIN_QUERY, in SELECT order
+_DOMAIN_COLUMNS = (
+    "final_domain",
+    "initial_domain",
+    "http_status",
+    "http_status_text",
+    "response_time_seconds",
+    "observed_at_ms",
+    "is_mobile_friendly",
+    "spf_record",
+    "dmarc_record",
+    "title",
+    "keywords",
+    "description",
+    "creation_date_ms",
+    "expiration_date_ms",
+    "registrar",
+    "registrant_country",
+    "registrant_org",
+)
+
+# Field names the loaders expect, mapped to their source column
+_DOMAIN_ALIASES = {
+    "domain": "initial_domain",
+    "status": "http_status",
+    "status_description": "http_status_text",
+    "response_time": "response_time_seconds",
+}
+
+# ISO datetime fields derived from epoch-millisecond columns
+_DOMAIN_TIMESTAMPS = {
+    "timestamp": "observed_at_ms",
+    "creation_date": "creation_date_ms",
+    "expiration_date": "expiration_date_ms",
+}
+
+
+def _iso_from_ms(ms) -> str | None:
+    """ISO-8601 UTC string of an epoch-millisecond value (None if missing or 0)."""
+    if not ms:
+        return None
+    return datetime.fromtimestamp(ms / 1000.0, tz=UTC).isoformat()
+
+
+def _domain_converters() -> tuple[tuple[str, int, Callable | None], ...]:
+    """(field, column index, converter) for every field of a domain record."""
+    index = {column: i for i, column in enumerate(_DOMAIN_COLUMNS)}
+    fields: list[tuple[str, int, Callable | None]] = [
+        (column, index[column], None) for column in _DOMAIN_COLUMNS
+    ]
+    fields += [(alias, index[column], None) for alias, column in _DOMAIN_ALIASES.items()]
+    fields += [(name, index[column], _iso_from_ms) for name, column in _DOMAIN_TIMESTAMPS.items()]
+    return tuple(fields)
+
+
+_DOMAIN_FIELDS = _domain_converters()
+
+
+def _filter_domains(conn: sqlite3.Connection, query: str, domains: Iterable[str] | None) -> str:
+    """
+    Restrict a url_status query (aliased us, with a WHERE clause) to a set of domains.
+
+    The domains go into a temporary table rather than an IN (...) list, so the set
+    can be as large as needed without hitting SQLite's variable limit.
+    """
+    if domains is None:
+        return query
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS selected_domains (final_domain TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM selected_domains")
+    conn.executemany(
+        "INSERT OR IGNORE INTO selected_domains VALUES (?)", ((name,) for name in domains)
+    )
+    return query + " AND us.final_domain IN (SELECT final_domain FROM selected_domains)"
+
+
+def domain_field_names() -> list[str]:
+    """Field names of the domain records built by read_domains/iter_domain_batches."""
+    return [name for name, _, _ in _DOMAIN_FIELDS]
+
+
+def _domain_record(values: tuple, skip_empty: bool) -> dict:
+    """
+    Build a domain dict straight from a SQLite row tuple.
+
+    With skip_empty, None and blank-string values are left out (the same rule as
+    clean_properties), so the record can be written with SET d += row as is.
+    """
+    record = {}
+    for name, index, convert in _DOMAIN_FIELDS:
+        value = values[index]
+        if convert is not None:
+            value = convert(value)
+        if skip_empty and (value is None or (isinstance(value, str) and not value.strip())):
+            continue
+        record[name] = value
+    return record
+
+
+def iter_domain_batches(
+    db_path: Path, batch_size: int = 1000, domains: Iterable[str] | None = None
+) -> Iterator[list[dict]]:
+    """
+    Stream Domain data from SQLite in batches.
+
+    Rows are pulled from the cursor with fetchmany(), so memory stays proportional to
+    batch_size rather than the number of domains. Empty values are omitted, so the
+    batches can be passed to load_domain_batches without cleaning.
+
+    Args:
+        db_path: Path to SQLite database
+        batch_size: Rows per yielded batch
+        domains: Only read these final_domain values (None reads every domain)
+
+    Yields:
+        Lists of domain dictionaries (same fields as read_domains, minus empty values)
+    """
+    with closing(sqlite3.connect(db_path)) as conn:
+        cursor = conn.cursor()
+        cursor.execute(_filter_domains(conn, _DOMAIN_QUERY, domains))
+        while rows := cursor.fetchmany(batch_size):
+            yield [_domain_record(row, skip_empty=True) for row in rows]
+
 
 def read_domains(db_path: Path) -> list[dict]:
     """
     Read Domain data from SQLite url_status table.
 
+    Loads every domain into memory; use iter_domain_batches for large databases.
+
     Args:
         db_path: Path to SQLite database
 
@@ -24,76 +173,18 @@ def read_domains(db_path: Path) -> list[dict]:
     # Use closing() to ensure connection is closed in Python 3.13+
     # The 'with sqlite3.connect()' context manager only manages transactions, not connection closure
     with closing(sqlite3.connect(db_path)) as conn:
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT DISTINCT
-                us.final_domain,
-                us.initial_domain,
-                us.http_status,
-                us.http_status_text,
-                us.response_time_seconds,
-                us.observed_at_ms,
-                us.is_mobile_friendly,
-                us.spf_record,
-                us.dmarc_record,
-                us.title,
-                us.keywords,
-                us.description,
-                w.creation_date_ms,
-                w.expiration_date_ms,
-                w.registrar,
-                w.registrant_country,
-                w.registrant_org
-            FROM url_status us
-            LEFT JOIN url_whois w ON us.id = w.url_status_id
-            WHERE us.final_domain IS NOT NULL
-            """
-        )
-        rows = cursor.fetchall()
-        # Convert to dicts and normalize field names for backward compatibility
-        domains = []
-        for row in rows:
-            domain_dict = dict(row)
-            # Map new schema to expected field names for loaders
-            domain_dict["domain"] = domain_dict.get("initial_domain", "")
-            domain_dict["status"] = domain_dict.get("http_status", 0)
-            domain_dict["status_description"] = domain_dict.get("http_status_text", "")
-            domain_dict["response_time"] = domain_dict.get("response_time_seconds", 0.0)
-            # Convert milliseconds to datetime string (ISO format)
-            observed_ms = domain_dict.get("observed_at_ms")
-            if observed_ms:
-                domain_dict["timestamp"] = datetime.fromtimestamp(
-                    observed_ms / 1000.0, tz=UTC
-                ).isoformat()
-            else:
-                domain_dict["timestamp"] = None
-            # Convert whois dates from milliseconds
-            creation_ms = domain_dict.get("creation_date_ms")
-            if creation_ms:
-                domain_dict["creation_date"] = datetime.fromtimestamp(
-                    creation_ms / 1000.0, tz=UTC
-                ).isoformat()
-            else:
-                domain_dict["creation_date"] = None
-            expiration_ms = domain_dict.get("expiration_date_ms")
-            if expiration_ms:
-                domain_dict["expiration_date"] = datetime.fromtimestamp(
-                    expiration_ms / 1000.0, tz=UTC
-                ).isoformat()
-            else:
-                domain_dict["expiration_date"] = None
-            domains.append(domain_dict)
-        return domains
-
-
-def read_technologies(db_path: Path) -> list[dict]:
+        cursor.execute(_DOMAIN_QUERY)
+        return [_domain_record(row, skip_empty=False) for row in cursor]
+
+
+def read_technologies(db_path: Path, domains: Iterable[str] | None = None) -> list[dict]:
     """
     Read Technology data and domain-technology mappings from SQLite.
 
     Args:
         db_path: Path to SQLite database
+        domains: Only read mappings of these final_domain values (None reads all)
 
     Returns:
         List of dictionaries with final_domain, technology_name, technology_category
@@ -102,17 +193,58 @@ def read_technologies(db_path: Path) -> list[dict]:
     with closing(sqlite3.connect(db_path)) as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        cursor.execute(
-            """
+        query = """
             SELECT DISTINCT us.final_domain, ut.technology_name, ut.technology_category
             FROM url_status us
             JOIN url_technologies ut ON us.id = ut.url_status_id
             WHERE ut.technology_name IS NOT NULL AND ut.technology_name != ''
             """
-        )
+        cursor.execute(_filter_domains(conn, query, domains))
         return [dict(row) for row in cursor.fetchall()]
 
 
+def get_domain_watermark(db_path: Path) -> tuple[int, int]:
+    """
+    High-water mark of the url_status table.
+
+    Returns:
+        (largest observed_at_ms, largest row id); 0 for an empty table
+    """
+    with closing(sqlite3.connect(db_path)) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(observed_at_ms), MAX(id) FROM url_status")
+        observed_at_ms, row_id = cursor.fetchone()
+        return int(observed_at_ms or 0), int(row_id or 0)
+
+
+def read_changed_domain_names(db_path: Path, observed_at_ms: int, row_id: int) -> set[str]:
+    """
+    Domains with url_status rows added or re-observed after a high-water mark.
+
+    A row counts as changed when its observed_at_ms is later than the mark or its id
+    is larger (new rows without a timestamp). Rows deleted from url_status are not
+    detected; a full load handles those.
+
+    Args:
+        db_path: Path to SQLite database
+        observed_at_ms: observed_at_ms part of the previous mark
+        row_id: Row id part of the previous mark
+
+    Returns:
+        Set of final_domain values
+    """
+    with closing(sqlite3.connect(db_path)) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT DISTINCT final_domain FROM url_status
+            WHERE final_domain IS NOT NULL AND (observed_at_ms > ? OR id > ?)
+            """,
+            (observed_at_ms, row_id),
+        )
+        return {row[0] for row in cursor}
+
+
 def get_domain_count(db_path: Path) -> int:
     """Get count of distinct domains in database."""
     # Use closing() to ensure connection is closed in Python 3.13+
@@ -1,5 +1,6 @@
 """Neo4j connection and utilities."""
 
+from public_company_graph.neo4j.bulk import BulkLoader, BulkLoadStats, partition_rows
 from public_company_graph.neo4j.connection import (
     get_neo4j_driver,
     verify_connection,
@@ -11,6 +12,12 @@ from public_company_graph.neo4j.constraints import (
     create_domain_constraints,
     create_technology_constraints,
 )
+from public_company_graph.neo4j.prepared import (
+    QUERY_REGISTRY,
+    PreparedQuery,
+    QueryRegistry,
+    register_query,
+)
 from public_company_graph.neo4j.utils import (
     clean_properties,
     clean_properties_batch,
@@ -28,4 +35,11 @@ __all__ = [
     "clean_properties",
     "clean_properties_batch",
     "delete_relationships_in_batches",
+    "PreparedQuery",
+    "QueryRegistry",
+    "QUERY_REGISTRY",
+    "register_query",
+    "BulkLoader",
+    "BulkLoadStats",
+    "partition_rows",
 ]
@@ -0,0 +1,231 @@
+"""
+Parallel partitioned bulk loader.
+
+Serial UNWIND loads push every batch through one session, so the database works on
+one transaction at a time. BulkLoader partitions rows by a stable hash of a key into
+disjoint shards and gives each shard its own writer thread, so N transactions run
+concurrently without two of them ever touching the same key:
+
+    loader = BulkLoader(driver, database=database, workers=8)
+    stats = loader.load(
+        "UNWIND $batch AS row MERGE (d:Domain {final_domain: row.final_domain}) SET d += row",
+        rows,
+        key="final_domain",
+    )
+
+For relationship loads, shard on one endpoint; the other endpoint may be shared
+between shards (e.g. a popular Technology), and the lock conflicts that causes are
+retried with exponential backoff.
+"""
+
+import logging
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from tenacity import (
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+from public_company_graph.retry import NEO4J_TRANSIENT, TRANSIENT_EXCEPTIONS
+
+logger = logging.getLogger(__name__)
+
+
+def shard_of(value, shards: int) -> int:
+    """Stable shard of a key value (CRC32, so identical across processes)."""
+    if shards <= 1:
+        return 0
+    return zlib.crc32(str(value).encode("utf-8")) % shards
+
+
+def partition_rows(
+    rows: Iterable[dict], key: str | Callable[[dict], object], shards: int
+) -> list[list[dict]]:
+    """
+    Split rows into disjoint shards by key hash.
+
+    Args:
+        rows: Row dictionaries
+        key: Row field (or function of the row) identifying the node written
+        shards: Number of shards
+
+    Returns:
+        One list of rows per shard; rows with equal keys share a shard
+    """
+    key_of = key if callable(key) else (lambda row: row[key])
+    partitions: list[list[dict]] = [[] for _ in range(max(shards, 1))]
+    for row in rows:
+        partitions[shard_of(key_of(row), shards)].append(row)
+    return partitions
+
+
+@dataclass
+class BulkLoadStats:
+    """Throughput metrics of one BulkLoader.load call."""
+
+    rows: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    rows_per_shard: list[int] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def record(self, shard: int, rows: int, retries: int) -> None:
+        """Count a committed batch (called from writer threads)."""
+        with self._lock:
+            self.rows += rows
+            self.batches += 1
+            self.retries += retries
+            self.rows_per_shard[shard] += rows
+
+
+class BulkLoader:
+    """
+    Concurrent UNWIND writer over hash-partitioned shards.
+
+    Each shard has one writer thread, so batches of a shard commit in order and
+    shards never write the same key. At most max_pending batches per shard are
+    queued, so memory stays bounded when rows come from a generator.
+    """
+
+    def __init__(
+        self,
+        driver,
+        database: str | None = None,
+        workers: int = 4,
+        batch_size: int = 1000,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_pending: int = 2,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            driver: Neo4j driver instance (its connection pool serves all writers)
+            database: Neo4j database name
+            workers: Number of shards / concurrent write transactions
+            batch_size: Rows per transaction
+            max_retries: Retries of a batch failing with a transient error (deadlock,
+                lock timeout, leader switch) before giving up
+            backoff: Initial retry delay in seconds (doubles per retry, with jitter)
+            max_pending: Queued batches per shard before reading blocks
+            logger: Optional logger instance
+        """
+        self.driver = driver
+        self.database = database
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_pending = max(1, max_pending)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def _write_batch(self, query: str, batch: list[dict], shard: int, stats: BulkLoadStats):
+        """Write one batch in its own transaction, retrying transient failures."""
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=wait_exponential(multiplier=self.backoff, max=30) + wait_random(0, self.backoff),
+            retry=retry_if_exception_type(TRANSIENT_EXCEPTIONS + NEO4J_TRANSIENT),
+            reraise=True,
+        )
+        for attempt in retrying:
+            with attempt, self.driver.session(database=self.database) as session:
+                with session.begin_transaction() as tx:
+                    tx.run(query, batch=batch).consume()
+                    tx.commit()
+        stats.record(shard, len(batch), attempt.retry_state.attempt_number - 1)
+
+    def load(
+        self,
+        query: str,
+        rows: Iterable[dict],
+        key: str | Callable[[dict], object],
+        description: str = "rows",
+        total: int | None = None,
+    ) -> BulkLoadStats:
+        """
+        Write rows with query ($batch is a list of rows) across the shards.
+
+        Args:
+            query: Cypher with UNWIND $batch AS row ...
+            rows: Row dictionaries (any iterable; read once)
+            key: Row field (or function of the row) to partition on
+            description: What the rows are, for the log lines
+            total: Expected number of rows, for progress/ETA logging
+
+        Returns:
+            BulkLoadStats for this load
+
+        Raises:
+            The first failed batch's error, as soon as it is seen. Batches already
+            running finish, queued ones are cancelled, and committed batches stay
+            written (the load is not atomic; MERGE-based loads can simply be rerun)
+        """
+        key_of = key if callable(key) else (lambda row: row[key])
+        stats = BulkLoadStats(rows_per_shard=[0] * self.workers)
+        start_time = time.perf_counter()
+
+        executors = [ThreadPoolExecutor(max_workers=1) for _ in range(self.workers)]
+        buffers: list[list[dict]] = [[] for _ in range(self.workers)]
+        pending: list[deque[Future]] = [deque() for _ in range(self.workers)]
+
+        last_log_time = start_time
+
+        def submit(shard: int) -> None:
+            nonlocal last_log_time
+            queue = pending[shard]
+            while len(queue) >= self.max_pending:
+                queue.popleft().result()
+            queue.append(
+                executors[shard].submit(self._write_batch, query, buffers[shard], shard, stats)
+            )
+            buffers[shard] = []
+
+            # Time-based progress logging (every 30 seconds)
+            current_time = time.perf_counter()
+            if total and current_time - last_log_time >= 30:
+                rate = stats.rows / (current_time - start_time)
+                remaining = (total - stats.rows) / rate if rate > 0 else 0
+                self.logger.info(
+                    f"  Progress: {stats.rows:,}/{total:,} {description} "
+                    f"({stats.rows / total * 100:.1f}%) | Rate: {rate:.1f}/sec | "
+                    f"ETA: {remaining / 60:.1f}min"
+                )
+                last_log_time = current_time
+
+        try:
+            for row in rows:
+                shard = shard_of(key_of(row), self.workers)
+                buffers[shard].append(row)
+                if len(buffers[shard]) >= self.batch_size:
+                    submit(shard)
+            for shard in range(self.workers):
+                if buffers[shard]:
+                    submit(shard)
+            for queue in pending:
+                while queue:
+                    queue.popleft().result()
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        stats.seconds = time.perf_counter() - start_time
+        self.logger.info(
+            f"   ✓ Wrote {stats.rows:,} {description} in {stats.batches} batches "
+            f"({self.workers} worker(s), {stats.retries} retries, "
+            f"{stats.rows_per_second:,.0f} rows/s)"
+        )
+        return stats
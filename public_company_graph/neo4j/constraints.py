@@ -9,6 +9,57 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Constraints and indexes for Domain nodes
+DOMAIN_CONSTRAINTS = [
+    "CREATE CONSTRAINT domain_name IF NOT EXISTS FOR (d:Domain) REQUIRE d.final_domain IS UNIQUE",
+    "CREATE INDEX domain_domain IF NOT EXISTS FOR (d:Domain) ON (d.domain)",
+]
+
+# Constraints and indexes for Technology nodes
+TECHNOLOGY_CONSTRAINTS = [
+    "CREATE CONSTRAINT technology_name IF NOT EXISTS FOR (t:Technology) REQUIRE t.name IS UNIQUE",
+]
+
+# Constraints and indexes for Company nodes (and similarity group nodes)
+COMPANY_CONSTRAINTS = [
+    "CREATE CONSTRAINT company_cik IF NOT EXISTS FOR (c:Company) REQUIRE c.cik IS UNIQUE",
+    "CREATE INDEX company_ticker IF NOT EXISTS FOR (c:Company) ON (c.ticker)",
+    # Indexes for enrichment properties (Phase 1)
+    "CREATE INDEX company_sector IF NOT EXISTS FOR (c:Company) ON (c.sector)",
+    "CREATE INDEX company_industry IF NOT EXISTS FOR (c:Company) ON (c.industry)",
+    "CREATE INDEX company_sic_code IF NOT EXISTS FOR (c:Company) ON (c.sic_code)",
+    "CREATE INDEX company_naics_code IF NOT EXISTS FOR (c:Company) ON (c.naics_code)",
+    # Indexes for filing metadata
+    "CREATE INDEX company_filing_date IF NOT EXISTS FOR (c:Company) ON (c.filing_date)",
+    "CREATE INDEX company_filing_year IF NOT EXISTS FOR (c:Company) ON (c.filing_year)",
+    "CREATE INDEX company_accession_number IF NOT EXISTS FOR (c:Company) ON (c.accession_number)",
+    # Group nodes for membership-based industry/size similarity
+    "CREATE CONSTRAINT industry_group_key IF NOT EXISTS FOR (g:IndustryGroup) REQUIRE g.key IS UNIQUE",
+    "CREATE CONSTRAINT size_bucket_key IF NOT EXISTS FOR (g:SizeBucket) REQUIRE g.key IS UNIQUE",
+]
+
+# Constraints and indexes for Document and Chunk nodes (GraphRAG layer)
+DOCUMENT_CONSTRAINTS = [
+    # Document node constraints (filing-level)
+    "CREATE CONSTRAINT unique_doc_id IF NOT EXISTS FOR (d:Document) REQUIRE d.doc_id IS UNIQUE",
+    "CREATE INDEX document_company_cik IF NOT EXISTS FOR (d:Document) ON (d.company_cik)",
+    "CREATE INDEX document_section_type IF NOT EXISTS FOR (d:Document) ON (d.section_type)",
+    # Chunk node constraints (text piece-level)
+    "CREATE CONSTRAINT unique_chunk_id IF NOT EXISTS FOR (c:Chunk) REQUIRE c.chunk_id IS UNIQUE",
+    "CREATE INDEX chunk_chunk_index IF NOT EXISTS FOR (c:Chunk) ON (c.chunk_index)",
+    # Vector index for fast similarity search (Neo4j 5+)
+    (
+        "CREATE VECTOR INDEX chunk_embedding_vector IF NOT EXISTS "
+        "FOR (c:Chunk) ON c.embedding "
+        "OPTIONS {indexConfig: {`vector.dimensions`: 1536, `vector.similarity_function`: 'cosine'}}"
+    ),
+]
+
+# Every statement above, in creation order (e.g. to apply after neo4j-admin import)
+ALL_CONSTRAINTS = (
+    DOMAIN_CONSTRAINTS + TECHNOLOGY_CONSTRAINTS + COMPANY_CONSTRAINTS + DOCUMENT_CONSTRAINTS
+)
+
 
 def _run_constraints(
     driver,
@@ -53,14 +104,7 @@ def create_domain_constraints(
         database: Neo4j database name
         logger: Optional logger instance
     """
-    constraints = [
-        (
-            "CREATE CONSTRAINT domain_name IF NOT EXISTS "
-            "FOR (d:Domain) REQUIRE d.final_domain IS UNIQUE"
-        ),
-        "CREATE INDEX domain_domain IF NOT EXISTS FOR (d:Domain) ON (d.domain)",
-    ]
-    _run_constraints(driver, constraints, database=database, log=logger)
+    _run_constraints(driver, DOMAIN_CONSTRAINTS, database=database, log=logger)
 
 
 def create_technology_constraints(
@@ -74,13 +118,7 @@ def create_technology_constraints(
         database: Neo4j database name
         logger: Optional logger instance
     """
-    constraints = [
-        (
-            "CREATE CONSTRAINT technology_name IF NOT EXISTS "
-            "FOR (t:Technology) REQUIRE t.name IS UNIQUE"
-        ),
-    ]
-    _run_constraints(driver, constraints, database=database, log=logger)
+    _run_constraints(driver, TECHNOLOGY_CONSTRAINTS, database=database, log=logger)
 
 
 def create_company_constraints(
@@ -94,20 +132,7 @@ def create_company_constraints(
         database: Neo4j database name
         logger: Optional logger instance
     """
-    constraints = [
-        "CREATE CONSTRAINT company_cik IF NOT EXISTS FOR (c:Company) REQUIRE c.cik IS UNIQUE",
-        "CREATE INDEX company_ticker IF NOT EXISTS FOR (c:Company) ON (c.ticker)",
-        # Indexes for enrichment properties (Phase 1)
-        "CREATE INDEX company_sector IF NOT EXISTS FOR (c:Company) ON (c.sector)",
-        "CREATE INDEX company_industry IF NOT EXISTS FOR (c:Company) ON (c.industry)",
-        "CREATE INDEX company_sic_code IF NOT EXISTS FOR (c:Company) ON (c.sic_code)",
-        "CREATE INDEX company_naics_code IF NOT EXISTS FOR (c:Company) ON (c.naics_code)",
-        # Indexes for filing metadata
-        "CREATE INDEX company_filing_date IF NOT EXISTS FOR (c:Company) ON (c.filing_date)",
-        "CREATE INDEX company_filing_year IF NOT EXISTS FOR (c:Company) ON (c.filing_year)",
-        "CREATE INDEX company_accession_number IF NOT EXISTS FOR (c:Company) ON (c.accession_number)",
-    ]
-    _run_constraints(driver, constraints, database=database, log=logger)
+    _run_constraints(driver, COMPANY_CONSTRAINTS, database=database, log=logger)
 
 
 def create_document_constraints(
@@ -126,28 +151,7 @@ def create_document_constraints(
         database: Neo4j database name
         logger: Optional logger instance
     """
-    constraints = [
-        # Document node constraints (filing-level)
-        (
-            "CREATE CONSTRAINT unique_doc_id IF NOT EXISTS "
-            "FOR (d:Document) REQUIRE d.doc_id IS UNIQUE"
-        ),
-        "CREATE INDEX document_company_cik IF NOT EXISTS FOR (d:Document) ON (d.company_cik)",
-        "CREATE INDEX document_section_type IF NOT EXISTS FOR (d:Document) ON (d.section_type)",
-        # Chunk node constraints (text piece-level)
-        (
-            "CREATE CONSTRAINT unique_chunk_id IF NOT EXISTS "
-            "FOR (c:Chunk) REQUIRE c.chunk_id IS UNIQUE"
-        ),
-        "CREATE INDEX chunk_chunk_index IF NOT EXISTS FOR (c:Chunk) ON (c.chunk_index)",
-        # Vector index for fast similarity search (Neo4j 5+)
-        (
-            "CREATE VECTOR INDEX chunk_embedding_vector IF NOT EXISTS "
-            "FOR (c:Chunk) ON c.embedding "
-            "OPTIONS {indexConfig: {`vector.dimensions`: 1536, `vector.similarity_function`: 'cosine'}}"
-        ),
-    ]
-    _run_constraints(driver, constraints, database=database, log=logger)
+    _run_constraints(driver, DOCUMENT_CONSTRAINTS, database=database, log=logger)
 
 
 def create_bootstrap_constraints(
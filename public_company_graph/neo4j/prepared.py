@@ -0,0 +1,83 @@
+"""
+Prepared (parameterized) Cypher query registry.
+
+Neo4j caches execution plans by query text. Queries built with f-strings produce a
+new text for every ticker, limit or weight, so each call is parsed and planned
+again. Registered queries are fixed templates whose variable parts are passed as
+parameters ($ticker, $limit, ...), so repeated calls hit the plan cache.
+
+Usage:
+    TOP_SIMILAR = register_query("company.top_similar", "MATCH ... {ticker: $ticker} ...")
+    with driver.session() as session:
+        records = TOP_SIMILAR.run(session, ticker="KO", limit=10)
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """A named Cypher template; all variable parts are $parameters."""
+
+    name: str
+    text: str
+    # Parameter defaults merged under the call's parameters
+    defaults: dict = field(default_factory=dict, compare=False)
+
+    def parameters(self, **parameters) -> dict:
+        """Call parameters merged over the defaults."""
+        return {**self.defaults, **parameters}
+
+    def run(self, session, **parameters):
+        """Run the template on a session (or transaction) with parameters."""
+        return session.run(self.text, self.parameters(**parameters))
+
+
+class QueryRegistry:
+    """
+    Thread-safe name -> PreparedQuery registry.
+
+    Registering the same name twice with the same text returns the existing entry;
+    a different text raises ValueError, since two templates under one name would
+    defeat the point of a stable query text.
+    """
+
+    def __init__(self):
+        self._queries: dict[str, PreparedQuery] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, text: str, defaults: dict | None = None) -> PreparedQuery:
+        """Register (or fetch the identical existing) template under name."""
+        with self._lock:
+            existing = self._queries.get(name)
+            if existing is not None:
+                if existing.text != text:
+                    raise ValueError(f"Query {name!r} is already registered with another text")
+                return existing
+            query = PreparedQuery(name=name, text=text, defaults=dict(defaults or {}))
+            self._queries[name] = query
+            return query
+
+    def get(self, name: str) -> PreparedQuery:
+        """Registered query by name (KeyError if unknown)."""
+        return self._queries[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._queries
+
+    def names(self) -> list[str]:
+        """Registered query names, sorted."""
+        return sorted(self._queries)
+
+
+# Process-wide registry used by the query modules
+QUERY_REGISTRY = QueryRegistry()
+
+
+def register_query(name: str, text: str, defaults: dict | None = None) -> PreparedQuery:
+    """Register a template in the process-wide registry."""
+    return QUERY_REGISTRY.register(name, text, defaults)
@@ -610,6 +610,121 @@ def _normalize_company_name(name: str) -> str:
     return name.strip()
 
 
+# =============================================================================
+# SENTENCE SEGMENTATION
+# =============================================================================
+
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+# Pattern 1: Capitalized multi-word sequences (1-4 words)
+_CAPITALIZED_SEQUENCE_PATTERN = re.compile(
+    r"\b([A-Z][a-zA-Z&\.\-]*(?:\s+[A-Z][a-zA-Z&\.\-]*){0,3})\b"
+)
+
+# Pattern 2: All-caps sequences (2-5 chars) - likely tickers
+_ALL_CAPS_PATTERN = re.compile(r"\b([A-Z]{2,5})\b")
+
+
+def _build_keyword_index() -> tuple[re.Pattern[str], dict[str, frozenset[RelationshipType]]]:
+    """
+    Build one combined keyword pattern covering every relationship type.
+
+    Alternatives are ordered longest-first, so a match at any position is the
+    longest keyword starting there; every other keyword starting at that
+    position is a prefix of it. Each keyword therefore maps to the union of the
+    types of all its keyword prefixes. Combined with restarting the search one
+    character after each match (keywords may overlap, e.g. "supply agreement
+    with"), this reproduces plain substring matching exactly.
+    """
+    keyword_types: dict[str, set[RelationshipType]] = {}
+    for rel_type, keywords in RELATIONSHIP_KEYWORDS.items():
+        for kw in keywords:
+            keyword_types.setdefault(kw, set()).add(rel_type)
+
+    tags: dict[str, frozenset[RelationshipType]] = {}
+    for kw in keyword_types:
+        types: set[RelationshipType] = set()
+        for other, other_types in keyword_types.items():
+            if kw.startswith(other):
+                types |= other_types
+        tags[kw] = frozenset(types)
+
+    alternation = "|".join(re.escape(kw) for kw in sorted(keyword_types, key=len, reverse=True))
+    return re.compile(alternation), tags
+
+
+_KEYWORD_PATTERN, _KEYWORD_TAGS = _build_keyword_index()
+
+
+@dataclass
+class TaggedSentence:
+    """A sentence tagged with every relationship type whose keywords it mentions."""
+
+    text: str
+    start: int  # Offset of the sentence in the source text
+    relationship_types: frozenset[RelationshipType]
+    _candidates: list[str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def candidates(self) -> list[str]:
+        """Potential company name spans in this sentence (computed once, then cached)."""
+        if self._candidates is None:
+            self._candidates = _CAPITALIZED_SEQUENCE_PATTERN.findall(
+                self.text
+            ) + _ALL_CAPS_PATTERN.findall(self.text)
+        return self._candidates
+
+
+def _tag_sentence(sentence: str) -> frozenset[RelationshipType]:
+    """Return the relationship types whose keywords appear in a sentence."""
+    sentence_lower = sentence.lower()
+    tags: frozenset[RelationshipType] = frozenset()
+    match = _KEYWORD_PATTERN.search(sentence_lower)
+    while match:
+        tags |= _KEYWORD_TAGS[match.group()]
+        match = _KEYWORD_PATTERN.search(sentence_lower, match.start() + 1)
+    return tags
+
+
+def segment_relationship_sentences(text: str | None) -> list[TaggedSentence]:
+    """
+    Split text into sentences once and tag each with its relationship types.
+
+    Sentences that mention no relationship keyword are dropped. Use this when
+    extracting several relationship types from the same text: the text is
+    scanned once instead of once per type.
+
+    Args:
+        text: Full text to segment
+
+    Returns:
+        List of TaggedSentence in document order
+    """
+    if not text:
+        return []
+
+    tagged: list[TaggedSentence] = []
+    pos = 0
+    for boundary in _SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        _append_tagged_sentence(tagged, text, pos, boundary.start())
+        pos = boundary.end()
+    _append_tagged_sentence(tagged, text, pos, len(text))
+    return tagged
+
+
+def _append_tagged_sentence(tagged: list[TaggedSentence], text: str, start: int, end: int) -> None:
+    """Strip text[start:end] and append it to tagged if it has relationship keywords."""
+    raw = text[start:end]
+    sentence = raw.strip()
+    if not sentence:
+        return
+    types = _tag_sentence(sentence)
+    if types:
+        offset = start + (len(raw) - len(raw.lstrip()))
+        tagged.append(TaggedSentence(text=sentence, start=offset, relationship_types=types))
+
+
 # =============================================================================
 # EXTRACTION FUNCTIONS
 # =============================================================================
@@ -629,22 +744,37 @@ def extract_relationship_sentences(
     Returns:
         List of (sentence, start_position) tuples
     """
-    if not text:
-        return []
+    return [
+        (s.text, s.start)
+        for s in segment_relationship_sentences(text)
+        if relationship_type in s.relationship_types
+    ]
 
-    keywords = RELATIONSHIP_KEYWORDS[relationship_type]
-    sentences = []
-    current_pos = 0
 
-    for sentence in re.split(r"(?<=[.!?])\s+", text):
-        sentence = sentence.strip()
-        sentence_lower = sentence.lower()
+def _build_decision_system(use_tiered_decision: bool, embedding_scorer, llm_verifier):
+    """Create a TieredDecisionSystem, or None if tiered decisions are disabled."""
+    # Only enable if embedding_scorer is provided (required for Tier 3)
+    if not use_tiered_decision or embedding_scorer is None:
+        return None
+
+    from public_company_graph.entity_resolution.tiered_decision import TieredDecisionSystem
+
+    return TieredDecisionSystem(
+        use_tier1=True,
+        use_tier2=True,
+        use_tier3=True,
+        use_tier4=(llm_verifier is not None),
+    )
 
-        # Check if any keyword appears in sentence
-        if sentence and any(kw in sentence_lower for kw in keywords):
-            sentences.append((sentence, current_pos))
-        current_pos += len(sentence) + 1
 
+def _segment_texts(
+    business_description: str | None, risk_factors: str | None
+) -> list[TaggedSentence]:
+    """Segment Item 1 then Item 1A into tagged sentences (in that order)."""
+    sentences = []
+    for text in (business_description, risk_factors):
+        if text:
+            sentences.extend(segment_relationship_sentences(text))
     return sentences
 
 
@@ -676,132 +806,133 @@ def extract_and_resolve_relationships(
     Returns:
         List of dicts with: cik, ticker, name, confidence, raw_mention, context
     """
+    return _resolve_tagged_sentences(
+        sentences=_segment_texts(business_description, risk_factors),
+        lookup=lookup,
+        relationship_type=relationship_type,
+        self_cik=self_cik,
+        decision_system=_build_decision_system(use_tiered_decision, embedding_scorer, llm_verifier),
+        embedding_scorer=embedding_scorer,
+        llm_verifier=llm_verifier,
+        resolution_cache={},
+    )
+
+
+def _resolve_tagged_sentences(
+    sentences: list[TaggedSentence],
+    lookup: CompanyLookup,
+    relationship_type: RelationshipType,
+    self_cik: str | None,
+    decision_system,
+    embedding_scorer,
+    llm_verifier,
+    resolution_cache: dict[str, dict[str, Any] | None],
+) -> list[dict[str, Any]]:
+    """
+    Resolve the candidates of pre-tagged sentences for one relationship type.
+
+    resolution_cache memoizes _resolve_candidate per candidate string; it is
+    only valid for a single (lookup, self_cik) pair and may be shared across
+    relationship types.
+    """
     results = []
     seen_ciks: set[str] = set()
 
-    # Initialize tiered decision system (default, recommended)
-    # Only enable if embedding_scorer is provided (required for Tier 3)
-    decision_system = None
-    if use_tiered_decision and embedding_scorer is not None:
-        from public_company_graph.entity_resolution.candidates import Candidate
-        from public_company_graph.entity_resolution.tiered_decision import (
-            TieredDecisionSystem,
-        )
+    # Convert relationship_type to Neo4j format (e.g., "competitor" -> "HAS_COMPETITOR")
+    neo4j_relationship_type = RELATIONSHIP_TYPE_TO_NEO4J.get(
+        relationship_type, f"HAS_{relationship_type.name}"
+    )
 
-        decision_system = TieredDecisionSystem(
-            use_tier1=True,
-            use_tier2=True,
-            use_tier3=True,
-            use_tier4=(llm_verifier is not None),
-        )
+    for tagged in sentences:
+        if relationship_type not in tagged.relationship_types:
+            continue
+        sentence = tagged.text
 
-    # Combine texts
-    texts = []
-    if business_description:
-        texts.append(business_description)
-    if risk_factors:
-        texts.append(risk_factors)
-
-    for text in texts:
-        # Find sentences with relationship keywords
-        sentences = extract_relationship_sentences(text, relationship_type)
-
-        for sentence, _ in sentences:
-            # Extract potential company names from this sentence
-            # Pattern 1: Capitalized multi-word sequences (1-4 words)
-            candidates = re.findall(
-                r"\b([A-Z][a-zA-Z&\.\-]*(?:\s+[A-Z][a-zA-Z&\.\-]*){0,3})\b",
-                sentence,
-            )
-
-            # Pattern 2: All-caps sequences (2-5 chars) - likely tickers
-            candidates += re.findall(r"\b([A-Z]{2,5})\b", sentence)
-
-            for candidate in candidates:
-                candidate = candidate.strip()
-                if len(candidate) < 2:
-                    continue
-
-                # Try to resolve against lookup
-                resolved = _resolve_candidate(candidate, lookup, self_cik)
+        for candidate in tagged.candidates:
+            candidate = candidate.strip()
+            if len(candidate) < 2:
+                continue
 
-                if resolved and resolved["cik"] not in seen_ciks:
-                    # Apply tiered decision system (default, recommended)
-                    tiered_decision = None
-                    embedding_similarity = None
-
-                    if decision_system:
-                        from public_company_graph.entity_resolution.candidates import Candidate
-
-                        # Create candidate object
-                        candidate_obj = Candidate(
-                            text=candidate,
-                            sentence=sentence[:500],
-                            start_pos=0,
-                            end_pos=len(candidate),
-                            source_pattern="extraction",
-                        )
-
-                        # Compute embedding similarity if scorer provided
-                        if embedding_scorer:
-                            try:
-                                embedding_result = embedding_scorer.score(
-                                    context=sentence[:500],
-                                    ticker=resolved["ticker"],
-                                    company_name=resolved["name"],
-                                )
-                                embedding_similarity = embedding_result.similarity
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to compute embedding similarity for {candidate}: {e}"
-                                )
-
-                        # Make tiered decision (decision_system only exists if embedding_scorer provided)
-                        # Convert relationship_type to Neo4j format (e.g., "competitor" -> "HAS_COMPETITOR")
-                        neo4j_relationship_type = RELATIONSHIP_TYPE_TO_NEO4J.get(
-                            relationship_type, f"HAS_{relationship_type.name}"
-                        )
-                        tiered_decision = decision_system.decide(
-                            candidate=candidate_obj,
-                            context=sentence[:500],
-                            relationship_type=neo4j_relationship_type,
-                            company_name=resolved["name"],
-                            embedding_similarity=embedding_similarity,
-                            llm_verifier=llm_verifier,
-                        )
-
-                        # Handle decision
-                        if tiered_decision.decision.value == "reject":
-                            # Skip this candidate - rejected by tiered system
-                            continue
-                        elif tiered_decision.decision.value == "candidate":
-                            # Store as candidate (medium confidence)
-                            pass  # Will be handled by caller based on confidence_tier
-
-                    seen_ciks.add(resolved["cik"])
-                    result_dict = {
-                        "target_cik": resolved["cik"],
-                        "target_ticker": resolved["ticker"],
-                        "target_name": resolved["name"],
-                        "confidence": resolved["confidence"],
-                        "raw_mention": candidate,
-                        "context": sentence[:200],
-                        "relationship_type": relationship_type.value,
-                    }
-
-                    # Add tiered decision metadata if available
-                    if tiered_decision:
-                        result_dict["embedding_similarity"] = embedding_similarity
-                        result_dict["decision_tier"] = tiered_decision.tier.value
-                        result_dict["decision_reason"] = tiered_decision.reason
-                        result_dict["decision_confidence"] = tiered_decision.confidence
-                        # Map decision to confidence tier for compatibility
-                        if tiered_decision.decision.value == "accept":
-                            result_dict["confidence_tier"] = "high"
-                        elif tiered_decision.decision.value == "candidate":
-                            result_dict["confidence_tier"] = "medium"
-
-                    results.append(result_dict)
+            # Try to resolve against lookup
+            if candidate in resolution_cache:
+                resolved = resolution_cache[candidate]
+            else:
+                resolved = _resolve_candidate(candidate, lookup, self_cik)
+                resolution_cache[candidate] = resolved
+
+            if resolved and resolved["cik"] not in seen_ciks:
+                # Apply tiered decision system (default, recommended)
+                tiered_decision = None
+                embedding_similarity = None
+
+                if decision_system:
+                    from public_company_graph.entity_resolution.candidates import Candidate
+
+                    # Create candidate object
+                    candidate_obj = Candidate(
+                        text=candidate,
+                        sentence=sentence[:500],
+                        start_pos=0,
+                        end_pos=len(candidate),
+                        source_pattern="extraction",
+                    )
+
+                    # Compute embedding similarity if scorer provided
+                    if embedding_scorer:
+                        try:
+                            embedding_result = embedding_scorer.score(
+                                context=sentence[:500],
+                                ticker=resolved["ticker"],
+                                company_name=resolved["name"],
+                            )
+                            embedding_similarity = embedding_result.similarity
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to compute embedding similarity for {candidate}: {e}"
+                            )
+
+                    # Make tiered decision (decision_system only exists if embedding_scorer provided)
+                    tiered_decision = decision_system.decide(
+                        candidate=candidate_obj,
+                        context=sentence[:500],
+                        relationship_type=neo4j_relationship_type,
+                        company_name=resolved["name"],
+                        embedding_similarity=embedding_similarity,
+                        llm_verifier=llm_verifier,
+                    )
+
+                    # Handle decision
+                    if tiered_decision.decision.value == "reject":
+                        # Skip this candidate - rejected by tiered system
+                        continue
+                    elif tiered_decision.decision.value == "candidate":
+                        # Store as candidate (medium confidence)
+                        pass  # Will be handled by caller based on confidence_tier
+
+                seen_ciks.add(resolved["cik"])
+                result_dict = {
+                    "target_cik": resolved["cik"],
+                    "target_ticker": resolved["ticker"],
+                    "target_name": resolved["name"],
+                    "confidence": resolved["confidence"],
+                    "raw_mention": candidate,
+                    "context": sentence[:200],
+                    "relationship_type": relationship_type.value,
+                }
+
+                # Add tiered decision metadata if available
+                if tiered_decision:
+                    result_dict["embedding_similarity"] = embedding_similarity
+                    result_dict["decision_tier"] = tiered_decision.tier.value
+                    result_dict["decision_reason"] = tiered_decision.reason
+                    result_dict["decision_confidence"] = tiered_decision.confidence
+                    # Map decision to confidence tier for compatibility
+                    if tiered_decision.decision.value == "accept":
+                        result_dict["confidence_tier"] = "high"
+                    elif tiered_decision.decision.value == "candidate":
+                        result_dict["confidence_tier"] = "medium"
+
+                results.append(result_dict)
 
     return results
 
@@ -914,7 +1045,8 @@ def extract_all_relationships(
     """
     Extract all business relationships from 10-K text.
 
-    Convenience function to extract all relationship types in one pass.
+    Convenience function to extract all relationship types in one pass: the
+    text is segmented and keyword-tagged once and shared across types.
 
     Args:
         business_description: Item 1 Business description text
@@ -933,18 +1065,22 @@ def extract_all_relationships(
     if relationship_types is None:
         relationship_types = list(RelationshipType)
 
+    # Segment once; each type then only visits the sentences tagged with it
+    sentences = _segment_texts(business_description, risk_factors)
+    decision_system = _build_decision_system(use_tiered_decision, embedding_scorer, llm_verifier)
+    resolution_cache: dict[str, dict[str, Any] | None] = {}
+
     results = {}
     for rel_type in relationship_types:
-        results[rel_type] = extract_and_resolve_relationships(
-            business_description=business_description,
-            risk_factors=risk_factors,
+        results[rel_type] = _resolve_tagged_sentences(
+            sentences=sentences,
             lookup=lookup,
             relationship_type=rel_type,
             self_cik=self_cik,
-            use_tiered_decision=use_tiered_decision,
-            embedding_threshold=embedding_threshold,
+            decision_system=decision_system,
             embedding_scorer=embedding_scorer,
             llm_verifier=llm_verifier,
+            resolution_cache=resolution_cache,
         )
 
     return results
@@ -19,6 +19,7 @@ Entity Resolution Strategy:
 
 import logging
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -205,6 +206,72 @@ COMPANY_NAME_PATTERNS = [
 ]
 
 
+# Every COMPETITOR_CONTEXT_PATTERNS match contains "compet" (competitor, compete,
+# competition). A cheap scan for this anchor locates the only regions where the
+# expensive patterns can match; they are then run on bounded windows around each
+# anchor instead of across whole risk-factor sections.
+_COMPETITOR_ANCHOR_PATTERN = re.compile(r"compet", re.IGNORECASE)
+
+# How far a match may start before its anchor ("Our principal competitors")
+_ANCHOR_LOOKBEHIND = 64
+
+# How far a match may extend past its anchor. The longest pattern captures a
+# block of up to 3000 characters plus a terminating phrase; keeping windows
+# longer than that also means its end-of-text alternative ("$") can only match
+# at a window end that is the real end of the text.
+_ANCHOR_LOOKAHEAD = 3200
+
+_COMPETITOR_CONTEXT_REGEXES = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in COMPETITOR_CONTEXT_PATTERNS
+]
+
+_COMPANY_NAME_REGEXES = [re.compile(pattern) for pattern in COMPANY_NAME_PATTERNS]
+
+
+def _competitor_windows(text: str) -> list[tuple[int, int]]:
+    """
+    Return merged (start, end) windows around every competitor anchor in text.
+
+    Windows closer together than a single window span are merged so that no
+    match can straddle two windows.
+    """
+    windows: list[tuple[int, int]] = []
+    for anchor in _COMPETITOR_ANCHOR_PATTERN.finditer(text):
+        start = max(anchor.start() - _ANCHOR_LOOKBEHIND, 0)
+        end = min(anchor.end() + _ANCHOR_LOOKAHEAD, len(text))
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def find_competitor_contexts(text: str) -> Iterator[re.Match[str]]:
+    """
+    Find competitor-context matches in text.
+
+    Equivalent to running each of COMPETITOR_CONTEXT_PATTERNS over the whole
+    text with re.finditer (in pattern order), but only scans bounded windows
+    around "compet" anchors, so cost scales with the number of competitor
+    mentions rather than section length. Matches starting more than
+    _ANCHOR_LOOKBEHIND characters before their anchor, or running on for more
+    than _ANCHOR_LOOKAHEAD characters after it, are truncated to the window.
+
+    Args:
+        text: Text to search
+
+    Yields:
+        Match objects against the original text (group 1 is the captured span)
+    """
+    if not text:
+        return
+
+    windows = _competitor_windows(text)
+    for regex in _COMPETITOR_CONTEXT_REGEXES:
+        for start, end in windows:
+            yield from regex.finditer(text, start, end)
+
+
 def extract_competitor_mentions(
     business_description: str | None,
     risk_factors: str | None,
@@ -236,19 +303,18 @@ def extract_competitor_mentions(
 
     for _source, text in texts:
         # Find competitor contexts
-        for pattern in COMPETITOR_CONTEXT_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL):
-                context = match.group(0)
-                captured = match.group(1) if match.lastindex else context
+        for match in find_competitor_contexts(text):
+            context = match.group(0)
+            captured = match.group(1) if match.lastindex else context
 
-                # For large blocks (like bullet-point lists), also extract from "such as" clauses
-                if len(captured) > 200:
-                    for such_as_match in SUCH_AS_PATTERN.finditer(captured):
-                        such_as_text = such_as_match.group(1)
-                        _extract_names_from_text(such_as_text, context[:200], mentions, seen_names)
+            # For large blocks (like bullet-point lists), also extract from "such as" clauses
+            if len(captured) > 200:
+                for such_as_match in SUCH_AS_PATTERN.finditer(captured):
+                    such_as_text = such_as_match.group(1)
+                    _extract_names_from_text(such_as_text, context[:200], mentions, seen_names)
 
-                # Extract company names from the captured text
-                _extract_names_from_text(captured, context[:200], mentions, seen_names)
+            # Extract company names from the captured text
+            _extract_names_from_text(captured, context[:200], mentions, seen_names)
 
     return mentions
 
@@ -260,8 +326,8 @@ def _extract_names_from_text(
     seen_names: set[str],
 ) -> None:
     """Extract company names from text and add to mentions list."""
-    for name_pattern in COMPANY_NAME_PATTERNS:
-        for name_match in re.finditer(name_pattern, text):
+    for name_regex in _COMPANY_NAME_REGEXES:
+        for name_match in name_regex.finditer(text):
             raw_name = name_match.group(1).strip()
 
             # Skip if too short or too long
@@ -21,21 +21,43 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from public_company_graph.cache import get_cache
 from public_company_graph.embeddings import get_openai_client
+from public_company_graph.utils.rate_limiting import AdaptiveConcurrencyLimiter
 
 if TYPE_CHECKING:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
 # Cache namespace for LLM verification results
 CACHE_NAMESPACE = "llm_verification"
 
+# Relationships packed into one chat completion by verify_batch_parallel.
+# Larger packs amortize the shared instructions but make a failed call costlier.
+DEFAULT_PACK_SIZE = 8
+
+# Completion budget per packed relationship (one JSON verdict)
+MAX_TOKENS_PER_ITEM = 150
+
+# Adaptive concurrency starts here and grows toward max_concurrent while calls succeed
+INITIAL_CONCURRENCY = 4
+
+# Retries for a pack that keeps getting rate-limited before it is marked UNCERTAIN
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Approximate pricing per 1K tokens (as of 2024)
+MODEL_PRICING = {
+    "gpt-4.1-mini": {"input": 0.0004, "output": 0.0016},
+    "gpt-4.1": {"input": 0.002, "output": 0.008},
+    "gpt-5.2-chat-latest": {"input": 0.00125, "output": 0.01},
+}
+
 
 class VerificationResult(Enum):
     """Result of LLM verification."""
@@ -56,6 +78,18 @@ class LLMVerificationResult:
     cost_tokens: int
 
 
+@dataclass
+class LLMCallMetrics:
+    """Latency and token usage of one chat completion."""
+
+    relationships: int  # Relationships packed into the call
+    latency_seconds: float
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    rate_limited: bool = False
+
+
 VERIFICATION_PROMPT = """You are verifying business relationships extracted from SEC 10-K filings.
 
 Given a context sentence and a claimed relationship, determine if the relationship is VALID.
@@ -86,6 +120,43 @@ Respond with JSON:
     "actual_relationship": "HAS_SUPPLIER/HAS_CUSTOMER/HAS_COMPETITOR/HAS_PARTNER/NONE"
 }}"""
 
+BATCH_SYSTEM_PROMPT = (
+    "You are a precise relationship extraction validator. Respond only with a JSON object."
+)
+
+BATCH_VERIFICATION_PROMPT = """You are verifying business relationships extracted from SEC 10-K filings.
+
+Each numbered candidate below has a context and a claimed relationship. For EACH candidate,
+determine if the relationship is VALID.
+
+RELATIONSHIP TYPES:
+- HAS_SUPPLIER: Target company provides goods/services TO the source company
+- HAS_CUSTOMER: Target company purchases goods/services FROM the source company
+- HAS_COMPETITOR: Target and source companies compete in the same market
+- HAS_PARTNER: Target and source companies have a strategic partnership/alliance
+
+VERIFICATION CRITERIA:
+1. Is the target company actually mentioned in the candidate's context?
+2. Does the context describe the claimed relationship?
+3. Is the DIRECTION correct? (supplier provides TO us, customer buys FROM us)
+4. Is this a current/ongoing relationship (not historical/hypothetical)?
+
+CANDIDATES:
+{candidates}
+
+Respond with a JSON object containing one result per candidate id:
+{{
+    "results": [
+        {{
+            "id": 0,
+            "verified": true/false,
+            "confidence": 0.0-1.0,
+            "explanation": "brief explanation",
+            "actual_relationship": "HAS_SUPPLIER/HAS_CUSTOMER/HAS_COMPETITOR/HAS_PARTNER/NONE"
+        }}
+    ]
+}}"""
+
 RELATIONSHIP_DESCRIPTIONS = {
     "HAS_SUPPLIER": "the target supplies goods/services to the source",
     "HAS_CUSTOMER": "the target purchases goods/services from the source",
@@ -106,11 +177,22 @@ class LLMRelationshipVerifier:
         self,
         client: OpenAI | None = None,
         model: str = "gpt-4.1-mini",  # Fast and cheap for verification
+        async_client: AsyncOpenAI | None = None,
     ):
-        """Initialize the verifier."""
+        """
+        Initialize the verifier.
+
+        Args:
+            client: Sync client for verify() (default: shared OpenAI client)
+            model: Chat model used for verification
+            async_client: Async client for verify_batch_parallel() (default: a new
+                AsyncOpenAI client per batch)
+        """
         self._client = client or get_openai_client()
+        self._async_client = async_client
         self.model = model
         self._cache = get_cache()
+        self.call_metrics: list[LLMCallMetrics] = []
 
     def _get_cache_key(
         self,
@@ -151,13 +233,7 @@ class LLMRelationshipVerifier:
         )
         cached = self._cache.get(CACHE_NAMESPACE, cache_key)
         if cached is not None:
-            return LLMVerificationResult(
-                result=VerificationResult(cached["result"]),
-                confidence=cached["confidence"],
-                explanation=cached["explanation"],
-                suggested_relationship=cached.get("suggested_relationship"),
-                cost_tokens=0,  # No cost for cached results
-            )
+            return _result_from_cache(cached)
 
         # Not cached - call LLM
         rel_desc = RELATIONSHIP_DESCRIPTIONS.get(
@@ -195,57 +271,16 @@ class LLMRelationshipVerifier:
                 data = json.loads(content)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse LLM response: {content}")
-                return LLMVerificationResult(
-                    result=VerificationResult.UNCERTAIN,
-                    confidence=0.0,
-                    explanation="Failed to parse LLM response",
-                    suggested_relationship=None,
-                    cost_tokens=total_tokens,
-                )
+                return _error_result("Failed to parse LLM response", total_tokens)
 
-            verified = data.get("verified", False)
-            confidence = data.get("confidence", 0.5)
-            explanation = data.get("explanation", "")
-            actual_rel = data.get("actual_relationship", claimed_relationship)
-
-            if verified and confidence >= 0.7:
-                result = VerificationResult.CONFIRMED
-            elif not verified and confidence >= 0.7:
-                result = VerificationResult.REJECTED
-            else:
-                result = VerificationResult.UNCERTAIN
-
-            llm_result = LLMVerificationResult(
-                result=result,
-                confidence=confidence,
-                explanation=explanation,
-                suggested_relationship=actual_rel if actual_rel != claimed_relationship else None,
-                cost_tokens=total_tokens,
-            )
-
-            # Cache the result (no TTL - verifications are deterministic)
-            self._cache.set(
-                CACHE_NAMESPACE,
-                cache_key,
-                {
-                    "result": result.value,
-                    "confidence": confidence,
-                    "explanation": explanation,
-                    "suggested_relationship": llm_result.suggested_relationship,
-                },
-            )
+            llm_result = _interpret_response(data, claimed_relationship, total_tokens)
+            self._cache_result(cache_key, llm_result)
 
             return llm_result
 
         except Exception as e:
             logger.error(f"LLM verification failed: {e}")
-            return LLMVerificationResult(
-                result=VerificationResult.UNCERTAIN,
-                confidence=0.0,
-                explanation=f"Error: {e}",
-                suggested_relationship=None,
-                cost_tokens=0,
-            )
+            return _error_result(f"Error: {e}")
 
     def cache_stats(self) -> dict:
         """Get cache statistics for LLM verifications."""
@@ -258,41 +293,43 @@ class LLMRelationshipVerifier:
         self,
         relationships: list[dict],
         max_concurrent: int = 20,
+        pack_size: int = DEFAULT_PACK_SIZE,
     ) -> list[LLMVerificationResult]:
         """
-        Verify multiple relationships in parallel using asyncio.
+        Verify multiple relationships concurrently using asyncio.
+
+        Cached verdicts are fetched with one bulk lookup. The remaining relationships
+        are packed `pack_size` at a time into a single structured-output request, and
+        packs run under an adaptive concurrency limit that backs off on rate limits.
+        Per-call latency and token usage are appended to `call_metrics`.
 
         Args:
             relationships: List of dicts with context, source_company, target_company, relationship_type
             max_concurrent: Max concurrent API calls (default: 20)
+            pack_size: Relationships per API call (default: DEFAULT_PACK_SIZE)
 
         Returns:
             List of verification results in same order as input
         """
         import asyncio
 
-        from openai import AsyncOpenAI
-
-        # Check cache first - filter out already cached
-        uncached_indices = []
         results: list[LLMVerificationResult | None] = [None] * len(relationships)
-
-        for i, rel in enumerate(relationships):
-            cache_key = self._get_cache_key(
+        cache_keys = [
+            self._get_cache_key(
                 rel["context"],
                 rel["source_company"],
                 rel["target_company"],
                 rel["relationship_type"],
             )
-            cached = self._cache.get(CACHE_NAMESPACE, cache_key)
-            if cached is not None:
-                results[i] = LLMVerificationResult(
-                    result=VerificationResult(cached["result"]),
-                    confidence=cached["confidence"],
-                    explanation=cached["explanation"],
-                    suggested_relationship=cached.get("suggested_relationship"),
-                    cost_tokens=0,
-                )
+            for rel in relationships
+        ]
+
+        # Bulk cache pre-filter
+        cached = self._cache.get_many(CACHE_NAMESPACE, list(set(cache_keys)))
+        uncached_indices = []
+        for i, key in enumerate(cache_keys):
+            if key in cached:
+                results[i] = _result_from_cache(cached[key])
             else:
                 uncached_indices.append(i)
 
@@ -300,132 +337,269 @@ class LLMRelationshipVerifier:
             logger.info(f"All {len(relationships)} verifications found in cache")
             return results  # type: ignore
 
+        pack_size = max(1, pack_size)
+        packs = [
+            uncached_indices[i : i + pack_size] for i in range(0, len(uncached_indices), pack_size)
+        ]
         logger.info(
-            f"Verifying {len(uncached_indices)} relationships "
+            f"Verifying {len(uncached_indices)} relationships in {len(packs)} requests "
             f"({len(relationships) - len(uncached_indices)} cached)"
         )
 
-        # Async verification function
-        async def verify_one(
-            client: AsyncOpenAI, idx: int, rel: dict, semaphore: asyncio.Semaphore
-        ) -> tuple[int, LLMVerificationResult]:
-            async with semaphore:
-                rel_desc = RELATIONSHIP_DESCRIPTIONS.get(
-                    rel["relationship_type"], "has a business relationship with"
-                )
-                prompt = VERIFICATION_PROMPT.format(
-                    context=rel["context"][:1500],
-                    source_company=rel["source_company"],
-                    target_company=rel["target_company"],
-                    relationship_type=rel["relationship_type"],
-                    relationship_description=rel_desc,
+        async def verify_all():
+            client = self._async_client or _default_async_client()
+            limiter = AdaptiveConcurrencyLimiter(
+                max_concurrency=max(1, max_concurrent),
+                initial_concurrency=min(max_concurrent, INITIAL_CONCURRENCY),
+            )
+            tasks = [
+                self._verify_pack_async(
+                    client,
+                    limiter,
+                    [relationships[i] for i in pack],
+                    [cache_keys[i] for i in pack],
                 )
+                for pack in packs
+            ]
 
+            completed = 0
+            for pack, pack_results in zip(packs, await asyncio.gather(*tasks), strict=True):
+                for idx, result in zip(pack, pack_results, strict=True):
+                    results[idx] = result
+                completed += len(pack)
+            logger.info(
+                f"Verified {completed}/{len(uncached_indices)} "
+                f"(final concurrency {limiter.limit}, "
+                f"{limiter.rate_limited_count} rate-limited responses)"
+            )
+
+        asyncio.run(verify_all())
+
+        return results  # type: ignore
+
+    async def _verify_pack_async(
+        self,
+        client: AsyncOpenAI,
+        limiter: AdaptiveConcurrencyLimiter,
+        pack: list[dict],
+        cache_keys: list[str],
+    ) -> list[LLMVerificationResult]:
+        """Verify one pack of relationships with a single chat completion."""
+        import asyncio
+
+        from openai import RateLimitError
+
+        prompt = _build_batch_prompt(pack)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            async with limiter:
+                start = time.perf_counter()
                 try:
                     response = await client.chat.completions.create(
                         model=self.model,
                         messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a precise relationship extraction validator. Respond only with JSON.",
-                            },
+                            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
                             {"role": "user", "content": prompt},
                         ],
                         temperature=0.0,
-                        max_tokens=200,
+                        max_tokens=MAX_TOKENS_PER_ITEM * len(pack) + 50,
+                        response_format={"type": "json_object"},
                     )
+                except RateLimitError as e:
+                    self._record_call(len(pack), time.perf_counter() - start, rate_limited=True)
+                    limiter.on_rate_limited()
+                    retry_after = _retry_after_seconds(e)
+                except Exception as e:
+                    logger.error(f"LLM verification failed: {e}")
+                    return [_error_result(f"Error: {e}") for _ in pack]
+                else:
+                    limiter.on_success()
+                    break
+
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                logger.error(f"LLM verification rate-limited {attempt + 1} times, giving up")
+                return [_error_result("Error: rate limited") for _ in pack]
+            await asyncio.sleep(retry_after if retry_after is not None else 2**attempt)
+
+        latency = time.perf_counter() - start
+        prompt_tokens = response.usage.prompt_tokens if response.usage else 0
+        completion_tokens = response.usage.completion_tokens if response.usage else 0
+        self._record_call(len(pack), latency, prompt_tokens, completion_tokens)
+
+        # Spread the call's tokens over its items so summed cost_tokens stays accurate
+        total_tokens = prompt_tokens + completion_tokens
+        tokens_per_item = [
+            total_tokens // len(pack) + (1 if i < total_tokens % len(pack) else 0)
+            for i in range(len(pack))
+        ]
+
+        content = response.choices[0].message.content
+        try:
+            items = json.loads(content).get("results", [])
+            by_id = {int(item["id"]): item for item in items if isinstance(item, dict)}
+        except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+            logger.warning(f"Failed to parse LLM response: {content}")
+            return [
+                _error_result("Failed to parse LLM response", tokens) for tokens in tokens_per_item
+            ]
 
-                    content = response.choices[0].message.content
-                    total_tokens = response.usage.total_tokens if response.usage else 0
-
-                    try:
-                        data = json.loads(content)
-                    except json.JSONDecodeError:
-                        return idx, LLMVerificationResult(
-                            result=VerificationResult.UNCERTAIN,
-                            confidence=0.0,
-                            explanation="Failed to parse LLM response",
-                            suggested_relationship=None,
-                            cost_tokens=total_tokens,
-                        )
-
-                    verified = data.get("verified", False)
-                    confidence = data.get("confidence", 0.5)
-                    explanation = data.get("explanation", "")
-                    actual_rel = data.get("actual_relationship", rel["relationship_type"])
-
-                    if verified and confidence >= 0.7:
-                        result = VerificationResult.CONFIRMED
-                    elif not verified and confidence >= 0.7:
-                        result = VerificationResult.REJECTED
-                    else:
-                        result = VerificationResult.UNCERTAIN
-
-                    llm_result = LLMVerificationResult(
-                        result=result,
-                        confidence=confidence,
-                        explanation=explanation,
-                        suggested_relationship=(
-                            actual_rel if actual_rel != rel["relationship_type"] else None
-                        ),
-                        cost_tokens=total_tokens,
-                    )
+        pack_results = []
+        for i, (rel, key) in enumerate(zip(pack, cache_keys, strict=True)):
+            data = by_id.get(i)
+            if data is None:
+                # Not cached, so the relationship is retried on the next run
+                pack_results.append(_error_result("Missing from LLM response", tokens_per_item[i]))
+                continue
+            result = _interpret_response(data, rel["relationship_type"], tokens_per_item[i])
+            self._cache_result(key, result)
+            pack_results.append(result)
+        return pack_results
+
+    def _cache_result(self, cache_key: str, result: LLMVerificationResult) -> None:
+        """Persist a verdict (no TTL - verifications are deterministic)."""
+        self._cache.set(
+            CACHE_NAMESPACE,
+            cache_key,
+            {
+                "result": result.result.value,
+                "confidence": result.confidence,
+                "explanation": result.explanation,
+                "suggested_relationship": result.suggested_relationship,
+            },
+        )
 
-                    # Cache the result
-                    cache_key = self._get_cache_key(
-                        rel["context"],
-                        rel["source_company"],
-                        rel["target_company"],
-                        rel["relationship_type"],
-                    )
-                    self._cache.set(
-                        CACHE_NAMESPACE,
-                        cache_key,
-                        {
-                            "result": result.value,
-                            "confidence": confidence,
-                            "explanation": explanation,
-                            "suggested_relationship": llm_result.suggested_relationship,
-                        },
-                    )
+    def _record_call(
+        self,
+        relationships: int,
+        latency_seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        rate_limited: bool = False,
+    ) -> None:
+        """Append metrics for one API call."""
+        self.call_metrics.append(
+            LLMCallMetrics(
+                relationships=relationships,
+                latency_seconds=latency_seconds,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost_usd=token_cost_usd(self.model, prompt_tokens, completion_tokens),
+                rate_limited=rate_limited,
+            )
+        )
 
-                    return idx, llm_result
+    def call_stats(self) -> dict[str, Any]:
+        """Summarize latency and token cost of API calls made by this verifier."""
+        calls = [m for m in self.call_metrics if not m.rate_limited]
+        latencies = sorted(m.latency_seconds for m in calls)
+        return {
+            "calls": len(calls),
+            "rate_limited_calls": len(self.call_metrics) - len(calls),
+            "relationships": sum(m.relationships for m in calls),
+            "prompt_tokens": sum(m.prompt_tokens for m in calls),
+            "completion_tokens": sum(m.completion_tokens for m in calls),
+            "cost_usd": sum(m.cost_usd for m in calls),
+            "mean_latency_seconds": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p95_latency_seconds": (
+                latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+            ),
+        }
 
-                except Exception as e:
-                    logger.error(f"LLM verification failed: {e}")
-                    return idx, LLMVerificationResult(
-                        result=VerificationResult.UNCERTAIN,
-                        confidence=0.0,
-                        explanation=f"Error: {e}",
-                        suggested_relationship=None,
-                        cost_tokens=0,
-                    )
 
-        async def verify_all():
-            import os
+def _result_from_cache(cached: dict) -> LLMVerificationResult:
+    """Rebuild a cached verdict (no cost for cached results)."""
+    return LLMVerificationResult(
+        result=VerificationResult(cached["result"]),
+        confidence=cached["confidence"],
+        explanation=cached["explanation"],
+        suggested_relationship=cached.get("suggested_relationship"),
+        cost_tokens=0,
+    )
 
-            from dotenv import load_dotenv
 
-            load_dotenv()
-            client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            semaphore = asyncio.Semaphore(max_concurrent)
+def _error_result(explanation: str, cost_tokens: int = 0) -> LLMVerificationResult:
+    """UNCERTAIN result for a relationship the LLM could not judge."""
+    return LLMVerificationResult(
+        result=VerificationResult.UNCERTAIN,
+        confidence=0.0,
+        explanation=explanation,
+        suggested_relationship=None,
+        cost_tokens=cost_tokens,
+    )
 
-            tasks = [
-                verify_one(client, idx, relationships[idx], semaphore) for idx in uncached_indices
-            ]
 
-            completed = 0
-            for coro in asyncio.as_completed(tasks):
-                idx, result = await coro
-                results[idx] = result
-                completed += 1
-                if completed % 50 == 0:
-                    logger.info(f"Verified {completed}/{len(uncached_indices)}")
-
-        # Run async
-        asyncio.run(verify_all())
+def _interpret_response(
+    data: dict, claimed_relationship: str, cost_tokens: int
+) -> LLMVerificationResult:
+    """Turn the LLM's JSON verdict into a verification result."""
+    verified = data.get("verified", False)
+    confidence = data.get("confidence", 0.5)
+    explanation = data.get("explanation", "")
+    actual_rel = data.get("actual_relationship", claimed_relationship)
+
+    if verified and confidence >= 0.7:
+        result = VerificationResult.CONFIRMED
+    elif not verified and confidence >= 0.7:
+        result = VerificationResult.REJECTED
+    else:
+        result = VerificationResult.UNCERTAIN
+
+    return LLMVerificationResult(
+        result=result,
+        confidence=confidence,
+        explanation=explanation,
+        suggested_relationship=actual_rel if actual_rel != claimed_relationship else None,
+        cost_tokens=cost_tokens,
+    )
 
-        return results  # type: ignore
+
+def _build_batch_prompt(pack: list[dict]) -> str:
+    """Render a pack of relationships as numbered candidates."""
+    candidates = []
+    for i, rel in enumerate(pack):
+        rel_desc = RELATIONSHIP_DESCRIPTIONS.get(
+            rel["relationship_type"], "has a business relationship with"
+        )
+        candidates.append(
+            f"[{i}] {rel['source_company']} --[{rel['relationship_type']}]--> "
+            f"{rel['target_company']} (valid if {rel_desc})\n"
+            f"CONTEXT: {rel['context'][:1500]}"
+        )
+    return BATCH_VERIFICATION_PROMPT.format(candidates="\n\n".join(candidates))
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read the Retry-After header from a rate-limit error, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+
+def _default_async_client() -> AsyncOpenAI:
+    """
+    Async client for batch verification.
+
+    SDK retries are disabled so 429s reach the adaptive limiter instead of being
+    retried blindly at full concurrency.
+    """
+    from openai import AsyncOpenAI
+
+    from public_company_graph.config import get_openai_api_key, get_openai_base_url
+
+    return AsyncOpenAI(api_key=get_openai_api_key(), base_url=get_openai_base_url(), max_retries=0)
+
+
+def token_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Dollar cost of a call from its token usage (unknown models priced as gpt-4.1-mini)."""
+    pricing = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4.1-mini"])
+    return (prompt_tokens / 1000) * pricing["input"] + (completion_tokens / 1000) * pricing[
+        "output"
+    ]
 
 
 def estimate_verification_cost(
@@ -444,13 +618,7 @@ def estimate_verification_cost(
     Returns:
         Dict with estimated costs
     """
-    # Approximate pricing (as of 2024)
-    pricing = {
-        "gpt-4.1-mini": {"input": 0.0004, "output": 0.0016},  # per 1K tokens
-        "gpt-4.1": {"input": 0.002, "output": 0.008},
-        "gpt-5.2-chat-latest": {"input": 0.00125, "output": 0.01},
-    }
-
+    pricing = MODEL_PRICING
     if model not in pricing:
         model = "gpt-4.1-mini"
 
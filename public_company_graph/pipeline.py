@@ -0,0 +1,417 @@
+"""
+In-process DAG pipeline runner.
+
+Each stage declares the artifacts (node labels, relationship types, properties,
+caches) it reads and writes; a stage depends on the stages producing its inputs.
+Stages whose dependencies are complete run concurrently on a thread pool, and all of
+them share one process:
+
+- one warm Neo4j driver pool (get_driver_and_database hands it out while a run is
+  active, and a script closing it leaves it open for the other stages),
+- the AppCache handle,
+- shared resources such as the company lookup, built once on first use and dropped
+  when a stage rewrites the artifacts they were built from.
+
+Stages that write the same nodes declare a shared lock (e.g. "Company") and never
+run at the same time, since concurrent writers to one node set deadlock in Neo4j.
+Logging is configured once by the caller; setup_logging inside a stage returns a
+child of the run's logger instead of replacing the process's handlers.
+
+Completed stages are recorded in a checkpoint file, so after a failure a resumed
+run starts again at the failed stage instead of at the top; a fully successful run
+clears it:
+
+    runner = PipelineRunner(stages, PipelineContext(driver, database), checkpoint)
+    result = runner.run(resume=True)
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_active_context: "PipelineContext | None" = None
+
+
+@dataclass
+class Stage:
+    """One pipeline step and the artifacts it reads and writes."""
+
+    name: str
+    run: Callable[["PipelineContext"], None]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    description: str = ""
+    # Disabled stages are treated as complete (their outputs already exist)
+    enabled: bool = True
+    # Locks held while running (e.g. node labels the stage writes); stages sharing
+    # one are never run at the same time
+    locks: tuple[str, ...] = ()
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of one pipeline run."""
+
+    completed: list[str] = field(default_factory=list)
+    # Already complete in the checkpoint, or disabled
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    # Not started because an earlier stage failed
+    not_run: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.not_run
+
+
+class _SharedDriver:
+    """A borrowed handle on the pipeline's driver; close() leaves the pool open."""
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def close(self) -> None:
+        pass
+
+
+class PipelineContext:
+    """State shared by all stages of a run: driver, cache and built resources."""
+
+    def __init__(
+        self,
+        driver,
+        database: str | None = None,
+        cache=None,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            driver: Neo4j driver instance (owned by the caller)
+            database: Neo4j database name
+            cache: AppCache instance (defaults to the process-wide cache)
+            logger: Configured logger of the run; stage loggers are its children
+        """
+        if cache is None:
+            from public_company_graph.cache import get_cache
+
+            cache = get_cache()
+        self.driver = driver
+        self.database = database
+        self.cache = cache
+        self.logger = logger or logging.getLogger(__name__)
+        self._resources: dict[str, tuple[Any, frozenset[str]]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def borrow_driver(self):
+        """The shared driver, wrapped so a stage closing it does not close the pool."""
+        return _SharedDriver(self.driver)
+
+    def shared(self, key: str, factory: Callable[[], Any], depends_on: Sequence[str] = ()):
+        """
+        Get a resource built once per run (concurrent callers wait for one build).
+
+        Args:
+            key: Resource name (e.g. "company_lookup")
+            factory: Builds the resource on first use
+            depends_on: Artifacts it is built from; it is rebuilt after a stage
+                writes any of them
+
+        Returns:
+            The resource
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._resources:
+                    return self._resources[key][0]
+            value = factory()
+            with self._lock:
+                self._resources[key] = (value, frozenset(depends_on))
+            return value
+
+    def invalidate(self, artifacts: Sequence[str]) -> list[str]:
+        """
+        Drop the resources built from any of the artifacts.
+
+        Returns:
+            Keys of the dropped resources
+        """
+        written = set(artifacts)
+        with self._lock:
+            stale = [key for key, (_, deps) in self._resources.items() if deps & written]
+            for key in stale:
+                del self._resources[key]
+        return stale
+
+    @contextmanager
+    def activate(self) -> Iterator["PipelineContext"]:
+        """Make this the active context of the process for the duration of a run."""
+        global _active_context
+        previous, _active_context = _active_context, self
+        try:
+            yield self
+        finally:
+            _active_context = previous
+
+
+def active_context() -> PipelineContext | None:
+    """The context of the pipeline run in progress, if any."""
+    return _active_context
+
+
+def shared_resource(key: str, factory: Callable[[], Any], depends_on: Sequence[str] = ()):
+    """
+    Build a resource, or reuse it if a pipeline run in this process already did.
+
+    Outside a pipeline run this just calls factory().
+    """
+    context = _active_context
+    if context is None:
+        return factory()
+    return context.shared(key, factory, depends_on)
+
+
+class PipelineCheckpoint:
+    """Completed stages of a run, persisted as JSON so a failed run can resume."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        if not self.path.exists():
+            return {"completed": {}}
+        try:
+            state: dict = json.loads(self.path.read_text())
+            return state
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable pipeline checkpoint {self.path}: {e}")
+            return {"completed": {}}
+
+    def _write(self, state: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+    def completed(self) -> set[str]:
+        """Names of the stages recorded as complete."""
+        with self._lock:
+            return set(self._read()["completed"])
+
+    def mark_complete(self, stage: str) -> None:
+        """Record a stage as complete."""
+        with self._lock:
+            state = self._read()
+            state["completed"][stage] = datetime.now(UTC).isoformat()
+            self._write(state)
+
+    def clear(self) -> None:
+        """Forget all completed stages (start of a fresh run, or end of a successful one)."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+def stage_dependencies(stages: Sequence[Stage]) -> dict[str, set[str]]:
+    """
+    Stages each stage depends on (the producers of its inputs).
+
+    Inputs nobody produces are external (e.g. the SQLite source) and add no edge.
+
+    Raises:
+        ValueError: On duplicate stage names or artifacts produced by two stages
+    """
+    producers: dict[str, str] = {}
+    names: set[str] = set()
+    for stage in stages:
+        if stage.name in names:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        names.add(stage.name)
+        for artifact in stage.outputs:
+            if artifact in producers:
+                raise ValueError(
+                    f"Artifact {artifact!r} is produced by both "
+                    f"{producers[artifact]!r} and {stage.name!r}"
+                )
+            producers[artifact] = stage.name
+    return {
+        stage.name: {
+            producers[a] for a in stage.inputs if producers.get(a, stage.name) != stage.name
+        }
+        for stage in stages
+    }
+
+
+def execution_waves(stages: Sequence[Stage]) -> list[list[str]]:
+    """
+    Group stages into waves; each wave only depends on earlier ones.
+
+    Returns:
+        Lists of stage names, in declaration order within a wave
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    dependencies = stage_dependencies(stages)
+    order = [stage.name for stage in stages]
+    done: set[str] = set()
+    waves = []
+    while len(done) < len(order):
+        wave = [name for name in order if name not in done and dependencies[name] <= done]
+        if not wave:
+            remaining = sorted(set(order) - done)
+            raise ValueError(f"Pipeline stages have a dependency cycle: {remaining}")
+        waves.append(wave)
+        done.update(wave)
+    return waves
+
+
+def run_script(script_path: Path, args: Sequence[str] = ()) -> Callable[[PipelineContext], None]:
+    """
+    Stage callable running a script's main(argv) in this process.
+
+    The script module is loaded on first run; it gets the shared driver through
+    get_driver_and_database. sys.exit(0) counts as success.
+    """
+    script_path = Path(script_path)
+
+    def run(context: PipelineContext) -> None:
+        spec = importlib.util.spec_from_file_location(
+            f"_pipeline_stage_{script_path.stem}", script_path
+        )
+        if spec is None or spec.loader is None:
+            raise FileNotFoundError(f"Script not found: {script_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        try:
+            module.main(list(args))
+        except SystemExit as e:
+            if e.code not in (0, None):
+                raise RuntimeError(f"{script_path.name} exited with status {e.code}") from e
+
+    return run
+
+
+class PipelineRunner:
+    """Runs stages in dependency order, independent stages concurrently."""
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        context: PipelineContext,
+        checkpoint: PipelineCheckpoint | None = None,
+        max_workers: int = 2,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            stages: Pipeline stages (declaration order breaks ties)
+            context: Shared state handed to every stage
+            checkpoint: Where completed stages are recorded (None disables resuming)
+            max_workers: Stages run at the same time
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If the stage graph is invalid (see execution_waves)
+        """
+        self.stages = list(stages)
+        self.context = context
+        self.checkpoint = checkpoint
+        self.max_workers = max(1, max_workers)
+        self.logger = logger or logging.getLogger(__name__)
+        self.dependencies = stage_dependencies(self.stages)
+        execution_waves(self.stages)
+
+    def _run_stage(self, stage: Stage) -> float:
+        self.logger.info("")
+        self.logger.info("=" * 70)
+        self.logger.info(f"▶ {stage.name}: {stage.description or stage.name}")
+        self.logger.info("=" * 70)
+        start_time = time.time()
+        stage.run(self.context)
+        return time.time() - start_time
+
+    def run(self, resume: bool = False) -> PipelineResult:
+        """
+        Run every stage not yet complete.
+
+        After a failure no new stages start; running ones finish, and their
+        completion is still recorded. A run that completes every stage clears
+        the checkpoint.
+
+        Args:
+            resume: Skip stages the checkpoint records as complete (otherwise the
+                checkpoint is cleared and everything runs)
+
+        Returns:
+            PipelineResult
+        """
+        result = PipelineResult()
+        done: set[str] = set()
+        if self.checkpoint is not None:
+            if resume:
+                done = self.checkpoint.completed() & set(self.dependencies)
+            else:
+                self.checkpoint.clear()
+        for stage in self.stages:
+            if stage.name in done or not stage.enabled:
+                done.add(stage.name)
+                result.skipped.append(stage.name)
+        if result.skipped:
+            self.logger.info(f"Skipping {len(result.skipped)} stage(s): {result.skipped}")
+
+        waiting = [stage for stage in self.stages if stage.name not in done]
+        running: dict[Future, Stage] = {}
+
+        with self.context.activate(), ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while waiting or running:
+                if not result.failed:
+                    held = {lock for s in running.values() for lock in s.locks}
+                    for stage in [s for s in waiting if self.dependencies[s.name] <= done]:
+                        if held.intersection(stage.locks):
+                            continue
+                        held.update(stage.locks)
+                        waiting.remove(stage)
+                        running[pool.submit(self._run_stage, stage)] = stage
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        self.logger.error(f"✗ {stage.name} failed: {e}")
+                        result.failed[stage.name] = e
+                        continue
+                    done.add(stage.name)
+                    result.completed.append(stage.name)
+                    if self.checkpoint is not None:
+                        self.checkpoint.mark_complete(stage.name)
+                    stale = self.context.invalidate(stage.outputs)
+                    if stale:
+                        self.logger.info(f"  Dropped shared resources: {stale}")
+                    self.logger.info(f"✓ {stage.name} completed ({elapsed:.1f}s)")
+
+        result.not_run = [stage.name for stage in waiting]
+        if result.ok and self.checkpoint is not None:
+            self.checkpoint.clear()
+        return result
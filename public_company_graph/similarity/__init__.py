@@ -7,6 +7,7 @@ Provides shared functions for computing cosine similarity on embeddings.
 from public_company_graph.similarity.cosine import (
     compute_cosine_similarity_matrix,
     compute_similarity_for_node_type,
+    delete_similarity_relationships,
     find_top_k_similar_pairs,
     validate_embedding,
     validate_similarity_score,
@@ -16,6 +17,7 @@ from public_company_graph.similarity.cosine import (
 __all__ = [
     "compute_cosine_similarity_matrix",
     "compute_similarity_for_node_type",
+    "delete_similarity_relationships",
     "find_top_k_similar_pairs",
     "validate_embedding",
     "validate_similarity_score",
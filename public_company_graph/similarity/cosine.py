@@ -6,6 +6,7 @@ Used by both Domain and Company similarity calculations.
 """
 
 import logging
+from collections.abc import Iterable
 
 import numpy as np
 from numpy.typing import NDArray
@@ -97,20 +98,59 @@ def compute_cosine_similarity_matrix(
     return np.array(similarity, dtype=np.float32)
 
 
+def _add_top_k(
+    pairs: dict[tuple[str, str], float],
+    keys: list[str],
+    i: int,
+    similarities: NDArray[np.float32],
+    similarity_threshold: float,
+    top_k: int,
+) -> None:
+    """Add row i's top-k neighbours above the threshold to pairs (self excluded)."""
+    similarities[i] = -1  # Exclude self
+    key_i = keys[i]
+
+    # Get top-k indices
+    top_indices = np.argsort(similarities)[::-1][:top_k]
+
+    for j in top_indices:
+        score = float(similarities[j])
+        if score >= similarity_threshold:
+            key_j = keys[j]
+            # Order keys consistently
+            if key_i < key_j:
+                pair_key = (key_i, key_j)
+            else:
+                pair_key = (key_j, key_i)
+
+            # Keep highest score for each pair
+            if pair_key not in pairs or score > pairs[pair_key]:
+                pairs[pair_key] = score
+
+
 def find_top_k_similar_pairs(
     keys: list[str],
     embeddings: list[list[float]],
     similarity_threshold: float = 0.7,
     top_k: int = 50,
+    rows: Iterable[str] | None = None,
+    block_size: int = 1024,
 ) -> dict[tuple[str, str], float]:
     """
     Find top-k similar pairs above a threshold.
 
+    With rows, only those keys' top-k lists are computed (their rows of the
+    similarity matrix, against every key), block_size rows at a time. This is the
+    incremental mode: rows are the keys whose embeddings changed, and the result
+    replaces just their edges.
+
     Args:
         keys: List of identifiers (e.g., domain names, CIKs)
         embeddings: List of embedding vectors (same order as keys)
         similarity_threshold: Minimum similarity score
         top_k: Maximum similar items per key
+        rows: Only compute the top-k lists of these keys (None computes all)
+        block_size: Rows per matrix product in the rows mode
 
     Returns:
         Dictionary mapping (key1, key2) -> similarity_score
@@ -122,33 +162,29 @@ def find_top_k_similar_pairs(
     if len(keys) < 2:
         return {}
 
-    # Compute similarity matrix
-    similarity_matrix = compute_cosine_similarity_matrix(embeddings)
-
     # Collect pairs above threshold
     pairs: dict[tuple[str, str], float] = {}
 
-    for i, key_i in enumerate(keys):
+    if rows is not None:
+        position = {key: i for i, key in enumerate(keys)}
+        row_indices = sorted(position[key] for key in set(rows) if key in position)
+        matrix = np.array(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1  # Avoid division by zero
+        normalized = matrix / norms
+        for start in range(0, len(row_indices), block_size):
+            block = row_indices[start : start + block_size]
+            similarities = normalized[block] @ normalized.T
+            for offset, i in enumerate(block):
+                _add_top_k(pairs, keys, i, similarities[offset], similarity_threshold, top_k)
+        return pairs
+
+    # Compute similarity matrix
+    similarity_matrix = compute_cosine_similarity_matrix(embeddings)
+
+    for i in range(len(keys)):
         # Get similarities for this item
-        similarities = similarity_matrix[i].copy()
-        similarities[i] = -1  # Exclude self
-
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
-
-        for j in top_indices:
-            score = float(similarities[j])
-            if score >= similarity_threshold:
-                key_j = keys[j]
-                # Order keys consistently
-                if key_i < key_j:
-                    pair_key = (key_i, key_j)
-                else:
-                    pair_key = (key_j, key_i)
-
-                # Keep highest score for each pair
-                if pair_key not in pairs or score > pairs[pair_key]:
-                    pairs[pair_key] = score
+        _add_top_k(pairs, keys, i, similarity_matrix[i].copy(), similarity_threshold, top_k)
 
     return pairs
 
@@ -162,6 +198,7 @@ def compute_similarity_for_node_type(
     top_k: int = 50,
     database: str | None = None,
     logger_instance: logging.Logger | None = None,
+    rows: Iterable[str] | None = None,
 ) -> dict[tuple[str, str], float]:
     """
     Compute pairwise similarity for all nodes of a given type.
@@ -175,6 +212,7 @@ def compute_similarity_for_node_type(
         top_k: Max similar nodes per node
         database: Neo4j database name
         logger_instance: Optional logger
+        rows: Only compute the top-k lists of these keys (e.g. changed nodes)
 
     Returns:
         Dictionary of (key1, key2) -> similarity_score pairs
@@ -212,12 +250,76 @@ def compute_similarity_for_node_type(
         embeddings=embeddings,
         similarity_threshold=similarity_threshold,
         top_k=top_k,
+        rows=rows,
     )
 
     log.info(f"Found {len(pairs)} similar pairs above threshold {similarity_threshold}")
     return pairs
 
 
+def delete_similarity_relationships(
+    driver,
+    node_label: str,
+    key_property: str,
+    relationship_type: str,
+    keys: Iterable[str] | None = None,
+    database: str | None = None,
+    batch_size: int = 1000,
+    logger_instance: logging.Logger | None = None,
+) -> int:
+    """
+    Delete similarity relationships, all of a type or only those touching some nodes.
+
+    Args:
+        driver: Neo4j driver
+        node_label: Node label (e.g., "Domain", "Company")
+        key_property: Property for node identifier
+        relationship_type: Relationship type (e.g., "SIMILAR_KEYWORD")
+        keys: Only delete relationships of these nodes, either direction (None: all)
+        database: Neo4j database name
+        batch_size: Nodes per delete transaction (with keys)
+        logger_instance: Optional logger
+
+    Returns:
+        Number of relationships deleted
+    """
+    log = logger_instance or logger
+
+    if keys is None:
+        log.info(f"Deleting existing {relationship_type} relationships...")
+        with driver.session(database=database) as session:
+            result = session.run(
+                f"""
+                MATCH (:{node_label})-[r:{relationship_type}]->(:{node_label})
+                DELETE r
+                RETURN count(r) AS deleted
+                """
+            )
+            deleted: int = safe_single(result, default=0, key="deleted")
+        if deleted > 0:
+            log.info(f"Deleted {deleted} existing relationships")
+        return deleted
+
+    keys = sorted(keys)
+    deleted = 0
+    with driver.session(database=database) as session:
+        for i in range(0, len(keys), batch_size):
+            # Collect first: an edge between two listed nodes matches twice
+            result = session.run(
+                f"""
+                UNWIND $batch AS key
+                MATCH (:{node_label} {{{key_property}: key}})-[r:{relationship_type}]-(:{node_label})
+                WITH DISTINCT r
+                DELETE r
+                RETURN count(r) AS deleted
+                """,
+                batch=keys[i : i + batch_size],
+            )
+            deleted += safe_single(result, default=0, key="deleted")
+    log.info(f"Deleted {deleted} {relationship_type} relationships of {len(keys)} nodes")
+    return deleted
+
+
 def write_similarity_relationships(
     driver,
     pairs: dict[tuple[str, str], float],
@@ -227,10 +329,15 @@ def write_similarity_relationships(
     database: str | None = None,
     batch_size: int = 1000,
     logger_instance: logging.Logger | None = None,
+    keys: Iterable[str] | None = None,
 ) -> int:
     """
     Write similarity relationships to Neo4j.
 
+    Existing relationships of the type are replaced: all of them, or with keys only
+    those touching the given nodes (pairs must then only involve those nodes, as
+    find_top_k_similar_pairs(rows=keys) returns).
+
     Args:
         driver: Neo4j driver
         pairs: Dictionary of (key1, key2) -> similarity_score
@@ -240,60 +347,58 @@ def write_similarity_relationships(
         database: Neo4j database name
         batch_size: Batch size for writes
         logger_instance: Optional logger
+        keys: Only replace the relationships of these nodes (None replaces all)
 
     Returns:
         Number of relationships created
     """
+    # gds imports this module, so import the writer lazily
+    from public_company_graph.gds.utils import write_relationships
+
     log = logger_instance or logger
 
-    if not pairs:
+    if not pairs and keys is None:
         log.info("No pairs to write")
         return 0
 
     # Delete existing relationships first (idempotent)
-    log.info(f"Deleting existing {relationship_type} relationships...")
-    with driver.session(database=database) as session:
-        result = session.run(
-            f"""
-            MATCH (:{node_label})-[r:{relationship_type}]->(:{node_label})
-            DELETE r
-            RETURN count(r) AS deleted
-            """
-        )
-        deleted = safe_single(result, default=0, key="deleted")
-        if deleted > 0:
-            log.info(f"Deleted {deleted} existing relationships")
+    delete_similarity_relationships(
+        driver,
+        node_label,
+        key_property,
+        relationship_type,
+        keys=keys,
+        database=database,
+        batch_size=batch_size,
+        logger_instance=log,
+    )
+    if not pairs:
+        log.info("No pairs to write")
+        return 0
 
-    # Write relationships (bidirectional - both directions for symmetric similarity)
+    # Write relationships (bidirectional - both directions for symmetric similarity);
+    # every pair's existing edges were just deleted, so CREATE skips MERGE's check
     log.info(f"Writing {len(pairs)} {relationship_type} relationships (bidirectional)...")
-    batch = [{"key1": k1, "key2": k2, "score": score} for (k1, k2), score in pairs.items()]
-
-    relationships_written = 0
-    with driver.session(database=database) as session:
-        for i in range(0, len(batch), batch_size):
-            chunk = batch[i : i + batch_size]
-            # Create relationships in both directions for symmetric similarity
-            result = session.run(
-                f"""
-                UNWIND $batch AS rel
-                MATCH (n1:{node_label} {{{key_property}: rel.key1}})
-                MATCH (n2:{node_label} {{{key_property}: rel.key2}})
-                WHERE n1 <> n2
-                MERGE (n1)-[r1:{relationship_type}]->(n2)
-                SET r1.score = rel.score,
-                    r1.metric = 'COSINE',
-                    r1.computed_at = datetime()
-                MERGE (n2)-[r2:{relationship_type}]->(n1)
-                SET r2.score = rel.score,
-                    r2.metric = 'COSINE',
-                    r2.computed_at = datetime()
-                RETURN count(r1) + count(r2) AS created
-                """,
-                batch=chunk,
-            )
-            created = safe_single(result, default=0, key="created")
-            if created:
-                relationships_written += created
+    pair_keys = list(pairs)
+    relationships_written = write_relationships(
+        driver,
+        relationship_type,
+        node_label,
+        node_label,
+        {
+            "source": np.array([k1 for k1, _ in pair_keys], dtype=object),
+            "target": np.array([k2 for _, k2 in pair_keys], dtype=object),
+            "score": np.fromiter(pairs.values(), dtype=np.float64, count=len(pair_keys)),
+        },
+        source_key=key_property,
+        target_key=key_property,
+        fresh=True,
+        bidirectional=True,
+        expressions={"metric": "'COSINE'", "computed_at": "datetime()"},
+        database=database,
+        batch_size=batch_size,
+        logger=log,
+    )
 
     log.info(f"Created {relationships_written} {relationship_type} relationships")
     return relationships_written
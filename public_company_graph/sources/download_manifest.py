@@ -0,0 +1,304 @@
+"""
+Persistent manifest of per-company 10-K download state.
+
+Without it, every run re-examines each company by globbing its filings directory,
+listing its portfolio tars and checking the datamule index cache, so a restart over
+~10k companies spends minutes on filesystem scans before downloading anything. The
+manifest (a small SQLite database next to the filings) records per CIK:
+
+- status: pending, downloaded (tar on disk, not yet extracted), extracted, no_10k,
+  or failed
+- attempts, the latest filing date, the extracted file and the last error
+
+so a rerun skips finished companies without touching the filesystem and starts with
+the ones that still have work:
+
+    manifest = DownloadManifest(get_data_dir() / "10k_manifest.db")
+    manifest.sync(companies)
+    for entry in manifest.work_queue(max_attempts=3):
+        ...
+        manifest.record(entry.cik, EXTRACTED, file_path=path)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DOWNLOADED = "downloaded"
+EXTRACTED = "extracted"
+NO_10K = "no_10k"
+FAILED = "failed"
+
+# Work order: extraction-only first (already paid for), then new, then retries
+_WORK_PRIORITY = {DOWNLOADED: 0, PENDING: 1, FAILED: 2}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    cik TEXT PRIMARY KEY,
+    ticker TEXT,
+    name TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    filing_date TEXT,
+    file_path TEXT,
+    error TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_downloads_status ON downloads(status);
+"""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Download state of one company."""
+
+    cik: str
+    ticker: str | None
+    name: str | None
+    status: str
+    attempts: int = 0
+    filing_date: str | None = None
+    file_path: str | None = None
+    error: str | None = None
+
+
+class DownloadManifest:
+    """SQLite-backed per-CIK download state, safe to update from worker threads."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: SQLite file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT count(*) FROM downloads").fetchone()[0])
+
+    def sync(self, companies: Iterable[dict]) -> int:
+        """
+        Add companies not in the manifest yet (as pending); refresh ticker/name.
+
+        Args:
+            companies: Dicts with 'cik' and optional 'ticker'/'name'
+
+        Returns:
+            Number of companies added
+        """
+        rows = [
+            (str(c["cik"]).zfill(10), c.get("ticker"), c.get("name"), _now()) for c in companies
+        ]
+        with self._lock, self._conn:
+            before = self._conn.execute("SELECT count(*) FROM downloads").fetchone()[0]
+            self._conn.executemany(
+                """
+                INSERT INTO downloads (cik, ticker, name, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(cik) DO UPDATE SET ticker = excluded.ticker, name = excluded.name
+                """,
+                rows,
+            )
+            after = self._conn.execute("SELECT count(*) FROM downloads").fetchone()[0]
+        return int(after - before)
+
+    def record(
+        self,
+        cik: str,
+        status: str,
+        error: str | None = None,
+        file_path: Path | str | None = None,
+        filing_date: str | None = None,
+    ) -> None:
+        """
+        Record the outcome of a download step.
+
+        Every status except DOWNLOADED (an intermediate step) counts as an attempt.
+        File path and filing date keep their previous values when not given.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE downloads
+                SET status = ?,
+                    attempts = attempts + ?,
+                    error = ?,
+                    file_path = coalesce(?, file_path),
+                    filing_date = coalesce(?, filing_date),
+                    updated_at = ?
+                WHERE cik = ?
+                """,
+                (
+                    status,
+                    0 if status == DOWNLOADED else 1,
+                    error,
+                    str(file_path) if file_path is not None else None,
+                    filing_date,
+                    _now(),
+                    str(cik).zfill(10),
+                ),
+            )
+
+    def entries(self, statuses: Iterable[str] | None = None) -> list[ManifestEntry]:
+        """All entries, or those with one of the statuses."""
+        query = "SELECT * FROM downloads"
+        params: tuple = ()
+        if statuses is not None:
+            statuses = tuple(statuses)
+            query += f" WHERE status IN ({', '.join('?' * len(statuses))})"
+            params = statuses
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_entry(row) for row in rows]
+
+    def work_queue(
+        self, max_attempts: int = 3, ciks: Iterable[str] | None = None
+    ) -> list[ManifestEntry]:
+        """
+        Entries that still need work, most useful first.
+
+        Args:
+            max_attempts: Failed entries with this many attempts are given up on
+            ciks: Restrict to these CIKs (e.g. a --limit subset)
+
+        Returns:
+            Downloaded-but-unextracted, then pending, then retryable failed entries
+        """
+        wanted = {str(cik).zfill(10) for cik in ciks} if ciks is not None else None
+        work = [
+            entry
+            for entry in self.entries(_WORK_PRIORITY)
+            if (entry.status != FAILED or entry.attempts < max_attempts)
+            and (wanted is None or entry.cik in wanted)
+        ]
+        return sorted(work, key=lambda entry: (_WORK_PRIORITY[entry.status], entry.cik))
+
+    def counts(self, ciks: Iterable[str] | None = None) -> dict[str, int]:
+        """Number of entries per status (optionally within a set of CIKs)."""
+        if ciks is None:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT status, count(*) AS n FROM downloads GROUP BY status"
+                ).fetchall()
+            return {row["status"]: row["n"] for row in rows}
+        wanted = {str(cik).zfill(10) for cik in ciks}
+        counts: dict[str, int] = {}
+        for entry in self.entries():
+            if entry.cik in wanted:
+                counts[entry.status] = counts.get(entry.status, 0) + 1
+        return counts
+
+    def reset(self, statuses: Iterable[str] | None = None) -> int:
+        """
+        Put entries back to pending with no attempts (all, or those with the statuses).
+
+        Returns:
+            Number of entries reset
+        """
+        query = "UPDATE downloads SET status = 'pending', attempts = 0, error = NULL"
+        params: tuple = ()
+        if statuses is not None:
+            statuses = tuple(statuses)
+            query += f" WHERE status IN ({', '.join('?' * len(statuses))})"
+            params = statuses
+        with self._lock, self._conn:
+            return self._conn.execute(query, params).rowcount
+
+    def seed_from_filesystem(
+        self, filings_dir: Path, portfolios_dir: Path, ciks: Iterable[str] | None = None
+    ) -> int:
+        """
+        Import download state from an existing data directory.
+
+        Companies with an extracted HTML/XML file become extracted; companies with
+        only portfolio tars become downloaded. Only CIKs already in the manifest
+        (sync first) are updated.
+
+        Args:
+            filings_dir: Extracted filings, one directory per CIK
+            portfolios_dir: Downloaded tars, one "10k_<CIK>" directory per company
+            ciks: Only look at these companies' directories (e.g. those just synced);
+                None scans every directory
+
+        Returns:
+            Number of entries updated
+        """
+        if ciks is None:
+            company_dirs = _subdirectories(filings_dir)
+            portfolio_dirs = _subdirectories(portfolios_dir)
+        else:
+            padded = [str(cik).zfill(10) for cik in ciks]
+            company_dirs = [str(Path(filings_dir) / cik) for cik in padded]
+            portfolio_dirs = [str(Path(portfolios_dir) / f"10k_{cik}") for cik in padded]
+
+        extracted: dict[str, str] = {}
+        for company_dir in company_dirs:
+            files = [p for p in Path(company_dir).rglob("*") if p.suffix in (".html", ".xml")]
+            if files:
+                latest = max(files, key=lambda p: p.stat().st_mtime)
+                extracted[Path(company_dir).name] = str(latest)
+        downloaded = {
+            Path(portfolio).name.removeprefix("10k_")
+            for portfolio in portfolio_dirs
+            if any(Path(portfolio).glob("*.tar"))
+        } - set(extracted)
+
+        now = _now()
+        with self._lock, self._conn:
+            updated = self._conn.executemany(
+                "UPDATE downloads SET status = ?, file_path = ?, updated_at = ? WHERE cik = ?",
+                [(EXTRACTED, path, now, cik) for cik, path in extracted.items()]
+                + [(DOWNLOADED, None, now, cik) for cik in downloaded],
+            ).rowcount
+        logger.info(
+            f"Seeded download manifest from {filings_dir}: "
+            f"{len(extracted):,} extracted, {len(downloaded):,} downloaded"
+        )
+        return updated
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _entry(row: sqlite3.Row) -> ManifestEntry:
+    return ManifestEntry(
+        cik=row["cik"],
+        ticker=row["ticker"],
+        name=row["name"],
+        status=row["status"],
+        attempts=row["attempts"],
+        filing_date=row["filing_date"],
+        file_path=row["file_path"],
+        error=row["error"],
+    )
+
+
+def _subdirectories(path: Path) -> list[str]:
+    if not Path(path).exists():
+        return []
+    with os.scandir(path) as it:
+        return [entry.path for entry in it if entry.is_dir()]
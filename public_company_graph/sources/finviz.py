@@ -22,6 +22,19 @@ logger = logging.getLogger(__name__)
 # Rate limiter for finviz
 _rate_limiter = get_rate_limiter("finviz", FINVIZ_RATE_LIMIT)
 
+FINVIZ_QUOTE_URL = "https://finviz.com/quote.ashx?t={ticker}"
+FINVIZ_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+_WEBSITE_PATTERN = (
+    r'Website["\']?\s*</td>\s*<td[^>]*>\s*<a[^>]*href=["\']'
+    r"(https?://(?:www\.)?([a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?"
+    r"(\.[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)+))"
+)
+
 
 def get_domain_from_finviz(session: requests.Session, ticker: str) -> DomainResult:
     """
@@ -38,38 +51,33 @@ def get_domain_from_finviz(session: requests.Session, ticker: str) -> DomainResu
         _rate_limiter()
 
     try:
-        url = f"https://finviz.com/quote.ashx?t={ticker}"
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-        }
-        response = session.get(url, headers=headers, timeout=5)
+        url = FINVIZ_QUOTE_URL.format(ticker=ticker)
+        response = session.get(url, headers=FINVIZ_HEADERS, timeout=5)
 
         if response.status_code == 200:
-            # Finviz has website in a table:
-            # <td>Website</td><td><a href="https://www.company.com">Website</a></td>
-            # More specific pattern to avoid catching Yahoo Finance links
-            # Look for the Website label followed by a link that's NOT yahoo.com
-            website_pattern = (
-                r'Website["\']?\s*</td>\s*<td[^>]*>\s*<a[^>]*href=["\']'
-                r"(https?://(?:www\.)?([a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?"
-                r"(\.[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)+))"
-            )
-            match = re.search(website_pattern, response.text, re.IGNORECASE)
-            if match:
-                domain = normalize_domain(match.group(1))
-                # Filter out infrastructure and known bad domains
-                if (
-                    domain
-                    and not is_infrastructure_domain(domain)
-                    and "finviz.com" not in domain
-                    and "yahoo.com" not in domain
-                    and "google.com" not in domain
-                ):
-                    return DomainResult(domain, "finviz", 0.7)
+            return _parse_finviz_domain(response.text)
     except Exception as e:
         logger.debug(f"Finviz error for {ticker}: {e}")
 
     return DomainResult(None, "finviz", 0.0)
+
+
+def _parse_finviz_domain(html: str) -> DomainResult:
+    """Company website from a Finviz quote page."""
+    # Finviz has website in a table:
+    # <td>Website</td><td><a href="https://www.company.com">Website</a></td>
+    # More specific pattern to avoid catching Yahoo Finance links
+    # Look for the Website label followed by a link that's NOT yahoo.com
+    match = re.search(_WEBSITE_PATTERN, html, re.IGNORECASE)
+    if match:
+        domain = normalize_domain(match.group(1))
+        # Filter out infrastructure and known bad domains
+        if (
+            domain
+            and not is_infrastructure_domain(domain)
+            and "finviz.com" not in domain
+            and "yahoo.com" not in domain
+            and "google.com" not in domain
+        ):
+            return DomainResult(domain, "finviz", 0.7)
+    return DomainResult(None, "finviz", 0.0)
@@ -4,25 +4,31 @@ SEC EDGAR pre-check utilities.
 Provides functions to check if a company has 10-K filings available
 before making expensive API calls. Uses free SEC EDGAR API.
 
-IMPORTANT: This should be run SEQUENTIALLY (not in parallel) to respect
-SEC's rate limit of 10 requests per second.
+Uncached checks run concurrently on an AsyncHttpClient, whose SEC token bucket
+keeps the whole run at SEC's rate limit of 10 requests per second.
 
 Results are cached to avoid repeating the 14+ minute SEC check on subsequent runs.
 """
 
+import asyncio
 import logging
-import time
 from collections.abc import Iterator
 
 import requests
 from tqdm import tqdm
 
 from public_company_graph.cache import get_cache
+from public_company_graph.utils.async_http import AsyncHttpClient, map_concurrent
 
 logger = logging.getLogger(__name__)
 
-# SEC EDGAR rate limit: 10 requests per second
-SEC_RATE_LIMIT_DELAY = 0.11  # Slightly over 0.1s to be safe
+SEC_HEADERS = {
+    "User-Agent": "public_company_graph script (contact: alexwoolford@example.com)",
+    "Accept": "application/json",
+}
+
+# Checks in flight at once (the SEC token bucket bounds the request rate)
+CHECK_CONCURRENCY = 16
 
 # Cache settings
 CACHE_NAMESPACE = "sec_10k_check"
@@ -59,48 +65,92 @@ def check_company_has_10k(
     # SEC EDGAR Submissions API (free, no authentication required)
     url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
 
-    headers = {
-        "User-Agent": "public_company_graph script (contact: alexwoolford@example.com)",
-        "Accept": "application/json",
-    }
-
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        response = session.get(url, headers=SEC_HEADERS, timeout=10)
         response.raise_for_status()
-        data = response.json()
-
-        # Check filings array
-        filings = data.get("filings", {})
-        if not filings:
-            return False
+        return _has_10k_in_range(response.json(), filing_date_start, filing_date_end)
 
-        recent = filings.get("recent", {})
-        if not recent:
-            return False
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"SEC EDGAR check failed for CIK {cik_padded}: {e}")
+        # On error, return True to allow datamule to try (fail-safe)
+        return True
+    except (KeyError, IndexError, ValueError) as e:
+        logger.debug(f"SEC EDGAR parse error for CIK {cik_padded}: {e}")
+        return True
 
-        forms = recent.get("form", [])
-        if not forms:
-            return False
 
-        # Check if any 10-K filings exist in date range
-        filing_dates = recent.get("filingDate", [])
+async def check_company_has_10k_async(
+    cik: str,
+    client: AsyncHttpClient,
+    filing_date_start: str = "2020-01-01",
+    filing_date_end: str = "2025-01-01",
+) -> bool:
+    """
+    Async variant of check_company_has_10k.
 
-        for i, form_type in enumerate(forms):
-            if form_type == "10-K":
-                if i < len(filing_dates):
-                    filing_date = filing_dates[i]
-                    if filing_date_start <= filing_date <= filing_date_end:
-                        return True
+    Errors return True (fail-safe, as in the sync version); a CIK unknown to
+    EDGAR (404) returns False.
 
-        return False
+    Args:
+        cik: Company CIK
+        client: Open AsyncHttpClient
+        filing_date_start: Start date for filing search (YYYY-MM-DD)
+        filing_date_end: End date for filing search (YYYY-MM-DD)
 
-    except requests.exceptions.RequestException as e:
-        logger.debug(f"SEC EDGAR check failed for CIK {cik_padded}: {e}")
-        # On error, return True to allow datamule to try (fail-safe)
-        return True
+    Returns:
+        True if company has 10-K filings in date range, False otherwise
+    """
+    cik_padded = cik.zfill(10)
+    url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+    try:
+        data = await client.get_json(url, headers=SEC_HEADERS)
+        if data is None:
+            return False
+        return _has_10k_in_range(data, filing_date_start, filing_date_end)
     except (KeyError, IndexError, ValueError) as e:
         logger.debug(f"SEC EDGAR parse error for CIK {cik_padded}: {e}")
         return True
+    except Exception as e:
+        logger.debug(f"SEC EDGAR check failed for CIK {cik_padded}: {e}")
+        return True
+
+
+def _has_10k_in_range(data: dict, filing_date_start: str, filing_date_end: str) -> bool:
+    """Whether a submissions document lists a 10-K filed within the date range."""
+    recent = (data.get("filings") or {}).get("recent") or {}
+    forms = recent.get("form", [])
+    filing_dates = recent.get("filingDate", [])
+
+    for i, form_type in enumerate(forms):
+        if form_type == "10-K" and i < len(filing_dates):
+            if filing_date_start <= filing_dates[i] <= filing_date_end:
+                return True
+    return False
+
+
+async def _check_companies_async(
+    companies: list[dict],
+    filing_date_start: str,
+    filing_date_end: str,
+    progress: tqdm,
+) -> dict[str, bool]:
+    """Check all companies concurrently; returns has-10-K by CIK."""
+    results: dict[str, bool] = {}
+
+    async def check(company: dict) -> bool:
+        return await check_company_has_10k_async(
+            company.get("cik", ""),
+            client,
+            filing_date_start=filing_date_start,
+            filing_date_end=filing_date_end,
+        )
+
+    async with AsyncHttpClient(cache=get_cache(), max_connections=CHECK_CONCURRENCY) as client:
+        async for company, outcome in map_concurrent(check, companies, CHECK_CONCURRENCY):
+            # An unexpected exception counts as an error: fail-safe to True
+            results[company.get("cik", "")] = outcome if isinstance(outcome, bool) else True
+            progress.update(1)
+    return results
 
 
 def filter_companies_with_10k(
@@ -116,7 +166,7 @@ def filter_companies_with_10k(
     Results are CACHED to avoid repeating the 14+ minute SEC check.
     Use force_refresh=True to re-check SEC (e.g., after new filings).
 
-    On first run: checks SEC EDGAR sequentially (~14 min for 8,000 companies)
+    On first run: checks SEC EDGAR concurrently at its 10 req/sec limit
     On subsequent runs: uses cache (instant)
 
     Args:
@@ -151,49 +201,30 @@ def filter_companies_with_10k(
     # No cache or force refresh - check SEC EDGAR
     logger.info("Checking SEC EDGAR for 10-K filings (this will be cached for future runs)")
 
-    session = requests.Session()
-    session.headers.update(
-        {"User-Agent": "public_company_graph script (contact: alexwoolford@example.com)"}
-    )
+    with tqdm(
+        total=len(companies),
+        desc="Pre-checking for 10-Ks",
+        unit="company",
+        disable=not show_progress,
+    ) as progress:
+        has_10k_by_cik = asyncio.run(
+            _check_companies_async(companies, filing_date_start, filing_date_end, progress)
+        )
 
     has_10k_count = 0
     no_10k_count = 0
     companies_with_10k = []  # Track CIKs for caching
 
-    iterator = tqdm(
-        companies,
-        desc="Pre-checking for 10-Ks",
-        unit="company",
-        disable=not show_progress,
-    )
-
-    for company in iterator:
+    for company in companies:
         cik = company.get("cik", "")
-        ticker = company.get("ticker", "unknown")
-
-        # Rate limit: 10 requests per second
-        time.sleep(SEC_RATE_LIMIT_DELAY)
-
-        has_10k = check_company_has_10k(
-            cik,
-            session=session,
-            filing_date_start=filing_date_start,
-            filing_date_end=filing_date_end,
-        )
-
-        if has_10k:
+        if has_10k_by_cik.get(cik, True):
             has_10k_count += 1
             companies_with_10k.append(cik)
             yield company
         else:
             no_10k_count += 1
-            logger.debug(f"Skipping {ticker} (CIK {cik}): No 10-K filings found")
-
-        # Update progress bar with counts
-        if show_progress:
-            iterator.set_postfix(
-                has_10k=has_10k_count,
-                no_10k=no_10k_count,
+            logger.debug(
+                f"Skipping {company.get('ticker', 'unknown')} (CIK {cik}): No 10-K filings found"
             )
 
     # Cache the results
@@ -0,0 +1,319 @@
+"""
+Async HTTP fetching for rate-limited public data sources (SEC EDGAR, Finviz, Yahoo).
+
+One AsyncHttpClient holds a pooled httpx connection set for a whole run, so a few
+hundred in-flight requests cost coroutines rather than threads. Every request:
+
+- takes a token from its host's process-wide TokenBucket (all SEC hosts share
+  one). The SEC bucket holds a single token, so SEC requests are spaced 1/rate
+  apart and never burst past its 10 req/s (SEC answers a burst with a 403, which
+  is not retried); other hosts may burst one second's worth after idle time,
+- on 429/503 pauses that bucket for the server's Retry-After (every caller of the
+  host backs off, not just the one that was told to) and retries,
+- is revalidated against the disk cache with If-None-Match / If-Modified-Since,
+  so an unchanged resource costs a 304 with no body.
+
+Usage:
+    async with AsyncHttpClient() as client:
+        data = await client.get_json(url, headers={"User-Agent": SEC_USER_AGENT})
+
+httpx is imported when a client is opened.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlsplit
+
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt
+from tenacity.wait import wait_exponential, wait_random
+
+from public_company_graph.constants import (
+    CACHE_TTL_HTTP_RESPONSES,
+    FINVIZ_RATE_LIMIT,
+    SEC_EDGAR_RATE_LIMIT,
+    YAHOO_FINANCE_RATE_LIMIT,
+)
+from public_company_graph.utils.rate_limiting import TokenBucket, get_token_bucket
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Host -> (bucket name, requests per second, burst capacity or None for one
+# second's worth). Hosts sharing a limit share a bucket.
+HOST_RATE_LIMITS: dict[str, tuple[str, float, float | None]] = {
+    "data.sec.gov": ("sec", SEC_EDGAR_RATE_LIMIT, 1.0),
+    "www.sec.gov": ("sec", SEC_EDGAR_RATE_LIMIT, 1.0),
+    "efts.sec.gov": ("sec", SEC_EDGAR_RATE_LIMIT, 1.0),
+    "finviz.com": ("finviz", FINVIZ_RATE_LIMIT, None),
+    "query1.finance.yahoo.com": ("yahoo", YAHOO_FINANCE_RATE_LIMIT, None),
+    "query2.finance.yahoo.com": ("yahoo", YAHOO_FINANCE_RATE_LIMIT, None),
+}
+DEFAULT_HOST_RATE_LIMIT = 5.0  # Hosts without a known limit
+
+HTTP_CACHE_NAMESPACE = "http_responses"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Parse a Retry-After header (delta-seconds or an HTTP date).
+
+    Args:
+        value: Header value
+        now: Current epoch time (for tests; defaults to time.time())
+
+    Returns:
+        Seconds to wait (>= 0), or None if missing or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+def bucket_for_host(host: str | None) -> TokenBucket:
+    """The process-wide token bucket limiting requests to a host."""
+    host = (host or "").lower()
+    name, rate, capacity = HOST_RATE_LIMITS.get(host, (host, DEFAULT_HOST_RATE_LIMIT, None))
+    return get_token_bucket(name, rate, capacity=capacity)
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fetched (or revalidated-from-cache) response."""
+
+    url: str
+    status: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    # True when the server answered 304 and the body came from the disk cache
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HttpStatusError(self.url, self.status)
+
+
+class HttpStatusError(Exception):
+    """Raised for a 4xx/5xx response that is not retried (or ran out of retries)."""
+
+    def __init__(self, url: str, status: int, retry_after: float | None = None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+_backoff = wait_exponential(multiplier=0.5, max=30) + wait_random(0, 0.5)
+
+
+def _retry_wait(retry_state) -> float:
+    """Back off exponentially, unless the host bucket is already paused for Retry-After."""
+    error = retry_state.outcome.exception()
+    if isinstance(error, HttpStatusError) and error.retry_after is not None:
+        return 0.0
+    return _backoff(retry_state)
+
+
+class AsyncHttpClient:
+    """Pooled, rate-limited, revalidating async HTTP client (see module docstring)."""
+
+    def __init__(
+        self,
+        cache=None,
+        headers: dict[str, str] | None = None,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        cache_ttl_days: int = CACHE_TTL_HTTP_RESPONSES,
+        transport=None,
+    ):
+        """
+        Args:
+            cache: AppCache for conditional requests (None disables revalidation)
+            headers: Headers sent with every request
+            max_connections: Size of the connection pool
+            timeout: Per-request timeout in seconds
+            max_retries: Retries after a transport error or a 429/5xx
+            cache_ttl_days: How long cached bodies are kept for revalidation
+            transport: httpx transport override (tests)
+        """
+        self.cache = cache
+        self.headers = headers or {}
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache_ttl_days = cache_ttl_days
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._transient_errors: tuple[type[BaseException], ...] = (HttpStatusError,)
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        self._transient_errors = (HttpStatusError, httpx.TransportError)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        return False
+
+    async def _fetch(
+        self, client: "httpx.AsyncClient", url: str, headers: dict[str, str], bucket: TokenBucket
+    ) -> "httpx.Response":
+        await bucket.acquire_async()
+        response = await client.get(url, headers=headers)
+        if response.status_code in RETRY_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                logger.debug(f"{url}: HTTP {response.status_code}, pausing {retry_after:.1f}s")
+                bucket.pause(retry_after)
+            raise HttpStatusError(url, response.status_code, retry_after)
+        return response
+
+    async def get(
+        self, url: str, headers: dict[str, str] | None = None, use_cache: bool = True
+    ) -> HttpResponse:
+        """
+        GET a URL under its host's rate limit, revalidating any cached copy.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            use_cache: Send conditional headers for (and store) cached bodies
+
+        Returns:
+            HttpResponse (4xx statuses other than 429 are returned, not raised)
+
+        Raises:
+            HttpStatusError: If 429/5xx responses persist through all retries
+            httpx.TransportError: If the connection keeps failing
+        """
+        client = self._client
+        if client is None:
+            raise RuntimeError("AsyncHttpClient must be used as 'async with AsyncHttpClient()'")
+
+        use_cache = use_cache and self.cache is not None
+        cached = self.cache.get(HTTP_CACHE_NAMESPACE, url) if use_cache else None
+        request_headers = dict(headers or {})
+        if cached:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        bucket = bucket_for_host(urlsplit(url).hostname)
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=_retry_wait,
+            retry=retry_if_exception_type(self._transient_errors),
+            reraise=True,
+        ):
+            with attempt:
+                response = await self._fetch(client, url, request_headers, bucket)
+
+        if response.status_code == 304 and cached:
+            return HttpResponse(url, 200, cached["content"], cached["headers"], from_cache=True)
+
+        result = HttpResponse(url, response.status_code, response.content, dict(response.headers))
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if use_cache and response.status_code == 200 and (etag or last_modified):
+            self.cache.set(
+                HTTP_CACHE_NAMESPACE,
+                url,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content": result.content,
+                    "headers": result.headers,
+                },
+                ttl_days=self.cache_ttl_days,
+            )
+        return result
+
+    async def get_json(
+        self, url: str, headers: dict[str, str] | None = None, use_cache: bool = True
+    ) -> Any | None:
+        """
+        GET a JSON document.
+
+        Returns:
+            Parsed JSON, or None on 404
+
+        Raises:
+            HttpStatusError: On other error statuses
+        """
+        response = await self.get(url, headers=headers, use_cache=use_cache)
+        if response.status == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+
+async def map_concurrent(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> AsyncIterator[tuple[T, R | BaseException]]:
+    """
+    Run func over items with at most `concurrency` calls in flight.
+
+    Yields:
+        (item, result) in completion order; a raised exception is yielded as the
+        result instead of aborting the other calls
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> tuple[T, R | BaseException]:
+        async with semaphore:
+            try:
+                return item, await func(item)
+            except Exception as e:
+                return item, e
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -20,8 +20,26 @@ Usage:
     # Or use as a context manager
     with limiter:
         make_api_call()
+
+TokenBucket allows bursts up to its capacity and refills at a fixed rate; it is
+shared by threads and asyncio tasks alike, and a 429's Retry-After can pause it for
+every caller of the host:
+
+    bucket = get_token_bucket("sec", rate=10.0, capacity=1)  # No burst
+    await bucket.acquire_async()   # or bucket.acquire() from a thread
+    bucket.pause(retry_after)      # after a 429
+
+For asyncio clients whose allowed concurrency is unknown up front (OpenAI),
+AdaptiveConcurrencyLimiter grows the number of in-flight requests while calls
+succeed and halves it whenever the API rate-limits us:
+
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=20)
+    async with limiter:
+        response = await make_async_api_call()
+    limiter.on_success()  # or limiter.on_rate_limited() after a 429
 """
 
+import asyncio
 import time
 from threading import Lock
 
@@ -69,16 +87,16 @@ class RateLimiter:
 
         This method is thread-safe and can be called from multiple threads.
         It will sleep if the minimum interval has not elapsed since the last call.
+        Each caller reserves its slot under the lock and sleeps outside it, so
+        waiting threads do not queue up behind one sleeping lock holder.
         """
         with self._lock:
             current_time = time.time()
-            elapsed = current_time - self._last_call
+            slot = max(current_time, self._last_call + self.min_interval)
+            self._last_call = slot
 
-            if elapsed < self.min_interval:
-                sleep_time = self.min_interval - elapsed
-                time.sleep(sleep_time)
-
-            self._last_call = time.time()
+        if slot > current_time:
+            time.sleep(slot - current_time)
 
     def __enter__(self):
         """Context manager entry - enforces rate limiting."""
@@ -99,6 +117,166 @@ class RateLimiter:
             self._last_call = 0.0
 
 
+class TokenBucket:
+    """
+    Token bucket rate limit, usable from threads and asyncio tasks.
+
+    Holds up to `capacity` tokens and refills at `rate` tokens per second, so idle
+    time buys a burst of up to `capacity` immediate calls while the long-run rate
+    never exceeds `rate`. Callers reserve a token under the lock and then wait
+    outside it (time.sleep or asyncio.sleep), so no caller blocks another.
+
+    Args:
+        rate: Tokens added per second (the sustained request rate)
+        capacity: Maximum burst (default: one second's worth, at least 1)
+        source_name: Name of the source (for logging/debugging)
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, source_name: str = "default"):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.source_name = source_name
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (the balance may go negative) and return the wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def _pause_remaining(self) -> float:
+        with self._lock:
+            return self._paused_until - time.monotonic()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait (blocking the thread) until tokens are available, then take them.
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        wait = self._reserve(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            # A pause may have started while we slept
+            wait = self._pause_remaining()
+        return waited
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        wait = self._reserve(tokens)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+            wait = self._pause_remaining()
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` (e.g. a server's Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit that adapts to rate limiting (AIMD).
+
+    Additive increase: after `limit` consecutive successes the limit grows by one,
+    up to max_concurrency. Multiplicative decrease: each rate-limit signal halves
+    the limit, down to min_concurrency. Must be used from a single event loop.
+
+    Args:
+        max_concurrency: Upper bound on in-flight requests
+        initial_concurrency: Starting limit (default: max_concurrency)
+        min_concurrency: Lower bound on in-flight requests (default: 1)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        initial_concurrency: int | None = None,
+        min_concurrency: int = 1,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min(min_concurrency, max_concurrency))
+        initial = initial_concurrency if initial_concurrency is not None else max_concurrency
+        self.limit = max(self.min_concurrency, min(initial, max_concurrency))
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.rate_limited_count = 0
+        self._successes_at_limit = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until fewer than `limit` requests are in flight, then take a slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def release(self) -> None:
+        """Give back a slot taken by acquire()."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+        return False
+
+    def on_success(self) -> None:
+        """Record a successful call (may raise the limit by one)."""
+        self._successes_at_limit += 1
+        if self._successes_at_limit >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes_at_limit = 0
+
+    def on_rate_limited(self) -> None:
+        """Record a rate-limit response (halves the limit)."""
+        self.rate_limited_count += 1
+        self.limit = max(self.min_concurrency, self.limit // 2)
+        self._successes_at_limit = 0
+
+
 # Global rate limiters for common sources
 # These can be imported and used directly, or create new instances as needed
 _rate_limiters: dict[str, RateLimiter] = {}
@@ -139,3 +317,30 @@ def get_rate_limiter(
         limiter = RateLimiter(requests_per_second=requests_per_second, source_name=source_name)
         _rate_limiters[source_name] = limiter
         return limiter
+
+
+_token_buckets: dict[str, TokenBucket] = {}
+
+
+def get_token_bucket(name: str, rate: float, capacity: float | None = None) -> TokenBucket:
+    """
+    Get or create the process-wide token bucket of a rate-limited service.
+
+    Every client of a service (e.g. all SEC hosts) should share one bucket, since
+    the limit applies to us, not to a client instance. The rate of an existing
+    bucket is not changed.
+
+    Args:
+        name: Bucket name (e.g. "sec")
+        rate: Sustained requests per second
+        capacity: Maximum burst (default: one second's worth)
+
+    Returns:
+        TokenBucket instance
+    """
+    with _rate_limiters_lock:
+        bucket = _token_buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(rate, capacity=capacity, source_name=name)
+            _token_buckets[name] = bucket
+        return bucket
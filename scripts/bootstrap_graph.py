@@ -13,6 +13,8 @@ Schema:
 Usage:
     python scripts/bootstrap_graph.py          # Dry-run (plan only)
     python scripts/bootstrap_graph.py --execute  # Actually load data
+    python scripts/bootstrap_graph.py --execute --workers 8  # More concurrent writers
+    python scripts/bootstrap_graph.py --execute --incremental  # Only rows changed since last load
 """
 
 import argparse
@@ -20,6 +22,7 @@ import logging
 import sys
 from pathlib import Path
 
+from public_company_graph.cache import get_cache
 from public_company_graph.cli import (
     add_execute_argument,
     get_driver_and_database,
@@ -28,15 +31,21 @@ from public_company_graph.cli import (
     verify_neo4j_connection,
 )
 from public_company_graph.config import get_domain_status_db
+from public_company_graph.constants import BULK_WRITE_WORKERS
+from public_company_graph.dirty import DirtySet
 from public_company_graph.ingest import (
+    current_watermark,
     get_domain_count,
     get_domain_metadata_counts,
     get_technology_count,
     get_uses_relationship_count,
-    load_domains,
+    ingest_incremental,
+    iter_domain_batches,
+    load_domain_batches,
     load_technologies,
-    read_domains,
     read_technologies,
+    read_watermark,
+    write_watermark,
 )
 from public_company_graph.neo4j import create_bootstrap_constraints
 
@@ -82,11 +91,22 @@ def dry_run_plan(db_path: Path, logger: logging.Logger = None):
     logger.info("=" * 70)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the main ETL pipeline."""
     parser = argparse.ArgumentParser(description="Bootstrap Neo4j graph from SQLite domain data")
     add_execute_argument(parser)
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BULK_WRITE_WORKERS,
+        help=f"Concurrent Neo4j write transactions (default: {BULK_WRITE_WORKERS})",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only load domains changed since the last load (full load if never loaded)",
+    )
+    args = parser.parse_args(argv)
 
     logger = setup_logging("bootstrap_graph", execute=args.execute)
 
@@ -129,19 +149,48 @@ def main():
         logger.info("Loading data from SQLite to Neo4j...")
         logger.info("-" * 70)
 
-        # Read domains from SQLite
-        domains = read_domains(db_path)
-        logger.info(f"Loading {len(domains)} Domain nodes...")
-        load_domains(driver, domains, database=database)
-        logger.info(f"✓ Loaded {len(domains)} Domain nodes")
-        logger.info("")
+        since = read_watermark(driver, database=database) if args.incremental else None
+        if since is not None:
+            logger.info("Loading changes since the last load (incremental)...")
+            result = ingest_incremental(
+                driver,
+                db_path,
+                since,
+                cache=get_cache(),
+                workers=args.workers,
+                database=database,
+                log=logger,
+            )
+            logger.info(f"✓ Updated {len(result.domains)} Domain nodes (marked dirty)")
+            logger.info("")
+        else:
+            if args.incremental:
+                logger.info("No stored high-water mark; running a full load")
+            # Taken before reading, so rows added during the load are picked up next time
+            watermark = current_watermark(db_path)
+
+            # Stream domains from SQLite (batches are written while the next is read)
+            domain_count = get_domain_count(db_path)
+            logger.info(f"Loading {domain_count} Domain nodes...")
+            loaded = load_domain_batches(
+                driver,
+                iter_domain_batches(db_path),
+                total=domain_count,
+                workers=args.workers,
+                database=database,
+            )
+            logger.info(f"✓ Loaded {loaded} Domain nodes")
+            logger.info("")
 
-        # Read technologies from SQLite
-        tech_mappings = read_technologies(db_path)
-        logger.info(f"Loading {len(tech_mappings)} technologies and USES relationships...")
-        load_technologies(driver, tech_mappings, database=database)
-        logger.info("✓ Loaded USES relationships")
-        logger.info("")
+            # Read technologies from SQLite
+            tech_mappings = read_technologies(db_path)
+            logger.info(f"Loading {len(tech_mappings)} technologies and USES relationships...")
+            load_technologies(driver, tech_mappings, workers=args.workers, database=database)
+            logger.info("✓ Loaded USES relationships")
+            logger.info("")
+            write_watermark(driver, watermark, database=database)
+            # Every domain may have changed: downstream stages recompute in full next run
+            DirtySet(get_cache(), "Domain").reset()
 
         # Summary
         logger.info("=" * 70)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed composite similarity index (SIMILAR_COMPOSITE edges).
+
+Scores every company against its SIMILAR_RISK/SIMILAR_DESCRIPTION neighbours plus
+shared technologies (the same score as find_similar_companies) and stores the top-N
+neighbours per company, so lookups read `limit` edges instead of aggregating and
+traversing Domain-Technology paths per request.
+
+Reruns are incremental: only companies whose component edges or technologies changed
+since the last build (and their neighbours) are rewritten. Use --full to rebuild all.
+
+Usage:
+    python scripts/build_composite_similarity_index.py            # Dry-run
+    python scripts/build_composite_similarity_index.py --execute  # Build/refresh
+    python scripts/build_composite_similarity_index.py --execute --full
+"""
+
+import argparse
+import sys
+
+from public_company_graph.cli import (
+    add_execute_argument,
+    get_driver_and_database,
+    setup_logging,
+    verify_neo4j_connection,
+)
+from public_company_graph.company.composite_index import (
+    COMPOSITE_INDEX_TOP_N,
+    build_composite_index,
+)
+
+
+def main(argv: list[str] | None = None):
+    """Run the composite similarity index build."""
+    parser = argparse.ArgumentParser(description="Build the composite similarity index")
+    add_execute_argument(parser)
+    parser.add_argument(
+        "--top-n",
+        type=int,
+        default=COMPOSITE_INDEX_TOP_N,
+        help=f"Neighbours stored per company (default: {COMPOSITE_INDEX_TOP_N})",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rewrite every company instead of only those whose inputs changed",
+    )
+    args = parser.parse_args(argv)
+
+    logger = setup_logging("build_composite_similarity_index", execute=args.execute)
+
+    if not args.execute:
+        logger.info("=" * 70)
+        logger.info("COMPOSITE SIMILARITY INDEX (Dry Run)")
+        logger.info("=" * 70)
+        logger.info("Would compute SIMILAR_COMPOSITE relationships:")
+        logger.info(f"  - Top {args.top_n} neighbours per company")
+        logger.info("  - Score: SIMILAR_RISK + SIMILAR_DESCRIPTION + shared technologies")
+        logger.info(f"  - Mode: {'full rebuild' if args.full else 'incremental'}")
+        logger.info("")
+        logger.info("To execute, run: python scripts/build_composite_similarity_index.py --execute")
+        return
+
+    driver, database = get_driver_and_database(logger)
+    try:
+        if not verify_neo4j_connection(driver, database, logger):
+            sys.exit(1)
+
+        logger.info("=" * 70)
+        logger.info("Building Composite Similarity Index")
+        logger.info("=" * 70)
+        build_composite_index(
+            driver,
+            database=database,
+            top_n=args.top_n,
+            incremental=not args.full,
+            logger=logger,
+        )
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    main()
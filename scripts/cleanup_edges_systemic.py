@@ -36,7 +36,7 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Systemically clean up relationship edges using tiered confidence system"
     )
@@ -51,7 +51,7 @@ def main():
         choices=["HAS_COMPETITOR", "HAS_PARTNER", "HAS_SUPPLIER", "HAS_CUSTOMER"],
         help="Specific relationship types to clean (default: all)",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     log = setup_logging("cleanup_edges_systemic", execute=args.execute)
     driver, database = get_driver_and_database(log)
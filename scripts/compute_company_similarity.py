@@ -7,12 +7,19 @@ This script creates:
 - SIMILAR_SIZE relationships (based on revenue, market_cap, employees)
 
 Uses the enriched Company properties from Phase 1 to create similarity edges.
+
+Pairs within a bucket grow quadratically with its size, so large buckets can be
+capped with --max-per-company, or written as group membership instead with
+--mode groups (Company-[:IN_INDUSTRY_GROUP]->IndustryGroup,
+Company-[:IN_SIZE_BUCKET]->SizeBucket), which is linear in the number of companies.
 """
 
 import argparse
+import itertools
 import logging
 import sys
 import time
+from collections.abc import Iterable
 
 from public_company_graph.cli import (
     add_execute_argument,
@@ -20,9 +27,13 @@ from public_company_graph.cli import (
     setup_logging,
     verify_neo4j_connection,
 )
+from public_company_graph.company.frame import load_company_frame
 from public_company_graph.company.similarity import (
-    compute_industry_similarity,
-    compute_size_similarity,
+    industry_group_memberships,
+    iter_industry_similarity,
+    iter_size_similarity,
+    size_bucket_memberships,
+    unique_pairs,
 )
 from public_company_graph.constants import BATCH_SIZE_LARGE
 from public_company_graph.neo4j.constraints import create_company_constraints
@@ -30,9 +41,70 @@ from public_company_graph.neo4j.constraints import create_company_constraints
 logger = logging.getLogger(__name__)
 
 
+def _write_batches(
+    driver,
+    query: str,
+    rows: Iterable[dict],
+    database: str | None,
+    batch_size: int,
+    log: logging.Logger,
+) -> int:
+    """
+    Stream rows into an `UNWIND $batch AS rel ... RETURN ... AS created` query.
+
+    Rows are pulled from the iterable one batch at a time, so pair generators are
+    never materialized. Progress is logged every 100 batches.
+
+    Returns:
+        Sum of the query's created counts
+    """
+    rows = iter(rows)
+    relationships_written = 0
+    processed = 0
+    start_time = time.time()
+    with driver.session(database=database) as session:
+        for batch_num in itertools.count(1):
+            chunk = list(itertools.islice(rows, batch_size))
+            if not chunk:
+                break
+            result = session.run(query, batch=chunk)
+            relationships_written += result.single()["created"]
+            processed += len(chunk)
+
+            if batch_num % 100 == 0:
+                elapsed = time.time() - start_time
+                rate = processed / elapsed * 60 if elapsed > 0 else 0
+                log.info(f"  Progress: {batch_num} batches - {processed:,} pairs ({rate:,.0f}/min)")
+
+    elapsed_total = time.time() - start_time
+    if processed:
+        rate_total = (relationships_written / elapsed_total * 60) if elapsed_total > 0 else 0
+        log.info(
+            f"Completed {processed:,} rows in {elapsed_total / 60:.1f} minutes "
+            f"({rate_total:,.0f} relationships/minute)"
+        )
+    return relationships_written
+
+
+def _delete_relationships(driver, rel_type: str, database: str | None, log) -> None:
+    """Delete existing Company relationships of one type (idempotent reruns)."""
+    log.info(f"Deleting existing {rel_type} relationships...")
+    with driver.session(database=database) as session:
+        result = session.run(
+            f"""
+            MATCH (:Company)-[r:{rel_type}]->()
+            DELETE r
+            RETURN count(r) AS deleted
+            """
+        )
+        deleted = result.single()["deleted"]
+        if deleted > 0:
+            log.info(f"Deleted {deleted} existing relationships")
+
+
 def write_industry_relationships(
     driver,
-    pairs: list[tuple],
+    pairs: Iterable[tuple],
     database: str | None = None,
     batch_size: int = BATCH_SIZE_LARGE,
     logger_instance: logging.Logger | None = None,
@@ -42,7 +114,7 @@ def write_industry_relationships(
 
     Args:
         driver: Neo4j driver
-        pairs: List of (cik1, cik2, properties) tuples
+        pairs: Iterable of (cik1, cik2, properties) tuples (may be a generator)
         database: Neo4j database name
         batch_size: Batch size for writes
         logger_instance: Optional logger
@@ -52,89 +124,50 @@ def write_industry_relationships(
     """
     log = logger_instance or logger
 
-    if not pairs:
+    pairs = iter(pairs)
+    first = next(pairs, None)
+    if first is None:
         log.info("No industry similarity pairs to write")
         return 0
 
-    # Delete existing relationships first (idempotent)
-    log.info("Deleting existing SIMILAR_INDUSTRY relationships...")
-    with driver.session(database=database) as session:
-        result = session.run(
-            """
-            MATCH (:Company)-[r:SIMILAR_INDUSTRY]->(:Company)
-            DELETE r
-            RETURN count(r) AS deleted
-            """
-        )
-        deleted = result.single()["deleted"]
-        if deleted > 0:
-            log.info(f"Deleted {deleted} existing relationships")
+    _delete_relationships(driver, "SIMILAR_INDUSTRY", database, log)
 
     # Write relationships (bidirectional - both directions for symmetric similarity)
-    log.info(f"Writing {len(pairs)} SIMILAR_INDUSTRY relationships (bidirectional)...")
-    batch = []
-    relationships_written = 0
-
-    for cik1, cik2, props in pairs:
-        batch.append(
-            {
-                "cik1": cik1,
-                "cik2": cik2,
-                "method": props.get("method", "UNKNOWN"),
-                "classification": props.get("classification", ""),
-                "score": props.get("score", 1.0),
-            }
-        )
-
-        if len(batch) >= batch_size:
-            with driver.session(database=database) as session:
-                result = session.run(
-                    """
-                    UNWIND $batch AS rel
-                    MATCH (c1:Company {cik: rel.cik1})
-                    MATCH (c2:Company {cik: rel.cik2})
-                    WHERE c1 <> c2
-                    MERGE (c1)-[r1:SIMILAR_INDUSTRY]->(c2)
-                    SET r1.method = rel.method,
-                        r1.classification = rel.classification,
-                        r1.score = rel.score,
-                        r1.computed_at = datetime()
-                    MERGE (c2)-[r2:SIMILAR_INDUSTRY]->(c1)
-                    SET r2.method = rel.method,
-                        r2.classification = rel.classification,
-                        r2.score = rel.score,
-                        r2.computed_at = datetime()
-                    RETURN count(r1) + count(r2) AS created
-                    """,
-                    batch=batch,
-                )
-                relationships_written += result.single()["created"]
-            batch = []
-
-    # Write remaining batch
-    if batch:
-        with driver.session(database=database) as session:
-            result = session.run(
-                """
-                UNWIND $batch AS rel
-                MATCH (c1:Company {cik: rel.cik1})
-                MATCH (c2:Company {cik: rel.cik2})
-                WHERE c1 <> c2
-                MERGE (c1)-[r1:SIMILAR_INDUSTRY]->(c2)
-                SET r1.method = rel.method,
-                    r1.classification = rel.classification,
-                    r1.score = rel.score,
-                    r1.computed_at = datetime()
-                MERGE (c2)-[r2:SIMILAR_INDUSTRY]->(c1)
-                SET r2.method = rel.method,
-                    r2.classification = rel.classification,
-                    r2.score = rel.score,
-                    r2.computed_at = datetime()
-                RETURN count(r1) + count(r2) AS created
-                """,
-                batch=batch,
-            )
-            relationships_written += result.single()["created"]
+    log.info("Writing SIMILAR_INDUSTRY relationships (bidirectional)...")
+    rows = (
+        {
+            "cik1": cik1,
+            "cik2": cik2,
+            "method": props.get("method", "UNKNOWN"),
+            "classification": props.get("classification", ""),
+            "score": props.get("score", 1.0),
+        }
+        for cik1, cik2, props in itertools.chain([first], pairs)
+    )
+    relationships_written = _write_batches(
+        driver,
+        """
+        UNWIND $batch AS rel
+        MATCH (c1:Company {cik: rel.cik1})
+        MATCH (c2:Company {cik: rel.cik2})
+        WHERE c1 <> c2
+        MERGE (c1)-[r1:SIMILAR_INDUSTRY]->(c2)
+        SET r1.method = rel.method,
+            r1.classification = rel.classification,
+            r1.score = rel.score,
+            r1.computed_at = datetime()
+        MERGE (c2)-[r2:SIMILAR_INDUSTRY]->(c1)
+        SET r2.method = rel.method,
+            r2.classification = rel.classification,
+            r2.score = rel.score,
+            r2.computed_at = datetime()
+        RETURN count(r1) + count(r2) AS created
+        """,
+        rows,
+        database,
+        batch_size,
+        log,
+    )
 
     log.info(f"Created {relationships_written} SIMILAR_INDUSTRY relationships")
     return relationships_written
@@ -142,7 +175,7 @@ def write_industry_relationships(
 
 def write_size_relationships(
     driver,
-    pairs: list[tuple],
+    pairs: Iterable[tuple],
     database: str | None = None,
     batch_size: int = BATCH_SIZE_LARGE,
     logger_instance: logging.Logger | None = None,
@@ -152,7 +185,7 @@ def write_size_relationships(
 
     Args:
         driver: Neo4j driver
-        pairs: List of (cik1, cik2, properties) tuples
+        pairs: Iterable of (cik1, cik2, properties) tuples (may be a generator)
         database: Neo4j database name
         batch_size: Batch size for writes
         logger_instance: Optional logger
@@ -162,30 +195,17 @@ def write_size_relationships(
     """
     log = logger_instance or logger
 
-    if not pairs:
+    pairs = iter(pairs)
+    first = next(pairs, None)
+    if first is None:
         log.info("No size similarity pairs to write")
         return 0
 
-    # Delete existing relationships first (idempotent)
-    log.info("Deleting existing SIMILAR_SIZE relationships...")
-    with driver.session(database=database) as session:
-        result = session.run(
-            """
-            MATCH (:Company)-[r:SIMILAR_SIZE]->(:Company)
-            DELETE r
-            RETURN count(r) AS deleted
-            """
-        )
-        deleted = result.single()["deleted"]
-        if deleted > 0:
-            log.info(f"Deleted {deleted} existing relationships")
-
-    # Write relationships using optimized UNWIND batching (bidirectional)
-    # This approach is reliable, performant, and works on all systems
-    log.info(f"Writing {len(pairs):,} SIMILAR_SIZE relationships (bidirectional)...")
+    _delete_relationships(driver, "SIMILAR_SIZE", database, log)
 
-    # Prepare batch data
-    batch_data = [
+    # Write relationships using UNWIND batching (bidirectional)
+    log.info("Writing SIMILAR_SIZE relationships (bidirectional)...")
+    rows = (
         {
             "cik1": cik1,
             "cik2": cik2,
@@ -194,70 +214,100 @@ def write_size_relationships(
             "bucket": props.get("bucket", ""),
             "score": props.get("score", 1.0),
         }
-        for cik1, cik2, props in pairs
-    ]
+        for cik1, cik2, props in itertools.chain([first], pairs)
+    )
+    relationships_written = _write_batches(
+        driver,
+        """
+        UNWIND $batch AS rel
+        MATCH (c1:Company {cik: rel.cik1})
+        MATCH (c2:Company {cik: rel.cik2})
+        WHERE c1 <> c2
+        MERGE (c1)-[r1:SIMILAR_SIZE]->(c2)
+        SET r1.method = rel.method,
+            r1.metric = rel.metric,
+            r1.bucket = rel.bucket,
+            r1.score = rel.score,
+            r1.computed_at = datetime()
+        MERGE (c2)-[r2:SIMILAR_SIZE]->(c1)
+        SET r2.method = rel.method,
+            r2.metric = rel.metric,
+            r2.bucket = rel.bucket,
+            r2.score = rel.score,
+            r2.computed_at = datetime()
+        RETURN count(r1) + count(r2) AS created
+        """,
+        rows,
+        database,
+        batch_size,
+        log,
+    )
 
-    relationships_written = 0
-    total_batches = (len(batch_data) + batch_size - 1) // batch_size
-    start_time = None
+    log.info(f"Created {relationships_written} SIMILAR_SIZE relationships")
+    return relationships_written
 
-    # Use optimized UNWIND batching with progress reporting (bidirectional)
-    # This is reliable and performant (typically 1-2M relationships/minute)
-    with driver.session(database=database) as session:
-        start_time = time.time()
-        for i in range(0, len(batch_data), batch_size):
-            chunk = batch_data[i : i + batch_size]
-            result = session.run(
-                """
-                UNWIND $batch AS rel
-                MATCH (c1:Company {cik: rel.cik1})
-                MATCH (c2:Company {cik: rel.cik2})
-                WHERE c1 <> c2
-                MERGE (c1)-[r1:SIMILAR_SIZE]->(c2)
-                SET r1.method = rel.method,
-                    r1.metric = rel.metric,
-                    r1.bucket = rel.bucket,
-                    r1.score = rel.score,
-                    r1.computed_at = datetime()
-                MERGE (c2)-[r2:SIMILAR_SIZE]->(c1)
-                SET r2.method = rel.method,
-                    r2.metric = rel.metric,
-                    r2.bucket = rel.bucket,
-                    r2.score = rel.score,
-                    r2.computed_at = datetime()
-                RETURN count(r1) + count(r2) AS created
-                """,
-                batch=chunk,
-            )
-            relationships_written += result.single()["created"]
 
-            # Progress reporting every 100 batches or at milestones
-            batch_num = (i // batch_size) + 1
-            if batch_num % 100 == 0 or batch_num == total_batches:
-                progress_pct = (batch_num / total_batches) * 100
-                processed = i + len(chunk)
-                total = len(batch_data)
-                elapsed = time.time() - start_time
-                rate = processed / elapsed if elapsed > 0 else 0
-                eta_seconds = (total - processed) / rate if rate > 0 else 0
-                eta_minutes = eta_seconds / 60
-
-                log.info(
-                    f"  Progress: {batch_num}/{total_batches} batches "
-                    f"({progress_pct:.1f}%) - {processed:,}/{total:,} relationships "
-                    f"({rate:,.0f}/min, ETA: {eta_minutes:.1f}m)"
-                )
-
-    if start_time:
-        elapsed_total = time.time() - start_time
-        rate_total = (relationships_written / elapsed_total * 60) if elapsed_total > 0 else 0
-        log.info(
-            f"Completed in {elapsed_total / 60:.1f} minutes "
-            f"({rate_total:,.0f} relationships/minute)"
-        )
+def write_group_memberships(
+    driver,
+    memberships: list[dict],
+    label: str,
+    rel_type: str,
+    database: str | None = None,
+    batch_size: int = BATCH_SIZE_LARGE,
+    logger_instance: logging.Logger | None = None,
+) -> int:
+    """
+    Write Company-[rel_type]->(label {key}) group memberships.
 
-    log.info(f"Created {relationships_written} SIMILAR_SIZE relationships")
-    return relationships_written
+    Each row's properties other than cik are set on the group node, so two companies
+    are similar iff they share a group: one edge per company and bucket instead of
+    one per pair.
+
+    Args:
+        driver: Neo4j driver
+        memberships: Rows from industry_group_memberships / size_bucket_memberships
+        label: Group node label (IndustryGroup, SizeBucket)
+        rel_type: Membership relationship type (IN_INDUSTRY_GROUP, IN_SIZE_BUCKET)
+        database: Neo4j database name
+        batch_size: Batch size for writes
+        logger_instance: Optional logger
+
+    Returns:
+        Number of membership relationships created
+    """
+    log = logger_instance or logger
+
+    _delete_relationships(driver, rel_type, database, log)
+    if not memberships:
+        log.info(f"No {label} memberships to write")
+        return 0
+
+    log.info(f"Writing {len(memberships):,} {rel_type} memberships...")
+    written = _write_batches(
+        driver,
+        f"""
+        UNWIND $batch AS rel
+        MATCH (c:Company {{cik: rel.cik}})
+        MERGE (g:{label} {{key: rel.key}})
+        SET g += rel.properties
+        MERGE (c)-[r:{rel_type}]->(g)
+        SET r.computed_at = datetime()
+        RETURN count(r) AS created
+        """,
+        (
+            {
+                "cik": row["cik"],
+                "key": row["key"],
+                "properties": {k: v for k, v in row.items() if k != "cik"},
+            }
+            for row in memberships
+        ),
+        database,
+        batch_size,
+        log,
+    )
+    log.info(f"Created {written} {rel_type} relationships")
+    return written
 
 
 def compute_all_similarity(
@@ -265,6 +315,8 @@ def compute_all_similarity(
     database: str | None = None,
     execute: bool = False,
     logger_instance: logging.Logger | None = None,
+    mode: str = "pairs",
+    max_per_company: int | None = None,
 ) -> dict[str, int]:
     """
     Compute all company similarity relationships.
@@ -274,29 +326,18 @@ def compute_all_similarity(
         database: Neo4j database name
         execute: If False, only print plan
         logger_instance: Optional logger
+        mode: "pairs" for SIMILAR_INDUSTRY/SIMILAR_SIZE edges, "groups" for
+            IN_INDUSTRY_GROUP/IN_SIZE_BUCKET memberships
+        max_per_company: Max similarity pairs per company in pairs mode (None = all)
 
     Returns:
         Dictionary with counts of relationships created
     """
     log = logger_instance or logger
 
-    # Fetch all companies with their properties
+    # Fetch all companies with their properties (one query, columnar)
     log.info("Fetching Company nodes from Neo4j...")
-    with driver.session(database=database) as session:
-        result = session.run(
-            """
-            MATCH (c:Company)
-            RETURN c.cik AS cik,
-                   c.sic_code AS sic_code,
-                   c.naics_code AS naics_code,
-                   c.sector AS sector,
-                   c.industry AS industry,
-                   c.revenue AS revenue,
-                   c.market_cap AS market_cap,
-                   c.employees AS employees
-            """
-        )
-        companies = [dict(row) for row in result]
+    companies = load_company_frame(driver, database)
 
     log.info(f"Found {len(companies)} companies")
 
@@ -305,33 +346,53 @@ def compute_all_similarity(
         log.info("DRY RUN MODE")
         log.info("=" * 80)
         log.info("Would compute similarity relationships:")
-        log.info("  - SIMILAR_INDUSTRY (by SIC, NAICS, sector, industry)")
-        log.info("  - SIMILAR_SIZE (by revenue, market_cap, employees)")
+        if mode == "groups":
+            log.info("  - IN_INDUSTRY_GROUP (by SIC, NAICS, sector, industry)")
+            log.info("  - IN_SIZE_BUCKET (by revenue, market_cap, employees)")
+        else:
+            log.info("  - SIMILAR_INDUSTRY (by SIC, NAICS, sector, industry)")
+            log.info("  - SIMILAR_SIZE (by revenue, market_cap, employees)")
         return {"industry": 0, "size": 0}
 
+    if mode == "groups":
+        log.info("")
+        log.info("=" * 80)
+        log.info("Computing Industry Groups and Size Buckets")
+        log.info("=" * 80)
+        industry_count = write_group_memberships(
+            driver,
+            industry_group_memberships(companies),
+            "IndustryGroup",
+            "IN_INDUSTRY_GROUP",
+            database=database,
+            logger_instance=log,
+        )
+        size_count = write_group_memberships(
+            driver,
+            size_bucket_memberships(companies, method="COMPOSITE"),
+            "SizeBucket",
+            "IN_SIZE_BUCKET",
+            database=database,
+            logger_instance=log,
+        )
+        return {"industry": industry_count, "size": size_count}
+
     # Compute industry similarity
     log.info("")
     log.info("=" * 80)
     log.info("Computing Industry Similarity")
     log.info("=" * 80)
 
-    industry_pairs = []
-    for method in ["SIC", "NAICS", "SECTOR", "INDUSTRY"]:
-        pairs = compute_industry_similarity(companies, method=method)
-        industry_pairs.extend(pairs)
-
-    # Deduplicate (same pair might match multiple methods)
-    seen = set()
-    unique_pairs = []
-    for cik1, cik2, props in industry_pairs:
-        pair_key = (cik1, cik2)
-        if pair_key not in seen:
-            seen.add(pair_key)
-            unique_pairs.append((cik1, cik2, props))
-
-    log.info(f"Total unique industry pairs: {len(unique_pairs)}")
+    # Same pair might match multiple methods: the first (most specific) method wins
+    industry_pairs = unique_pairs(
+        itertools.chain.from_iterable(
+            iter_industry_similarity(companies, method=method, max_per_company=max_per_company)
+            for method in ["SIC", "NAICS", "SECTOR", "INDUSTRY"]
+        ),
+        max_per_company,
+    )
     industry_count = write_industry_relationships(
-        driver, unique_pairs, database=database, logger_instance=log
+        driver, industry_pairs, database=database, logger_instance=log
     )
 
     # Compute size similarity
@@ -340,8 +401,9 @@ def compute_all_similarity(
     log.info("Computing Size Similarity")
     log.info("=" * 80)
 
-    size_pairs = compute_size_similarity(companies, method="COMPOSITE")
-    log.info(f"Total size pairs: {len(size_pairs)}")
+    size_pairs = iter_size_similarity(
+        companies, method="COMPOSITE", max_per_company=max_per_company
+    )
     size_count = write_size_relationships(
         driver, size_pairs, database=database, logger_instance=log
     )
@@ -349,14 +411,28 @@ def compute_all_similarity(
     return {"industry": industry_count, "size": size_count}
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the company similarity computation script."""
     parser = argparse.ArgumentParser(
         description="Compute company-to-company similarity relationships"
     )
     add_execute_argument(parser)
+    parser.add_argument(
+        "--mode",
+        choices=["pairs", "groups"],
+        default="pairs",
+        help="pairs: SIMILAR_INDUSTRY/SIMILAR_SIZE edges between companies; "
+        "groups: one IN_INDUSTRY_GROUP/IN_SIZE_BUCKET edge per company and bucket "
+        "(default: pairs)",
+    )
+    parser.add_argument(
+        "--max-per-company",
+        type=int,
+        default=None,
+        help="In pairs mode, cap similarity pairs per company (default: all pairs)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("compute_company_similarity", execute=args.execute)
 
@@ -364,7 +440,9 @@ def main():
         # Dry-run: show plan
         driver, database = get_driver_and_database(logger)
         try:
-            compute_all_similarity(driver, database=database, execute=False, logger_instance=logger)
+            compute_all_similarity(
+                driver, database=database, execute=False, logger_instance=logger, mode=args.mode
+            )
         finally:
             driver.close()
         return
@@ -389,15 +467,24 @@ def main():
         logger.info("")
         logger.info("2. Computing similarity relationships...")
         counts = compute_all_similarity(
-            driver, database=database, execute=True, logger_instance=logger
+            driver,
+            database=database,
+            execute=True,
+            logger_instance=logger,
+            mode=args.mode,
+            max_per_company=args.max_per_company,
         )
 
         logger.info("")
         logger.info("=" * 80)
         logger.info("✓ Complete!")
         logger.info("=" * 80)
-        logger.info(f"Created {counts['industry']} SIMILAR_INDUSTRY relationships")
-        logger.info(f"Created {counts['size']} SIMILAR_SIZE relationships")
+        if args.mode == "groups":
+            logger.info(f"Created {counts['industry']} IN_INDUSTRY_GROUP relationships")
+            logger.info(f"Created {counts['size']} IN_SIZE_BUCKET relationships")
+        else:
+            logger.info(f"Created {counts['industry']} SIMILAR_INDUSTRY relationships")
+            logger.info(f"Created {counts['size']} SIMILAR_SIZE relationships")
 
     finally:
         driver.close()
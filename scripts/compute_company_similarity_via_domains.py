@@ -198,7 +198,7 @@ def compute_company_similarity_via_domains(
     return relationships_written
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the script."""
     parser = argparse.ArgumentParser(
         description="Compute Company similarity via Domain-Domain relationships"
@@ -211,7 +211,7 @@ def main():
         help="Minimum similarity score threshold (default: 0.6)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("compute_company_similarity_via_domains", execute=args.execute)
 
@@ -239,7 +239,7 @@ def compute_domain_similarity(
         logger.error(traceback.format_exc())
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the domain similarity computation script."""
     parser = argparse.ArgumentParser(
         description="Compute Domain-Domain similarity based on description embeddings",
@@ -263,7 +263,7 @@ def main():
         help="Maximum number of similar domains per domain (default: 50)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("compute_domain_similarity", execute=args.execute)
 
@@ -12,27 +12,82 @@ public_company_graph.gds:
 Usage:
     python scripts/compute_gds_features.py          # Dry-run (plan only)
     python scripts/compute_gds_features.py --execute  # Compute all features
+    python scripts/compute_gds_features.py --execute --tech-adoption-backend sparse
+    python scripts/compute_gds_features.py --execute --tech-similarity-backend sparse
+    python scripts/compute_gds_features.py --execute --tech-adoption-backend sparse \
+        --tech-similarity-backend sparse --skip-tech-affinity  # No GDS plugin needed
+    python scripts/compute_gds_features.py --execute --incremental  # Only changed companies
 """
 
 import argparse
 import logging
 import sys
 
+from public_company_graph.cache import get_cache
 from public_company_graph.cli import (
     add_execute_argument,
     get_driver_and_database,
     setup_logging,
     verify_neo4j_connection,
 )
+from public_company_graph.dirty import DirtySet
 from public_company_graph.gds import (
+    GraphProjectionManager,
     cleanup_leftover_graphs,
     compute_company_description_similarity,
     compute_company_technology_similarity,
+    compute_company_technology_similarity_sparse,
     compute_tech_adoption_prediction,
+    compute_tech_adoption_prediction_sparse,
     compute_tech_affinity_bundling,
     get_gds_client,
 )
 
+# DirtySet consumer name of the description similarity feature
+DESCRIPTION_SIMILARITY_CONSUMER = "company_description_similarity"
+
+
+class LazyGdsClient:
+    """
+    GDS client and projection manager, created on first use.
+
+    The SciPy backends need neither, so a run that only uses them never connects
+    to GDS (and does not need the graphdatascience package or the GDS plugin).
+    """
+
+    def __init__(self, driver, database: str | None, logger: logging.Logger):
+        self.driver = driver
+        self.database = database
+        self.logger = logger
+        self.gds = None
+        self.projections: GraphProjectionManager | None = None
+
+    def get(self) -> tuple:
+        """
+        Connect on first call (and drop leftover projections of earlier runs).
+
+        Returns:
+            Tuple of (gds client, GraphProjectionManager)
+
+        Raises:
+            ImportError: If graphdatascience is not installed
+        """
+        if self.gds is None or self.projections is None:
+            self.gds = get_gds_client(self.driver, database=self.database)
+            # Projections are shared between features and dropped once at the end
+            self.projections = GraphProjectionManager(self.gds, self.database, logger=self.logger)
+            self.logger.info("Cleaning up leftover graph projections...")
+            cleanup_leftover_graphs(self.gds, database=self.database, logger=self.logger)
+            self.logger.info("✓ Cleanup complete")
+        return self.gds, self.projections
+
+    def close(self) -> None:
+        """Drop this run's projections and close the client (if one was created)."""
+        if self.projections is not None:
+            self.projections.drop_all()
+        if self.gds is not None:
+            self.gds.close()
+
 
 def print_dry_run_plan(logger: logging.Logger = None):
     """Print the GDS features plan without executing."""
@@ -69,24 +124,49 @@ def print_dry_run_plan(logger: logging.Logger = None):
     logger.info("=" * 70)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run main GDS computation pipeline."""
     parser = argparse.ArgumentParser(description="Compute GDS features using Python GDS client")
     add_execute_argument(parser)
-    args = parser.parse_args()
+    parser.add_argument(
+        "--tech-adoption-backend",
+        choices=["gds", "sparse"],
+        default="gds",
+        help="Technology adoption backend: GDS projection or in-process SciPy (default: gds)",
+    )
+    parser.add_argument(
+        "--tech-similarity-backend",
+        choices=["gds", "sparse"],
+        default="gds",
+        help="Company technology similarity backend: GDS projection or in-process SciPy "
+        "(default: gds)",
+    )
+    parser.add_argument(
+        "--skip-tech-affinity",
+        action="store_true",
+        help="Skip technology affinity bundling (the one feature with no SciPy backend)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Recompute description similarity only for companies changed since the last run",
+    )
+    args = parser.parse_args(argv)
 
     logger = setup_logging("compute_gds_features", execute=args.execute)
 
-    # Check dependencies
-    try:
-        from graphdatascience import GraphDataScience  # noqa: F401
-    except ImportError as e:
-        logger.error(str(e))
-        logger.error("Install missing dependencies with: pip install graphdatascience")
-        sys.exit(1)
+    # Check dependencies (only GDS-backed features need the GDS client)
+    needs_gds = "gds" in (args.tech_adoption_backend, args.tech_similarity_backend)
+    if args.execute and needs_gds:
+        try:
+            from graphdatascience import GraphDataScience  # noqa: F401
+        except ImportError as e:
+            logger.error(str(e))
+            logger.error("Install missing dependencies with: pip install graphdatascience")
+            sys.exit(1)
 
     driver, database = get_driver_and_database(logger)
-    gds = get_gds_client(driver, database=database)
+    gds_client = LazyGdsClient(driver, database, logger)
 
     try:
         # Test connection
@@ -104,15 +184,28 @@ def main():
         logger.info("=" * 70)
         logger.info(f"Using database: {database}")
         logger.info("")
-
-        # Clean up leftover graph projections
-        logger.info("Cleaning up leftover graph projections...")
-        cleanup_leftover_graphs(gds, database=database, logger=logger)
-        logger.info("✓ Cleanup complete")
+        failed = False
 
         # Compute tech features (they don't depend on companies)
-        compute_tech_adoption_prediction(gds, driver, database=database, logger=logger)
-        compute_tech_affinity_bundling(gds, driver, database=database, logger=logger)
+        if args.tech_adoption_backend == "sparse":
+            compute_tech_adoption_prediction_sparse(driver, database=database, logger=logger)
+        else:
+            gds, projections = gds_client.get()
+            compute_tech_adoption_prediction(
+                gds, driver, database=database, projections=projections, logger=logger
+            )
+        if args.skip_tech_affinity:
+            logger.info("⚠ Skipping technology affinity bundling (--skip-tech-affinity)")
+        else:
+            try:
+                gds, projections = gds_client.get()
+            except ImportError as e:
+                # Only reachable with both SciPy backends: the rest can run without GDS
+                logger.warning(f"⚠ Skipping technology affinity bundling: {e}")
+            else:
+                compute_tech_affinity_bundling(
+                    gds, driver, database=database, projections=projections, logger=logger
+                )
 
         # Compute company similarity if Company nodes exist
         with driver.session(database=database) as session:
@@ -127,9 +220,26 @@ def main():
 
         if company_count > 0:
             logger.info(f"Found {company_count} companies with embeddings - computing similarity")
-            compute_company_description_similarity(
-                driver, database=database, execute=True, logger=logger
-            )
+            dirty = DirtySet(get_cache(), "Company")
+            dirty_batch = dirty.pending(DESCRIPTION_SIMILARITY_CONSUMER)
+            incremental = args.incremental and not dirty_batch.full
+            if incremental and not dirty_batch.keys:
+                logger.info("✓ No changed companies - description similarity is up to date")
+            else:
+                try:
+                    compute_company_description_similarity(
+                        driver,
+                        database=database,
+                        execute=True,
+                        logger=logger,
+                        keys=dirty_batch.keys if incremental else None,
+                    )
+                except Exception:
+                    # Leave the batch pending so the next run retries these companies
+                    logger.error("✗ Description similarity failed - changed companies stay pending")
+                    failed = True
+            if not failed:
+                dirty.acknowledge(DESCRIPTION_SIMILARITY_CONSUMER, dirty_batch)
         else:
             logger.info("⚠ No companies with embeddings found - skipping description similarity")
 
@@ -145,9 +255,20 @@ def main():
 
         if company_count > 0:
             logger.info(f"Found {company_count} companies with technologies")
-            compute_company_technology_similarity(
-                gds, driver, database=database, execute=True, logger=logger
-            )
+            if args.tech_similarity_backend == "sparse":
+                compute_company_technology_similarity_sparse(
+                    driver, database=database, execute=True, logger=logger
+                )
+            else:
+                gds, projections = gds_client.get()
+                compute_company_technology_similarity(
+                    gds,
+                    driver,
+                    database=database,
+                    execute=True,
+                    projections=projections,
+                    logger=logger,
+                )
         else:
             logger.info("⚠ No companies with technologies found - skipping tech similarity")
 
@@ -170,9 +291,12 @@ def main():
             result = session.run("MATCH ()-[r:SIMILAR_TECHNOLOGY]->() RETURN count(r) AS count")
             logger.info(f"Company Technology Similarities: {result.single()['count']}")
 
+        if failed:
+            sys.exit(1)
+
     finally:
+        gds_client.close()
         driver.close()
-        gds.close()
 
 
 if __name__ == "__main__":
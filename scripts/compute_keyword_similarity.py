@@ -13,6 +13,7 @@ Usage:
     python scripts/compute_keyword_similarity.py                    # Dry-run
     python scripts/compute_keyword_similarity.py --execute          # Execute
     python scripts/compute_keyword_similarity.py --validate         # Validate embeddings
+    python scripts/compute_keyword_similarity.py --execute --incremental  # Changed domains only
 """
 
 import argparse
@@ -24,11 +25,13 @@ from public_company_graph.cli import (
     setup_logging,
     verify_neo4j_connection,
 )
+from public_company_graph.dirty import DirtySet
 from public_company_graph.embeddings import (
     EMBEDDING_MODEL,
     create_embedding,
     create_embeddings_for_nodes,
     get_openai_client,
+    invalidate_embeddings,
     suppress_http_logging,
 )
 from public_company_graph.similarity import (
@@ -36,6 +39,9 @@ from public_company_graph.similarity import (
     write_similarity_relationships,
 )
 
+# DirtySet consumer name of this script
+DIRTY_CONSUMER = "keyword_similarity"
+
 
 def validate_keyword_embeddings(driver, database: str, logger) -> bool:
     """
@@ -106,7 +112,7 @@ def validate_keyword_embeddings(driver, database: str, logger) -> bool:
     return True
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Compute Domain keyword similarity using embeddings"
@@ -133,7 +139,12 @@ def main():
         default=50,
         help="Max similar domains per domain (default: 50)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute SIMILAR_KEYWORD edges of domains changed since the last run",
+    )
+    args = parser.parse_args(argv)
 
     logger = setup_logging("compute_keyword_similarity", execute=args.execute)
     suppress_http_logging()
@@ -199,6 +210,24 @@ def main():
 
     cache = get_cache()
 
+    # Nodes with an embedding are skipped, so invalidate the changed domains first
+    dirty = DirtySet(cache, "Domain")
+    dirty_batch = dirty.pending(DIRTY_CONSUMER)
+    if dirty_batch.keys:
+        invalidate_embeddings(
+            driver,
+            cache,
+            node_label="Domain",
+            text_property="keywords",
+            key_property="final_domain",
+            keys=dirty_batch.keys,
+            embedding_property="keyword_embedding",
+            database=database,
+            log=logger,
+        )
+    # Without a baseline every domain counts as changed
+    rows = dirty_batch.keys if args.incremental and not dirty_batch.full else None
+
     processed, created, cached, failed = create_embeddings_for_nodes(
         driver=driver,
         cache=cache,
@@ -230,6 +259,7 @@ def main():
         top_k=args.top_k,
         database=database,
         logger_instance=logger,
+        rows=rows,
     )
 
     # Step 3: Write relationships
@@ -245,7 +275,9 @@ def main():
         relationship_type="SIMILAR_KEYWORD",
         database=database,
         logger_instance=logger,
+        keys=rows,
     )
+    dirty.acknowledge(DIRTY_CONSUMER, dirty_batch)
 
     # Summary
     logger.info("")
@@ -7,6 +7,9 @@ This script:
 2. Creates embeddings using OpenAI (with unified cache)
 3. Updates Company nodes with embeddings
 
+Companies marked dirty by load_company_data.py (new or changed description) have
+their embeddings invalidated first, so only those are re-embedded.
+
 Usage:
     python scripts/create_company_embeddings.py          # Dry-run (plan only)
     python scripts/create_company_embeddings.py --execute  # Actually create embeddings
@@ -25,14 +28,19 @@ from public_company_graph.cli import (
     verify_neo4j_connection,
 )
 from public_company_graph.constants import BATCH_SIZE_SMALL
+from public_company_graph.dirty import DirtySet
 from public_company_graph.embeddings import (
     create_embeddings_for_nodes,
     get_openai_client,
+    invalidate_embeddings,
     suppress_http_logging,
 )
 
+# DirtySet consumer name of this stage
+DIRTY_CONSUMER = "company_embeddings"
+
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the company embeddings creation script."""
     parser = argparse.ArgumentParser(
         description="Create OpenAI embeddings for company descriptions"
@@ -43,7 +51,7 @@ def main():
         help="Actually create embeddings (default is dry-run)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("create_company_embeddings", execute=args.execute)
     suppress_http_logging()
@@ -156,6 +164,23 @@ def main():
         logger.info(f"  Updated {total_updated:,} companies in {elapsed:.1f}s")
 
     # Step 2: Create embeddings for all companies with descriptions
+    # (nodes with an embedding are skipped, so invalidate the changed ones first)
+    dirty = DirtySet(cache, "Company")
+    dirty_batch = dirty.pending(DIRTY_CONSUMER)
+    if dirty_batch.keys:
+        logger.info(f"Invalidating embeddings of {len(dirty_batch):,} changed companies...")
+        invalidate_embeddings(
+            driver,
+            cache,
+            node_label="Company",
+            text_property="description",
+            key_property="cik",
+            keys=dirty_batch.keys,
+            embedding_property="description_embedding",
+            database=database,
+            log=logger,
+        )
+
     logger.info("Creating embeddings for companies with descriptions...")
     processed, created, cached, failed = create_embeddings_for_nodes(
         driver=driver,
@@ -169,6 +194,7 @@ def main():
         execute=True,
         log=logger,
     )
+    dirty.acknowledge(DIRTY_CONSUMER, dirty_batch)
 
     logger.info("=" * 80)
     logger.info("Complete!")
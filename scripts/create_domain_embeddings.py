@@ -8,6 +8,9 @@ This script uses the general-purpose embedding creation system to:
 3. Update Domain nodes with description_embedding property
 4. Store model metadata for reproducibility
 
+Domains marked dirty by the incremental bootstrap have their embeddings invalidated
+first, so only those are re-embedded.
+
 Usage:
     python scripts/create_domain_embeddings.py                    # Dry-run (plan only)
     python scripts/create_domain_embeddings.py --execute          # Actually create embeddings
@@ -24,14 +27,19 @@ from public_company_graph.cli import (
     setup_logging,
     verify_neo4j_connection,
 )
+from public_company_graph.dirty import DirtySet
 from public_company_graph.embeddings import (
     EMBEDDING_DIMENSION,
     EMBEDDING_MODEL,
     create_embeddings_for_nodes,
     get_openai_client,
+    invalidate_embeddings,
     suppress_http_logging,
 )
 
+# DirtySet consumer name of this stage
+DIRTY_CONSUMER = "domain_embeddings"
+
 
 def update_domain_embeddings(
     driver,
@@ -58,6 +66,22 @@ def update_domain_embeddings(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    # Nodes with an embedding are skipped, so invalidate the changed ones first
+    dirty = DirtySet(cache, "Domain")
+    dirty_batch = dirty.pending(DIRTY_CONSUMER)
+    if execute and dirty_batch.keys:
+        invalidate_embeddings(
+            driver,
+            cache,
+            node_label="Domain",
+            text_property="description",
+            key_property="final_domain",
+            keys=dirty_batch.keys,
+            embedding_property="description_embedding",
+            database=database,
+            log=logger,
+        )
+
     # Use general-purpose function with batch API for speed
     processed, created, cached, failed = create_embeddings_for_nodes(
         driver=driver,
@@ -77,6 +101,7 @@ def update_domain_embeddings(
     )
 
     if execute:
+        dirty.acknowledge(DIRTY_CONSUMER, dirty_batch)
         logger.info("=" * 80)
         logger.info("Embedding Processing Complete")
         logger.info("=" * 80)
@@ -94,7 +119,7 @@ def update_domain_embeddings(
         logger.info(f"  Embeddings in cache: {cache_stats['by_namespace'].get('embeddings', 0)}")
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the domain embeddings creation script."""
     parser = argparse.ArgumentParser(
         description="Create embeddings for Domain descriptions",
@@ -102,7 +127,7 @@ def main():
     )
     add_execute_argument(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("create_domain_embeddings", execute=args.execute)
 
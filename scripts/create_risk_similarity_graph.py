@@ -37,7 +37,7 @@ from public_company_graph.embeddings import (
 )
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the risk factors similarity graph creation pipeline."""
     parser = argparse.ArgumentParser(
         description="Create embeddings and similarity relationships for company risk factors"
@@ -48,7 +48,7 @@ def main():
         help="Actually create embeddings and relationships (default is dry-run)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("create_risk_similarity_graph", execute=args.execute)
     suppress_http_logging()
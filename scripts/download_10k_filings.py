@@ -18,6 +18,12 @@ Usage:
     python scripts/download_10k_filings.py          # Dry-run (plan only)
     python scripts/download_10k_filings.py --execute  # Actually download
     python scripts/download_10k_filings.py --execute --from-neo4j  # Use Neo4j instead of SEC
+    python scripts/download_10k_filings.py --execute --retry-failed  # Retry given-up failures
+
+Per-company progress is kept in data/10k_manifest.db (see
+public_company_graph.sources.download_manifest): a rerun skips extracted companies and
+companies without a 10-K without scanning their directories, and starts with the
+companies that still have work.
 """
 
 import argparse
@@ -57,6 +63,14 @@ from public_company_graph.sources.datamule_index import (
     filter_companies_with_10k_fast,
     mark_cik_no_10k_available,
 )
+from public_company_graph.sources.download_manifest import (
+    DOWNLOADED,
+    EXTRACTED,
+    FAILED,
+    NO_10K,
+    PENDING,
+    DownloadManifest,
+)
 from public_company_graph.sources.sec_companies import (
     get_all_companies_from_neo4j,
     get_all_companies_from_sec,
@@ -68,7 +82,10 @@ from public_company_graph.utils.tar_extraction import (
     extract_from_tar,
     get_filing_date_from_tar_name,
 )
-from public_company_graph.utils.tar_selection import find_tar_with_latest_10k
+from public_company_graph.utils.tar_selection import (
+    find_tar_with_latest_10k,
+    get_latest_10k_filing_date_from_tar,
+)
 
 # Try to import datamule
 try:
@@ -96,6 +113,8 @@ logger = logging.getLogger(__name__)
 # Output directories for 10-K filings
 FILINGS_DIR = get_data_dir() / "10k_filings"  # Organized extracted HTML files
 PORTFOLIOS_DIR = get_data_dir() / "10k_portfolios"  # Datamule portfolio directories (tar files)
+MANIFEST_PATH = get_data_dir() / "10k_manifest.db"  # Per-company download state
+MAX_ATTEMPTS = 3  # Failed companies are given up on after this many attempts
 
 
 def download_10k_for_company(
@@ -109,6 +128,8 @@ def download_10k_for_company(
     filing_date_start: str = "2020-01-01",  # Start date for filing search (focus on recent filings)
     filing_date_end: str = None,  # End date for filing search (None = current date + 1 year for future filings)
     force: bool = False,  # If True, delete existing files and re-download
+    check_existing: bool = True,  # False skips the file/tar scans (manifest says nothing is on disk)
+    manifest: DownloadManifest | None = None,  # Records the downloaded tar's filing date
 ) -> tuple[bool, Path | None, str | None]:
     """
     Download the most recent 10-K filing for a company.
@@ -119,6 +140,8 @@ def download_10k_for_company(
         name: Company name (for logging)
         output_dir: Base directory for storing filings
         max_retries: Maximum number of retry attempts (default: 1 to prevent multiple API charges on failures)
+        check_existing: Look for previously extracted files and downloaded tars first
+        manifest: Download manifest to mark the company downloaded in once tars arrive
 
     Returns:
         Tuple of (success, file_path, error_message)
@@ -146,7 +169,11 @@ def download_10k_for_company(
     portfolio_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure parent directory exists
 
     # Check if HTML/XML file already exists (extracted)
-    existing_files = list(company_dir.glob("**/*.html")) + list(company_dir.glob("**/*.xml"))
+    existing_files = (
+        list(company_dir.glob("**/*.html")) + list(company_dir.glob("**/*.xml"))
+        if check_existing
+        else []
+    )
     if existing_files and not force:
         # Get most recent file
         most_recent = max(existing_files, key=lambda p: p.stat().st_mtime)
@@ -168,7 +195,7 @@ def download_10k_for_company(
     # If so, extract from them instead of re-downloading (unless force=True)
     # Sort by actual filing date (from filename), not modification time
     tar_files = sorted(
-        portfolio_path.glob("*.tar") if portfolio_path.exists() else [],
+        portfolio_path.glob("*.tar") if check_existing and portfolio_path.exists() else [],
         key=get_filing_date_from_tar_name,
         reverse=True,  # Most recent first
     )
@@ -339,6 +366,18 @@ def download_10k_for_company(
             tar_file_with_latest = find_tar_with_latest_10k(
                 tar_files, ticker=ticker, cik=cik_padded
             )
+            if manifest is not None:
+                # Paid for: a crash from here on resumes with extraction, not a download
+                filing_date = (
+                    get_latest_10k_filing_date_from_tar(tar_file_with_latest)
+                    if tar_file_with_latest
+                    else None
+                )
+                manifest.record(
+                    cik_padded,
+                    DOWNLOADED,
+                    filing_date=filing_date.strftime("%Y-%m-%d") if filing_date else None,
+                )
 
             if not tar_file_with_latest:
                 logger.warning(
@@ -464,6 +503,9 @@ def download_all_10ks(
     force: bool = False,  # If True, delete existing files and re-download
     pre_filter: bool = True,  # Pre-filter companies using Datamule index (default: True, saves credits)
     refresh_filter: bool = False,  # If True, force refresh the pre-filter cache
+    manifest_path: Path = MANIFEST_PATH,  # Per-company download state (resume without scans)
+    max_attempts: int = MAX_ATTEMPTS,  # Give up on a failing company after this many attempts
+    retry_failed: bool = False,  # If True, retry companies that were given up on
 ) -> dict[str, int]:
     """
     Download 10-K filings for all companies.
@@ -476,6 +518,11 @@ def download_all_10ks(
         from_neo4j: If True, get companies from Neo4j; if False, get from SEC EDGAR
         keep_tar_files: If True, keep tar files after extraction (default: True, needed for datamule parsing)
         workers: Number of parallel workers (default: {DEFAULT_WORKERS}, auto-increased to {DEFAULT_WORKERS_WITH_API} with API key)
+        manifest_path: SQLite download manifest; companies it records as extracted or
+            without a 10-K are not re-examined (force resets it; refresh_filter
+            rechecks the companies without a 10-K)
+        max_attempts: Failed companies are skipped once they reach this many attempts
+        retry_failed: Reset failed companies so they are attempted again
 
     Returns:
         Dict with counts: total, downloaded, cached, no_10k_available, errors, failed
@@ -585,6 +632,14 @@ def download_all_10ks(
                 logger.info("  --refresh-filter: Will re-query Datamule index (ignoring cache)")
         else:
             logger.info("⚠️  Pre-filter DISABLED: Will attempt all companies (may waste credits)")
+        if manifest_path.exists():
+            with DownloadManifest(manifest_path) as manifest:
+                counts = manifest.counts(str(c["cik"]).zfill(10) for c in companies)
+            logger.info(
+                f"Manifest: {counts.get(EXTRACTED, 0):,} already extracted, "
+                f"{counts.get(NO_10K, 0):,} without 10-K, "
+                f"{counts.get(FAILED, 0):,} failed (skipped after {max_attempts} attempts)"
+            )
         logger.info("=" * 80)
         logger.info("To execute, run: python scripts/download_10k_filings.py --execute")
         return {
@@ -689,8 +744,51 @@ def download_all_10ks(
         logger.info("=" * 80)
         logger.info("")
 
-    # Thread-safe stats
-    stats = ExecutionStats(downloaded=0, cached=0, no_10k_available=0, errors=0)
+    # Per-company state from previous runs; companies new to the manifest are seeded
+    # from their directories, after which they are skipped without scanning them
+    ciks = [str(c["cik"]).zfill(10) for c in companies]
+    manifest = DownloadManifest(manifest_path)
+    known = {entry.cik for entry in manifest.entries()}
+    manifest.sync(companies)
+    new_ciks = [cik for cik in ciks if cik not in known]
+    if new_ciks and not force:
+        manifest.seed_from_filesystem(FILINGS_DIR, PORTFOLIOS_DIR, ciks=new_ciks)
+    if force:
+        manifest.reset()
+    else:
+        if retry_failed:
+            logger.info(f"Retrying {manifest.reset([FAILED]):,} failed companies (--retry-failed)")
+        if refresh_filter:
+            # New 10-Ks may have been filed since these companies were checked
+            logger.info(
+                f"Rechecking {manifest.reset([NO_10K]):,} companies without a 10-K "
+                "(--refresh-filter)"
+            )
+
+    done = manifest.counts(ciks)
+    work = [
+        {
+            "cik": entry.cik,
+            "ticker": entry.ticker or "N/A",
+            "name": entry.name or "Unknown",
+            "status": entry.status,
+        }
+        for entry in manifest.work_queue(max_attempts=max_attempts, ciks=ciks)
+    ]
+    given_up = done.get(FAILED, 0) - sum(1 for company in work if company["status"] == FAILED)
+    logger.info(
+        f"Manifest: {done.get(EXTRACTED, 0):,} extracted, {done.get(NO_10K, 0):,} without 10-K, "
+        f"{given_up:,} given up after {max_attempts} attempts → {len(work):,} to process"
+    )
+    logger.info("")
+
+    # Thread-safe stats (companies finished in earlier runs count as cached/no 10-K)
+    stats = ExecutionStats(
+        downloaded=0,
+        cached=done.get(EXTRACTED, 0),
+        no_10k_available=done.get(NO_10K, 0),
+        errors=given_up,
+    )
 
     # Time-based progress logging (logs to file every 30 seconds)
     import threading
@@ -718,6 +816,8 @@ def download_all_10ks(
             filing_date_start=filing_date_start,
             filing_date_end=filing_date_end,
             force=force,
+            check_existing=company["status"] != PENDING,
+            manifest=manifest,
         )
 
         return ticker, success, file_path, error
@@ -730,6 +830,7 @@ def download_all_10ks(
         cik = company["cik"]
 
         if success:
+            manifest.record(cik, EXTRACTED, file_path=file_path)
             if file_path and file_path.exists():
                 # Check if it was just downloaded (new file) or already existed
                 file_age_hours = (time.time() - file_path.stat().st_mtime) / 3600
@@ -747,6 +848,7 @@ def download_all_10ks(
             if error and "No 10-K found" in error:
                 # This is expected for many companies (ETFs, foreign companies, etc.)
                 stats.increment("no_10k_available")
+                manifest.record(cik, NO_10K, error=error)
                 failed_companies.append((ticker, cik, "no_10k", error))
                 logger.debug(
                     f"⊘ No 10-K: {ticker} ({cik}) - expected for ETFs/foreign/inactive companies"
@@ -754,6 +856,7 @@ def download_all_10ks(
             else:
                 # Actual error (download failure, extraction failure, etc.)
                 stats.increment("errors")
+                manifest.record(cik, FAILED, error=error or "Unknown error")
                 failed_companies.append((ticker, cik, "error", error or "Unknown error"))
                 logger.debug(f"✗ Error: {ticker} ({cik}): {error}")
 
@@ -765,10 +868,10 @@ def download_all_10ks(
                 elapsed = current_time - progress_state["start_time"]
                 processed = progress_state["processed"]
                 rate = processed / elapsed if elapsed > 0 else 0
-                remaining = (total - processed) / rate if rate > 0 else 0
-                pct = (processed / total * 100) if total > 0 else 0
+                remaining = (len(work) - processed) / rate if rate > 0 else 0
+                pct = (processed / len(work) * 100) if work else 0
                 logger.info(
-                    f"  Progress: {processed:,}/{total:,} ({pct:.1f}%) | "
+                    f"  Progress: {processed:,}/{len(work):,} ({pct:.1f}%) | "
                     f"Rate: {rate:.1f}/sec | ETA: {remaining / 60:.1f}min | "
                     f"Downloaded: {stats.get('downloaded'):,} | Cached: {stats.get('cached'):,} | "
                     f"No 10-K: {stats.get('no_10k_available'):,} | Errors: {stats.get('errors'):,}"
@@ -782,6 +885,7 @@ def download_all_10ks(
         cik = company["cik"]
         logger.debug(f"Unexpected error processing {ticker} ({cik}): {error}")
         stats.increment("errors")
+        manifest.record(cik, FAILED, error=str(error))
 
     # Process companies in parallel using utility
     # Redirect stdout at FD level to suppress datamule's print() spam
@@ -793,7 +897,7 @@ def download_all_10ks(
     os.close(devnull_fd)
     try:
         execute_parallel(
-            companies,
+            work,
             process_company,
             max_workers=workers,
             desc="Downloading 10-Ks",
@@ -812,6 +916,7 @@ def download_all_10ks(
         sys.stdout.flush()
         os.dup2(stdout_backup, stdout_fd)
         os.close(stdout_backup)
+        manifest.close()
 
     # Get final stats
     downloaded = stats.get("downloaded")
@@ -863,7 +968,7 @@ def download_all_10ks(
     }
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the 10-K download script."""
     parser = argparse.ArgumentParser(
         description="Download most recent 10-K filing for all companies from SEC EDGAR (or Neo4j)"
@@ -916,9 +1021,20 @@ def main():
     parser.add_argument(
         "--refresh-filter",
         action="store_true",
-        help="Force refresh the pre-filter cache (re-query Datamule index). Use when new 10-Ks may have been filed.",
+        help="Force refresh the pre-filter cache (re-query Datamule index) and recheck companies recorded without a 10-K. Use when new 10-Ks may have been filed.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=MAX_ATTEMPTS,
+        help=f"Give up on a failing company after this many attempts (default: {MAX_ATTEMPTS})",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Retry companies that failed in earlier runs (resets their attempt counts)",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set up logging first so all messages are properly logged
     logger = setup_logging("download_10k_filings", execute=args.execute)
@@ -955,6 +1071,8 @@ def main():
             force=args.force,
             pre_filter=args.pre_filter,
             refresh_filter=args.refresh_filter,
+            max_attempts=args.max_attempts,
+            retry_failed=args.retry_failed,
         )
 
         if args.execute:
@@ -164,7 +164,7 @@ def enrich_company_identifiers(
     }
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the company identifier enrichment."""
     parser = argparse.ArgumentParser(
         description="Enrich Company nodes with name and ticker from SEC EDGAR"
@@ -177,7 +177,7 @@ def main():
         help="Batch size for updates (default: 1000)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     log = setup_logging("enrich_company_identifiers", execute=args.execute)
 
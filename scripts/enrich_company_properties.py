@@ -14,29 +14,36 @@ Company Properties:
 - Metadata: data_source, data_updated_at
 
 Data Sources:
-- SEC EDGAR API: SIC/NAICS codes (public domain)
+- SEC EDGAR: SIC/NAICS codes (public domain), read offline from the bulk
+  submissions.zip when it is present (--download-sec-archive fetches it), else
+  from the submissions API one request per company
 - Yahoo Finance: Sector, industry, market cap, revenue, employees, HQ location
 - Wikidata: Supplemental data (optional, lower priority)
 
 Performance:
-- Uses parallel processing with ThreadPoolExecutor
-- SEC and Yahoo APIs have independent rate limits (10 req/sec each)
-- First run: ~15-20 minutes for 5000 companies
+- One asyncio event loop drives all fetches: SEC submissions go through a pooled
+  AsyncHttpClient (token bucket at the SEC's 10 req/sec, Retry-After honoured,
+  ETag/Last-Modified revalidation on reruns); yfinance calls run on a small thread
+  pool gated by a 10 req/sec Yahoo token bucket
+- A company's SEC and Yahoo fetches run at the same time
+- With the bulk archive, SEC fields need no network I/O at all
+- First run: ~10 minutes for 5000 companies (bounded by the rate limits)
 - Subsequent runs: seconds (all cached for 30 days)
 
 Usage:
     python scripts/enrich_company_properties.py          # Dry-run (plan only)
     python scripts/enrich_company_properties.py --execute  # Actually enrich data
-    python scripts/enrich_company_properties.py --execute --workers 20  # More parallelism
+    python scripts/enrich_company_properties.py --execute --workers 64  # More in flight
+    python scripts/enrich_company_properties.py --execute --download-sec-archive
 """
 
 import argparse
+import asyncio
 import sys
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-import requests
 from tqdm import tqdm
 
 from public_company_graph.cache import get_cache
@@ -47,33 +54,45 @@ from public_company_graph.cli import (
     verify_neo4j_connection,
 )
 from public_company_graph.company.enrichment import (
-    fetch_sec_company_info,
+    fetch_sec_company_info_async,
     fetch_wikidata_info,
     fetch_yahoo_finance_info,
     merge_company_data,
 )
-from public_company_graph.constants import BATCH_SIZE_SMALL, CACHE_TTL_COMPANY_PROPERTIES
+from public_company_graph.config import get_data_dir
+from public_company_graph.constants import (
+    BATCH_SIZE_SMALL,
+    CACHE_TTL_COMPANY_PROPERTIES,
+    YAHOO_FINANCE_RATE_LIMIT,
+)
 from public_company_graph.neo4j import clean_properties_batch, create_company_constraints
+from public_company_graph.sources.sec_submissions_archive import (
+    download_submissions_archive,
+    load_submissions_archive,
+)
+from public_company_graph.utils.async_http import AsyncHttpClient, map_concurrent
+from public_company_graph.utils.rate_limiting import get_token_bucket
 
-# Rate limiting for Yahoo Finance (be conservative)
-# 10 requests per second max
-from public_company_graph.utils.rate_limiting import get_rate_limiter
-
-_yahoo_rate_limiter = get_rate_limiter("yahoo_finance", requests_per_second=10.0)
-
-# Default number of parallel workers
-# With rate limits of 10 req/sec per API and ~200ms latency per call,
-# 20 workers keeps both APIs saturated at their rate limits
-DEFAULT_WORKERS = 20
+# Default number of companies in flight at once
+# At 10 req/sec per API and ~200-500ms latency, 32 in flight keeps both APIs at
+# their rate limits; the token buckets, not this number, bound the request rate
+DEFAULT_WORKERS = 32
 
+# yfinance is synchronous; this many threads cover 10 req/sec at ~500ms per call
+YAHOO_THREADS = 8
 
-def rate_limit_yahoo():
-    """Simple rate limiting for Yahoo Finance."""
-    _yahoo_rate_limiter()
+# SEC bulk submissions archive (used instead of the per-CIK API when present)
+SEC_SUBMISSIONS_ARCHIVE = get_data_dir() / "sec" / "submissions.zip"
 
 
-def enrich_company(
-    cik: str, ticker: str, name: str, session: requests.Session, cache
+async def enrich_company(
+    cik: str,
+    ticker: str,
+    name: str,
+    client: AsyncHttpClient,
+    cache,
+    yahoo_executor: ThreadPoolExecutor,
+    sec_table: dict[str, dict] | None = None,
 ) -> tuple[dict | None, bool]:
     """
     Enrich a single company with data from all sources.
@@ -87,8 +106,11 @@ def enrich_company(
         cik: Company CIK
         ticker: Stock ticker
         name: Company name
-        session: HTTP session for SEC API
+        client: Open AsyncHttpClient for the SEC API
         cache: Unified cache instance
+        yahoo_executor: Thread pool running the (blocking) yfinance calls
+        sec_table: SEC properties by CIK from the bulk archive; when given, SEC
+            data is looked up there instead of fetched
 
     Returns:
         Tuple of (enriched company data dictionary, was_cached).
@@ -100,10 +122,20 @@ def enrich_company(
     if cached:
         return cached, True
 
-    # Not in cache - fetch from sources
-    sec_data = fetch_sec_company_info(cik, session=session)
-    rate_limit_yahoo()
-    yahoo_data = fetch_yahoo_finance_info(ticker) if ticker else None
+    async def fetch_yahoo() -> dict | None:
+        if not ticker:
+            return None
+        await get_token_bucket("yahoo", YAHOO_FINANCE_RATE_LIMIT).acquire_async()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(yahoo_executor, fetch_yahoo_finance_info, ticker)
+
+    async def fetch_sec() -> dict | None:
+        if sec_table is not None:
+            return sec_table.get(cik.zfill(10))
+        return await fetch_sec_company_info_async(cik, client)
+
+    # Not in cache - fetch from sources (SEC and Yahoo concurrently)
+    sec_data, yahoo_data = await asyncio.gather(fetch_sec(), fetch_yahoo())
     wikidata_data = fetch_wikidata_info(ticker, name)  # Optional, may return None
 
     # Merge data from all sources
@@ -120,6 +152,96 @@ def enrich_company(
     return None, False
 
 
+async def _enrich_companies_async(
+    driver,
+    cache,
+    companies: list[dict],
+    batch_size: int,
+    database: str | None,
+    logger,
+    max_workers: int,
+    sec_table: dict[str, dict] | None = None,
+) -> dict:
+    """Fetch, cache and write all companies; returns the counters."""
+    counters = {"enriched": 0, "failed": 0, "cached": 0, "processed": 0}
+    results: list[dict] = []
+
+    async def process_company(company: dict) -> tuple[dict | None, bool]:
+        if not company.get("cik"):
+            return None, False
+        return await enrich_company(
+            company["cik"],
+            company.get("ticker", ""),
+            company.get("name", ""),
+            client,
+            cache,
+            yahoo_executor,
+            sec_table=sec_table,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=YAHOO_THREADS, thread_name_prefix="yfinance"
+    ) as yahoo_executor:
+        async with AsyncHttpClient(cache=cache, max_connections=max_workers) as client:
+            with tqdm(
+                total=len(companies),
+                desc="Enriching",
+                unit="company",
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]",
+            ) as pbar:
+                async for company, outcome in map_concurrent(
+                    process_company, companies, max_workers
+                ):
+                    counters["processed"] += 1
+                    pbar.update(1)
+                    if isinstance(outcome, BaseException):
+                        logger.warning(
+                            f"Error processing {company.get('ticker', 'unknown')}: {outcome}"
+                        )
+                        counters["failed"] += 1
+                        continue
+
+                    enriched_data, was_cached = outcome
+                    if enriched_data is None:
+                        counters["failed"] += 1
+                    else:
+                        counters["enriched"] += 1
+                        if was_cached:
+                            counters["cached"] += 1
+                        results.append({"cik": company["cik"], **enriched_data})
+
+                    # Update tqdm postfix with cache stats
+                    cache_pct = counters["cached"] / counters["processed"] * 100
+                    pbar.set_postfix(
+                        cached=f"{counters['cached']}",
+                        cache_pct=f"{cache_pct:.0f}%",
+                        failed=counters["failed"],
+                    )
+
+                    # Batch update to Neo4j when we have enough (off the event loop)
+                    if len(results) >= batch_size:
+                        batch_to_update, results = results, []
+                        await asyncio.to_thread(
+                            _update_companies_batch,
+                            driver,
+                            batch_to_update,
+                            database=database,
+                            logger=logger,
+                        )
+                        # Use tqdm.write to avoid interfering with progress bar
+                        tqdm.write(
+                            f"  Updated {len(batch_to_update)} companies in Neo4j... "
+                            f"({counters['processed']}/{len(companies)})"
+                        )
+
+    # Final batch update
+    if results:
+        _update_companies_batch(driver, results, database=database, logger=logger)
+        logger.info(f"  Updated final {len(results)} companies in Neo4j")
+
+    return counters
+
+
 def enrich_all_companies(
     driver,
     cache,
@@ -128,13 +250,13 @@ def enrich_all_companies(
     execute: bool = False,
     logger=None,
     max_workers: int = DEFAULT_WORKERS,
+    sec_archive: Path | None = None,
 ) -> int:
     """
     Enrich all Company nodes with properties from public data sources.
 
-    Uses parallel processing to maximize throughput while respecting rate limits.
-    SEC and Yahoo APIs have independent rate limits, so calling them in parallel
-    roughly doubles throughput compared to sequential processing.
+    Runs the fetches on one event loop: up to max_workers companies are in flight,
+    and per-API token buckets keep each source at (not above) its rate limit.
 
     Args:
         driver: Neo4j driver
@@ -143,7 +265,9 @@ def enrich_all_companies(
         database: Neo4j database name
         execute: If False, only print plan
         logger: Logger instance
-        max_workers: Number of parallel worker threads (default: 20)
+        max_workers: Companies fetched concurrently (default: 32)
+        sec_archive: Bulk submissions.zip to read SEC fields from (None uses the
+            SEC API)
 
     Returns:
         Number of companies enriched
@@ -175,142 +299,35 @@ def enrich_all_companies(
         logger.info("DRY RUN MODE")
         logger.info("=" * 80)
         logger.info(f"Would enrich {len(companies)} companies")
-        logger.info(f"Workers: {max_workers} (parallel threads)")
+        logger.info(f"Concurrency: {max_workers} companies in flight")
         logger.info("Sources: SEC EDGAR, Yahoo Finance, Wikidata")
+        logger.info(f"SEC fields from: {sec_archive or 'SEC submissions API'}")
         logger.info("=" * 80)
         return 0
 
-    # Thread-local storage for HTTP sessions (one per thread)
-    thread_local = threading.local()
-
-    def get_session():
-        """Get or create thread-local HTTP session."""
-        if not hasattr(thread_local, "session"):
-            session = requests.Session()
-            adapter = requests.adapters.HTTPAdapter(
-                pool_connections=10,
-                pool_maxsize=10,
-                max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3),
-            )
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            thread_local.session = session
-        return thread_local.session
-
-    # Thread-safe counters
-    counters_lock = threading.Lock()
-    counters = {"enriched": 0, "failed": 0, "cached": 0, "processed": 0}
-
-    # Thread-safe results collection
-    results_lock = threading.Lock()
-    results = []
-
-    def process_company(company: dict) -> tuple[str, dict | None, bool]:
-        """Process a single company (thread worker function)."""
-        cik = company.get("cik")
-        ticker = company.get("ticker", "")
-        name = company.get("name", "")
-
-        if not cik:
-            return cik, None, False
-
-        # Get thread-local HTTP session
-        http_session = get_session()
-
-        # Enrich company (rate limiters are thread-safe)
-        enriched_data, was_cached = enrich_company(cik, ticker, name, http_session, cache)
-
-        return cik, enriched_data, was_cached
-
     logger.info("=" * 80)
-    logger.info("Enriching Company Properties (Parallel)")
+    logger.info("Enriching Company Properties (async)")
     logger.info("=" * 80)
-    logger.info(f"  Workers: {max_workers} parallel threads")
-    logger.info("  Rate limits: SEC 10/sec, Yahoo 10/sec (independent)")
+    logger.info(f"  Concurrency: {max_workers} companies in flight")
+    logger.info(
+        f"  Rate limits: SEC 10/sec, Yahoo {YAHOO_FINANCE_RATE_LIMIT:.0f}/sec (independent)"
+    )
     logger.info(
         f"  Estimated time: ~{len(companies) // 10} seconds ({len(companies) // 600} minutes)"
     )
     logger.info("")
 
     start_time = time.time()
-
-    # Process companies in parallel with tqdm progress bar
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_company = {
-            executor.submit(process_company, company): company for company in companies
-        }
-
-        # Process results as they complete with tqdm progress bar
-        with tqdm(
-            total=len(companies),
-            desc="Enriching",
-            unit="company",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]",
-        ) as pbar:
-            for future in as_completed(future_to_company):
-                company = future_to_company[future]
-                try:
-                    cik, enriched_data, was_cached = future.result()
-
-                    with counters_lock:
-                        counters["processed"] += 1
-
-                        if enriched_data is None:
-                            counters["failed"] += 1
-                        else:
-                            counters["enriched"] += 1
-                            if was_cached:
-                                counters["cached"] += 1
-
-                        # Update tqdm postfix with cache stats
-                        cache_pct = (
-                            (counters["cached"] / counters["processed"] * 100)
-                            if counters["processed"] > 0
-                            else 0
-                        )
-                        pbar.set_postfix(
-                            cached=f"{counters['cached']}",
-                            cache_pct=f"{cache_pct:.0f}%",
-                            failed=counters["failed"],
-                        )
-
-                    # Collect result for Neo4j batch update
-                    if enriched_data:
-                        batch_to_update = None
-                        with results_lock:
-                            results.append({"cik": cik, **enriched_data})
-
-                            # Batch update to Neo4j when we have enough
-                            if len(results) >= batch_size:
-                                batch_to_update = results.copy()
-                                results.clear()
-
-                        # Update Neo4j outside the lock to avoid blocking other threads
-                        if batch_to_update:
-                            _update_companies_batch(
-                                driver, batch_to_update, database=database, logger=logger
-                            )
-                            # Use tqdm.write to avoid interfering with progress bar
-                            tqdm.write(
-                                f"  Updated {len(batch_to_update)} companies in Neo4j... "
-                                f"({counters['processed']}/{len(companies)})"
-                            )
-
-                    pbar.update(1)
-
-                except Exception as e:
-                    logger.warning(f"Error processing {company.get('ticker', 'unknown')}: {e}")
-                    with counters_lock:
-                        counters["processed"] += 1
-                        counters["failed"] += 1
-                    pbar.update(1)
-
-    # Final batch update
-    with results_lock:
-        if results:
-            _update_companies_batch(driver, results, database=database, logger=logger)
-            logger.info(f"  Updated final {len(results)} companies in Neo4j")
+    sec_table = None
+    if sec_archive is not None:
+        sec_table = load_submissions_archive(
+            sec_archive, ciks=[c["cik"] for c in companies if c.get("cik")]
+        )
+    counters = asyncio.run(
+        _enrich_companies_async(
+            driver, cache, companies, batch_size, database, logger, max_workers, sec_table
+        )
+    )
 
     elapsed = time.time() - start_time
     logger.info("=" * 80)
@@ -353,7 +370,7 @@ def _update_companies_batch(driver, batch: list[dict], database: str = None, log
         raise
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the company property enrichment script."""
     parser = argparse.ArgumentParser(
         description="Enrich Company nodes with properties from public data sources"
@@ -369,10 +386,24 @@ def main():
         "--workers",
         type=int,
         default=DEFAULT_WORKERS,
-        help=f"Number of parallel worker threads (default: {DEFAULT_WORKERS})",
+        help=f"Companies fetched concurrently (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--sec-archive",
+        type=Path,
+        default=SEC_SUBMISSIONS_ARCHIVE,
+        help=(
+            "SEC bulk submissions.zip to read SIC/NAICS from; the per-CIK API is used "
+            f"if it does not exist (default: {SEC_SUBMISSIONS_ARCHIVE})"
+        ),
+    )
+    parser.add_argument(
+        "--download-sec-archive",
+        action="store_true",
+        help="Download (or refresh) the SEC bulk submissions archive first",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("enrich_company_properties", execute=args.execute)
     cache = get_cache()
@@ -385,6 +416,13 @@ def main():
     for ns, ns_count in sorted(cache_stats["by_namespace"].items(), key=lambda x: -x[1]):
         logger.info(f"    {ns}: {ns_count:,}")
 
+    sec_archive = args.sec_archive if args.sec_archive.exists() else None
+    if sec_archive is None and not args.download_sec_archive:
+        logger.info(
+            f"No SEC submissions archive at {args.sec_archive}; using the SEC API "
+            "(pass --download-sec-archive to fetch it)"
+        )
+
     if not args.execute:
         # Dry-run: show plan
         driver, database = get_driver_and_database(logger)
@@ -397,6 +435,7 @@ def main():
                 execute=False,
                 logger=logger,
                 max_workers=args.workers,
+                sec_archive=sec_archive,
             )
         finally:
             driver.close()
@@ -418,6 +457,11 @@ def main():
         logger.info("1. Creating/verifying constraints...")
         create_company_constraints(driver, database=database, logger=logger)
 
+        if args.download_sec_archive:
+            logger.info("")
+            logger.info("Downloading SEC bulk submissions archive...")
+            sec_archive = download_submissions_archive(args.sec_archive, force=True)
+
         # Enrich companies
         logger.info("")
         logger.info("2. Enriching company properties...")
@@ -429,6 +473,7 @@ def main():
             execute=True,
             logger=logger,
             max_workers=args.workers,
+            sec_archive=sec_archive,
         )
 
         logger.info("")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Export the bootstrap graph as neo4j-admin bulk import files.
+
+For cold rebuilds: instead of loading Domain, Technology, USES, Company, HAS_DOMAIN
+(and optionally the GraphRAG Document/Chunk layer) through transactional Cypher, this
+writes header-plus-CSV files straight from the SQLite source and the 10-K cache, plus
+import.sh (the `neo4j-admin database import full` command) and constraints.cypher.
+
+Rebuild steps:
+    1. python scripts/export_admin_import.py --execute
+    2. Stop Neo4j, run data/admin_import/import.sh, start Neo4j
+    3. python scripts/export_admin_import.py --apply-constraints
+       (also resets the Domain/Company dirty sets, so later stages recompute in full)
+    4. Continue with the remaining pipelines (embeddings, similarity, GDS)
+
+Usage:
+    python scripts/export_admin_import.py                      # Dry-run (plan only)
+    python scripts/export_admin_import.py --execute            # Write import files
+    python scripts/export_admin_import.py --execute --with-documents
+    python scripts/export_admin_import.py --apply-constraints  # After the import
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from public_company_graph.cache import get_cache
+from public_company_graph.cli import (
+    add_execute_argument,
+    get_driver_and_database,
+    setup_logging,
+    verify_neo4j_connection,
+)
+from public_company_graph.config import get_data_dir, get_domain_status_db
+from public_company_graph.dirty import DirtySet
+from public_company_graph.ingest import (
+    export_admin_import,
+    get_domain_count,
+    get_uses_relationship_count,
+    read_companies,
+)
+from public_company_graph.neo4j import (
+    create_bootstrap_constraints,
+    create_company_constraints,
+    create_document_constraints,
+)
+
+
+def iter_filing_chunks(companies: list[dict], logger: logging.Logger):
+    """Extract and chunk the full 10-K text of each company with a local filing."""
+    from public_company_graph.graphrag import (
+        chunk_filing_sections,
+        extract_full_text_with_datamule,
+        find_10k_file_for_company,
+    )
+
+    filings_dir = get_data_dir() / "10k_filings"
+    missing = 0
+    for company in companies:
+        file_path = find_10k_file_for_company(company["cik"], filings_dir)
+        full_text = (
+            extract_full_text_with_datamule(file_path, company["cik"], base_dir=filings_dir)
+            if file_path
+            else None
+        )
+        if not full_text:
+            missing += 1
+            continue
+        yield from chunk_filing_sections(
+            sections={"full_filing": full_text},
+            company_cik=company["cik"],
+            company_ticker=company.get("ticker"),
+            company_name=company.get("name"),
+            filing_year=company.get("filing_year"),
+        )
+    if missing:
+        logger.warning(f"No filing text for {missing} companies (skipped)")
+
+
+def main():
+    """Run the neo4j-admin import export."""
+    parser = argparse.ArgumentParser(description="Export neo4j-admin bulk import files")
+    add_execute_argument(parser)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=get_data_dir() / "admin_import",
+        help="Directory for the import files (default: data/admin_import)",
+    )
+    parser.add_argument(
+        "--database",
+        default="neo4j",
+        help="Database name used in import.sh (default: neo4j)",
+    )
+    parser.add_argument(
+        "--with-documents",
+        action="store_true",
+        help="Also export Document/Chunk nodes from local 10-K filings (slow)",
+    )
+    parser.add_argument(
+        "--apply-constraints",
+        action="store_true",
+        help="Create constraints and indexes on the running, imported database "
+        "and reset the dirty sets",
+    )
+    args = parser.parse_args()
+
+    logger = setup_logging("export_admin_import", execute=args.execute)
+
+    if args.apply_constraints:
+        driver, database = get_driver_and_database(logger)
+        try:
+            if not verify_neo4j_connection(driver, database, logger):
+                sys.exit(1)
+            create_bootstrap_constraints(driver, database=database, logger=logger)
+            create_company_constraints(driver, database=database, logger=logger)
+            create_document_constraints(driver, database=database, logger=logger)
+        finally:
+            driver.close()
+        # Every node was replaced: downstream stages recompute in full next run
+        cache = get_cache()
+        DirtySet(cache, "Domain").reset()
+        DirtySet(cache, "Company").reset()
+        logger.info("✓ Reset Domain and Company dirty sets")
+        return
+
+    db_path = get_domain_status_db()
+    if not db_path.exists():
+        logger.error(f"Database not found at {db_path}")
+        sys.exit(1)
+    companies = read_companies(get_cache())
+
+    if not args.execute:
+        logger.info("=" * 70)
+        logger.info("NEO4J-ADMIN IMPORT EXPORT (Dry Run)")
+        logger.info("=" * 70)
+        logger.info(f"Would write import files to {args.output_dir}:")
+        logger.info(f"  - Domain nodes: {get_domain_count(db_path):,}")
+        logger.info(f"  - USES relationships: up to {get_uses_relationship_count(db_path):,}")
+        logger.info(f"  - Company nodes: {len(companies):,}")
+        logger.info(f"  - Document/Chunk layer: {'yes' if args.with_documents else 'no'}")
+        logger.info("")
+        logger.info("To execute, run: python scripts/export_admin_import.py --execute")
+        return
+
+    logger.info("=" * 70)
+    logger.info("Exporting neo4j-admin Import Files")
+    logger.info("=" * 70)
+    export = export_admin_import(
+        args.output_dir,
+        db_path,
+        companies=companies,
+        chunks=iter_filing_chunks(companies, logger) if args.with_documents else None,
+        database=args.database,
+    )
+    logger.info("")
+    logger.info(f"✓ Wrote {len(export.files)} files to {args.output_dir}")
+    logger.info("Next steps:")
+    logger.info(f"  1. Stop Neo4j and run {args.output_dir / 'import.sh'}")
+    logger.info(
+        "  2. Start Neo4j and run: python scripts/export_admin_import.py --apply-constraints"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,7 @@ from public_company_graph.parsing.business_relationship_extraction import (
     extract_all_relationships,
 )
 from public_company_graph.parsing.llm_verification import (
+    DEFAULT_PACK_SIZE,
     LLMRelationshipVerifier,
     VerificationResult,
     estimate_verification_cost,
@@ -72,6 +73,7 @@ from public_company_graph.parsing.relationship_config import (
     ConfidenceTier,
     get_confidence_tier,
 )
+from public_company_graph.pipeline import shared_resource
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +103,7 @@ def extract_with_verification(
     verify_supplier_customer: bool = True,
     embedding_threshold: float = 0.30,
     max_concurrent: int = 20,
+    pack_size: int = DEFAULT_PACK_SIZE,
 ) -> dict[str, list[dict[str, Any]]]:
     """
     Extract relationships with PARALLEL LLM verification for SUPPLIER/CUSTOMER.
@@ -119,6 +122,7 @@ def extract_with_verification(
         verify_supplier_customer: If True, use LLM to verify SUPPLIER/CUSTOMER
         embedding_threshold: Threshold for embedding-based filtering
         max_concurrent: Max concurrent LLM verification calls (default: 20)
+        pack_size: Relationships verified per LLM call
 
     Returns:
         Dict mapping neo4j_type → list of verified relationships
@@ -269,10 +273,20 @@ def extract_with_verification(
         # Run parallel verification
         verification_start = time.time()
         verification_results = verifier.verify_batch_parallel(
-            verification_batch, max_concurrent=max_concurrent
+            verification_batch, max_concurrent=max_concurrent, pack_size=pack_size
         )
         verification_time = time.time() - verification_start
         logger.info(f"Verification time: {verification_time:.1f}s")
+        call_stats = verifier.call_stats()
+        if call_stats["calls"]:
+            logger.info(
+                f"LLM calls: {call_stats['calls']} "
+                f"({call_stats['rate_limited_calls']} rate-limited), "
+                f"mean latency {call_stats['mean_latency_seconds']:.2f}s, "
+                f"p95 {call_stats['p95_latency_seconds']:.2f}s, "
+                f"{call_stats['prompt_tokens'] + call_stats['completion_tokens']:,} tokens, "
+                f"${call_stats['cost_usd']:.4f}"
+            )
 
         # Process results
         for candidate, verification in zip(all_candidates, verification_results, strict=True):
@@ -389,7 +403,7 @@ def load_verified_relationships(
     return counts
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run extraction with LLM verification."""
     parser = argparse.ArgumentParser(
         description="Extract business relationships with LLM verification"
@@ -424,6 +438,12 @@ def main():
         default=20,
         help="Max concurrent LLM verification calls (default: 20)",
     )
+    parser.add_argument(
+        "--pack-size",
+        type=int,
+        default=DEFAULT_PACK_SIZE,
+        help=f"Relationships verified per LLM call (default: {DEFAULT_PACK_SIZE})",
+    )
     parser.add_argument(
         "--estimate-cost",
         action="store_true",
@@ -435,7 +455,7 @@ def main():
         help="Clear existing business relationships before extraction (for reproducibility)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     log = setup_logging("extract_llm_verified", execute=args.execute)
 
@@ -532,9 +552,13 @@ def main():
         log.info("Extracting with LLM Verification")
         log.info("=" * 60)
 
-        # Build lookup
+        # Build lookup (reused if an earlier stage of this pipeline run built it)
         log.info("Building company lookup...")
-        lookup = build_company_lookup(driver, database=database)
+        lookup = shared_resource(
+            "company_lookup",
+            lambda: build_company_lookup(driver, database=database),
+            depends_on=("Company", "Company.identifiers"),
+        )
 
         # Extract with verification
         log.info("Extracting and verifying relationships...")
@@ -548,6 +572,7 @@ def main():
             verify_supplier_customer=not args.skip_llm_verification,
             embedding_threshold=args.embedding_threshold,
             max_concurrent=args.concurrency,
+            pack_size=args.pack_size,
         )
 
         # Load into Neo4j
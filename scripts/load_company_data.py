@@ -11,6 +11,9 @@ Schema additions:
 - Relationships: (Company)-[:HAS_DOMAIN]->(Domain)
 - Properties: Company.description, Company.risk_factors
 
+Companies that are new or whose description changed are marked in the Company
+DirtySet, so the embedding and similarity stages can recompute just those.
+
 Dependencies:
 - Requires: Cache populated by parse_10k_filings.py (namespace: 10k_extracted)
 
@@ -29,13 +32,40 @@ from public_company_graph.cli import (
     setup_logging,
     verify_neo4j_connection,
 )
-from public_company_graph.neo4j import clean_properties_batch, create_company_constraints
+from public_company_graph.constants import BULK_WRITE_WORKERS
+from public_company_graph.dirty import DirtySet
+from public_company_graph.ingest.cache_readers import read_companies
+from public_company_graph.neo4j import (
+    BulkLoader,
+    clean_properties_batch,
+    create_company_constraints,
+)
+from public_company_graph.utils.hashing import compute_text_hash
+
+
+def changed_descriptions(driver, companies: list[dict], database: str = None) -> set[str]:
+    """
+    CIKs of companies that are new or whose description differs from the graph.
+
+    Compares Company.description_hash, so descriptions are not read back from Neo4j.
+    Sets description_hash on each company dict.
+    """
+    with driver.session(database=database) as session:
+        result = session.run("MATCH (c:Company) RETURN c.cik AS cik, c.description_hash AS hash")
+        stored = {record["cik"]: record["hash"] for record in result}
+    changed = set()
+    for company in companies:
+        company["description_hash"] = compute_text_hash(company.get("description") or "") or None
+        if company["cik"] not in stored or stored[company["cik"]] != company["description_hash"]:
+            changed.add(company["cik"])
+    return changed
 
 
 def load_companies(
     driver,
     cache,
     batch_size: int = 1000,
+    workers: int = 1,
     database: str = None,
     execute: bool = False,
     logger: logging.Logger = None,
@@ -47,6 +77,7 @@ def load_companies(
         driver: Neo4j driver
         cache: AppCache instance
         batch_size: Batch size for loading
+        workers: Concurrent write transactions
         database: Neo4j database name
         execute: If False, only print plan
         logger: Logger instance
@@ -55,62 +86,12 @@ def load_companies(
         logger = logging.getLogger(__name__)
 
     # 10-K first approach: Only use 10k_extracted cache
-    company_keys = cache.keys(namespace="10k_extracted", limit=20000) or []
+    companies_to_load = read_companies(cache)
 
-    if not company_keys:
+    if not companies_to_load:
         logger.error("No companies found in cache. Run parse_10k_filings.py first.")
         return []
 
-    logger.info(f"Loading {len(company_keys)} companies from 10-K filings")
-
-    # Load companies from 10-K cache
-    companies_to_load = []
-    for cik in company_keys:
-        ten_k_data = cache.get("10k_extracted", cik)
-        if not ten_k_data:
-            continue
-
-        # Get website from 10-K
-        domain = ten_k_data.get("website")
-        if domain:
-            domain = domain.lower().replace("www.", "").strip()
-
-        # Extract filing metadata
-        filing_date = ten_k_data.get("filing_date")
-        accession_number = ten_k_data.get("accession_number")
-        fiscal_year_end = ten_k_data.get("fiscal_year_end")
-        filing_year = ten_k_data.get("filing_year")
-
-        # Fallback: Get from filing_metadata dict if present
-        if not filing_date and ten_k_data.get("filing_metadata"):
-            metadata = ten_k_data["filing_metadata"]
-            filing_date = metadata.get("filing_date")
-            accession_number = metadata.get("accession_number") or accession_number
-            fiscal_year_end = metadata.get("fiscal_year_end") or fiscal_year_end
-            filing_year = metadata.get("filing_year") or filing_year
-
-        # Build company dict, using None for empty values (will be cleaned later)
-        ticker_val = ten_k_data.get("ticker", "").upper().strip()
-        name_val = ten_k_data.get("name", "").strip()
-        desc_val = ten_k_data.get("business_description", "").strip()
-        risk_val = ten_k_data.get("risk_factors", "").strip()
-
-        companies_to_load.append(
-            {
-                "cik": str(cik),
-                "ticker": ticker_val or None,
-                "name": name_val or None,
-                "description": desc_val or None,
-                "description_source": "10k" if desc_val else None,
-                "risk_factors": risk_val or None,
-                "domain": domain or None,
-                "filing_date": filing_date or None,
-                "accession_number": accession_number or None,
-                "fiscal_year_end": fiscal_year_end or None,
-                "filing_year": filing_year or None,
-            }
-        )
-
     logger.info(f"Found {len(companies_to_load)} companies with data")
 
     if not execute:
@@ -119,48 +100,50 @@ def load_companies(
         logger.info(f"  {companies_with_domains} companies would have domains")
         return []
 
-    # Load Company nodes in batches
-    with driver.session(database=database) as session:
-        total_loaded = 0
-        for i in range(0, len(companies_to_load), batch_size):
-            batch = companies_to_load[i : i + batch_size]
-
-            # Clean empty strings and None values - Neo4j doesn't store nulls
-            cleaned_batch = clean_properties_batch(batch)
-
-            # Use CASE WHEN for date conversions (date() function) and computed fields
-            # Properties in the cleaned batch will have empty strings/nulls removed
-            query = """
-            UNWIND $batch AS company
-            MERGE (c:Company {cik: company.cik})
-            SET c.ticker = company.ticker,
-                c.name = company.name,
-                c.description = company.description,
-                c.description_source = company.description_source,
-                c.risk_factors = company.risk_factors,
-                c.loaded_at = datetime(),
-                // Set filing metadata if available (using date() function for DATE type)
-                c.filing_date = CASE WHEN company.filing_date IS NOT NULL THEN date(company.filing_date) ELSE c.filing_date END,
-                c.filing_year = CASE WHEN company.filing_year IS NOT NULL THEN company.filing_year ELSE c.filing_year END,
-                c.accession_number = CASE WHEN company.accession_number IS NOT NULL THEN company.accession_number ELSE c.accession_number END,
-                c.fiscal_year_end = CASE WHEN company.fiscal_year_end IS NOT NULL THEN date(company.fiscal_year_end) ELSE c.fiscal_year_end END,
-                // Construct SEC EDGAR URL for auditability (strip leading zeros from CIK)
-                c.sec_filing_url = CASE
-                    WHEN company.accession_number IS NOT NULL
-                    THEN 'https://www.sec.gov/Archives/edgar/data/' +
-                         toString(toInteger(company.cik)) + '/' +
-                         replace(company.accession_number, '-', '') + '/'
-                    ELSE c.sec_filing_url
-                END
-            REMOVE c.business_description_10k
-            """
-
-            session.run(query, batch=cleaned_batch)
-            total_loaded += len(batch)
-            logger.info(f"  Loaded {total_loaded}/{len(companies_to_load)} Company nodes...")
-
-        logger.info(f"✓ Loaded {total_loaded} Company nodes")
+    changed = changed_descriptions(driver, companies_to_load, database=database)
+    logger.info(f"{len(changed)} companies are new or have a changed description")
 
+    # Load Company nodes; shards are disjoint by CIK, so writers never contend.
+    # Clean empty strings and None values - Neo4j doesn't store nulls
+    # Use CASE WHEN for date conversions (date() function) and computed fields
+    loader = BulkLoader(
+        driver, database=database, workers=workers, batch_size=batch_size, logger=logger
+    )
+    stats = loader.load(
+        """
+        UNWIND $batch AS company
+        MERGE (c:Company {cik: company.cik})
+        SET c.ticker = company.ticker,
+            c.name = company.name,
+            c.description = company.description,
+            c.description_source = company.description_source,
+            c.description_hash = company.description_hash,
+            c.risk_factors = company.risk_factors,
+            c.loaded_at = datetime(),
+            // Set filing metadata if available (using date() function for DATE type)
+            c.filing_date = CASE WHEN company.filing_date IS NOT NULL THEN date(company.filing_date) ELSE c.filing_date END,
+            c.filing_year = CASE WHEN company.filing_year IS NOT NULL THEN company.filing_year ELSE c.filing_year END,
+            c.accession_number = CASE WHEN company.accession_number IS NOT NULL THEN company.accession_number ELSE c.accession_number END,
+            c.fiscal_year_end = CASE WHEN company.fiscal_year_end IS NOT NULL THEN date(company.fiscal_year_end) ELSE c.fiscal_year_end END,
+            // Construct SEC EDGAR URL for auditability (strip leading zeros from CIK)
+            c.sec_filing_url = CASE
+                WHEN company.accession_number IS NOT NULL
+                THEN 'https://www.sec.gov/Archives/edgar/data/' +
+                     toString(toInteger(company.cik)) + '/' +
+                     replace(company.accession_number, '-', '') + '/'
+                ELSE c.sec_filing_url
+            END
+        REMOVE c.business_description_10k
+        """,
+        clean_properties_batch(companies_to_load),
+        key="cik",
+        description="Company nodes",
+        total=len(companies_to_load),
+    )
+    logger.info(f"✓ Loaded {stats.rows} Company nodes")
+
+    # Downstream stages (embeddings, similarity) recompute just these companies
+    DirtySet(cache, "Company").mark(changed)
     return companies_to_load
 
 
@@ -168,6 +151,7 @@ def create_has_domain_relationships(
     driver,
     companies_data: list[dict],
     batch_size: int = 1000,
+    workers: int = 1,
     database: str = None,
     execute: bool = False,
     logger: logging.Logger = None,
@@ -179,6 +163,7 @@ def create_has_domain_relationships(
         driver: Neo4j driver
         companies_data: List of company dictionaries with cik and domain
         batch_size: Batch size for loading
+        workers: Concurrent write transactions
         database: Neo4j database name
         execute: If False, only print plan
         logger: Logger instance
@@ -195,30 +180,24 @@ def create_has_domain_relationships(
         logger.info(f"DRY RUN: Would create {len(companies_with_domains)} HAS_DOMAIN relationships")
         return
 
-    # Create relationships in batches
-    with driver.session(database=database) as session:
-        total_created = 0
-        for i in range(0, len(companies_with_domains), batch_size):
-            batch = companies_with_domains[i : i + batch_size]
-
-            query = """
-            UNWIND $batch AS company
-            MATCH (c:Company {cik: company.cik})
-            MATCH (d:Domain {final_domain: company.domain})
-            MERGE (c)-[r:HAS_DOMAIN]->(d)
-            SET r.loaded_at = datetime()
-            """
-
-            result = session.run(query, batch=batch)
-            # Consume result to execute query
-            result.consume()
-            total_created += len(batch)
-            logger.info(
-                f"  Created {total_created}/{len(companies_with_domains)} "
-                f"HAS_DOMAIN relationships..."
-            )
-
-        logger.info(f"✓ Created {total_created} HAS_DOMAIN relationships")
+    # Create relationships, sharded by company
+    loader = BulkLoader(
+        driver, database=database, workers=workers, batch_size=batch_size, logger=logger
+    )
+    stats = loader.load(
+        """
+        UNWIND $batch AS company
+        MATCH (c:Company {cik: company.cik})
+        MATCH (d:Domain {final_domain: company.domain})
+        MERGE (c)-[r:HAS_DOMAIN]->(d)
+        SET r.loaded_at = datetime()
+        """,
+        companies_with_domains,
+        key="cik",
+        description="HAS_DOMAIN relationships",
+        total=len(companies_with_domains),
+    )
+    logger.info(f"✓ Created {stats.rows} HAS_DOMAIN relationships")
 
 
 def dry_run_plan(cache, logger: logging.Logger = None):
@@ -283,7 +262,7 @@ def dry_run_plan(cache, logger: logging.Logger = None):
     logger.info("=" * 80)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the company data loading script."""
     parser = argparse.ArgumentParser(description="Load Company nodes and relationships into Neo4j")
     parser.add_argument(
@@ -295,8 +274,14 @@ def main():
         default=1000,
         help="Batch size for loading (default: 1000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BULK_WRITE_WORKERS,
+        help=f"Concurrent Neo4j write transactions (default: {BULK_WRITE_WORKERS})",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger = setup_logging("load_company_data", execute=args.execute)
     cache = get_cache()
@@ -336,6 +321,7 @@ def main():
             driver,
             cache,
             batch_size=args.batch_size,
+            workers=args.workers,
             database=database,
             execute=True,
             logger=logger,
@@ -349,6 +335,7 @@ def main():
                 driver,
                 companies_data,
                 batch_size=args.batch_size,
+                workers=args.workers,
                 database=database,
                 execute=True,
                 logger=logger,
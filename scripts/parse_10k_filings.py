@@ -329,7 +329,7 @@ def parse_all_10ks(
     }
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the 10-K parsing script."""
     parser = argparse.ArgumentParser(description="Parse downloaded 10-K filings")
     add_execute_argument(parser)
@@ -359,7 +359,7 @@ def main():
         action="store_true",
         help="Incremental mode: Merge additional fields into existing cache entries (don't overwrite)",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set up logging (logger is used globally in this module)
     global logger
@@ -1,31 +1,60 @@
 #!/usr/bin/env python3
 """
-Orchestration script to run all data pipelines in the correct order.
+Orchestration script to run all data pipelines in dependency order.
 
-This script recreates the graph from scratch in the correct order:
+This script recreates the graph from scratch:
 1. Bootstrap Graph: Load Domain and Technology nodes from SQLite
-2. Load Company Data: Collect domains, create embeddings, load Company nodes
-3. Compute GDS Features: Technology adoption, affinity, and company similarity
+2. Load Company Data: Parse 10-Ks, load and enrich Company nodes, extract relationships
+3. Embeddings & Similarity: Domain/Company embeddings and similarity edges
+4. Compute GDS Features: Technology adoption, affinity, and company similarity
 
-All steps run in sequence to ensure the graph is complete and correct.
+Each stage declares the artifacts it reads and writes (see build_stages), and runs
+in this process once the stages producing its inputs are done; independent stages
+(e.g. Domain embeddings and Company enrichment) run concurrently, except that stages
+writing the same node label take turns. All stages share one Neo4j driver pool,
+cache handle and log (public_company_graph.pipeline).
+
+Completed stages are checkpointed in data/pipeline_checkpoint.json; after a failure,
+--resume continues at the failed stage. A fully successful run clears the checkpoint.
 
 Usage:
     python scripts/run_all_pipelines.py          # Dry-run (plan only)
     python scripts/run_all_pipelines.py --execute  # Actually run all pipelines
+    python scripts/run_all_pipelines.py --execute --resume  # Continue a failed run
+    python scripts/run_all_pipelines.py --execute --incremental  # Recompute changed nodes only
+
+With --incremental, the bootstrap loads only changed domains and the similarity stages
+recompute only the Domain/Company keys marked dirty by earlier stages (see
+public_company_graph.dirty). Embedding stages always re-embed just the dirty nodes.
 """
 
 import argparse
-import subprocess
 import sys
 import time
 from pathlib import Path
 
-from public_company_graph.cli import setup_logging
+from public_company_graph.cache import get_cache
+from public_company_graph.cli import (
+    get_driver_and_database,
+    setup_logging,
+    verify_neo4j_connection,
+)
+from public_company_graph.config import get_data_dir
+from public_company_graph.pipeline import (
+    PipelineCheckpoint,
+    PipelineContext,
+    PipelineRunner,
+    Stage,
+    execution_waves,
+    run_script,
+    stage_dependencies,
+)
 
 # Script paths
 SCRIPT_DIR = Path(__file__).parent
 BOOTSTRAP_SCRIPT = SCRIPT_DIR / "bootstrap_graph.py"
 COMPUTE_GDS_SCRIPT = SCRIPT_DIR / "compute_gds_features.py"
+BUILD_COMPOSITE_INDEX_SCRIPT = SCRIPT_DIR / "build_composite_similarity_index.py"
 DOWNLOAD_10K_SCRIPT = SCRIPT_DIR / "download_10k_filings.py"
 PARSE_10K_SCRIPT = SCRIPT_DIR / "parse_10k_filings.py"
 # Note: collect_domains.py is not used in 10-K first pipeline (website comes from 10-K)
@@ -45,57 +74,182 @@ CLEANUP_EDGES_SCRIPT = SCRIPT_DIR / "cleanup_edges_systemic.py"
 CREATE_RISK_SIMILARITY_SCRIPT = SCRIPT_DIR / "create_risk_similarity_graph.py"
 
 
-def run_script(
-    script_path: Path,
-    execute: bool = False,
-    description: str = "",
-    extra_args: list = None,
-    logger=None,
-):
-    """Run a script and return success status."""
-    if logger is None:
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-    if not script_path.exists():
-        logger.error(f"Script not found: {script_path}")
-        return False
-
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info(f"{description}")
-    logger.info("=" * 70)
-    logger.info(f"Running: {script_path.name}")
-
-    cmd = [sys.executable, str(script_path)]
-    if execute:
-        cmd.append("--execute")
-    if extra_args:
-        cmd.extend(extra_args)
-
-    start_time = time.time()
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=False)
-        elapsed = time.time() - start_time
-        if result.returncode == 0:
-            logger.info(f"✓ {script_path.name} completed successfully ({elapsed:.1f}s)")
-            return True
-        else:
-            logger.error(f"✗ {script_path.name} failed with return code {result.returncode}")
-            return False
-    except subprocess.CalledProcessError as e:
-        elapsed = time.time() - start_time
-        logger.error(f"✗ {script_path.name} failed after {elapsed:.1f}s: {e}")
-        return False
-    except KeyboardInterrupt:
-        logger.warning("Interrupted by user")
-        return False
-
-
-def main():
+CHECKPOINT_FILE = get_data_dir() / "pipeline_checkpoint.json"
+
+# Stage locks: concurrent writers to the same nodes (properties or relationships)
+# deadlock, so stages writing Company or Domain nodes take these and run one at a time
+COMPANY_WRITES = ("Company",)
+DOMAIN_WRITES = ("Domain",)
+
+
+def build_stages(run_10k_stages: bool = True, incremental: bool = False) -> list[Stage]:
+    """
+    Declare the pipeline stages and the artifacts each one reads and writes.
+
+    Args:
+        run_10k_stages: Download and parse 10-Ks (False reuses the cached ones)
+        incremental: Pass --incremental to the stages that support it
+
+    Returns:
+        Stages in declaration order (also the order ties are started in)
+    """
+    incremental_args = ["--incremental"] if incremental else []
+    return [
+        Stage(
+            "bootstrap_graph",
+            run_script(BOOTSTRAP_SCRIPT, ["--execute", *incremental_args]),
+            inputs=("domain_status.db",),
+            outputs=("Domain", "Technology", "USES"),
+            description="Load Domain and Technology nodes from SQLite",
+            locks=DOMAIN_WRITES,
+        ),
+        # Everything company-related cascades from the 10-Ks: websites → domains,
+        # business descriptions → embeddings, competitor mentions → relationships
+        Stage(
+            "download_10k_filings",
+            run_script(DOWNLOAD_10K_SCRIPT, ["--execute"]),
+            outputs=("10k_filings",),
+            description="Download most recent 10-K per company",
+            enabled=run_10k_stages,
+        ),
+        Stage(
+            "parse_10k_filings",
+            run_script(PARSE_10K_SCRIPT, ["--execute"]),
+            inputs=("10k_filings",),
+            outputs=("10k_extracted",),
+            description="Parse 10-K filings (extract websites, descriptions)",
+            enabled=run_10k_stages,
+        ),
+        Stage(
+            "load_company_data",
+            run_script(LOAD_COMPANY_DATA_SCRIPT, ["--execute"]),
+            inputs=("10k_extracted", "Domain"),
+            outputs=("Company", "HAS_DOMAIN"),
+            description="Load Company nodes and HAS_DOMAIN relationships",
+            locks=COMPANY_WRITES + DOMAIN_WRITES,
+        ),
+        # Extraction's lookup table needs name/ticker from SEC EDGAR
+        Stage(
+            "enrich_company_identifiers",
+            run_script(ENRICH_COMPANY_IDENTIFIERS_SCRIPT, ["--execute"]),
+            inputs=("Company",),
+            outputs=("Company.identifiers",),
+            description="Enrich Company identifiers (name/ticker from SEC EDGAR)",
+            locks=COMPANY_WRITES,
+        ),
+        Stage(
+            "enrich_company_properties",
+            run_script(ENRICH_COMPANY_PROPERTIES_SCRIPT, ["--execute"]),
+            inputs=("Company.identifiers",),
+            outputs=("Company.properties",),
+            description="Enrich Company properties (industry, size, etc.)",
+            locks=COMPANY_WRITES,
+        ),
+        Stage(
+            "compute_company_similarity",
+            run_script(COMPUTE_COMPANY_SIMILARITY_SCRIPT, ["--execute"]),
+            inputs=("Company.properties",),
+            outputs=("SIMILAR_INDUSTRY", "SIMILAR_SIZE"),
+            description="Create SIMILAR_INDUSTRY and SIMILAR_SIZE relationships",
+            locks=COMPANY_WRITES,
+        ),
+        # CRITICAL: Company embeddings must exist BEFORE extraction, which validates
+        # candidates by embedding similarity (missing embeddings default to 1.0)
+        Stage(
+            "create_company_embeddings",
+            run_script(CREATE_COMPANY_EMBEDDINGS_SCRIPT, ["--execute"]),
+            inputs=("Company",),
+            outputs=("Company.description_embedding",),
+            description="Create Company description embeddings",
+            locks=COMPANY_WRITES,
+        ),
+        # Extract HAS_COMPETITOR/HAS_CUSTOMER/HAS_SUPPLIER/HAS_PARTNER with embedding
+        # similarity + LLM verification; requires identifiers and embeddings
+        Stage(
+            "extract_business_relationships",
+            run_script(EXTRACT_BUSINESS_RELATIONSHIPS_SCRIPT, ["--execute", "--clean"]),
+            inputs=("10k_extracted", "Company.identifiers", "Company.description_embedding"),
+            outputs=("business_relationships",),
+            description="Extract business relationships from 10-K filings",
+            locks=COMPANY_WRITES,
+        ),
+        # Tiered confidence: medium-confidence edges become candidates, low are deleted
+        Stage(
+            "cleanup_edges",
+            run_script(CLEANUP_EDGES_SCRIPT, ["--execute"]),
+            inputs=("business_relationships",),
+            outputs=("business_relationships.cleaned",),
+            description="Cleanup edge quality (tiered confidence system)",
+            locks=COMPANY_WRITES,
+        ),
+        Stage(
+            "create_risk_similarity",
+            run_script(CREATE_RISK_SIMILARITY_SCRIPT, ["--execute"]),
+            inputs=("10k_extracted", "Company"),
+            outputs=("SIMILAR_RISK",),
+            description="Create risk factor embeddings and SIMILAR_RISK relationships",
+            locks=COMPANY_WRITES,
+        ),
+        Stage(
+            "create_domain_embeddings",
+            run_script(CREATE_DOMAIN_EMBEDDINGS_SCRIPT, ["--execute"]),
+            inputs=("Domain",),
+            outputs=("Domain.description_embedding",),
+            description="Create Domain description embeddings",
+            locks=DOMAIN_WRITES,
+        ),
+        Stage(
+            "compute_domain_similarity",
+            run_script(COMPUTE_DOMAIN_SIMILARITY_SCRIPT, ["--execute"]),
+            inputs=("Domain.description_embedding",),
+            outputs=("Domain.SIMILAR_DESCRIPTION",),
+            description="Compute Domain-Domain description similarity",
+            locks=DOMAIN_WRITES,
+        ),
+        Stage(
+            "compute_keyword_similarity",
+            run_script(COMPUTE_KEYWORD_SIMILARITY_SCRIPT, ["--execute", *incremental_args]),
+            inputs=("Domain",),
+            outputs=("Domain.SIMILAR_KEYWORD",),
+            description="Compute Domain-Domain keyword similarity",
+            locks=DOMAIN_WRITES,
+        ),
+        Stage(
+            "company_similarity_via_domains",
+            run_script(COMPUTE_COMPANY_SIMILARITY_VIA_DOMAINS_SCRIPT, ["--execute"]),
+            inputs=("HAS_DOMAIN", "Domain.SIMILAR_DESCRIPTION", "Domain.SIMILAR_KEYWORD"),
+            outputs=("Company.SIMILAR_KEYWORD", "Company.SIMILAR_DESCRIPTION.via_domains"),
+            description="Create Company-Company edges from Domain similarity",
+            locks=COMPANY_WRITES,
+        ),
+        # Rewrites Company SIMILAR_DESCRIPTION, so it runs after the via-domains edges
+        Stage(
+            "compute_gds_features",
+            run_script(COMPUTE_GDS_SCRIPT, ["--execute", *incremental_args]),
+            inputs=(
+                "USES",
+                "HAS_DOMAIN",
+                "Company.description_embedding",
+                "Company.SIMILAR_DESCRIPTION.via_domains",
+            ),
+            outputs=("LIKELY_TO_ADOPT", "CO_OCCURS_WITH", "Company.SIMILAR_DESCRIPTION"),
+            description="Compute GDS features (tech adoption, affinity, company similarity)",
+            locks=COMPANY_WRITES + DOMAIN_WRITES,
+        ),
+        Stage(
+            "build_composite_index",
+            run_script(BUILD_COMPOSITE_INDEX_SCRIPT, ["--execute"]),
+            inputs=("SIMILAR_RISK", "Company.SIMILAR_DESCRIPTION", "USES", "HAS_DOMAIN"),
+            outputs=("SIMILAR_COMPOSITE",),
+            description="Precompute SIMILAR_COMPOSITE neighbours for find_similar_companies",
+            locks=COMPANY_WRITES,
+        ),
+    ]
+
+
+def main(argv: list[str] | None = None):
     """Run main orchestration function."""
-    parser = argparse.ArgumentParser(description="Run all data pipelines in the correct order")
+    parser = argparse.ArgumentParser(description="Run all data pipelines in dependency order")
     parser.add_argument(
         "--execute",
         action="store_true",
@@ -106,60 +260,61 @@ def main():
         action="store_true",
         help="Fast mode: skip re-downloading/parsing 10-Ks if already cached",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reload changed domains and recompute similarity for dirty nodes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages completed by the previous (failed) run",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Independent stages run at the same time (default: 2)",
+    )
+    args = parser.parse_args(argv)
 
     # Set up logging - always use timestamped logs for the orchestrator
     logger = setup_logging("full_pipeline", execute=args.execute)
 
+    cache = get_cache()
+    cached_10ks = cache.count("10k_extracted")
+    run_10k_stages = cached_10ks == 0 or not args.fast
+    stages = build_stages(run_10k_stages=run_10k_stages, incremental=args.incremental)
+    waves = execution_waves(stages)
+    checkpoint = PipelineCheckpoint(CHECKPOINT_FILE)
+
     if not args.execute:
+        by_name = {stage.name: stage for stage in stages}
+        dependencies = stage_dependencies(stages)
+        completed = checkpoint.completed() if args.resume else set()
         logger.info("=" * 70)
         logger.info("PIPELINE ORCHESTRATION PLAN (Dry Run)")
         logger.info("=" * 70)
         logger.info("")
-        logger.info("This script will recreate the graph from scratch:")
-        logger.info("")
-        logger.info("Step 1: Bootstrap Graph")
-        logger.info("  - bootstrap_graph.py - Load Domain and Technology nodes from SQLite")
-        logger.info("")
-        logger.info("Step 2: Download & Parse 10-K Filings (Start of pipeline)")
-        logger.info("  - download_10k_filings.py - Download most recent 10-K per company")
-        logger.info("  - parse_10k_filings.py - Extract websites, business descriptions")
-        logger.info("")
-        logger.info("Step 3: Load Company Data")
-        logger.info("  - load_company_data.py - Load Company nodes and HAS_DOMAIN relationships")
-        logger.info(
-            "  - enrich_company_identifiers.py - Add name/ticker from SEC EDGAR (required!)"
-        )
-        logger.info("  - enrich_company_properties.py - Enrich Company nodes with properties")
-        logger.info("  - compute_company_similarity.py - Create SIMILAR_INDUSTRY and SIMILAR_SIZE")
-        logger.info(
-            "  - create_company_embeddings.py - Create Company description embeddings (REQUIRED for extraction)"
-        )
-        logger.info(
-            "  - extract_with_llm_verification.py - Extract business relationships from 10-K filings"
-        )
-        logger.info("    (HAS_COMPETITOR, HAS_CUSTOMER, HAS_SUPPLIER, HAS_PARTNER)")
-        logger.info("    Uses embedding similarity + LLM verification for high precision")
-        logger.info(
-            "  - create_risk_similarity_graph.py - Create risk factor embeddings & SIMILAR_RISK"
-        )
-        logger.info("")
-        logger.info("Step 4: Domain Embeddings & Similarity")
-        logger.info("  - create_domain_embeddings.py - Create embeddings for Domain descriptions")
-        logger.info(
-            "  - compute_domain_similarity.py - Compute Domain-Domain description similarity"
-        )
-        logger.info("  - compute_keyword_similarity.py - Compute Domain-Domain keyword similarity")
         logger.info(
-            "  - compute_company_similarity_via_domains.py - "
-            "Create Company-Company edges from Domain similarity"
+            f"Stages in the same wave run concurrently (up to {args.workers} at once), "
+            "except those sharing a lock:"
         )
-        logger.info("")
-        logger.info("Step 5: Compute GDS Features")
-        logger.info("  - compute_gds_features.py - Compute all features:")
-        logger.info("    * Technology adoption predictions")
-        logger.info("    * Technology affinity/bundling")
-        logger.info("    * Company description similarity")
+        for i, wave in enumerate(waves, 1):
+            logger.info("")
+            logger.info(f"Wave {i}:")
+            for name in wave:
+                stage = by_name[name]
+                status = ""
+                if not stage.enabled:
+                    status = " [skipped: 10-Ks already cached]"
+                elif name in completed:
+                    status = " [complete, resume skips it]"
+                after = ", ".join(sorted(dependencies[name])) or "-"
+                logger.info(f"  - {name}{status}: {stage.description}")
+                logger.info(f"      after: {after}")
+                if stage.locks:
+                    logger.info(f"      locks: {', '.join(stage.locks)}")
         logger.info("")
         logger.info("=" * 70)
         logger.info("To execute, run: python scripts/run_all_pipelines.py --execute")
@@ -171,226 +326,35 @@ def main():
     logger.info("=" * 70)
     logger.info("RUNNING ALL PIPELINES")
     logger.info("=" * 70)
-    logger.info("")
-
-    # Step 1: Bootstrap Graph (Domain + Technology nodes)
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP 1: Bootstrap Graph")
-    logger.info("=" * 70)
-
-    if not run_script(
-        BOOTSTRAP_SCRIPT,
-        execute=True,
-        description="Loading Domain and Technology nodes from SQLite",
-        logger=logger,
-    ):
-        logger.error("Failed at bootstrap step")
-        return
-
-    # Step 2: Download & Parse 10-K Filings (Start of pipeline)
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP 2: Download & Parse 10-K Filings")
-    logger.info("=" * 70)
-    logger.info("This is the START of the pipeline - everything cascades from 10-Ks:")
-    logger.info("  - 10-Ks → Company websites → Domain collection")
-    logger.info("  - 10-Ks → Business descriptions → Company embeddings")
-    logger.info("  - 10-Ks → Competitor mentions → Direct competitor relationships")
-    logger.info("")
-
-    # Check if 10-Ks already downloaded
-    from public_company_graph.cache import get_cache
-
-    cache = get_cache()
-    cached_10ks = cache.count("10k_extracted")
-
-    if cached_10ks == 0 or not args.fast:
-        # Download 10-Ks (pre-filter is enabled by default to save credits)
-        if not run_script(
-            DOWNLOAD_10K_SCRIPT,
-            execute=True,
-            description="Step 2.1: Download 10-K Filings",
-            logger=logger,
-        ):
-            logger.error("Pipeline failed at download_10k_filings step")
-            return
-
-        # Parse 10-Ks
-        if not run_script(
-            PARSE_10K_SCRIPT,
-            execute=True,
-            description="Step 2.2: Parse 10-K Filings (extract websites, descriptions)",
-            logger=logger,
-        ):
-            logger.error("Pipeline failed at parse_10k_filings step")
-            return
-    else:
+    if not run_10k_stages:
         logger.info(f"✓ {cached_10ks} 10-Ks already parsed (fast mode: skipping)")
-        if args.fast:
-            logger.info("  Use without --fast to re-download/parse 10-Ks")
-
-    # Step 3: Company Data (10-K first approach)
-    # Website and business description come directly from 10-K filings
-    # No external API calls needed (collect_domains.py is skipped)
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP 3: Load Company Data (from 10-K filings)")
-    logger.info("=" * 70)
-
-    from public_company_graph.cache import get_cache
-
-    cache = get_cache()
-    ten_k_count = cache.count("10k_extracted")
-    logger.info(f"  Found {ten_k_count} companies with 10-K data")
-
-    # Load Company nodes (uses 10k_extracted cache directly)
-    if not run_script(
-        LOAD_COMPANY_DATA_SCRIPT,
-        execute=True,
-        description="Step 2.2: Loading Company nodes and HAS_DOMAIN relationships",
-        logger=logger,
-    ):
-        logger.error("Failed at load_company_data step")
-        return
-
-    # CRITICAL: Enrich Company nodes with name/ticker from SEC EDGAR
-    # This is required for business relationship extraction (lookup table needs name/ticker)
-    if not run_script(
-        ENRICH_COMPANY_IDENTIFIERS_SCRIPT,
-        execute=True,
-        description="Step 2.3: Enrich Company Identifiers (name/ticker from SEC EDGAR)",
-        logger=logger,
-    ):
-        logger.error("Failed at enrich_company_identifiers step")
-        return
-
-    # Enrich Company nodes with properties (SEC, Yahoo Finance, etc.)
-    if not run_script(
-        ENRICH_COMPANY_PROPERTIES_SCRIPT,
-        execute=True,
-        description="Step 2.4: Enrich Company Properties (Industry, Size, etc.)",
-        logger=logger,
-    ):
-        logger.error("Failed at enrich_company_properties step")
-        return
-
-    # Compute company similarity relationships
-    if not run_script(
-        COMPUTE_COMPANY_SIMILARITY_SCRIPT,
-        execute=True,
-        description="Step 2.5: Compute Company Similarity (Industry & Size)",
-        logger=logger,
-    ):
-        logger.error("Failed at compute_company_similarity step")
-        return
-
-    # CRITICAL: Create embeddings for Company nodes BEFORE extraction
-    # Extraction uses embedding similarity for validation, so embeddings must exist first
-    if not run_script(
-        CREATE_COMPANY_EMBEDDINGS_SCRIPT,
-        execute=True,
-        description="Step 2.6: Create Company Description Embeddings",
-        logger=logger,
-    ):
-        logger.error("Pipeline failed at create_company_embeddings step")
-        return
+        logger.info("  Use without --fast to re-download/parse 10-Ks")
 
-    # Extract business relationships from 10-K filings (CompanyKG edge types)
-    # This extracts: HAS_COMPETITOR, HAS_CUSTOMER, HAS_SUPPLIER, HAS_PARTNER
-    # Uses embedding similarity + LLM verification for high precision
-    # NOTE: Requires name/ticker from enrich_company_identifiers step AND embeddings from create_company_embeddings step!
-    if not run_script(
-        EXTRACT_BUSINESS_RELATIONSHIPS_SCRIPT,
-        execute=True,
-        description="Step 2.7: Extract Business Relationships from 10-K Filings",
-        extra_args=["--clean"],  # Start fresh for reproducibility
-        logger=logger,
-    ):
-        logger.error("Failed at extract_with_llm_verification step")
-        return
-
-    # Cleanup edges to ensure quality (applies tiered confidence system)
-    # This ensures all fact edges meet high confidence thresholds
-    # Converts medium-confidence to candidates, deletes low-confidence
-    if not run_script(
-        CLEANUP_EDGES_SCRIPT,
-        execute=True,
-        description="Step 2.7a: Cleanup Edge Quality (Apply Tiered Confidence System)",
-        logger=logger,
-    ):
-        logger.error("Failed at cleanup_edges_systemic step")
-        return
-
-    # Create risk factor embeddings and SIMILAR_RISK relationships
-    if not run_script(
-        CREATE_RISK_SIMILARITY_SCRIPT,
-        execute=True,
-        description="Step 2.8: Create Risk Factor Embeddings and SIMILAR_RISK Relationships",
-        logger=logger,
-    ):
-        logger.error("Pipeline failed at create_risk_similarity step")
-        return
-
-    # Step 4: Domain Embeddings
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP 4: Domain Embeddings")
-    logger.info("=" * 70)
-
-    # Always run create_domain_embeddings (it checks cache internally)
-    if not run_script(
-        CREATE_DOMAIN_EMBEDDINGS_SCRIPT,
-        execute=True,
-        description="Step 3.1: Create Domain Description Embeddings",
-        logger=logger,
-    ):
-        logger.error("Failed at create_domain_embeddings step")
-        return
-
-    if not run_script(
-        COMPUTE_DOMAIN_SIMILARITY_SCRIPT,
-        execute=True,
-        description="Step 3.2: Compute Domain-Domain Description Similarity",
-        logger=logger,
-    ):
-        logger.error("Failed at compute_domain_similarity step")
-        return
-
-    if not run_script(
-        COMPUTE_KEYWORD_SIMILARITY_SCRIPT,
-        execute=True,
-        description="Step 3.3: Compute Domain-Domain Keyword Similarity",
-        logger=logger,
-    ):
-        logger.error("Failed at compute_keyword_similarity step")
-        return
-
-    # Create company similarity from domain similarity
-    if not run_script(
-        COMPUTE_COMPANY_SIMILARITY_VIA_DOMAINS_SCRIPT,
-        execute=True,
-        description="Step 3.4: Create Company-Company edges from Domain similarity",
-        logger=logger,
-    ):
-        logger.error("Failed at compute_company_similarity_via_domains step")
-        return
-
-    # Step 5: Compute all GDS features (tech + company similarity in one pass)
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP 5: Compute GDS Features")
-    logger.info("=" * 70)
-    logger.info("Computing all GDS features: Technology adoption, affinity, and company similarity")
-
-    if not run_script(
-        COMPUTE_GDS_SCRIPT,
-        execute=True,
-        description="Computing all GDS features (tech adoption, affinity, company similarity)",
-        logger=logger,
-    ):
-        logger.error("Failed at GDS computation step")
-        return
+    driver, database = get_driver_and_database(logger)
+    try:
+        if not verify_neo4j_connection(driver, database, logger):
+            sys.exit(1)
+        runner = PipelineRunner(
+            stages,
+            PipelineContext(driver, database, cache=cache, logger=logger),
+            checkpoint=checkpoint,
+            max_workers=args.workers,
+            logger=logger,
+        )
+        result = runner.run(resume=args.resume)
+    finally:
+        driver.close()
+
+    if not result.ok:
+        logger.error("")
+        logger.error("=" * 70)
+        logger.error(f"PIPELINE FAILED at: {', '.join(result.failed)}")
+        logger.error("=" * 70)
+        if result.not_run:
+            logger.error(f"Not run: {', '.join(result.not_run)}")
+        logger.error("Fix the error and continue with:")
+        logger.error("  python scripts/run_all_pipelines.py --execute --resume")
+        sys.exit(1)
 
     # Summary
     total_elapsed = time.time() - pipeline_start
@@ -421,6 +385,7 @@ def main():
     logger.info("  ✓ SIMILAR_DESCRIPTION relationships (Company → Company)")
     logger.info("  ✓ SIMILAR_KEYWORD relationships (Company → Company, from domains)")
     logger.info("  ✓ SIMILAR_RISK relationships (Company → Company, risk factor similarity)")
+    logger.info("  ✓ SIMILAR_COMPOSITE relationships (Company → Company, precomputed top-N)")
     logger.info("")
 
 
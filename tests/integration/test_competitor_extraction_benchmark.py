@@ -0,0 +1,130 @@
+"""
+Per-filing latency benchmark for competitor extraction on real 10-K files.
+
+Extracts Item 1 and Item 1A from each available filing, checks that the
+anchor-windowed competitor-context scan finds exactly what a full-text scan
+finds, then times extract_competitor_mentions() on them. Per-filing latencies
+are logged so regressions in the competitor-context scan are visible in test
+output. tests/fixtures/10k_filings ships a trimmed filing, so this always runs.
+
+Run with: pytest tests/integration/test_competitor_extraction_benchmark.py -s
+"""
+
+import logging
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from public_company_graph.config import get_data_dir
+from public_company_graph.parsing.business_description import extract_business_description
+from public_company_graph.parsing.competitor_extraction import (
+    COMPETITOR_CONTEXT_PATTERNS,
+    extract_competitor_mentions,
+    find_competitor_contexts,
+)
+from public_company_graph.parsing.risk_factors import extract_risk_factors
+
+logger = logging.getLogger(__name__)
+
+# Cap on filings benchmarked (parsing the HTML dominates test wall time)
+MAX_FILINGS = 20
+
+# Generous per-filing ceiling; typical filings take a few milliseconds
+MAX_SECONDS_PER_FILING = 2.0
+
+
+@pytest.fixture
+def filings_dir():
+    """
+    Get the 10-K filings directory.
+
+    Prefers test fixtures (for immediate testability after clone),
+    falls back to data directory (for full dataset).
+    """
+    fixtures_dir = Path(__file__).parent.parent / "fixtures" / "10k_filings"
+    if fixtures_dir.exists() and any(fixtures_dir.glob("**/*.html")):
+        return fixtures_dir
+    return get_data_dir() / "10k_filings"
+
+
+def _context_spans(matches) -> list[tuple[str, int, int]]:
+    return [(m.re.pattern, m.start(), m.end()) for m in matches]
+
+
+def _full_text_contexts(text: str) -> list[tuple[str, int, int]]:
+    """What find_competitor_contexts must return: every pattern over the whole text."""
+    return _context_spans(
+        match
+        for pattern in COMPETITOR_CONTEXT_PATTERNS
+        for match in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
+    )
+
+
+def _filing_sections(filings_dir: Path) -> list[tuple[str, str | None, str | None]]:
+    """(name, Item 1, Item 1A) of up to MAX_FILINGS filings with either section."""
+    files = sorted(filings_dir.glob("**/10k_*.html"))[:MAX_FILINGS] if filings_dir.exists() else []
+    if not files:
+        pytest.skip(f"No 10-K files found in {filings_dir}")
+
+    sections = []
+    for file_path in files:
+        business = extract_business_description(file_path, filings_dir=filings_dir)
+        risk_factors = extract_risk_factors(file_path, filings_dir=filings_dir)
+        if business or risk_factors:
+            sections.append((str(file_path.relative_to(filings_dir)), business, risk_factors))
+    if not sections:
+        pytest.skip("No filings had extractable Item 1 or Item 1A text")
+    return sections
+
+
+@pytest.mark.integration
+def test_windowed_scan_matches_full_text_scan(filings_dir):
+    """
+    Business Outcome: Scanning only around "compet" anchors loses no competitor context.
+
+    Given: Item 1 and Item 1A text of real 10-K files
+    When: We find competitor contexts with the windowed scan
+    Then: The matches are exactly those of each pattern run over the full text
+    """
+    total = 0
+    for name, business, risk_factors in _filing_sections(filings_dir):
+        for text in (business, risk_factors):
+            if not text:
+                continue
+            windowed = _context_spans(find_competitor_contexts(text))
+            assert windowed == _full_text_contexts(text), name
+            total += len(windowed)
+    assert total > 0, "Expected competitor contexts in the 10-K text"
+
+
+@pytest.mark.integration
+def test_competitor_extraction_latency_per_filing(filings_dir):
+    """
+    Business Outcome: Competitor extraction stays fast on real filings.
+
+    Given: Real 10-K files
+    When: We extract competitor mentions from Item 1 and Item 1A
+    Then: Each filing completes well under MAX_SECONDS_PER_FILING
+    """
+    latencies: list[tuple[str, int, float]] = []
+    for name, business, risk_factors in _filing_sections(filings_dir):
+        start = time.perf_counter()
+        extract_competitor_mentions(business, risk_factors)
+        elapsed = time.perf_counter() - start
+
+        text_chars = len(business or "") + len(risk_factors or "")
+        latencies.append((name, text_chars, elapsed))
+
+    for name, text_chars, elapsed in latencies:
+        logger.info(f"{name}: {text_chars:,} chars in {elapsed * 1000:.1f} ms")
+    total = sum(elapsed for _, _, elapsed in latencies)
+    logger.info(
+        f"Competitor extraction: {len(latencies)} filings, "
+        f"mean {total / len(latencies) * 1000:.1f} ms, "
+        f"max {max(elapsed for _, _, elapsed in latencies) * 1000:.1f} ms"
+    )
+
+    slow = [(name, elapsed) for name, _, elapsed in latencies if elapsed > MAX_SECONDS_PER_FILING]
+    assert not slow, f"Filings exceeded {MAX_SECONDS_PER_FILING}s: {slow}"
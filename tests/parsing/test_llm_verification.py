@@ -1,11 +1,15 @@
 """Tests for LLM relationship verification."""
 
+import json
+import re
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
 from public_company_graph.parsing.llm_verification import (
     RELATIONSHIP_DESCRIPTIONS,
+    LLMCallMetrics,
     LLMRelationshipVerifier,
     LLMVerificationResult,
     VerificationResult,
@@ -157,6 +161,130 @@ class TestLLMRelationshipVerifier:
             mock_count.assert_called_once_with("llm_verification")
 
 
+class _DictCache:
+    """In-memory stand-in for AppCache."""
+
+    def __init__(self):
+        self.data = {}
+        self.get_many_calls = 0
+
+    def get(self, namespace, key):
+        return self.data.get((namespace, key))
+
+    def get_many(self, namespace, keys):
+        self.get_many_calls += 1
+        return {k: self.data[(namespace, k)] for k in keys if (namespace, k) in self.data}
+
+    def set(self, namespace, key, value, ttl_days=None):
+        self.data[(namespace, key)] = value
+
+
+class _FakeAsyncClient:
+    """Async client that confirms every packed candidate it is sent."""
+
+    def __init__(self, drop_ids=()):
+        self.requests = []
+        self.drop_ids = set(drop_ids)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        prompt = kwargs["messages"][-1]["content"]
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)]
+        results = [
+            {
+                "id": i,
+                "verified": True,
+                "confidence": 0.9,
+                "explanation": "Supplier named in context.",
+                "actual_relationship": "HAS_SUPPLIER",
+            }
+            for i in ids
+            if i not in self.drop_ids
+        ]
+        message = SimpleNamespace(content=json.dumps({"results": results}))
+        usage = SimpleNamespace(prompt_tokens=100 * len(ids), completion_tokens=30 * len(ids))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+class TestBatchVerification:
+    """Tests for packed async verification."""
+
+    @staticmethod
+    def _relationships(n):
+        return [
+            {
+                "context": f"We purchase components from Supplier {i}.",
+                "source_company": "ACME Corp",
+                "target_company": f"Supplier {i}",
+                "relationship_type": "HAS_SUPPLIER",
+            }
+            for i in range(n)
+        ]
+
+    @staticmethod
+    def _verifier(async_client):
+        verifier = LLMRelationshipVerifier(client=Mock(), async_client=async_client)
+        verifier._cache = _DictCache()
+        return verifier
+
+    def test_packs_relationships_into_fewer_calls(self):
+        """Ten relationships with pack_size=4 should take three API calls."""
+        client = _FakeAsyncClient()
+        verifier = self._verifier(client)
+
+        results = verifier.verify_batch_parallel(self._relationships(10), pack_size=4)
+
+        assert len(client.requests) == 3
+        assert all(r.result == VerificationResult.CONFIRMED for r in results)
+        assert client.requests[0]["response_format"] == {"type": "json_object"}
+
+    def test_cached_results_skip_api_with_one_bulk_lookup(self):
+        """A second run should be served from the cache with a single get_many."""
+        client = _FakeAsyncClient()
+        verifier = self._verifier(client)
+        relationships = self._relationships(5)
+
+        verifier.verify_batch_parallel(relationships, pack_size=2)
+        calls_after_first_run = len(client.requests)
+        verifier._cache.get_many_calls = 0
+
+        results = verifier.verify_batch_parallel(relationships, pack_size=2)
+
+        assert len(client.requests) == calls_after_first_run
+        assert verifier._cache.get_many_calls == 1
+        assert all(r.cost_tokens == 0 for r in results)
+
+    def test_missing_items_are_uncertain_and_not_cached(self):
+        """A candidate the LLM skips should come back UNCERTAIN and stay uncached."""
+        verifier = self._verifier(_FakeAsyncClient(drop_ids={1}))
+
+        results = verifier.verify_batch_parallel(self._relationships(3), pack_size=3)
+
+        assert [r.result for r in results] == [
+            VerificationResult.CONFIRMED,
+            VerificationResult.UNCERTAIN,
+            VerificationResult.CONFIRMED,
+        ]
+        assert len(verifier._cache.data) == 2
+
+    def test_records_call_metrics(self):
+        """Each API call should record latency and token cost."""
+        verifier = self._verifier(_FakeAsyncClient())
+
+        results = verifier.verify_batch_parallel(self._relationships(6), pack_size=3)
+
+        assert len(verifier.call_metrics) == 2
+        assert all(isinstance(m, LLMCallMetrics) for m in verifier.call_metrics)
+        stats = verifier.call_stats()
+        assert stats["calls"] == 2
+        assert stats["relationships"] == 6
+        assert stats["prompt_tokens"] == 600
+        assert stats["cost_usd"] > 0
+        # Packed tokens are spread over the items, so nothing is lost or double counted
+        assert sum(r.cost_tokens for r in results) == 600 + 180
+
+
 class TestCostEstimation:
     """Tests for cost estimation."""
 
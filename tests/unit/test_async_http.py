@@ -0,0 +1,151 @@
+"""
+Unit tests for public_company_graph.utils.async_http module.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from public_company_graph.utils import async_http, rate_limiting
+from public_company_graph.utils.async_http import (
+    AsyncHttpClient,
+    HttpStatusError,
+    map_concurrent,
+    parse_retry_after,
+)
+from public_company_graph.utils.rate_limiting import TokenBucket
+
+
+def test_parse_retry_after():
+    """Delta-seconds, HTTP dates, and garbage."""
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    later = format_datetime(now + timedelta(seconds=30), usegmt=True)
+
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(later, now=now.timestamp()) == pytest.approx(30.0)
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_sec_hosts_share_a_bucket_without_burst(monkeypatch):
+    """All SEC hosts draw from one single-token bucket; other hosts may burst."""
+    monkeypatch.setattr(rate_limiting, "_token_buckets", {})
+
+    sec = async_http.bucket_for_host("data.sec.gov")
+
+    assert async_http.bucket_for_host("www.sec.gov") is sec
+    assert (sec.rate, sec.capacity) == (10.0, 1.0)
+    assert async_http.bucket_for_host("finviz.com").capacity >= 1.0
+
+
+def test_map_concurrent_bounds_in_flight_and_yields_errors():
+    """At most `concurrency` calls run at once; exceptions are yielded, not raised."""
+    in_flight = peak = 0
+
+    async def work(n):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if n == 3:
+            raise ValueError("boom")
+        return n * 2
+
+    async def run():
+        return [pair async for pair in map_concurrent(work, range(10), concurrency=3)]
+
+    results = dict(asyncio.run(run()))
+    assert peak == 3
+    assert isinstance(results.pop(3), ValueError)
+    assert results == {n: n * 2 for n in range(10) if n != 3}
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, namespace, key):
+        return self.data.get((namespace, key))
+
+    def set(self, namespace, key, value, ttl_days=None):
+        self.data[(namespace, key)] = value
+
+
+@pytest.fixture
+def fast_buckets(monkeypatch):
+    """Unthrottled, isolated host buckets."""
+    buckets = {}
+    monkeypatch.setattr(
+        async_http,
+        "bucket_for_host",
+        lambda host: buckets.setdefault(host, TokenBucket(rate=1000.0, capacity=1000)),
+    )
+    return buckets
+
+
+def run_client(handler, coro_fn, **kwargs):
+    httpx = pytest.importorskip("httpx")
+
+    async def run():
+        async with AsyncHttpClient(transport=httpx.MockTransport(handler), **kwargs) as client:
+            return await coro_fn(client)
+
+    return asyncio.run(run())
+
+
+def test_revalidates_with_etag(fast_buckets):
+    """A cached body is revalidated with If-None-Match and reused on 304."""
+    httpx = pytest.importorskip("httpx")
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"name": "ACME"}, headers={"ETag": '"v1"'})
+
+    cache = DictCache()
+    url = "https://data.sec.gov/submissions/CIK0000000001.json"
+    first = run_client(handler, lambda c: c.get(url), cache=cache)
+    second = run_client(handler, lambda c: c.get(url), cache=cache)
+
+    assert seen == [None, '"v1"']
+    assert not first.from_cache
+    assert second.from_cache and second.json() == {"name": "ACME"}
+
+
+def test_retry_after_pauses_host_and_retries(fast_buckets):
+    """A 429 pauses the host bucket for Retry-After, then the request is retried."""
+    httpx = pytest.importorskip("httpx")
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.05"})
+        return httpx.Response(200, json={"ok": True})
+
+    result = run_client(handler, lambda c: c.get_json("https://data.sec.gov/x.json"))
+
+    assert result == {"ok": True}
+    assert len(calls) == 2
+    assert fast_buckets["data.sec.gov"]._paused_until > 0
+
+
+def test_get_json_404_and_exhausted_retries(fast_buckets):
+    """404 is None; a persistent 503 raises after the retries."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(503, headers={"Retry-After": "0"})
+
+    assert run_client(handler, lambda c: c.get_json("https://finviz.com/missing")) is None
+    with pytest.raises(HttpStatusError) as excinfo:
+        run_client(handler, lambda c: c.get("https://finviz.com/down"), max_retries=1)
+    assert excinfo.value.status == 503
@@ -22,6 +22,7 @@ from public_company_graph.parsing.business_relationship_extraction import (
     extract_all_relationships,
     extract_and_resolve_relationships,
     extract_relationship_sentences,
+    segment_relationship_sentences,
 )
 
 # =============================================================================
@@ -197,6 +198,67 @@ class TestSentenceExtraction:
         assert sentences == []
 
 
+class TestSentenceSegmentation:
+    """Tests for single-pass sentence segmentation and tagging."""
+
+    def test_tags_sentence_with_all_matching_types(self):
+        """A sentence mentioning several relationship keywords gets every type."""
+        text = "Our largest customer is also a key supplier and competitor."
+
+        sentences = segment_relationship_sentences(text)
+
+        assert len(sentences) == 1
+        assert sentences[0].relationship_types == {
+            RelationshipType.CUSTOMER,
+            RelationshipType.SUPPLIER,
+            RelationshipType.COMPETITOR,
+        }
+
+    def test_overlapping_keywords_are_all_tagged(self):
+        """Overlapping keywords (supply agreement / agreement with) both count."""
+        sentences = segment_relationship_sentences("We signed a supply agreement with Foo.")
+
+        assert sentences[0].relationship_types == {
+            RelationshipType.SUPPLIER,
+            RelationshipType.PARTNER,
+        }
+
+    def test_drops_sentences_without_keywords(self):
+        """Sentences with no relationship keyword are not returned."""
+        text = "We are a company. Our competitors include Intel."
+
+        sentences = segment_relationship_sentences(text)
+
+        assert [s.text for s in sentences] == ["Our competitors include Intel."]
+
+    def test_start_offsets_point_into_text(self):
+        """Start offsets locate each sentence in the original text."""
+        text = "Intro text.   We compete with Intel.\n\n  Our customers are global."
+
+        for sentence in segment_relationship_sentences(text):
+            assert text[sentence.start : sentence.start + len(sentence.text)] == sentence.text
+
+    def test_matches_per_type_extraction(self):
+        """Segmentation agrees with per-type sentence extraction."""
+        text = """We compete with Intel. Our largest customer is Apple.
+        Our key supplier is Broadcom. We have a partnership with Microsoft."""
+
+        segmented = segment_relationship_sentences(text)
+
+        for rel_type in RelationshipType:
+            expected = extract_relationship_sentences(text, rel_type)
+            assert [(s.text, s.start) for s in segmented if rel_type in s.relationship_types] == (
+                expected
+            )
+
+    def test_candidates_are_cached(self):
+        """Candidate spans are computed once per sentence."""
+        sentence = segment_relationship_sentences("Our competitors include Intel and AMD.")[0]
+
+        assert "AMD" in sentence.candidates
+        assert sentence.candidates is sentence.candidates
+
+
 # =============================================================================
 # Test Entity Resolution
 # =============================================================================
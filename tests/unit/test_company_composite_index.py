@@ -0,0 +1,224 @@
+"""
+Unit tests for the precomputed composite similarity index.
+"""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from public_company_graph.company.composite_index import (
+    build_composite_index,
+    component_signatures,
+    composite_neighbors,
+)
+from public_company_graph.company.queries import (
+    find_similar_companies,
+    find_similar_companies_batch,
+)
+
+EDGES = pd.DataFrame(
+    [
+        ("A", "B", "SIMILAR_RISK", 0.9),
+        ("B", "A", "SIMILAR_RISK", 0.9),
+        ("A", "C", "SIMILAR_DESCRIPTION", 0.7),
+        ("C", "A", "SIMILAR_DESCRIPTION", None),
+        ("B", "C", "SIMILAR_RISK", 0.5),
+    ],
+    columns=["cik1", "cik2", "rel_type", "score"],
+).astype({"score": float})
+TECHNOLOGIES = pd.DataFrame(
+    [("A", 1), ("A", 2), ("C", 1), ("C", 2), ("B", 3)], columns=["cik", "tech_id"]
+)
+
+
+class TestCompositeNeighbors:
+    """Tests for composite_neighbors scoring."""
+
+    def test_scores_match_live_query_semantics(self):
+        """Both edge directions count, null scores are skipped, shared tech adds weight."""
+        neighbors = composite_neighbors(EDGES, TECHNOLOGIES).set_index(["cik1", "cik2"])
+
+        a_b = neighbors.loc[("A", "B")]
+        assert a_b["score"] == pytest.approx(2 * 0.8 * 0.9)
+        assert a_b["risk_matches"] == 2
+        a_c = neighbors.loc[("A", "C")]
+        assert a_c["score"] == pytest.approx(0.8 * 0.7 + 2 * 0.05)
+        assert (a_c["desc_matches"], a_c["shared_tech_count"]) == (2, 2)
+
+    def test_ranks_best_first_and_keeps_top_n(self):
+        """Rank 0 is the best neighbour; only top_n rows per company are kept."""
+        neighbors = composite_neighbors(EDGES, TECHNOLOGIES, top_n=1)
+
+        assert neighbors.groupby("cik1").size().max() == 1
+        assert neighbors.set_index("cik1").loc["A", "cik2"] == "B"
+
+    def test_signature_changes_only_for_touched_companies(self):
+        """Re-scoring B-C changes B and C signatures but not A's."""
+        before = component_signatures(EDGES, TECHNOLOGIES)
+        rescored = EDGES.copy()
+        rescored.loc[4, "score"] = 0.6
+
+        after = component_signatures(rescored, TECHNOLOGIES)
+
+        assert after["A"] == before["A"]
+        assert after["B"] != before["B"] and after["C"] != before["C"]
+
+
+def _driver(stored_signatures, indexed_edges=()):
+    """Mock driver serving the index exports and capturing write batches."""
+    driver = MagicMock()
+    session = MagicMock()
+    driver.session.return_value.__enter__ = MagicMock(return_value=session)
+    driver.session.return_value.__exit__ = MagicMock(return_value=False)
+    writes: dict[str, list] = {"delete": [], "create": [], "signature": []}
+
+    def run(query, **params):
+        result = MagicMock()
+        if "type(r) AS rel_type" in query:
+            records = EDGES.where(EDGES.notna(), None).to_dict("records")
+        elif "id(t) AS tech_id" in query:
+            records = TECHNOLOGIES.to_dict("records")
+        elif "composite_signature AS signature" in query:
+            records = [{"cik": c, "signature": s} for c, s in stored_signatures.items()]
+        elif "AS lister" in query:
+            records = [{"lister": c1} for c1, c2 in indexed_edges if c2 in params["ciks"]]
+        else:
+            key = "delete" if "DELETE" in query else "create" if "CREATE" in query else "signature"
+            writes[key].extend(params["batch"])
+            result.single.return_value = {"created": len(params["batch"])}
+            return result
+        result.__iter__ = MagicMock(return_value=iter(records))
+        return result
+
+    session.run.side_effect = run
+    return driver, writes
+
+
+class TestBuildCompositeIndex:
+    """Tests for build_composite_index refresh logic."""
+
+    def test_first_build_writes_every_company(self):
+        """Without stored signatures every company is refreshed."""
+        driver, writes = _driver({"A": None, "B": None, "C": None, "D": None})
+
+        written = build_composite_index(driver, logger=MagicMock())
+
+        assert written == 6
+        assert {row["cik"] for row in writes["signature"]} == {"A", "B", "C"}
+
+    def test_unchanged_inputs_write_nothing(self):
+        """Matching signatures skip the refresh."""
+        signatures = component_signatures(EDGES, TECHNOLOGIES).to_dict()
+        driver, writes = _driver({**signatures, "D": None})
+
+        assert build_composite_index(driver, logger=MagicMock()) == 0
+        assert writes == {"delete": [], "create": [], "signature": []}
+
+    def test_changed_company_refreshes_its_neighbours(self):
+        """A stale signature on C rewrites C and the companies listing C."""
+        signatures = component_signatures(EDGES, TECHNOLOGIES).to_dict()
+        driver, writes = _driver({**signatures, "C": "stale"})
+
+        build_composite_index(driver, logger=MagicMock())
+
+        assert {row["cik"] for row in writes["delete"]} == {"A", "B", "C"}
+        assert [row["cik"] for row in writes["signature"]] == ["C"]
+
+    def test_changed_company_refreshes_stale_listers(self):
+        """A company whose stored list still holds C is rewritten even if C left it."""
+        signatures = component_signatures(EDGES, TECHNOLOGIES).to_dict()
+        driver, writes = _driver({**signatures, "C": "stale", "D": None}, [("D", "C")])
+
+        build_composite_index(driver, logger=MagicMock())
+
+        assert {row["cik"] for row in writes["delete"]} == {"A", "B", "C", "D"}
+        assert "D" not in {row["source"] for row in writes["create"]}
+
+
+class TestFindSimilarCompaniesIndex:
+    """Tests for the indexed lookup in find_similar_companies."""
+
+    @staticmethod
+    def _driver(indexed_rows):
+        driver = MagicMock()
+        session = MagicMock()
+        driver.session.return_value.__enter__ = MagicMock(return_value=session)
+        driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        session.run.side_effect = [iter(indexed_rows), iter([{"ticker": "LIVE"}])]
+        return driver, session
+
+    def test_reads_index_when_built(self):
+        """Indexed rows are returned without running the live query."""
+        driver, session = self._driver([{"ticker": "PEP"}])
+
+        assert find_similar_companies(driver, "KO", limit=5) == [{"ticker": "PEP"}]
+        assert session.run.call_count == 1
+        assert session.run.call_args.args[1] == {"ticker": "KO", "limit": 5, "min_score": 0.0}
+
+    def test_falls_back_to_live_query(self):
+        """An empty index lookup runs the live composite query."""
+        driver, session = self._driver([])
+
+        assert find_similar_companies(driver, "KO") == [{"ticker": "LIVE"}]
+        assert session.run.call_count == 2
+
+
+class TestFindSimilarCompaniesBatch:
+    """Tests for find_similar_companies_batch."""
+
+    @staticmethod
+    def _driver(responses):
+        """Driver whose sessions answer each query from responses[$tickers tuple]."""
+        driver = MagicMock()
+        calls = []
+
+        def run(text, parameters):
+            calls.append((text, parameters))
+            indexed = "SIMILAR_COMPOSITE" in text
+            rows = responses.get((indexed, tuple(parameters["tickers"])), [])
+            return iter(rows)
+
+        session = MagicMock()
+        session.run.side_effect = run
+        driver.session.return_value.__enter__ = MagicMock(return_value=session)
+        driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        return driver, calls
+
+    def test_index_hits_and_live_fallback_in_one_query_each(self):
+        """Index misses are computed live together; every ticker gets a ranked list."""
+        driver, calls = self._driver(
+            {
+                (True, ("KO", "PEP", "XYZ")): [
+                    {"source": "KO", "ticker": "PEP"},
+                    {"source": "KO", "ticker": "MNST"},
+                ],
+                (False, ("PEP", "XYZ")): [{"source": "PEP", "ticker": "KO"}],
+            }
+        )
+
+        peers = find_similar_companies_batch(driver, ["KO", "PEP", "XYZ", "KO"], limit=5)
+
+        assert peers == {
+            "KO": [{"ticker": "PEP"}, {"ticker": "MNST"}],
+            "PEP": [{"ticker": "KO"}],
+            "XYZ": [],
+        }
+        assert len(calls) == 2
+        assert calls[0][1] == {"tickers": ["KO", "PEP", "XYZ"], "limit": 5, "min_score": 0.0}
+        assert "UNWIND $tickers" in calls[1][0]
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_chunks(self, max_workers):
+        """Tickers are split into chunk_size queries, optionally run concurrently."""
+        driver, calls = self._driver(
+            {(True, (t,)): [{"source": t, "ticker": t + "_PEER"}] for t in "ABCD"}
+        )
+
+        peers = find_similar_companies_batch(
+            driver, list("ABCD"), chunk_size=1, max_workers=max_workers
+        )
+
+        assert list(peers) == list("ABCD")
+        assert peers["C"] == [{"ticker": "C_PEER"}]
+        assert len(calls) == 4
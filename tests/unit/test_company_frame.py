@@ -0,0 +1,66 @@
+"""
+Unit tests for public_company_graph.company.frame module.
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from public_company_graph.company.frame import CompanyFrame, load_company_frame
+from public_company_graph.pipeline import PipelineContext
+
+RECORDS = [
+    {"cik": "0001", "sic_code": "7372", "revenue": 5e7, "employees": 99},
+    {"cik": "0002", "sic_code": "3571", "revenue": 1e8, "employees": 100},
+    {"cik": None, "sic_code": "7372", "revenue": 1e12},  # No CIK: dropped
+    {"cik": "0003", "sic_code": "7372", "revenue": None, "employees": 10_000},
+    {"cik": "0004", "sic_code": "", "revenue": 2e10, "employees": "n/a"},
+]
+
+
+def test_from_records_columns():
+    """Missing categories are "", missing or non-numeric metrics are NaN."""
+    frame = CompanyFrame.from_records(RECORDS)
+
+    assert len(frame) == 4
+    assert frame.cik.tolist() == ["0001", "0002", "0003", "0004"]
+    assert frame.sic_code.tolist() == ["7372", "3571", "7372", ""]
+    assert np.isnan(frame.revenue[2]) and np.isnan(frame.employees[3])
+    assert frame.to_records()[3]["sic_code"] is None
+
+
+def test_group_by_keeps_first_occurrence_and_frame_order():
+    frame = CompanyFrame.from_records(RECORDS)
+
+    groups = frame.group_by("sic_code")
+
+    assert list(groups) == ["7372", "3571"]
+    assert groups["7372"].tolist() == [0, 2]
+
+
+def test_size_tiers_match_thresholds():
+    """Tier boundaries are inclusive at the lower edge; missing values are -1."""
+    frame = CompanyFrame.from_records(RECORDS)
+
+    assert frame.size_tiers("revenue").tolist() == [0, 1, -1, 3]
+    assert frame.size_tiers("employees").tolist() == [0, 1, 3, -1]
+    assert {k: v.tolist() for k, v in frame.group_by_size("employees").items()} == {
+        "<100": [0],
+        "100-1000": [1],
+        ">10000": [2],
+    }
+
+
+def test_load_is_shared_within_a_pipeline_run():
+    """One query per run until Company properties are rewritten."""
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value.run.return_value = RECORDS
+    context = PipelineContext(driver, "neo4j", cache=MagicMock())
+
+    with context.activate():
+        first = load_company_frame(context.borrow_driver(), "neo4j")
+        assert load_company_frame(context.borrow_driver(), "neo4j") is first
+        context.invalidate(["Company.properties"])
+        assert load_company_frame(context.borrow_driver(), "neo4j") is not first
+
+    assert driver.session.call_count == 2
@@ -0,0 +1,108 @@
+"""
+Unit tests for company industry and size similarity.
+"""
+
+import itertools
+from collections import Counter
+
+from public_company_graph.company.similarity import (
+    bucket_companies_by_size,
+    compute_industry_similarity,
+    compute_size_similarity,
+    industry_group_memberships,
+    iter_industry_similarity,
+    iter_size_similarity,
+    size_bucket_memberships,
+    unique_pairs,
+)
+
+COMPANIES = [
+    {"cik": "0003", "sic_code": "7372", "revenue": 5e10, "employees": 50},
+    {"cik": "0001", "sic_code": "7372", "revenue": 2e10, "employees": 60},
+    {"cik": "0002", "sic_code": "7372", "revenue": 9e10, "employees": None},
+    {"cik": "0004", "sic_code": "2834", "revenue": 3e10},
+    {"cik": None, "sic_code": "7372", "revenue": 4e10},
+]
+
+
+def _degrees(pairs):
+    return Counter(itertools.chain.from_iterable((a, b) for a, b, _ in pairs))
+
+
+class TestIndustrySimilarity:
+    """Tests for industry similarity pairs and group memberships."""
+
+    def test_all_pairs_in_group_lower_cik_first(self):
+        """Every pair in a SIC group appears once, ordered by CIK."""
+        pairs = compute_industry_similarity(COMPANIES, method="SIC")
+
+        assert sorted((a, b) for a, b, _ in pairs) == [
+            ("0001", "0002"),
+            ("0001", "0003"),
+            ("0002", "0003"),
+        ]
+        assert pairs[0][2] == {"method": "SIC", "classification": "7372", "score": 1.0}
+
+    def test_cap_limits_pairs_per_company(self):
+        """With a cap, a large group yields O(N) pairs."""
+        companies = [{"cik": f"{i:04d}", "sector": "Tech"} for i in range(100)]
+
+        pairs = list(iter_industry_similarity(companies, "SECTOR", max_per_company=4))
+
+        assert len(pairs) < 2 * 100
+        assert max(_degrees(pairs).values()) <= 4
+
+    def test_group_memberships_one_row_per_company_and_group(self):
+        """Memberships are linear in companies."""
+        rows = industry_group_memberships(COMPANIES, methods=["SIC"])
+
+        assert len(rows) == 4
+        assert {"cik": "0004", "key": "SIC:2834", "method": "SIC", "classification": "2834"} in rows
+
+
+class TestSizeSimilarity:
+    """Tests for size buckets, pairs and memberships."""
+
+    def test_bucket_companies_by_size(self):
+        """Companies land in their revenue tier."""
+        assert bucket_companies_by_size(COMPANIES, "revenue") == {
+            ">$10B": ["0003", "0001", "0002", "0004"]
+        }
+
+    def test_composite_pairs_are_unique(self):
+        """A pair sharing several buckets is emitted once (first metric wins)."""
+        pairs = compute_size_similarity(COMPANIES, method="COMPOSITE")
+
+        keys = [(a, b) for a, b, _ in pairs]
+        assert len(keys) == len(set(keys)) == 6
+        assert dict(zip(keys, pairs, strict=True))[("0001", "0003")][2]["metric"] == "revenue"
+
+    def test_capped_pairs_are_nearest_by_value(self):
+        """With a cap, each company is paired with its closest neighbours by the metric."""
+        companies = [{"cik": f"{i:04d}", "revenue": 1e10 + i * 1e6} for i in range(50)]
+
+        pairs = list(iter_size_similarity(companies, "REVENUE", max_per_company=2))
+
+        assert ("0010", "0011") in {(a, b) for a, b, _ in pairs}
+        assert all(abs(int(a) - int(b)) == 1 for a, b, _ in pairs)
+        assert max(_degrees(pairs).values()) <= 2
+
+    def test_size_bucket_memberships(self):
+        """One row per company and metric with a value."""
+        rows = size_bucket_memberships(COMPANIES, method="EMPLOYEES")
+
+        assert [(r["cik"], r["key"]) for r in rows] == [
+            ("0003", "employees:<100"),
+            ("0001", "employees:<100"),
+        ]
+
+
+class TestUniquePairs:
+    """Tests for unique_pairs."""
+
+    def test_dedupes_and_caps(self):
+        """Repeated pairs are dropped; companies at the cap take no more pairs."""
+        pairs = [("a", "b", {}), ("a", "b", {"x": 1}), ("a", "c", {}), ("b", "c", {})]
+
+        assert [(a, b) for a, b, _ in unique_pairs(pairs, max_per_company=1)] == [("a", "b")]
+        assert len(list(unique_pairs(pairs))) == 3
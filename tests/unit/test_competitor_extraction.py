@@ -2,15 +2,19 @@
 Unit tests for competitor extraction from 10-K filings.
 """
 
+import re
+
 import pytest
 
 from public_company_graph.parsing.competitor_extraction import (
+    COMPETITOR_CONTEXT_PATTERNS,
     CompetitorLookup,
     CompetitorMention,
     _is_common_word,
     _normalize_company_name,
     extract_and_resolve_competitors,
     extract_competitor_mentions,
+    find_competitor_contexts,
     resolve_competitors,
 )
 
@@ -82,6 +86,52 @@ class TestIsCommonWord:
         assert not _is_common_word("Apple")
 
 
+class TestFindCompetitorContexts:
+    """Tests for the anchor-windowed competitor context scan."""
+
+    def test_matches_full_text_scan(self):
+        """Windowed matches equal a full-text finditer over every pattern."""
+        filler = "Revenue grew due to strong demand across regions. " * 200
+        text = (
+            filler
+            + "We compete with products from Apple Inc. and Google. "
+            + filler
+            + "Our principal competitors include: Intel Corporation and others such as "
+            + "Qualcomm Inc. in mobile markets, along with many smaller vendors. Patents matter. "
+            + filler
+        )
+
+        expected = [
+            (m.start(), m.end())
+            for pattern in COMPETITOR_CONTEXT_PATTERNS
+            for m in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
+        ]
+
+        assert [(m.start(), m.end()) for m in find_competitor_contexts(text)] == expected
+
+    def test_unterminated_block_matches_full_text_scan(self):
+        """A long competitor block with no terminator behaves as in a full scan."""
+        block = "Intel Corporation, NVIDIA Corporation and Advanced Micro Devices " * 3
+        for text in (
+            "Our competitors include: " + block + "filler text " * 600,
+            "filler text " * 600 + "Our competitors include: " + block,
+        ):
+            expected = [
+                (m.start(), m.end())
+                for pattern in COMPETITOR_CONTEXT_PATTERNS
+                for m in re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
+            ]
+
+            assert [(m.start(), m.end()) for m in find_competitor_contexts(text)] == expected
+
+    def test_no_anchor_no_matches(self):
+        """Text without "compet" never runs the context patterns."""
+        assert list(find_competitor_contexts("We sell widgets. " * 1000)) == []
+
+    def test_handles_empty_text(self):
+        assert list(find_competitor_contexts("")) == []
+
+
 class TestExtractCompetitorMentions:
     """Tests for extracting competitor mentions from text."""
 
@@ -0,0 +1,98 @@
+"""
+Unit tests for scripts/compute_gds_features.py backend selection.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from public_company_graph.dirty import DirtyBatch
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "compute_gds_features.py"
+
+
+@pytest.fixture
+def script(monkeypatch):
+    """The script module, with Neo4j and the similarity features mocked out."""
+    spec = importlib.util.spec_from_file_location("compute_gds_features", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    driver = MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    session.run.return_value.single.return_value = {"company_count": 0, "count": 0}
+    monkeypatch.setattr(module, "setup_logging", lambda *a, **kw: MagicMock())
+    monkeypatch.setattr(module, "get_driver_and_database", lambda logger: (driver, "neo4j"))
+    monkeypatch.setattr(module, "verify_neo4j_connection", lambda *a: True)
+    for name in (
+        "compute_tech_adoption_prediction_sparse",
+        "compute_company_technology_similarity_sparse",
+        "compute_tech_adoption_prediction",
+        "compute_tech_affinity_bundling",
+        "compute_company_technology_similarity",
+    ):
+        monkeypatch.setattr(module, name, MagicMock(name=name))
+    monkeypatch.setattr(
+        module, "get_gds_client", MagicMock(side_effect=ImportError("graphdatascience missing"))
+    )
+    return module
+
+
+def test_sparse_backends_run_without_gds(script, monkeypatch):
+    """Both SciPy backends: no GDS client, no projection cleanup, affinity skipped."""
+    monkeypatch.setitem(sys.modules, "graphdatascience", None)  # Not installed
+    cleanup = MagicMock()
+    monkeypatch.setattr(script, "cleanup_leftover_graphs", cleanup)
+
+    script.main(
+        ["--execute", "--tech-adoption-backend", "sparse", "--tech-similarity-backend", "sparse"]
+    )
+
+    script.compute_tech_adoption_prediction_sparse.assert_called_once()
+    script.compute_tech_affinity_bundling.assert_not_called()
+    script.compute_tech_adoption_prediction.assert_not_called()
+    cleanup.assert_not_called()
+
+
+def test_gds_backend_requires_graphdatascience(script, monkeypatch):
+    """A GDS backend without the package exits before connecting."""
+    monkeypatch.setitem(sys.modules, "graphdatascience", None)
+
+    with pytest.raises(SystemExit):
+        script.main(["--execute", "--tech-similarity-backend", "sparse"])
+    script.get_gds_client.assert_not_called()
+
+
+def test_failed_description_similarity_stays_pending(script, monkeypatch):
+    """A failed incremental run exits non-zero without acknowledging the dirty batch."""
+    session = script.get_driver_and_database(None)[0].session.return_value.__enter__.return_value
+    session.run.return_value.single.return_value = {"company_count": 1, "count": 0}
+    dirty = MagicMock()
+    dirty.pending.return_value = DirtyBatch(frozenset({"0000320193"}), upto=1.0)
+    monkeypatch.setattr(script, "DirtySet", MagicMock(return_value=dirty))
+    monkeypatch.setattr(script, "get_cache", MagicMock())
+    monkeypatch.setattr(
+        script,
+        "compute_company_description_similarity",
+        MagicMock(side_effect=RuntimeError("write failed")),
+    )
+
+    with pytest.raises(SystemExit):
+        script.main(
+            [
+                "--execute",
+                "--incremental",
+                "--tech-adoption-backend",
+                "sparse",
+                "--tech-similarity-backend",
+                "sparse",
+                "--skip-tech-affinity",
+            ]
+        )
+
+    assert script.compute_company_description_similarity.call_args.kwargs["keys"] == {"0000320193"}
+    dirty.acknowledge.assert_not_called()
+    script.compute_company_technology_similarity_sparse.assert_called_once()
@@ -284,6 +284,28 @@ class TestFindTopKSimilarPairsEdgeCases:
         # Due to the way pairs are collected, counts might vary
         # but should be bounded by the number of pairs
 
+    def test_rows_match_full_computation(self):
+        """rows=... computes exactly the full result's top-k lists of those keys."""
+        rng = np.random.default_rng(7)
+        embeddings = rng.normal(size=(40, 8)).tolist()
+        keys = [f"key_{i:02d}" for i in range(40)]
+
+        full = find_top_k_similar_pairs(keys, embeddings, similarity_threshold=0.0, top_k=5)
+        everything = find_top_k_similar_pairs(
+            keys, embeddings, similarity_threshold=0.0, top_k=5, rows=keys, block_size=7
+        )
+        assert everything.keys() == full.keys()
+        for pair, score in full.items():
+            assert everything[pair] == pytest.approx(score, abs=1e-6)
+
+        rows = {"key_03", "key_17", "missing"}
+        partial = find_top_k_similar_pairs(
+            keys, embeddings, similarity_threshold=0.0, top_k=5, rows=rows
+        )
+        assert len(partial) == 10  # Five neighbours each, no shared pair
+        assert all(k1 in rows or k2 in rows for k1, k2 in partial)
+        assert partial.keys() <= full.keys()
+
     def test_ordered_keys_in_pairs(self):
         """Keys in pairs should be consistently ordered (key1 < key2)."""
         embeddings = [[0.5] * 10 for _ in range(5)]
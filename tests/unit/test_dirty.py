@@ -0,0 +1,67 @@
+"""
+Unit tests for public_company_graph.dirty module.
+"""
+
+import pytest
+
+from public_company_graph.cache import AppCache
+from public_company_graph.dirty import DirtySet
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AppCache(tmp_path / "cache")
+    yield cache
+    cache.close()
+
+
+def test_consumer_without_baseline_recomputes_all(cache):
+    """A consumer that never acknowledged gets a full batch."""
+    dirty = DirtySet(cache, "Company")
+    dirty.mark(["1", "2"])
+
+    batch = dirty.pending("embeddings")
+
+    assert batch.full
+    assert batch.keys == {"1", "2"}
+
+
+def test_consumers_keep_separate_positions(cache):
+    """Acknowledging in one stage does not hide keys from the next."""
+    dirty = DirtySet(cache, "Company")
+    dirty.acknowledge("embeddings", dirty.pending("embeddings"))
+    dirty.acknowledge("similarity", dirty.pending("similarity"))
+
+    dirty.mark(["1", "2"])
+    embeddings = dirty.pending("embeddings")
+    assert not embeddings.full and embeddings.keys == {"1", "2"}
+    dirty.acknowledge("embeddings", embeddings)
+
+    assert dirty.pending("embeddings").keys == frozenset()
+    assert dirty.pending("similarity").keys == {"1", "2"}
+
+
+def test_marks_after_pending_stay_pending(cache):
+    """Keys marked while a consumer works are returned on its next run."""
+    dirty = DirtySet(cache, "Domain")
+    dirty.acknowledge("similarity", dirty.pending("similarity"))
+    dirty.mark(["a.com"])
+    batch = dirty.pending("similarity")
+
+    dirty.mark(["b.com"])
+    dirty.acknowledge("similarity", batch)
+
+    assert dirty.pending("similarity").keys == {"b.com"}
+
+
+def test_seen_marks_are_pruned_and_reset_forgets_baselines(cache):
+    """Marks every consumer has seen are dropped; reset forces full runs."""
+    dirty = DirtySet(cache, "Domain")
+    dirty.acknowledge("embeddings", dirty.pending("embeddings"))
+    dirty.mark(["a.com"])
+    dirty.acknowledge("embeddings", dirty.pending("embeddings"))
+
+    assert cache.get("dirty", "Domain")["marks"] == {}
+
+    dirty.reset()
+    assert dirty.pending("embeddings").full
@@ -0,0 +1,111 @@
+"""
+Unit tests for public_company_graph.sources.download_manifest module.
+"""
+
+import pytest
+
+from public_company_graph.sources.download_manifest import (
+    DOWNLOADED,
+    EXTRACTED,
+    FAILED,
+    NO_10K,
+    PENDING,
+    DownloadManifest,
+)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = DownloadManifest(tmp_path / "manifest.db")
+    yield manifest
+    manifest.close()
+
+
+def companies(*ciks):
+    return [{"cik": cik, "ticker": f"T{cik}", "name": f"Company {cik}"} for cik in ciks]
+
+
+def test_sync_adds_new_companies_as_pending(manifest):
+    """CIKs are zero-padded; re-syncing known companies adds nothing."""
+    assert manifest.sync(companies("1", "2")) == 2
+    assert manifest.sync(companies("2", "3")) == 1
+
+    assert manifest.counts() == {PENDING: 3}
+    assert {entry.cik for entry in manifest.entries()} == {
+        "0000000001",
+        "0000000002",
+        "0000000003",
+    }
+
+
+def test_work_queue_order_and_give_up(manifest):
+    """Downloaded first, then pending, then failures below max_attempts."""
+    manifest.sync(companies("1", "2", "3", "4", "5"))
+    manifest.record("1", EXTRACTED, file_path="/f/10k_2024.html")
+    manifest.record("2", NO_10K, error="No 10-K found")
+    manifest.record("3", FAILED, error="timeout")
+    manifest.record("4", DOWNLOADED, filing_date="2024-02-01")
+
+    queue = manifest.work_queue(max_attempts=3)
+    assert [(e.cik[-1], e.status) for e in queue] == [
+        ("4", DOWNLOADED),
+        ("5", PENDING),
+        ("3", FAILED),
+    ]
+    assert queue[0].attempts == 0 and queue[0].filing_date == "2024-02-01"
+
+    manifest.record("3", FAILED, error="timeout")
+    assert [e.cik[-1] for e in manifest.work_queue(max_attempts=2)] == ["4", "5"]
+    assert [e.cik[-1] for e in manifest.work_queue(ciks=["5"])] == ["5"]
+
+    assert manifest.reset([FAILED]) == 1
+    assert [(e.cik[-1], e.status) for e in manifest.work_queue(max_attempts=2)][1] == (
+        "3",
+        PENDING,
+    )
+
+
+def test_state_survives_reopening(tmp_path):
+    """A rerun sees the previous run's progress."""
+    with DownloadManifest(tmp_path / "manifest.db") as manifest:
+        manifest.sync(companies("1"))
+        manifest.record("1", EXTRACTED, file_path="/f/10k_2024.html")
+
+    with DownloadManifest(tmp_path / "manifest.db") as manifest:
+        (entry,) = manifest.entries()
+        assert entry.status == EXTRACTED
+        assert entry.attempts == 1
+        assert entry.file_path == "/f/10k_2024.html"
+
+
+def test_seed_from_filesystem(manifest, tmp_path):
+    """Existing extracted files and portfolio tars become extracted/downloaded."""
+    filings = tmp_path / "10k_filings"
+    portfolios = tmp_path / "10k_portfolios"
+    (filings / "0000000001").mkdir(parents=True)
+    (filings / "0000000001" / "10k_2024.html").write_text("<html/>")
+    (filings / "0000000002").mkdir()  # Empty: nothing extracted
+    (portfolios / "10k_0000000002").mkdir(parents=True)
+    (portfolios / "10k_0000000002" / "batch_000_001.tar").write_bytes(b"")
+    manifest.sync(companies("1", "2", "3"))
+
+    assert manifest.seed_from_filesystem(filings, portfolios) == 2
+    assert {e.cik[-1]: e.status for e in manifest.entries()} == {
+        "1": EXTRACTED,
+        "2": DOWNLOADED,
+        "3": PENDING,
+    }
+
+
+def test_seed_only_given_ciks(manifest, tmp_path):
+    """Seeding newly synced CIKs leaves the state of known companies alone."""
+    filings = tmp_path / "10k_filings"
+    for cik in ("0000000001", "0000000002"):
+        (filings / cik).mkdir(parents=True)
+        (filings / cik / "10k_2024.html").write_text("<html/>")
+    manifest.sync(companies("1"))
+    manifest.record("1", FAILED, error="timeout")
+    manifest.sync(companies("2"))
+
+    assert manifest.seed_from_filesystem(filings, tmp_path / "none", ciks=["2"]) == 1
+    assert {e.cik[-1]: e.status for e in manifest.entries()} == {"1": FAILED, "2": EXTRACTED}
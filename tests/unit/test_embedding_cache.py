@@ -19,6 +19,7 @@ import pytest
 from public_company_graph.cache import AppCache
 from public_company_graph.embeddings.create import (
     create_embeddings_for_nodes,
+    invalidate_embeddings,
 )
 from tests.conftest import MockResult
 
@@ -803,3 +804,34 @@ class TestEmbeddingCacheKeyDerivation:
             cached = cache.get("embeddings", expected_key)
             assert cached is not None
             cache.close()
+
+
+class TestInvalidateEmbeddings:
+    """Tests for invalidate_embeddings (re-embedding changed nodes)."""
+
+    def test_drops_only_cache_entries_with_changed_text(self, tmp_path):
+        """Node embeddings are removed; cached ones survive if the text is unchanged."""
+        cache = AppCache(tmp_path / "cache")
+        try:
+            entry = {"embedding": [0.1], "model": "m", "dimension": 1}
+            cache.set("embeddings", "1:description", {**entry, "text": "same text"})
+            cache.set("embeddings", "2:description", {**entry, "text": "old text"})
+
+            driver = MagicMock()
+            session = driver.session.return_value.__enter__.return_value
+            session.run.return_value = [
+                {"key": "1", "text": " same text "},
+                {"key": "2", "text": "new text"},
+            ]
+
+            stale = invalidate_embeddings(
+                driver, cache, "Company", "description", "cik", keys={"1", "2"}
+            )
+
+            assert stale == 1
+            assert cache.get("embeddings", "1:description") is not None
+            assert cache.get("embeddings", "2:description") is None
+            query = session.run.call_args.args[0]
+            assert "REMOVE n.description_embedding" in query
+        finally:
+            cache.close()
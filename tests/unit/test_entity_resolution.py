@@ -16,9 +16,11 @@ import pytest
 from public_company_graph.entity_resolution.candidates import (
     Candidate,
     CapitalizedWordExtractor,
+    SentenceIndex,
     TickerExtractor,
     extract_candidates,
     extract_candidates_with_stats,
+    iter_unique_candidates,
 )
 from public_company_graph.entity_resolution.filters import (
     FilterReason,
@@ -453,6 +455,22 @@ class TestExactTickerMatcher:
         assert not result.matched
         assert result.match_type == MatchType.NO_MATCH
 
+    def test_could_match_agrees_with_match(self, sample_lookup):
+        """The cheap pre-check never rejects a candidate that match() accepts."""
+        for matcher in (ExactTickerMatcher(), ExactNameMatcher(), NormalizedNameMatcher()):
+            for text in ("NVDA", "ZZZZ", "nvidia corporation", "NVIDIA", "The"):
+                candidate = Candidate(
+                    text=text,
+                    start_pos=0,
+                    end_pos=len(text),
+                    source_pattern="capitalized",
+                    sentence=text,
+                )
+
+                assert matcher.could_match(candidate, sample_lookup) == (
+                    matcher.match(candidate, sample_lookup).matched
+                )
+
 
 class TestExactNameMatcher:
     """Tests for ExactNameMatcher."""
@@ -599,6 +617,38 @@ class TestRuleBasedScorer:
         assert result.final_confidence == 0.0
 
 
+class TestSentenceIndex:
+    """Tests for precomputed sentence boundary lookup."""
+
+    def test_finds_containing_sentence(self):
+        text = "First sentence here. Microsoft competes with Intel. Last one!"
+        index = SentenceIndex(text)
+
+        assert index.sentence_at(text.index("Intel")) == "Microsoft competes with Intel."
+        assert index.sentence_at(0) == "First sentence here."
+        assert index.sentence_at(text.index("Last")) == "Last one!"
+
+    def test_shares_sentence_strings(self):
+        """Candidates in the same sentence share one sentence string."""
+        text = "Microsoft competes with Intel and Apple."
+        index = SentenceIndex(text)
+
+        assert index.sentence_at(text.index("Intel")) is index.sentence_at(text.index("Apple"))
+
+    def test_truncates_long_sentences(self):
+        text = "Word " * 200 + "end."
+
+        assert len(SentenceIndex(text).sentence_at(0)) == 500
+
+    def test_candidates_carry_sentence(self):
+        text = "We are big. Microsoft competes with Intel."
+
+        candidates = {c.text: c for c in iter_unique_candidates(text)}
+
+        assert candidates["Intel"].sentence == "Microsoft competes with Intel."
+        assert candidates["We"].sentence == "We are big."
+
+
 # =============================================================================
 # Full Pipeline Tests
 # =============================================================================
@@ -642,6 +692,31 @@ class TestEntityResolver:
         for result in results:
             assert result.confidence >= 0.9
 
+    def test_iter_resolve_matches_resolve(self, sample_lookup, sample_text):
+        """Streaming resolution yields the same results as resolve()."""
+        resolver = EntityResolver()
+
+        streamed = list(resolver.iter_resolve(sample_text, sample_lookup))
+
+        assert [r.to_dict() for r in streamed] == [
+            r.to_dict() for r in resolver.resolve(sample_text, sample_lookup)
+        ]
+
+    def test_result_types_use_slots(self, sample_lookup):
+        """Per-candidate result objects are slotted (no per-instance __dict__)."""
+        resolver = EntityResolver()
+
+        result = resolver.resolve("We compete with Microsoft.", sample_lookup)[0]
+
+        for obj in (
+            result,
+            result.candidate,
+            result.filter_result,
+            result.match_result,
+            result.confidence_result,
+        ):
+            assert not hasattr(obj, "__dict__")
+
     def test_returns_stats(self, sample_lookup, sample_text):
         """Test that stats are returned correctly."""
         resolver = EntityResolver()
@@ -4,6 +4,8 @@ Unit tests for GDS company similarity functions.
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from public_company_graph.gds.company_similarity import (
     compute_company_description_similarity,
 )
@@ -118,7 +120,8 @@ class TestComputeCompanyDescriptionSimilarity:
 
         # Third call: write relationships
         mock_write_result = MagicMock()
-        mock_write_result.single.return_value = {"created": 3}
+        # The write query counts both directions
+        mock_write_result.single.return_value = {"created": 6}
 
         mock_session.run.side_effect = [
             mock_delete_result,
@@ -143,19 +146,19 @@ class TestComputeCompanyDescriptionSimilarity:
         assert result == 6
         mock_find_similar.assert_called_once()
 
-    def test_handles_exception_gracefully(self):
-        """Test that exceptions are handled and logged."""
+    def test_logs_and_reraises_exceptions(self):
+        """Test that exceptions are logged and re-raised (callers must not acknowledge)."""
         mock_driver = MagicMock()
         mock_driver.session.side_effect = Exception("Connection failed")
         mock_logger = MagicMock()
 
-        result = compute_company_description_similarity(
-            driver=mock_driver,
-            execute=True,
-            logger=mock_logger,
-        )
+        with pytest.raises(Exception, match="Connection failed"):
+            compute_company_description_similarity(
+                driver=mock_driver,
+                execute=True,
+                logger=mock_logger,
+            )
 
-        assert result == 0
         mock_logger.error.assert_called()
 
     def test_uses_default_logger_when_none_provided(self):
@@ -270,7 +273,7 @@ class TestComputeCompanyDescriptionSimilarity:
 
         # Each batch write returns count
         mock_write_result = MagicMock()
-        mock_write_result.single.return_value = {"created": len(pairs)}
+        mock_write_result.single.return_value = {"created": len(pairs) * 2}
 
         mock_session.run.side_effect = [
             mock_delete_result,
@@ -5,96 +5,78 @@ Unit tests for GDS company technology similarity functions.
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
 from public_company_graph.gds.company_tech import (
-    _build_batch,
-    _identify_node_columns,
     compute_company_technology_similarity,
+    compute_company_technology_similarity_sparse,
 )
+from public_company_graph.gds.utils import iter_unwind_batches, similarity_result_columns
 
 
-class TestIdentifyNodeColumns:
-    """Tests for _identify_node_columns helper function."""
+def _similarity_batches(similarity_result, **kwargs):
+    """Run a similarity stream through the column extractor and UNWIND batcher."""
+    node_id1, node_id2, similarity = similarity_result_columns(similarity_result, MagicMock())
+    columns = {"node_id1": node_id1, "node_id2": node_id2, "similarity": similarity}
+    return list(iter_unwind_batches(columns, **kwargs))
+
+
+class TestSimilarityResultColumns:
+    """Tests for node column identification in similarity_result_columns."""
 
     def test_identifies_nodeid_columns(self):
         """Test identification of nodeId1/nodeId2 columns."""
-        df = pd.DataFrame(
-            {
-                "nodeId1": [1, 2],
-                "nodeId2": [3, 4],
-                "similarity": [0.9, 0.8],
-            }
-        )
+        df = pd.DataFrame({"nodeId1": [1, 2], "nodeId2": [3, 4], "similarity": [0.9, 0.8]})
 
-        col1, col2 = _identify_node_columns(df)
+        node_id1, node_id2, similarity = similarity_result_columns(df)
 
-        assert col1 == "nodeId1"
-        assert col2 == "nodeId2"
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [3, 4]
+        assert similarity.tolist() == [0.9, 0.8]
 
     def test_identifies_source_target_columns(self):
         """Test identification of source/target columns."""
-        df = pd.DataFrame(
-            {
-                "source": [1, 2],
-                "target": [3, 4],
-                "score": [0.9, 0.8],
-            }
-        )
+        df = pd.DataFrame({"source": [1, 2], "target": [3, 4], "score": [0.9, 0.8]})
 
-        col1, col2 = _identify_node_columns(df)
+        node_id1, node_id2, similarity = similarity_result_columns(df)
 
-        assert col1 == "source"
-        assert col2 == "target"
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [3, 4]
+        assert similarity.tolist() == [0.9, 0.8]
 
     def test_identifies_node1_node2_columns(self):
         """Test identification of node1/node2 columns."""
-        df = pd.DataFrame(
-            {
-                "node1": [1, 2],
-                "node2": [3, 4],
-                "weight": [0.9, 0.8],
-            }
-        )
+        df = pd.DataFrame({"node1": [1, 2], "node2": [3, 4], "weight": [0.9, 0.8]})
 
-        col1, col2 = _identify_node_columns(df)
+        node_id1, node_id2, _ = similarity_result_columns(df)
 
-        assert col1 == "node1"
-        assert col2 == "node2"
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [3, 4]
 
-    def test_returns_none_for_unrecognized_columns(self):
-        """Test that None is returned for unrecognized columns."""
-        df = pd.DataFrame(
-            {
-                "foo": [1, 2],
-                "bar": [3, 4],
-            }
-        )
-
-        col1, col2 = _identify_node_columns(df)
+    def test_raises_for_unrecognized_columns(self):
+        """Test that unrecognized columns raise instead of writing nothing."""
+        df = pd.DataFrame({"foo": [1, 2], "bar": [3, 4]})
 
-        assert col1 is None
-        assert col2 is None
+        with pytest.raises(ValueError, match="Unexpected columns"):
+            similarity_result_columns(df)
 
 
-class TestBuildBatch:
-    """Tests for _build_batch helper function."""
+class TestSimilarityBatches:
+    """Tests for turning similarity streams into UNWIND batches."""
 
     def test_builds_batch_from_dataframe(self):
         """Test building batch from DataFrame."""
-        df = pd.DataFrame(
-            {
-                "nodeId1": [1, 2],
-                "nodeId2": [3, 4],
-                "similarity": [0.9, 0.8],
-            }
-        )
-        mock_logger = MagicMock()
+        df = pd.DataFrame({"nodeId1": [1, 2], "nodeId2": [3, 4], "similarity": [0.9, 0.8]})
 
-        batch = _build_batch(df, mock_logger)
+        batches = _similarity_batches(df, max_rows=10)
 
-        assert len(batch) == 2
-        assert batch[0] == {"node_id1": 1, "node_id2": 3, "similarity": 0.9}
-        assert batch[1] == {"node_id1": 2, "node_id2": 4, "similarity": 0.8}
+        assert batches == [
+            [
+                {"node_id1": 1, "node_id2": 3, "similarity": 0.9},
+                {"node_id1": 2, "node_id2": 4, "similarity": 0.8},
+            ]
+        ]
+        assert type(batches[0][0]["node_id1"]) is int
 
     def test_builds_batch_from_dict_iterator(self):
         """Test building batch from dict-based iterator."""
@@ -104,45 +86,40 @@ class TestBuildBatch:
                 {"node1": 3, "node2": 4, "score": 0.8},
             ]
         )
-        mock_logger = MagicMock()
 
-        batch = _build_batch(results, mock_logger)
+        (batch,) = _similarity_batches(results, max_rows=10)
 
-        assert len(batch) == 2
-        assert batch[0]["node_id1"] == 1
-        assert batch[0]["node_id2"] == 2
-        assert batch[0]["similarity"] == 0.9
+        assert batch[0] == {"node_id1": 1, "node_id2": 2, "similarity": 0.9}
+        assert batch[1] == {"node_id1": 3, "node_id2": 4, "similarity": 0.8}
 
     def test_builds_batch_from_tuple_iterator(self):
         """Test building batch from tuple-based iterator."""
-        results = iter(
-            [
-                (1, 2, 0.9),
-                (3, 4, 0.8),
-            ]
-        )
-        mock_logger = MagicMock()
+        results = iter([(1, 2, 0.9), (3, 4, 0.8)])
 
-        batch = _build_batch(results, mock_logger)
+        (batch,) = _similarity_batches(results, max_rows=10)
 
-        assert len(batch) == 2
-        assert batch[0] == {"node_id1": 1, "node_id2": 2, "similarity": 0.9}
-        assert batch[1] == {"node_id1": 3, "node_id2": 4, "similarity": 0.8}
+        assert batch == [
+            {"node_id1": 1, "node_id2": 2, "similarity": 0.9},
+            {"node_id1": 3, "node_id2": 4, "similarity": 0.8},
+        ]
 
-    def test_handles_empty_dataframe(self):
-        """Test building batch from empty DataFrame."""
+    def test_max_bytes_splits_batches(self):
+        """Test that the byte bound splits a stream below max_rows."""
         df = pd.DataFrame(
-            {
-                "nodeId1": [],
-                "nodeId2": [],
-                "similarity": [],
-            }
+            {"nodeId1": range(10), "nodeId2": range(10, 20), "similarity": [0.5] * 10}
         )
-        mock_logger = MagicMock()
 
-        batch = _build_batch(df, mock_logger)
+        batches = _similarity_batches(df, max_rows=100, max_bytes=100)
 
-        assert len(batch) == 0
+        assert len(batches) > 1
+        assert all(len(batch) < 10 for batch in batches)
+        assert [row["node_id1"] for batch in batches for row in batch] == list(range(10))
+
+    def test_handles_empty_dataframe(self):
+        """Test building batches from an empty DataFrame."""
+        df = pd.DataFrame({"nodeId1": [], "nodeId2": [], "similarity": []})
+
+        assert _similarity_batches(df, max_rows=10) == []
 
 
 class TestComputeCompanyTechnologySimilarity:
@@ -165,7 +142,7 @@ class TestComputeCompanyTechnologySimilarity:
         mock_driver.session.assert_not_called()
         mock_gds.graph.project.cypher.assert_not_called()
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_creates_bipartite_graph(self, mock_safe_drop):
         """Test that bipartite Company-Technology graph is created."""
         mock_gds = MagicMock()
@@ -219,7 +196,7 @@ class TestComputeCompanyTechnologySimilarity:
         assert "Company" in call_args[1]
         assert "Technology" in call_args[1]
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_deletes_existing_relationships_first(self, mock_safe_drop):
         """Test that existing SIMILAR_TECHNOLOGY relationships are deleted."""
         mock_gds = MagicMock()
@@ -265,7 +242,7 @@ class TestComputeCompanyTechnologySimilarity:
         assert "DELETE" in first_query
         assert "SIMILAR_TECHNOLOGY" in first_query
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_filters_to_company_company_pairs_only(self, mock_safe_drop):
         """Test that results are filtered to Company-Company pairs only."""
         mock_gds = MagicMock()
@@ -327,7 +304,7 @@ class TestComputeCompanyTechnologySimilarity:
         # Only Company-Company pairs should be written
         assert result == 1
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_handles_exception_gracefully(self, mock_safe_drop):
         """Test that exceptions are caught and logged."""
         mock_gds = MagicMock()
@@ -368,7 +345,7 @@ class TestComputeCompanyTechnologySimilarity:
 
         assert result == 0
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_respects_similarity_threshold(self, mock_safe_drop):
         """Test that similarity_threshold is passed to GDS."""
         mock_gds = MagicMock()
@@ -412,7 +389,7 @@ class TestComputeCompanyTechnologySimilarity:
         call_kwargs = mock_gds.nodeSimilarity.stream.call_args[1]
         assert call_kwargs["similarityCutoff"] == 0.7
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_respects_top_k_parameter(self, mock_safe_drop):
         """Test that top_k is passed to GDS."""
         mock_gds = MagicMock()
@@ -456,7 +433,7 @@ class TestComputeCompanyTechnologySimilarity:
         call_kwargs = mock_gds.nodeSimilarity.stream.call_args[1]
         assert call_kwargs["topK"] == 25
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_ensures_consistent_relationship_direction(self, mock_safe_drop):
         """Test that relationship direction is consistent (alphabetical CIK order)."""
         mock_gds = MagicMock()
@@ -516,10 +493,10 @@ class TestComputeCompanyTechnologySimilarity:
         # The batch should have been reordered so lower CIK comes first
         write_call = mock_session.run.call_args_list[-1]
         batch = write_call[1]["batch"]
-        assert batch[0]["cik1"] == "000111"  # Lower CIK first
-        assert batch[0]["cik2"] == "000222"
+        assert batch[0]["source"] == "000111"  # Lower CIK first
+        assert batch[0]["target"] == "000222"
 
-    @patch("public_company_graph.gds.company_tech.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_drops_graph_after_completion(self, mock_safe_drop):
         """Test that graph is dropped after processing."""
         mock_gds = MagicMock()
@@ -560,3 +537,71 @@ class TestComputeCompanyTechnologySimilarity:
         )
 
         mock_graph.drop.assert_called_once()
+
+
+class TestComputeCompanyTechnologySimilaritySparse:
+    """Tests for the in-process sparse backend."""
+
+    @staticmethod
+    def _driver(edges):
+        """Mock driver serving a Company-Technology export and capturing write batches."""
+        mock_driver = MagicMock()
+        mock_session = MagicMock()
+        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        written = []
+
+        def run(query, **params):
+            result = MagicMock()
+            if "RETURN DISTINCT c.cik AS cik" in query:
+                result.__iter__ = MagicMock(
+                    return_value=iter([{"cik": c, "tech_id": t} for c, t in edges])
+                )
+            elif "DELETE r" in query:
+                result.single.return_value = {"deleted": 0}
+            else:
+                written.extend(params["batch"])
+                result.single.return_value = {"created": len(params["batch"])}
+            return result
+
+        mock_session.run.side_effect = run
+        return mock_driver, written
+
+    EDGES = [
+        ("000222", 1),
+        ("000222", 2),
+        ("000111", 1),
+        ("000111", 2),
+        ("000111", 3),
+        ("000333", 9),
+    ]
+
+    def test_writes_one_edge_per_pair_lower_cik_first(self):
+        """Jaccard({1,2}, {1,2,3}) = 2/3 is written once, directed by CIK."""
+        driver, written = self._driver(self.EDGES)
+
+        created = compute_company_technology_similarity_sparse(
+            driver, similarity_threshold=0.5, logger=MagicMock()
+        )
+
+        assert created == 1
+        assert written == [{"source": "000111", "target": "000222", "score": 2 / 3}]
+
+    def test_lsh_path_matches_exact(self):
+        """Forcing MinHash/LSH gives the same result on an easy graph."""
+        driver, written = self._driver(self.EDGES)
+
+        compute_company_technology_similarity_sparse(
+            driver, similarity_threshold=0.5, lsh_min_companies=1, logger=MagicMock()
+        )
+
+        assert written == [{"source": "000111", "target": "000222", "score": 2 / 3}]
+
+    def test_dry_run_and_empty_export(self):
+        """Dry run touches nothing; an empty export writes nothing."""
+        driver, written = self._driver([])
+
+        assert compute_company_technology_similarity_sparse(driver, execute=False) == 0
+        driver.session.assert_not_called()
+        assert compute_company_technology_similarity_sparse(driver, logger=MagicMock()) == 0
+        assert written == []
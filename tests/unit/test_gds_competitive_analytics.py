@@ -0,0 +1,138 @@
+"""
+Unit tests for competitive graph analytics.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from public_company_graph.gds.competitive_analytics import (
+    compute_all_competitive_analytics,
+    compute_all_competitive_analytics_sparse,
+)
+
+
+class TestComputeAllCompetitiveAnalytics:
+    """Tests for the shared-projection GDS path."""
+
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
+    def test_single_projection_mutate_then_write(self, mock_safe_drop):
+        """Algorithms mutate one native projection, which is written once and dropped."""
+        gds = MagicMock()
+        graph = MagicMock()
+        gds.graph.project.return_value = (
+            graph,
+            {"nodeCount": 10, "relationshipCount": 20},
+        )
+        gds.pageRank.mutate.return_value = {"nodePropertiesWritten": 10}
+        gds.louvain.mutate.return_value = {"communityCount": 3}
+        gds.betweenness.mutate.return_value = {"nodePropertiesWritten": 10}
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"updated": 7}
+
+        results = compute_all_competitive_analytics(gds, driver, logger=MagicMock())
+
+        assert results == {"pagerank": 10, "communities": 3, "degree": 7, "betweenness": 10}
+        gds.graph.project.assert_called_once()
+        gds.graph.project.cypher.assert_not_called()
+        gds.graph.nodeProperties.write.assert_called_once()
+        written = gds.graph.nodeProperties.write.call_args.args[1]
+        assert set(written) == {
+            "competitive_pagerank",
+            "competitive_community",
+            "competitive_betweenness",
+        }
+        # Integer degrees, only on companies with edges: Cypher instead of gds.degree
+        gds.degree.mutate.assert_not_called()
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert any("SET c.competitive_in_degree" in query for query in queries)
+        assert any("SET c.competitive_out_degree" in query for query in queries)
+        gds.pageRank.write.assert_not_called()
+        graph.drop.assert_called_once()
+
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
+    def test_error_still_drops_projection(self, mock_safe_drop):
+        """A failing algorithm returns zero counts and releases the projection."""
+        gds = MagicMock()
+        graph = MagicMock()
+        gds.graph.project.return_value = (graph, {"nodeCount": 1, "relationshipCount": 0})
+        gds.louvain.mutate.side_effect = RuntimeError("boom")
+
+        results = compute_all_competitive_analytics(gds, MagicMock(), logger=MagicMock())
+
+        assert results["communities"] == 0
+        gds.graph.nodeProperties.write.assert_not_called()
+        graph.drop.assert_called_once()
+
+
+class TestComputeAllCompetitiveAnalyticsSparse:
+    """Tests for the in-process backend."""
+
+    @staticmethod
+    def _driver(nodes, edges):
+        driver = MagicMock()
+        session = MagicMock()
+        driver.session.return_value.__enter__ = MagicMock(return_value=session)
+        driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        writes = []
+
+        def run(query, **params):
+            if "batch" in params:
+                writes.extend(params["batch"])
+                result = MagicMock()
+                result.single.return_value = {"created": len(params["batch"])}
+                return result
+            if "HAS_COMPETITOR" in query:
+                return iter(edges)
+            return iter(nodes)
+
+        session.run.side_effect = run
+        return driver, writes
+
+    def test_computes_and_writes_all_properties(self):
+        """One write row per company with all five properties."""
+        nodes = [{"id": i, "pagerank": None} for i in (10, 11, 12, 13)]
+        edges = [
+            {"source": 10, "target": 11},
+            {"source": 11, "target": 12},
+            {"source": 13, "target": 12},
+        ]
+        driver, writes = self._driver(nodes, edges)
+
+        results = compute_all_competitive_analytics_sparse(driver, logger=MagicMock())
+
+        assert results["pagerank"] == 4
+        rows = {row["id"]: row for row in writes}
+        assert rows[12]["in_degree"] == 2
+        assert rows[13]["out_degree"] == 1
+        assert isinstance(rows[12]["in_degree"], int)
+        # Zero degrees are not written (the query keeps the stored value)
+        assert rows[10]["in_degree"] == 0
+        write_query = driver.session.return_value.__enter__.return_value.run.call_args.args[0]
+        assert "CASE WHEN row.in_degree > 0" in write_query
+        # 11 is the only node on a shortest path (10 -> 11 -> 12)
+        assert rows[11]["betweenness"] == pytest.approx(1.0)
+        assert rows[12]["pagerank"] > rows[10]["pagerank"]
+        assert rows[10]["pagerank"] == pytest.approx(0.15)
+        assert set(rows[10]) == {
+            "id",
+            "pagerank",
+            "community",
+            "in_degree",
+            "out_degree",
+            "betweenness",
+        }
+
+    @patch("public_company_graph.gds.competitive_analytics.pagerank")
+    def test_warm_start_uses_stored_scores(self, mock_pagerank):
+        """Stored competitive_pagerank values seed the power iteration."""
+        mock_pagerank.side_effect = lambda adjacency, **kwargs: np.ones(adjacency.shape[0])
+        nodes = [{"id": 1, "pagerank": 0.4}, {"id": 2, "pagerank": None}]
+        driver, _ = self._driver(nodes, [{"source": 1, "target": 2}])
+
+        compute_all_competitive_analytics_sparse(driver, logger=MagicMock())
+
+        initial = mock_pagerank.call_args.kwargs["initial"]
+        assert initial[0] == 0.4 and np.isnan(initial[1])
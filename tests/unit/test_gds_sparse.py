@@ -0,0 +1,306 @@
+"""
+Unit tests for the in-process sparse graph algorithms.
+
+Results are checked against straightforward dense/loop implementations of the
+same definitions (GDS PageRank semantics, Cypher co-occurrence counting).
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from public_company_graph.gds.sparse import (
+    BipartiteGraph,
+    betweenness_centrality,
+    cooccurrence_matrix,
+    cooccurrence_operator,
+    jaccard_top_k,
+    jaccard_top_k_lsh,
+    louvain_communities,
+    lsh_band_rows,
+    lsh_candidate_pairs,
+    minhash_signatures,
+    pagerank,
+    personalized_pagerank,
+    segment_max,
+    top_k_per_column,
+)
+
+
+@pytest.fixture
+def random_graph():
+    """Random Domain-Technology graph with string ids like a real export."""
+    rng = np.random.default_rng(7)
+    edges = [(f"d{d}", f"t{t}") for d in range(120) for t in range(25) if rng.random() < 0.12]
+    # Every domain uses at least one technology (as in a USES export)
+    edges += [(f"d{d}", "t0") for d in range(120)]
+    return BipartiteGraph.from_edges([e[0] for e in edges], [e[1] for e in edges])
+
+
+def _dense_pagerank(weights: np.ndarray, source: int, damping=0.85, iterations=20):
+    """Reference PPR: GDS formula with no dangling redistribution."""
+    n = len(weights)
+    out = weights.sum(axis=1)
+    scores = np.zeros(n)
+    scores[source] = 1 - damping
+    for _ in range(iterations):
+        updated = np.zeros(n)
+        updated[source] = 1 - damping
+        for u in range(n):
+            if out[u] > 0:
+                updated += damping * scores[u] * weights[u] / out[u]
+        if np.abs(updated - scores).max() < 1e-7:
+            return updated
+        scores = updated
+    return scores
+
+
+class TestBipartiteGraph:
+    """Tests for BipartiteGraph construction."""
+
+    def test_duplicate_edges_collapse(self):
+        """Repeated edges count once."""
+        graph = BipartiteGraph.from_edges([1, 1, 2], [10, 10, 10])
+
+        assert graph.matrix.nnz == 2
+        assert graph.left_degree.tolist() == [1, 1]
+        assert graph.right_degree.tolist() == [2]
+
+
+class TestCooccurrence:
+    """Tests for co-occurrence counts."""
+
+    def test_matches_pair_counting(self, random_graph):
+        """C[a, b] equals the number of domains using both a and b."""
+        dense = random_graph.matrix.toarray()
+        expected = dense.T @ dense
+        np.fill_diagonal(expected, 0)
+
+        assert np.array_equal(cooccurrence_matrix(random_graph).toarray(), expected)
+
+    def test_operator_matches_matrix(self, random_graph):
+        """The factored operator multiplies like the materialized matrix."""
+        x = np.random.default_rng(0).random((len(random_graph.right_ids), 3))
+        expected = cooccurrence_matrix(random_graph) @ x
+
+        assert np.allclose(cooccurrence_operator(random_graph) @ x, expected, rtol=1e-5)
+
+
+class TestPersonalizedPageRank:
+    """Tests for batched personalized PageRank."""
+
+    def test_matches_single_source_reference(self, random_graph):
+        """Each column equals a single-source PPR run."""
+        weights = cooccurrence_matrix(random_graph).toarray().astype(np.float64)
+        sources = np.array([0, 4, 11])
+
+        scores = personalized_pagerank(cooccurrence_operator(random_graph), sources)
+
+        for column, source in enumerate(sources):
+            expected = _dense_pagerank(weights, source)
+            assert np.allclose(scores[:, column], expected, atol=1e-6)
+
+
+class TestSegmentMax:
+    """Tests for per-row max over CSR rows."""
+
+    def test_matches_row_loop(self, random_graph):
+        """segment_max equals the max over each row's columns."""
+        values = np.random.default_rng(1).random((len(random_graph.right_ids), 4))
+        dense = random_graph.matrix.toarray()
+
+        result = segment_max(random_graph.matrix, values)
+
+        for row in range(dense.shape[0]):
+            expected = values[np.flatnonzero(dense[row])].max(axis=0)
+            assert np.array_equal(result[row], expected)
+
+    def test_rejects_empty_rows(self):
+        """Rows without entries have no max."""
+        graph = BipartiteGraph.from_edges([1], [10])
+        graph.matrix.resize((2, 1))
+
+        with pytest.raises(ValueError, match="at least one entry"):
+            segment_max(graph.matrix, np.ones((1, 1)))
+
+
+class TestTopKPerColumn:
+    """Tests for top-k selection."""
+
+    def test_best_first_and_positive_only(self):
+        """Returns the highest positive scores, best first."""
+        scores = np.array([[0.1, 0.0], [0.5, 0.0], [0.3, 0.2], [0.0, 0.0]])
+
+        result = dict(top_k_per_column(scores, top_k=2))
+
+        assert result[0].tolist() == [1, 2]
+        assert result[1].tolist() == [2]
+
+
+def _dense_jaccard(graph: BipartiteGraph) -> np.ndarray:
+    """Reference Jaccard between left nodes' neighbour sets (0 on the diagonal)."""
+    sets = [set(graph.matrix[i].indices) for i in range(graph.matrix.shape[0])]
+    n = len(sets)
+    similarity = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                similarity[i, j] = len(sets[i] & sets[j]) / len(sets[i] | sets[j])
+    return similarity
+
+
+class TestJaccardTopK:
+    """Tests for exact and MinHash/LSH top-k Jaccard."""
+
+    def test_exact_matches_pairwise_reference(self, random_graph):
+        """Each row gets its top_k neighbours above the cutoff, best first."""
+        reference = _dense_jaccard(random_graph)
+
+        rows, cols, similarity = jaccard_top_k(random_graph.matrix, 4, 0.2, block_size=17)
+
+        for i in range(len(reference)):
+            expected = np.sort(reference[i][reference[i] >= 0.2])[::-1][:4]
+            assert similarity[rows == i] == pytest.approx(expected)
+            assert reference[i, cols[rows == i]] == pytest.approx(similarity[rows == i])
+
+    def test_minhash_agreement_estimates_jaccard(self, random_graph):
+        """Signature agreement rate approximates the true similarity."""
+        reference = _dense_jaccard(random_graph)
+        signatures = minhash_signatures(random_graph.matrix, num_perm=512)
+
+        i, j = np.unravel_index(np.argmax(reference), reference.shape)
+        agreement = np.mean(signatures[i] == signatures[j])
+        assert agreement == pytest.approx(reference[i, j], abs=0.1)
+
+    def test_band_rows_put_threshold_above_lsh_midpoint(self):
+        """Chosen banding has its S-curve midpoint below the threshold."""
+        rows = lsh_band_rows(128, 0.5)
+        assert (1 / (128 // rows)) ** (1 / rows) <= 0.5
+        assert lsh_band_rows(128, 0.9) > rows
+
+    def test_lsh_candidates_are_unique_ordered_pairs(self, random_graph):
+        """Candidates satisfy left < right with no duplicates."""
+        signatures = minhash_signatures(random_graph.matrix)
+        left, right = lsh_candidate_pairs(signatures, 4, max_bucket_size=10)
+
+        assert np.all(left < right)
+        assert len(set(zip(left.tolist(), right.tolist(), strict=True))) == len(left)
+
+    def test_lsh_recovers_exact_result(self, random_graph):
+        """With a generous banding the approximate result equals the exact one."""
+        exact = jaccard_top_k(random_graph.matrix, 4, 0.3)
+        approx = jaccard_top_k_lsh(random_graph.matrix, 4, 0.3)
+
+        assert set(zip(*map(np.ndarray.tolist, approx[:2]), strict=True)) <= set(
+            zip(*map(np.ndarray.tolist, exact[:2]), strict=True)
+        )
+        assert len(approx[0]) >= 0.95 * len(exact[0])
+        assert np.all(approx[2] >= 0.3)
+
+
+@pytest.fixture
+def random_digraph():
+    """Random directed graph like a HAS_COMPETITOR export."""
+    rng = np.random.default_rng(3)
+    dense = (rng.random((40, 40)) < 0.07).astype(np.float64)
+    np.fill_diagonal(dense, 0.0)
+    return dense
+
+
+def _loop_betweenness(dense: np.ndarray) -> np.ndarray:
+    """Reference betweenness from all-pairs BFS distances and path counts."""
+    n = len(dense)
+    distance = np.full((n, n), -1)
+    paths = np.zeros((n, n))
+    for source in range(n):
+        distance[source, source], paths[source, source] = 0, 1
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for v in np.flatnonzero(dense[u]):
+                if distance[source, v] < 0:
+                    distance[source, v] = distance[source, u] + 1
+                    queue.append(v)
+                if distance[source, v] == distance[source, u] + 1:
+                    paths[source, v] += paths[source, u]
+
+    scores = np.zeros(n)
+    for s, t, v in np.ndindex(n, n, n):
+        if len({s, t, v}) < 3 or distance[s, t] < 0 or distance[s, v] < 0 or distance[v, t] < 0:
+            continue
+        if distance[s, v] + distance[v, t] == distance[s, t]:
+            scores[v] += paths[s, v] * paths[v, t] / paths[s, t]
+    return scores
+
+
+class TestGlobalPageRank:
+    """Tests for global PageRank."""
+
+    def test_matches_linear_solve(self, random_digraph):
+        """Converged scores solve x = (1 - d) + d · Pᵀx (no dangling redistribution)."""
+        out = random_digraph.sum(axis=1)
+        transition = random_digraph / np.where(out > 0, out, 1.0)[:, None]
+        expected = np.linalg.solve(np.eye(40) - 0.85 * transition.T, np.full(40, 0.15))
+
+        scores = pagerank(sparse.csr_matrix(random_digraph), max_iterations=500, tolerance=1e-12)
+
+        assert np.allclose(scores, expected)
+
+    def test_warm_start_converges_faster(self, random_digraph):
+        """Starting from converged scores needs far fewer iterations for the same result."""
+        adjacency = sparse.csr_matrix(random_digraph)
+        converged = pagerank(adjacency, max_iterations=500, tolerance=1e-12)
+
+        warm = pagerank(adjacency, max_iterations=2, tolerance=1e-12, initial=converged)
+        cold = pagerank(adjacency, max_iterations=2, tolerance=1e-12)
+
+        assert np.allclose(warm, converged)
+        assert not np.allclose(cold, converged)
+
+
+class TestBetweennessCentrality:
+    """Tests for Brandes betweenness."""
+
+    def test_matches_reference(self, random_digraph):
+        """Exact scores match the all-pairs definition."""
+        scores = betweenness_centrality(sparse.csr_matrix(random_digraph))
+
+        assert np.allclose(scores, _loop_betweenness(random_digraph))
+
+    def test_sampled_scaling(self, random_digraph):
+        """All sources sampled equals exact; fewer are scaled by n / samples."""
+        adjacency = sparse.csr_matrix(random_digraph)
+        exact = betweenness_centrality(adjacency)
+
+        assert np.allclose(betweenness_centrality(adjacency, samples=40), exact)
+        sampled = betweenness_centrality(adjacency, samples=20, seed=1)
+        assert sampled.shape == exact.shape
+        assert np.isclose(sampled.sum(), exact.sum(), rtol=0.5)
+
+
+class TestLouvainCommunities:
+    """Tests for Louvain community detection."""
+
+    def test_separates_linked_cliques(self):
+        """Two dense groups joined by one edge become two communities."""
+        dense = np.zeros((12, 12))
+        for group in (range(0, 6), range(6, 12)):
+            for u in group:
+                for v in group:
+                    if u < v:
+                        dense[u, v] = 1.0
+        dense[0, 6] = 1.0
+
+        communities = louvain_communities(sparse.csr_matrix(dense))
+
+        assert len(set(communities[:6])) == 1
+        assert len(set(communities[6:])) == 1
+        assert communities[0] != communities[6]
+
+    def test_isolated_nodes_keep_own_community(self):
+        """Nodes without edges are singleton communities."""
+        communities = louvain_communities(sparse.csr_matrix((3, 3)))
+
+        assert sorted(communities) == [0, 1, 2]
@@ -4,14 +4,17 @@ Unit tests for GDS technology adoption prediction functions.
 
 from unittest.mock import MagicMock, patch
 
-from public_company_graph.gds.tech_adoption import compute_tech_adoption_prediction
+from public_company_graph.gds.tech_adoption import (
+    compute_tech_adoption_prediction,
+    compute_tech_adoption_prediction_sparse,
+)
 
 
 class TestComputeTechAdoptionPrediction:
     """Tests for compute_tech_adoption_prediction function."""
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_creates_graph_and_runs_pagerank(self, mock_safe_drop, mock_delete_rels):
         """Test full flow: graph creation and PageRank computation."""
         mock_gds = MagicMock()
@@ -85,7 +88,7 @@ class TestComputeTechAdoptionPrediction:
         # The actual value depends on mock setup; integration tests verify correct counts
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_deletes_existing_relationships(self, mock_safe_drop, mock_delete_rels):
         """Test that existing LIKELY_TO_ADOPT relationships are deleted."""
         mock_gds = MagicMock()
@@ -118,7 +121,7 @@ class TestComputeTechAdoptionPrediction:
         assert call_kwargs["database"] == "testdb"
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_handles_exception_gracefully(self, mock_safe_drop, mock_delete_rels):
         """Test that exceptions are caught and logged."""
         mock_gds = MagicMock()
@@ -150,7 +153,7 @@ class TestComputeTechAdoptionPrediction:
         assert result == 0
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_respects_max_iterations_parameter(self, mock_safe_drop, mock_delete_rels):
         """Test that max_iterations is passed to PageRank."""
         mock_gds = MagicMock()
@@ -192,7 +195,7 @@ class TestComputeTechAdoptionPrediction:
         assert call_kwargs["maxIterations"] == 50
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_respects_damping_factor_parameter(self, mock_safe_drop, mock_delete_rels):
         """Test that damping_factor is passed to PageRank."""
         mock_gds = MagicMock()
@@ -232,7 +235,7 @@ class TestComputeTechAdoptionPrediction:
         assert call_kwargs["dampingFactor"] == 0.9
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_processes_technologies_in_batches(self, mock_safe_drop, mock_delete_rels):
         """Test that technologies are processed in batches."""
         mock_gds = MagicMock()
@@ -273,7 +276,7 @@ class TestComputeTechAdoptionPrediction:
         assert mock_gds.pageRank.write.call_count == 2
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_handles_individual_tech_errors(self, mock_safe_drop, mock_delete_rels):
         """Test that errors processing individual technologies don't stop the batch."""
         mock_gds = MagicMock()
@@ -343,7 +346,7 @@ class TestComputeTechAdoptionPrediction:
         mock_logger.warning.assert_called()
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_filters_ubiquitous_technologies(self, mock_safe_drop, mock_delete_rels):
         """Test that query filters out technologies used by >50% of domains."""
         mock_gds = MagicMock()
@@ -373,7 +376,7 @@ class TestComputeTechAdoptionPrediction:
         assert "0.5" in cypher_query or "50" in cypher_query.replace(" ", "")
 
     @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
-    @patch("public_company_graph.gds.tech_adoption.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_cleans_up_temp_property_after_batch(self, mock_safe_drop, mock_delete_rels):
         """Test that temporary PageRank property is cleaned up after each batch."""
         mock_gds = MagicMock()
@@ -418,3 +421,56 @@ class TestComputeTechAdoptionPrediction:
             if "ppr_score_temp" in str(call) and "REMOVE" in str(call)
         ]
         assert len(cleanup_calls) >= 1
+
+
+class TestComputeTechAdoptionPredictionSparse:
+    """Tests for the in-process sparse backend."""
+
+    @staticmethod
+    def _driver(edges, total_domains):
+        """Mock driver serving a USES export and capturing write batches."""
+        mock_driver = MagicMock()
+        mock_session = MagicMock()
+        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        written = []
+
+        def run(query, **params):
+            result = MagicMock()
+            if "RETURN id(d) AS domain_id" in query:
+                result.__iter__ = MagicMock(
+                    return_value=iter([{"domain_id": d, "tech_id": t} for d, t in edges])
+                )
+            elif "count(d) AS total" in query:
+                result.single.return_value = {"total": total_domains}
+            else:
+                written.extend(params["batch"])
+                result.single.return_value = {"created": len(params["batch"])}
+            return result
+
+        mock_session.run.side_effect = run
+        return mock_driver, written
+
+    @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
+    def test_predicts_non_users_of_cooccurring_technology(self, mock_delete_rels):
+        """Domains using a co-occurring technology are predicted; users are not."""
+        # Tech 100 and 200 co-occur on domain 1; domain 2 uses only 200; domain 3 only 300.
+        edges = [(1, 100), (1, 200), (2, 200), (3, 300), (4, 300), (5, 300)]
+        driver, written = self._driver(edges, total_domains=6)
+
+        created = compute_tech_adoption_prediction_sparse(driver, top_k=5, logger=MagicMock())
+
+        predictions = {(row["source"], row["target"]) for row in written}
+        assert (2, 100) in predictions
+        assert (1, 100) not in predictions  # Already uses it
+        assert all(tech != 300 for _, tech in predictions)  # Used by 50%, but no co-occurrence
+        assert created == len(written)
+        mock_delete_rels.assert_called_once()
+
+    @patch("public_company_graph.gds.tech_adoption.delete_relationships_in_batches")
+    def test_skips_when_no_edges(self, mock_delete_rels):
+        """Nothing is deleted or written without USES edges."""
+        driver, written = self._driver([], total_domains=0)
+
+        assert compute_tech_adoption_prediction_sparse(driver, logger=MagicMock()) == 0
+        mock_delete_rels.assert_not_called()
@@ -5,15 +5,14 @@ Unit tests for GDS technology affinity functions.
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
-from public_company_graph.gds.tech_affinity import (
-    _identify_columns,
-    compute_tech_affinity_bundling,
-)
+from public_company_graph.gds.tech_affinity import compute_tech_affinity_bundling
+from public_company_graph.gds.utils import similarity_result_columns
 
 
-class TestIdentifyColumns:
-    """Tests for _identify_columns helper function."""
+class TestSimilarityResultColumns:
+    """Tests for similarity_result_columns on Technology similarity streams."""
 
     def test_identifies_standard_column_names(self):
         """Test identification of standard GDS column names."""
@@ -26,11 +25,12 @@ class TestIdentifyColumns:
         )
         mock_logger = MagicMock()
 
-        col1, col2, sim_col = _identify_columns(df, mock_logger)
+        node_id1, node_id2, similarity = similarity_result_columns(df, mock_logger)
 
-        assert col1 == "nodeId1"
-        assert col2 == "nodeId2"
-        assert sim_col == "similarity"
+        assert node_id1.tolist() == [1, 2, 3]
+        assert node_id2.tolist() == [4, 5, 6]
+        assert similarity.tolist() == [0.9, 0.8, 0.7]
+        mock_logger.info.assert_called_with("   Using columns: nodeId1, nodeId2, similarity")
 
     def test_identifies_alternative_column_names(self):
         """Test identification of alternative column names (source/target)."""
@@ -41,13 +41,12 @@ class TestIdentifyColumns:
                 "score": [0.9, 0.8, 0.7],
             }
         )
-        mock_logger = MagicMock()
 
-        col1, col2, sim_col = _identify_columns(df, mock_logger)
+        node_id1, node_id2, similarity = similarity_result_columns(df, MagicMock())
 
-        assert col1 == "source"
-        assert col2 == "target"
-        assert sim_col == "score"
+        assert node_id1.tolist() == [1, 2, 3]
+        assert node_id2.tolist() == [4, 5, 6]
+        assert similarity.tolist() == [0.9, 0.8, 0.7]
 
     def test_identifies_node1_node2_columns(self):
         """Test identification of node1/node2 column names."""
@@ -58,16 +57,15 @@ class TestIdentifyColumns:
                 "weight": [0.9, 0.8],
             }
         )
-        mock_logger = MagicMock()
 
-        col1, col2, sim_col = _identify_columns(df, mock_logger)
+        node_id1, node_id2, similarity = similarity_result_columns(df, MagicMock())
 
-        assert col1 == "node1"
-        assert col2 == "node2"
-        assert sim_col == "weight"
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [4, 5]
+        assert similarity.tolist() == [0.9, 0.8]
 
-    def test_returns_none_for_unrecognized_columns(self):
-        """Test that None is returned for unrecognized column names."""
+    def test_raises_for_unrecognized_columns(self):
+        """Test that unrecognized column names raise ValueError."""
         df = pd.DataFrame(
             {
                 "foo": [1, 2],
@@ -75,14 +73,9 @@ class TestIdentifyColumns:
                 "baz": [0.9, 0.8],
             }
         )
-        mock_logger = MagicMock()
 
-        col1, col2, sim_col = _identify_columns(df, mock_logger)
-
-        assert col1 is None
-        assert col2 is None
-        assert sim_col is None
-        mock_logger.error.assert_called()
+        with pytest.raises(ValueError, match="foo"):
+            similarity_result_columns(df, MagicMock())
 
     def test_handles_mixed_case_column_names(self):
         """Test that column identification is case-insensitive."""
@@ -95,12 +88,12 @@ class TestIdentifyColumns:
         )
         mock_logger = MagicMock()
 
-        col1, col2, sim_col = _identify_columns(df, mock_logger)
+        node_id1, node_id2, similarity = similarity_result_columns(df, mock_logger)
 
-        # Should find them (case-insensitive comparison)
-        assert col1 == "NODEID1"
-        assert col2 == "NodeId2"
-        assert sim_col == "SIMILARITY"
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [4, 5]
+        assert similarity.tolist() == [0.9, 0.8]
+        mock_logger.info.assert_called_with("   Using columns: NODEID1, NodeId2, SIMILARITY")
 
 
 class TestComputeTechAffinityBundling:
@@ -309,7 +302,7 @@ class TestComputeTechAffinityBundling:
         call_kwargs = mock_gds.nodeSimilarity.stream.call_args[1]
         assert call_kwargs["topK"] == 15
 
-    @patch("public_company_graph.gds.tech_affinity.safe_drop_graph")
+    @patch("public_company_graph.gds.utils.safe_drop_graph")
     def test_drops_existing_graph_before_projection(self, mock_safe_drop):
         """Test that existing graph is dropped before creating new one."""
         mock_gds = MagicMock()
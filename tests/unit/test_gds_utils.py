@@ -4,11 +4,20 @@ Unit tests for GDS utility functions.
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from public_company_graph.gds.utils import (
+    GraphProjectionManager,
+    ProjectionSpec,
     cleanup_leftover_graphs,
+    iter_unwind_batches,
+    relationship_write_query,
     safe_drop_graph,
+    similarity_result_columns,
+    write_relationships,
+    write_unwind_batches,
 )
 
 
@@ -120,3 +129,256 @@ class TestGetGdsClient:
     # - The function has dynamic imports that are hard to mock
     # - Behavior is covered by integration tests
     # - These tests would require complex patching with minimal value
+
+
+class TestSimilarityResultColumns:
+    """Tests for similarity_result_columns."""
+
+    def test_dataframe_columns_are_converted(self):
+        """GDS stream column names map to int64/int64/float64 arrays."""
+        df = pd.DataFrame({"node1": [1, 2], "node2": [3, 4], "similarity": [0.5, 0.25]})
+
+        node_id1, node_id2, similarity = similarity_result_columns(df)
+
+        assert node_id1.dtype == np.int64 and similarity.dtype == np.float64
+        assert node_id1.tolist() == [1, 2]
+        assert node_id2.tolist() == [3, 4]
+        assert similarity.tolist() == [0.5, 0.25]
+
+    def test_unknown_dataframe_columns_raise(self):
+        """A DataFrame without node id columns is rejected."""
+        with pytest.raises(ValueError):
+            similarity_result_columns(pd.DataFrame({"a": [1], "b": [2]}))
+
+    def test_row_iterables_fall_back_to_row_loop(self):
+        """Lists of dicts are accepted too."""
+        rows = [{"nodeId1": 7, "nodeId2": 8, "score": 0.9}]
+
+        node_id1, node_id2, similarity = similarity_result_columns(rows)
+
+        assert (node_id1.tolist(), node_id2.tolist(), similarity.tolist()) == ([7], [8], [0.9])
+
+
+class TestUnwindBatches:
+    """Tests for iter_unwind_batches and write_unwind_batches."""
+
+    def test_batches_are_native_python_rows(self):
+        """Rows become dicts of native values, split by max_rows."""
+        columns = {"a": np.arange(5, dtype=np.int64), "b": np.linspace(0, 1, 5)}
+
+        batches = list(iter_unwind_batches(columns, max_rows=2))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[0][1] == {"a": 1, "b": 0.25}
+        assert type(batches[0][0]["a"]) is int
+
+    def test_max_bytes_caps_rows_per_batch(self):
+        """A small byte budget shrinks batches below max_rows."""
+        columns = {"node_id1": np.arange(100), "node_id2": np.arange(100)}
+
+        batches = list(iter_unwind_batches(columns, max_rows=100, max_bytes=300))
+
+        assert len(batches) > 1
+        assert sum(len(b) for b in batches) == 100
+
+    def test_write_sums_count_key(self):
+        """Each batch is one session.run; the count column is summed."""
+        session = MagicMock()
+        session.run.return_value.single.return_value = {"created": 2}
+
+        written = write_unwind_batches(
+            session, "UNWIND $batch AS rel RETURN count(*) AS created", {"x": np.arange(4)}, 2
+        )
+
+        assert written == 4
+        assert session.run.call_count == 2
+        assert session.run.call_args.kwargs["batch"] == [{"x": 2}, {"x": 3}]
+
+    def test_write_without_count_key_counts_rows(self):
+        """count_key=None counts rows sent."""
+        session = MagicMock()
+
+        written = write_unwind_batches(
+            session, "UNWIND $batch AS rel", {"x": np.arange(3)}, 10, count_key=None
+        )
+
+        assert written == 3
+        assert session.run.call_count == 1
+
+
+CYPHER_SPEC = ProjectionSpec(
+    name="cooc",
+    labels=("Technology",),
+    relationship_types=("USES",),
+    node_query="MATCH (t:Technology) RETURN id(t) AS id",
+    relationship_query="MATCH (a)-[:USES]->(b) RETURN id(a) AS source, id(b) AS target",
+)
+NATIVE_SPEC = ProjectionSpec(
+    name="competitive",
+    labels=("Company",),
+    relationship_types=("HAS_COMPETITOR",),
+    node_projection="Company",
+    relationship_projection="HAS_COMPETITOR",
+)
+
+
+class TestGraphProjectionManager:
+    """Tests for GraphProjectionManager."""
+
+    @staticmethod
+    def _manager(keep_alive=True):
+        gds = MagicMock()
+        gds.graph.project.cypher.side_effect = lambda name, *_: (
+            MagicMock(name=name),
+            {"nodeCount": 3, "relationshipCount": 4},
+        )
+        gds.graph.project.side_effect = lambda name, *_: (
+            MagicMock(name=name),
+            {"nodeCount": 5, "relationshipCount": 6},
+        )
+        gds.graph.exists.return_value = {"exists": True}
+        manager = GraphProjectionManager(
+            gds, database="db", keep_alive=keep_alive, logger=MagicMock()
+        )
+        return manager, gds
+
+    def test_reuses_live_projection(self):
+        """A second get returns the live graph without projecting again."""
+        manager, gds = self._manager()
+
+        graph, counts = manager.get(CYPHER_SPEC)
+        again, _ = manager.get(CYPHER_SPEC)
+
+        assert again is graph
+        assert counts == {"nodeCount": 3, "relationshipCount": 4}
+        gds.graph.project.cypher.assert_called_once()
+        assert gds.graph.project.cypher.call_args.args[0] == "cooc_db"
+
+    def test_invalidate_drops_projections_reading_written_types(self):
+        """Only projections that read an invalidated label or type are re-projected."""
+        manager, gds = self._manager()
+
+        graph, _ = manager.get(CYPHER_SPEC)
+        native, _ = manager.get(NATIVE_SPEC)
+        assert manager.invalidate("USES") == 1
+        again, _ = manager.get(CYPHER_SPEC)
+
+        graph.drop.assert_called_once()
+        native.drop.assert_not_called()
+        assert again is not graph
+        assert gds.graph.project.cypher.call_count == 2
+        assert manager.invalidate("Industry") == 0
+
+    def test_reprojects_when_dropped_externally(self):
+        """A projection missing from the catalog is projected again."""
+        manager, gds = self._manager()
+
+        manager.get(CYPHER_SPEC)
+        gds.graph.exists.return_value = {"exists": False}
+        manager.get(CYPHER_SPEC)
+
+        assert gds.graph.project.cypher.call_count == 2
+
+    def test_prefers_native_projection(self):
+        """Specs with native projections never use Cypher projection."""
+        manager, gds = self._manager()
+
+        _, counts = manager.get(NATIVE_SPEC)
+
+        gds.graph.project.assert_called_once_with("competitive_db", "Company", "HAS_COMPETITOR")
+        gds.graph.project.cypher.assert_not_called()
+        assert counts["nodeCount"] == 5
+
+    def test_release_and_drop_all(self):
+        """Shared managers keep projections until drop_all; ephemeral ones drop on release."""
+        manager, _ = self._manager()
+        graph, _ = manager.get(CYPHER_SPEC)
+        manager.release(CYPHER_SPEC)
+        graph.drop.assert_not_called()
+        manager.drop_all()
+        graph.drop.assert_called_once()
+
+        ephemeral, _ = self._manager(keep_alive=False)
+        graph, _ = ephemeral.get(CYPHER_SPEC)
+        ephemeral.release(CYPHER_SPEC)
+        graph.drop.assert_called_once()
+
+
+class TestRelationshipWriter:
+    """Tests for relationship_write_query and write_relationships."""
+
+    def test_query_seeks_each_endpoint_separately(self):
+        """Id seeks use one MATCH per endpoint, never a cartesian product."""
+        query = relationship_write_query(
+            "CO_OCCURS_WITH", "Technology", "Technology", ["similarity"], fresh=True
+        )
+
+        assert "MATCH (a:Technology) WHERE id(a) = row.source" in query
+        assert "MATCH (b:Technology) WHERE id(b) = row.target" in query
+        assert "CREATE (a)-[r:CO_OCCURS_WITH]->(b)" in query
+        assert "MERGE" not in query
+        assert "r.similarity = row.similarity" in query
+        assert query.endswith("RETURN count(*) AS created")
+
+    def test_keyed_bidirectional_merge(self):
+        """Key seeks, both directions and expression properties."""
+        query = relationship_write_query(
+            "SIMILAR_KEYWORD",
+            "Company",
+            "Company",
+            ["score"],
+            source_key="cik",
+            target_key="cik",
+            bidirectional=True,
+            expressions={"metric": "'COSINE'"},
+        )
+
+        assert "MATCH (a:Company {cik: row.source})" in query
+        assert "MERGE (a)-[r:SIMILAR_KEYWORD]->(b)" in query
+        assert "MERGE (b)-[r2:SIMILAR_KEYWORD]->(a)" in query
+        assert "r2.metric = 'COSINE'" in query
+        assert query.endswith("RETURN count(*) * 2 AS created")
+
+    @staticmethod
+    def _driver():
+        driver = MagicMock()
+        session = MagicMock()
+        driver.session.return_value.__enter__ = MagicMock(return_value=session)
+        driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        batches = []
+
+        def run(query, **params):
+            batches.append(params["batch"])
+            result = MagicMock()
+            result.single.return_value = {"created": len(params["batch"])}
+            return result
+
+        session.run.side_effect = run
+        return driver, session, batches
+
+    COLUMNS = {
+        "source": np.arange(5),
+        "target": np.arange(5) + 10,
+        "score": np.linspace(0.5, 0.9, 5),
+    }
+
+    def test_writes_batches_in_one_session(self):
+        """One session writes every batch in order."""
+        driver, session, batches = self._driver()
+
+        written = write_relationships(
+            driver, "REL", "A", "B", self.COLUMNS, batch_size=2, logger=MagicMock()
+        )
+
+        assert written == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0][0] == {"source": 0, "target": 10, "score": 0.5}
+        session.execute_write.assert_not_called()
+
+    def test_empty_columns_write_nothing(self):
+        """No rows, no session."""
+        driver, _, _ = self._driver()
+        empty = {"source": np.array([]), "target": np.array([])}
+
+        assert write_relationships(driver, "REL", "A", "B", empty) == 0
+        driver.session.assert_not_called()
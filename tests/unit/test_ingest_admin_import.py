@@ -0,0 +1,124 @@
+"""
+Unit tests for public_company_graph.ingest.admin_import module.
+"""
+
+import csv
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from public_company_graph.graphrag.chunking import DocumentChunk
+from public_company_graph.ingest.admin_import import export_admin_import
+from public_company_graph.ingest.cache_readers import company_record
+
+
+@pytest.fixture
+def domain_db(tmp_path):
+    """SQLite source with two domains (one duplicated by whois) and three USES rows."""
+    db_path = tmp_path / "domain_status.db"
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE url_status (
+                id INTEGER PRIMARY KEY, final_domain TEXT, initial_domain TEXT,
+                http_status INTEGER, http_status_text TEXT, response_time_seconds REAL,
+                observed_at_ms INTEGER, is_mobile_friendly INTEGER, spf_record TEXT,
+                dmarc_record TEXT, title TEXT, keywords TEXT, description TEXT
+            );
+            CREATE TABLE url_whois (
+                id INTEGER PRIMARY KEY, url_status_id INTEGER, creation_date_ms INTEGER,
+                expiration_date_ms INTEGER, registrar TEXT, registrant_country TEXT,
+                registrant_org TEXT
+            );
+            CREATE TABLE url_technologies (
+                id INTEGER PRIMARY KEY, url_status_id INTEGER, technology_name TEXT,
+                technology_category TEXT
+            );
+            INSERT INTO url_status (id, final_domain, initial_domain, http_status, title)
+            VALUES (1, 'acme.com', 'www.acme.com', 200, 'Acme, "the" company'),
+                   (2, 'beta.io', 'beta.io', 404, NULL);
+            INSERT INTO url_whois (url_status_id, registrar) VALUES (1, 'A'), (1, 'B');
+            INSERT INTO url_technologies (url_status_id, technology_name, technology_category)
+            VALUES (1, 'React', 'JavaScript'), (1, 'React', 'Frameworks'), (2, 'Nginx', NULL);
+            """
+        )
+        conn.commit()
+    return db_path
+
+
+def _read(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return list(csv.reader(handle))
+
+
+def test_exports_bootstrap_graph_in_admin_import_layout(tmp_path, domain_db):
+    """Node/relationship files carry typed headers and de-duplicated rows."""
+    companies = [
+        company_record(
+            "0000320193",
+            {"ticker": "acme", "website": "www.acme.com", "accession_number": "0000-24-1"},
+        ),
+        company_record("0000000002", {"name": "No Site Inc"}),
+    ]
+
+    export = export_admin_import(tmp_path / "out", domain_db, companies=companies)
+
+    domains = _read(tmp_path / "out" / "domains.csv")
+    assert domains[0][0] == "final_domain:ID(Domain)"
+    assert "http_status:int" in domains[0] and "loaded_at:datetime" in domains[0]
+    assert sorted(row[0] for row in domains[1:]) == ["acme.com", "beta.io"]
+    title = domains[0].index("title")
+    assert next(row for row in domains[1:] if row[0] == "acme.com")[title] == (
+        'Acme, "the" company'
+    )
+
+    assert [row[0] for row in _read(tmp_path / "out" / "technologies.csv")[1:]] == [
+        "React",
+        "Nginx",
+    ]
+    assert len(_read(tmp_path / "out" / "uses.csv")) == 3  # header + one row per pair
+
+    header, *rows = _read(tmp_path / "out" / "companies.csv")
+    company = dict(zip(header, rows[0], strict=True))
+    assert company["cik:ID(Company)"] == "0000320193"
+    assert company["ticker"] == "ACME"
+    assert company["sec_filing_url"] == "https://www.sec.gov/Archives/edgar/data/320193/0000241/"
+    assert _read(tmp_path / "out" / "has_domain.csv")[1][:2] == ["0000320193", "acme.com"]
+
+    assert {f.name for f in export.files} == {
+        "Domain",
+        "Technology",
+        "USES",
+        "Company",
+        "HAS_DOMAIN",
+        "IngestState",
+    }
+    assert _read(tmp_path / "out" / "ingest_state.csv")[1][:3] == ["domain_status", "0", "2"]
+    script = (tmp_path / "out" / "import.sh").read_text()
+    assert "neo4j-admin database import full" in script
+    assert "--relationships=USES=" in script
+    assert (
+        "REQUIRE d.final_domain IS UNIQUE;" in (tmp_path / "out" / "constraints.cypher").read_text()
+    )
+
+
+def test_exports_document_layer(tmp_path, domain_db):
+    """Chunks become Document/Chunk nodes with ordered NEXT_CHUNK links."""
+    chunks = [
+        DocumentChunk(
+            text=f"part {i}\nline", chunk_index=i, section_type="full_filing", company_cik="1"
+        )
+        for i in (1, 0, 2)
+    ]
+
+    export_admin_import(tmp_path / "out", domain_db, companies=[], chunks=chunks)
+
+    documents = _read(tmp_path / "out" / "documents.csv")
+    assert documents[1][0] == "1_full_filing_unknown"
+    assert _read(tmp_path / "out" / "chunks.csv")[1][1] == "part 0\nline"
+    assert _read(tmp_path / "out" / "next_chunk.csv")[1:] == [
+        ["1_full_filing_unknown_chunk_0", "1_full_filing_unknown_chunk_1"],
+        ["1_full_filing_unknown_chunk_1", "1_full_filing_unknown_chunk_2"],
+    ]
+    assert len(_read(tmp_path / "out" / "has_document.csv")) == 1  # Company 1 not exported
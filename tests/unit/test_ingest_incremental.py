@@ -0,0 +1,63 @@
+"""
+Unit tests for public_company_graph.ingest.incremental module.
+"""
+
+from unittest.mock import MagicMock
+
+from public_company_graph.ingest.incremental import (
+    IngestWatermark,
+    diff_technologies,
+    read_watermark,
+    write_watermark,
+)
+
+
+def _mapping(domain, name, category=None):
+    return {"final_domain": domain, "technology_name": name, "technology_category": category}
+
+
+def test_diff_technologies_adds_and_removes_only_changes():
+    """Unchanged edges are left alone; new ones are added, dropped ones removed."""
+    current = [
+        _mapping("a.com", "React"),
+        _mapping("a.com", "Nginx", "Web servers"),
+        _mapping("a.com", "Nginx", "Reverse proxies"),  # Same edge, other category
+        _mapping("b.com", "Vue"),
+    ]
+    existing = {"a.com": {"React", "jQuery"}, "c.com": {"PHP"}}
+
+    added, removed = diff_technologies(current, existing, {"a.com", "b.com", "c.com"})
+
+    assert [(row["final_domain"], row["technology_name"]) for row in added] == [
+        ("a.com", "Nginx"),
+        ("b.com", "Vue"),
+    ]
+    assert removed == [
+        {"final_domain": "a.com", "technology_name": "jQuery"},
+        {"final_domain": "c.com", "technology_name": "PHP"},  # No current mappings left
+    ]
+
+
+def test_diff_technologies_no_changes():
+    """Identical technology sets produce no writes."""
+    added, removed = diff_technologies(
+        [_mapping("a.com", "React")], {"a.com": {"React"}}, {"a.com"}
+    )
+
+    assert added == [] and removed == []
+
+
+def test_watermark_round_trip():
+    """The mark is read from and written to the IngestState node."""
+    driver = MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    session.run.return_value.single.return_value = None
+
+    assert read_watermark(driver) is None
+
+    session.run.return_value.single.return_value = {"observed_at_ms": 5000, "row_id": 4}
+    assert read_watermark(driver) == IngestWatermark(5000, 4)
+
+    write_watermark(driver, IngestWatermark(6000, 7))
+    params = session.run.call_args.kwargs
+    assert params == {"source": "domain_status", "observed_at_ms": 6000, "row_id": 7}
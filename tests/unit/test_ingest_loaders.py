@@ -0,0 +1,59 @@
+"""
+Unit tests for public_company_graph.ingest.loaders module.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from public_company_graph.ingest.loaders import load_domain_batches, load_domains
+
+
+def _driver():
+    """Mock driver capturing write batches."""
+    driver = MagicMock()
+    session = MagicMock()
+    driver.session.return_value.__enter__ = MagicMock(return_value=session)
+    driver.session.return_value.__exit__ = MagicMock(return_value=False)
+    written = []
+    tx = session.begin_transaction.return_value.__enter__.return_value
+    tx.run.side_effect = lambda query, batch: written.append(batch) or MagicMock()
+    return driver, tx, written
+
+
+def test_load_domain_batches_streams_every_batch():
+    """Each batch is written once, in order, from a generator."""
+    driver, _, written = _driver()
+    batches = ([{"final_domain": f"d{i}.com"}, {"final_domain": f"e{i}.com"}] for i in range(3))
+
+    loaded = load_domain_batches(driver, batches, total=6, log=MagicMock())
+
+    assert loaded == 6
+    assert [row["final_domain"] for batch in written for row in batch] == [
+        "d0.com",
+        "e0.com",
+        "d1.com",
+        "e1.com",
+        "d2.com",
+        "e2.com",
+    ]
+
+
+def test_load_domain_batches_surfaces_write_errors():
+    """A failed background write is raised to the caller."""
+    driver, tx, _ = _driver()
+    tx.run.side_effect = RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        load_domain_batches(driver, iter([[{"final_domain": "a.com"}]]), log=MagicMock())
+
+
+def test_load_domains_cleans_and_validates():
+    """load_domains drops empty values and rejects rows without final_domain."""
+    driver, _, written = _driver()
+
+    load_domains(driver, [{"final_domain": "a.com", "title": "", "status": None}], log=MagicMock())
+    assert written == [[{"final_domain": "a.com"}]]
+
+    with pytest.raises(ValueError, match="index 1"):
+        load_domains(driver, [{"final_domain": "a.com"}, {"domain": "b.com"}], log=MagicMock())
@@ -0,0 +1,124 @@
+"""
+Unit tests for the local mock OpenAI server.
+
+The server-backed tests talk to 127.0.0.1 through the real OpenAI client, which is
+exactly how load tests use it.
+"""
+
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from openai import AsyncOpenAI, OpenAI, RateLimitError
+
+from public_company_graph.embeddings.mock_server import (
+    MockOpenAIBackend,
+    MockOpenAIConfig,
+    MockOpenAIServer,
+    deterministic_embedding,
+)
+from public_company_graph.parsing.llm_verification import (
+    LLMRelationshipVerifier,
+    VerificationResult,
+)
+
+
+class TestMockOpenAIBackend:
+    """Request handling without sockets."""
+
+    def test_embeddings_are_deterministic_and_normalized(self):
+        """Same text and model give the same unit vector; different text differs."""
+        a = deterministic_embedding("Apple Inc.", "text-embedding-3-small", 64)
+        b = deterministic_embedding("Apple Inc.", "text-embedding-3-small", 64)
+        c = deterministic_embedding("Microsoft", "text-embedding-3-small", 64)
+
+        assert a == b
+        assert a != c
+        assert np.linalg.norm(a) == pytest.approx(1.0)
+
+    def test_embeddings_respect_requested_dimensions(self):
+        """The dimensions parameter overrides the configured size."""
+        backend = MockOpenAIBackend(MockOpenAIConfig(embedding_dimension=32))
+        status, _, body = backend.handle(
+            "/v1/embeddings", {"model": "m", "input": ["a", "b"], "dimensions": 8}
+        )
+
+        assert status == 200
+        assert [len(d["embedding"]) for d in body["data"]] == [8, 8]
+        assert backend.stats.embedding_inputs == 2
+
+    def test_packed_verification_prompt_gets_one_verdict_per_candidate(self):
+        """Canned completions answer each numbered candidate."""
+        backend = MockOpenAIBackend()
+        prompt = (
+            "CANDIDATES:\n[0] ACME --[HAS_SUPPLIER]--> Intel (valid if ...)\n"
+            "CONTEXT: ...\n\n[1] ACME --[HAS_CUSTOMER]--> Walmart (valid if ...)\n"
+        )
+        _, _, body = backend.handle(
+            "/v1/chat/completions", {"messages": [{"role": "user", "content": prompt}]}
+        )
+
+        results = json.loads(body["choices"][0]["message"]["content"])["results"]
+        assert [(r["id"], r["actual_relationship"]) for r in results] == [
+            (0, "HAS_SUPPLIER"),
+            (1, "HAS_CUSTOMER"),
+        ]
+
+    def test_request_budget_returns_429_with_headers(self):
+        """Requests beyond requests_per_minute are rejected with Retry-After."""
+        backend = MockOpenAIBackend(MockOpenAIConfig(requests_per_minute=2))
+        request = {"model": "m", "input": "x"}
+
+        statuses = [backend.handle("/v1/embeddings", request) for _ in range(3)]
+
+        assert [s[0] for s in statuses] == [200, 200, 429]
+        assert statuses[1][1]["x-ratelimit-remaining-requests"] == "0"
+        assert "retry-after" in statuses[2][1]
+        assert backend.stats.rate_limited == 1
+
+
+class TestMockOpenAIServer:
+    """End-to-end tests through the OpenAI client."""
+
+    def test_embeddings_round_trip(self):
+        """The client decodes the mock's embeddings to the deterministic vectors."""
+        with MockOpenAIServer(MockOpenAIConfig(embedding_dimension=16)) as server:
+            client = OpenAI(api_key="mock", base_url=server.base_url)
+            response = client.embeddings.create(model="m", input=["hello", "world"])
+
+        expected = deterministic_embedding("hello", "m", 16)
+        assert response.data[0].embedding == pytest.approx(expected, rel=1e-6)
+        assert len(response.data) == 2
+
+    def test_injected_429_raises_rate_limit_error(self):
+        """error_rate=1.0 rejects every request."""
+        with MockOpenAIServer(MockOpenAIConfig(error_rate=1.0)) as server:
+            client = OpenAI(api_key="mock", base_url=server.base_url, max_retries=0)
+            with pytest.raises(RateLimitError):
+                client.embeddings.create(model="m", input="hello")
+
+    def test_batch_verification_against_mock(self):
+        """Packed async verification completes against the mock with concurrency."""
+        relationships = [
+            {
+                "context": f"We purchase components from Supplier {i}.",
+                "source_company": "ACME Corp",
+                "target_company": f"Supplier {i}",
+                "relationship_type": "HAS_SUPPLIER",
+            }
+            for i in range(12)
+        ]
+        config = MockOpenAIConfig(latency_seconds=0.02)
+        with MockOpenAIServer(config) as server:
+            verifier = LLMRelationshipVerifier(
+                client=Mock(),
+                async_client=AsyncOpenAI(api_key="mock", base_url=server.base_url),
+            )
+            verifier._cache = Mock(get_many=Mock(return_value={}))
+            results = verifier.verify_batch_parallel(relationships, pack_size=2)
+
+        assert all(r.result == VerificationResult.CONFIRMED for r in results)
+        assert server.stats.chat_completions == 6
+        assert server.stats.peak_in_flight > 1
+        assert verifier.call_stats()["calls"] == 6
@@ -0,0 +1,90 @@
+"""
+Unit tests for public_company_graph.neo4j.bulk module.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j.exceptions import TransientError
+
+from public_company_graph.neo4j.bulk import BulkLoader, partition_rows, shard_of
+
+
+def _driver(fail_first: int = 0, error: Exception | None = None):
+    """Mock driver recording (thread, batch) per committed write."""
+    driver = MagicMock()
+    session = MagicMock()
+    driver.session.return_value.__enter__ = MagicMock(return_value=session)
+    driver.session.return_value.__exit__ = MagicMock(return_value=False)
+    tx = session.begin_transaction.return_value.__enter__.return_value
+    written = []
+    failures = {"left": fail_first}
+    lock = threading.Lock()
+
+    def run(query, batch):
+        with lock:
+            if failures["left"]:
+                failures["left"] -= 1
+                raise error or TransientError("Neo.TransientError.Transaction.DeadlockDetected")
+            written.append((threading.current_thread().name, batch))
+        return MagicMock()
+
+    tx.run.side_effect = run
+    return driver, written
+
+
+ROWS = [{"key": f"k{i % 40}", "value": i} for i in range(200)]
+
+
+def test_partitions_are_disjoint_and_stable():
+    """Equal keys land in one shard, and the shard never depends on the process."""
+    shards = partition_rows(ROWS, key="key", shards=4)
+
+    assert sum(len(shard) for shard in shards) == len(ROWS)
+    keys = [{row["key"] for row in shard} for shard in shards]
+    assert all(not (keys[i] & keys[j]) for i in range(4) for j in range(i + 1, 4))
+    assert shard_of("k1", 4) == shard_of("k1", 4)
+    assert shard_of("anything", 1) == 0
+
+
+def test_load_writes_every_row_once_across_workers():
+    """Batches respect batch_size and each key is written by a single thread."""
+    driver, written = _driver()
+
+    stats = BulkLoader(driver, workers=4, batch_size=16, logger=MagicMock()).load(
+        "UNWIND $batch AS row ...", iter(ROWS), key="key"
+    )
+
+    assert stats.rows == len(ROWS)
+    assert stats.batches == len(written)
+    assert sum(stats.rows_per_shard) == len(ROWS)
+    assert all(len(batch) <= 16 for _, batch in written)
+    assert sorted(row["value"] for _, batch in written for row in batch) == list(range(200))
+    writer_of = {}
+    for thread, batch in written:
+        for row in batch:
+            assert writer_of.setdefault(row["key"], thread) == thread
+
+
+def test_retries_transient_errors():
+    """Deadlocked batches are retried and counted."""
+    driver, written = _driver(fail_first=2)
+
+    stats = BulkLoader(driver, workers=1, batch_size=100, backoff=0.001, logger=MagicMock()).load(
+        "UNWIND $batch AS row ...", ROWS, key="key"
+    )
+
+    assert stats.rows == len(ROWS)
+    assert stats.retries == 2
+    assert len(written) == 2
+
+
+def test_non_transient_errors_are_raised():
+    """Other errors fail the load without retrying."""
+    driver, written = _driver(fail_first=1, error=ValueError("bad row"))
+
+    with pytest.raises(ValueError, match="bad row"):
+        BulkLoader(driver, workers=2, batch_size=500, logger=MagicMock()).load(
+            "UNWIND $batch AS row ...", ROWS, key="key"
+        )
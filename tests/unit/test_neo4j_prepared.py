@@ -0,0 +1,83 @@
+"""Tests for the prepared-query registry and the parameterized company queries."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from public_company_graph.company.queries import (
+    DEFAULT_SIMILARITY_WEIGHTS,
+    get_similarity_breakdown_query,
+    get_top_similar_companies_query,
+    get_top_similar_companies_query_extended,
+)
+from public_company_graph.neo4j.prepared import QUERY_REGISTRY, QueryRegistry
+
+
+class TestQueryRegistry:
+    def test_register_is_idempotent(self):
+        registry = QueryRegistry()
+        first = registry.register("q", "RETURN $x AS x", {"x": 1})
+        assert registry.register("q", "RETURN $x AS x") is first
+        assert "q" in registry
+        assert registry.names() == ["q"]
+
+    def test_conflicting_text_raises(self):
+        registry = QueryRegistry()
+        registry.register("q", "RETURN $x AS x")
+        with pytest.raises(ValueError):
+            registry.register("q", "RETURN 1")
+
+    def test_run_merges_defaults(self):
+        query = QueryRegistry().register("q", "RETURN $x AS x, $y AS y", {"x": 1, "y": 2})
+        session = MagicMock()
+        query.run(session, y=3)
+        session.run.assert_called_once_with("RETURN $x AS x, $y AS y", {"x": 1, "y": 3})
+
+
+class TestParameterizedCompanyQueries:
+    def test_company_queries_registered(self):
+        for name in (
+            "company.top_similar",
+            "company.top_similar_no_tech",
+            "company.top_similar_extended",
+            "company.similarity_breakdown",
+            "company.composite_similar",
+        ):
+            assert name in QUERY_REGISTRY
+
+    @pytest.mark.parametrize("include_shared_tech", [True, False])
+    def test_text_is_stable_across_calls(self, include_shared_tech):
+        text_ko, params_ko = get_top_similar_companies_query(
+            "KO", limit=5, include_shared_tech=include_shared_tech
+        )
+        text_pep, params_pep = get_top_similar_companies_query(
+            "PEP",
+            limit=50,
+            weights={"SIMILAR_RISK": 2.0},
+            min_score=0.3,
+            include_shared_tech=include_shared_tech,
+        )
+        assert text_ko == text_pep
+        assert "KO" not in text_ko and "$ticker" in text_ko
+        assert params_ko["ticker"] == "KO" and params_ko["limit"] == 5
+        assert params_pep["weights"]["SIMILAR_RISK"] == 2.0
+        assert params_pep["min_score"] == 0.3
+
+    def test_missing_weights_fall_back_per_type(self):
+        _, params = get_top_similar_companies_query("KO")
+        assert params["weights"]["SIMILAR_RISK"] == DEFAULT_SIMILARITY_WEIGHTS["SIMILAR_RISK"]
+        _, params = get_top_similar_companies_query("KO", weights={"SIMILAR_RISK": 2.0})
+        assert params["weights"]["SIMILAR_DESCRIPTION"] == 0.5
+
+    def test_extended_rel_types_follow_weights(self):
+        text, params = get_top_similar_companies_query_extended(
+            "KO", weights={"SIMILAR_RISK": 1.0, "SIMILAR_SIZE": 0.2}
+        )
+        assert params["rel_types"] == ["SIMILAR_RISK", "SIMILAR_SIZE"]
+        assert params["weights"]["SIMILAR_SIZE"] == 0.2
+        assert text == get_top_similar_companies_query_extended("AAPL")[0]
+
+    def test_breakdown_parameters(self):
+        text, params = get_similarity_breakdown_query("KO", "PEP")
+        assert params == {"ticker1": "KO", "ticker2": "PEP"}
+        assert "KO" not in text
@@ -0,0 +1,173 @@
+"""
+Unit tests for public_company_graph.pipeline module.
+"""
+
+import logging
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from public_company_graph.cli.logging import setup_logging
+from public_company_graph.pipeline import (
+    PipelineCheckpoint,
+    PipelineContext,
+    PipelineRunner,
+    Stage,
+    active_context,
+    execution_waves,
+    shared_resource,
+)
+
+
+@pytest.fixture
+def context():
+    return PipelineContext(MagicMock(), "neo4j", cache=MagicMock())
+
+
+def recording_stage(name, calls, inputs=(), outputs=(), fail=False):
+    def run(ctx):
+        calls.append(name)
+        if fail:
+            raise RuntimeError(f"{name} broke")
+
+    return Stage(name, run, inputs=inputs, outputs=outputs)
+
+
+def test_waves_follow_declared_inputs():
+    """Stages depend on the producers of their inputs; unproduced inputs are external."""
+    stages = [
+        Stage("load", None, inputs=("sqlite",), outputs=("Domain",)),
+        Stage("embed", None, inputs=("Domain",), outputs=("Domain.embedding",)),
+        Stage("keywords", None, inputs=("Domain",), outputs=("SIMILAR_KEYWORD",)),
+        Stage("similar", None, inputs=("Domain.embedding",), outputs=("SIMILAR",)),
+    ]
+
+    assert execution_waves(stages) == [["load"], ["embed", "keywords"], ["similar"]]
+
+
+def test_invalid_graphs_are_rejected():
+    """Cycles and artifacts with two producers are errors."""
+    with pytest.raises(ValueError, match="cycle"):
+        execution_waves([Stage("a", None, ("y",), ("x",)), Stage("b", None, ("x",), ("y",))])
+    with pytest.raises(ValueError, match="produced by both"):
+        execution_waves([Stage("a", None, outputs=("x",)), Stage("b", None, outputs=("x",))])
+
+
+def test_independent_stages_run_concurrently(context):
+    """Two stages without a dependency between them are in flight at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(ctx):
+        barrier.wait()
+
+    stages = [Stage("a", run, outputs=("x",)), Stage("b", run, outputs=("y",))]
+    result = PipelineRunner(stages, context, max_workers=2).run()
+
+    assert result.ok
+    assert sorted(result.completed) == ["a", "b"]
+
+
+def test_failed_run_resumes_at_failed_stage(context, tmp_path):
+    """Completed stages are checkpointed and skipped by a resumed run."""
+    checkpoint = PipelineCheckpoint(tmp_path / "checkpoint.json")
+    calls = []
+    stages = [
+        recording_stage("load", calls, outputs=("Company",)),
+        recording_stage("embed", calls, inputs=("Company",), outputs=("emb",), fail=True),
+        recording_stage("extract", calls, inputs=("emb",)),
+    ]
+
+    result = PipelineRunner(stages, context, checkpoint).run()
+
+    assert list(result.failed) == ["embed"]
+    assert result.not_run == ["extract"]
+    assert checkpoint.completed() == {"load"}
+
+    calls.clear()
+    stages[1] = recording_stage("embed", calls, inputs=("Company",), outputs=("emb",))
+    result = PipelineRunner(stages, context, checkpoint).run(resume=True)
+
+    assert result.ok
+    assert calls == ["embed", "extract"]
+    assert result.skipped == ["load"]
+    assert checkpoint.completed() == set()  # Cleared after a fully successful run
+
+
+def test_stages_sharing_a_lock_never_overlap(context):
+    """Independent stages taking the same lock run one at a time; others still overlap."""
+    running: set[str] = set()
+    overlapped: dict[str, set[str]] = {}
+    lock = threading.Lock()
+
+    def stage(name, locks):
+        def run(ctx):
+            with lock:
+                overlapped[name] = set(running)
+                running.add(name)
+            time.sleep(0.05)
+            with lock:
+                running.discard(name)
+                overlapped[name] |= running
+
+        return Stage(name, run, outputs=(name,), locks=locks)
+
+    stages = [
+        stage("enrich", ("Company",)),
+        stage("embed", ("Company",)),
+        stage("keywords", ("Domain",)),
+    ]
+    result = PipelineRunner(stages, context, max_workers=3).run()
+
+    assert result.ok
+    assert "embed" not in overlapped["enrich"] and "enrich" not in overlapped["embed"]
+    assert "keywords" in overlapped["enrich"]
+
+
+def test_shared_resources_are_built_once_and_invalidated(context):
+    """Stages reuse a resource until a stage writes what it was built from."""
+    builds = []
+
+    def lookup(ctx):
+        assert active_context() is ctx
+        shared_resource("lookup", lambda: builds.append(1), depends_on=("Company",))
+
+    stages = [
+        Stage("first", lookup, outputs=("a",)),
+        Stage("second", lookup, inputs=("a",), outputs=("b",)),
+        Stage("rewrite", lambda ctx: None, inputs=("b",), outputs=("Company",)),
+        Stage("third", lookup, inputs=("Company",)),
+    ]
+    result = PipelineRunner(stages, context, max_workers=1).run()
+
+    assert result.ok
+    assert len(builds) == 2
+    assert active_context() is None
+
+
+def test_stage_logging_keeps_the_run_handlers(tmp_path):
+    """setup_logging inside a run returns a child logger and leaves handlers alone."""
+    run_logger = logging.getLogger("test_pipeline_run")
+    handler = logging.NullHandler()
+    root = logging.getLogger()
+    root.addHandler(handler)
+    context = PipelineContext(MagicMock(), "neo4j", cache=MagicMock(), logger=run_logger)
+    try:
+        with context.activate():
+            stage_logger = setup_logging("stage_script", execute=True, log_dir=tmp_path)
+        assert stage_logger.parent is run_logger
+        assert handler in root.handlers
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        root.removeHandler(handler)
+
+
+def test_stage_driver_close_keeps_pool_open(context):
+    """Scripts closing the borrowed driver do not close the shared one."""
+    driver = context.borrow_driver()
+    driver.close()
+    driver.session(database="neo4j")
+
+    context.driver.close.assert_not_called()
+    context.driver.session.assert_called_once_with(database="neo4j")
@@ -1,15 +1,22 @@
 """
 Unit tests for rate limiting utility.
 
-Tests the RateLimiter class and get_rate_limiter function.
+Tests the RateLimiter and TokenBucket classes and their registries.
 """
 
+import asyncio
 import threading
 import time
 
 import pytest
 
-from public_company_graph.utils.rate_limiting import RateLimiter, get_rate_limiter
+from public_company_graph.utils.rate_limiting import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    get_token_bucket,
+)
 
 
 class TestRateLimiter:
@@ -193,3 +200,93 @@ class TestGetRateLimiter:
         assert limiter1 is limiter2, "Same source should return same limiter"
         # Note: The rate is set on first call, subsequent calls don't change it
         assert limiter2.requests_per_second == 10.0, "Rate should be from first call"
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AdaptiveConcurrencyLimiter class."""
+
+    def test_init_invalid(self):
+        """max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            AdaptiveConcurrencyLimiter(max_concurrency=0)
+
+    def test_rate_limit_halves_and_success_grows(self):
+        """Limit halves on rate limiting and climbs back one step at a time."""
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+        limiter.on_rate_limited()
+        assert limiter.limit == 4
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        assert limiter.limit == 1  # Never below min_concurrency
+
+        limiter.on_success()
+        assert limiter.limit == 2
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.limit == 8  # Never above max_concurrency
+
+    def test_in_flight_never_exceeds_limit(self):
+        """Concurrent tasks are held to the current limit."""
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=10, initial_concurrency=3)
+
+        async def task():
+            async with limiter:
+                await asyncio.sleep(0.001)
+
+        async def run():
+            await asyncio.gather(*(task() for _ in range(20)))
+
+        asyncio.run(run())
+        assert limiter.peak_in_flight == 3
+        assert limiter.in_flight == 0
+
+
+class TestTokenBucket:
+    """Test TokenBucket class."""
+
+    def test_init_invalid(self):
+        """rate must be positive."""
+        with pytest.raises(ValueError, match="rate must be > 0"):
+            TokenBucket(rate=0.0)
+
+    def test_burst_then_rate(self):
+        """A full bucket serves `capacity` calls at once, then one per 1/rate."""
+        bucket = TokenBucket(rate=20.0, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            assert bucket.acquire() == 0.0
+        assert time.monotonic() - start < 0.05
+
+        waited = bucket.acquire()
+        assert 0.03 <= waited <= 0.1
+
+    def test_pause_holds_back_callers(self):
+        """pause() delays the next acquire even with tokens available."""
+        bucket = TokenBucket(rate=100.0, capacity=10)
+        bucket.pause(0.1)
+
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_async_acquire_respects_rate(self):
+        """Concurrent tasks are spread out to the bucket's rate."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+            return time.monotonic() - start
+
+        # 1 immediate + 5 more at 50/s
+        assert asyncio.run(run()) >= 0.09
+
+    def test_registry_returns_same_bucket(self):
+        """Buckets are shared per name; the first rate wins."""
+        first = get_token_bucket("test_shared_bucket", rate=5.0)
+        second = get_token_bucket("test_shared_bucket", rate=50.0)
+
+        assert first is second
+        assert second.rate == 5.0
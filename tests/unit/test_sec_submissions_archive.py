@@ -0,0 +1,75 @@
+"""
+Unit tests for public_company_graph.sources.sec_submissions_archive module.
+"""
+
+import json
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from public_company_graph.sources.sec_submissions_archive import (
+    download_submissions_archive,
+    load_submissions_archive,
+)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """A small submissions.zip laid out like SEC's bulk archive."""
+    path = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(
+            "CIK0000320193.json",
+            json.dumps(
+                {
+                    "cik": "320193",
+                    "name": "Apple Inc.",
+                    "sic": "3571",
+                    "filings": {"recent": {"form": ["10-K"]}},
+                }
+            ),
+        )
+        zf.writestr(
+            "CIK0000789019.json",
+            json.dumps({"cik": "789019", "name": "MICROSOFT CORP", "sic": ["7372", "Software"]}),
+        )
+        # Older-filings page: no company properties
+        zf.writestr("CIK0000320193-submissions-001.json", json.dumps({"form": ["10-K"]}))
+        zf.writestr("CIK0000000001.json", "{not json")
+    return path
+
+
+def test_load_builds_cik_table(archive):
+    """Company members are parsed; filing pages and unreadable members are skipped."""
+    table = load_submissions_archive(archive)
+
+    assert set(table) == {"0000320193", "0000789019"}
+    assert table["0000320193"]["sic_code"] == "3571"
+    assert table["0000320193"]["company_name"] == "Apple Inc."
+    assert table["0000789019"]["sic_code"] == "7372"
+
+
+def test_load_only_wanted_ciks(archive):
+    """Only the requested CIKs are parsed (any zero-padding)."""
+    assert set(load_submissions_archive(archive, ciks=["320193", "42"])) == {"0000320193"}
+
+
+def test_load_missing_archive(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_submissions_archive(tmp_path / "missing.zip")
+
+
+def test_download_skips_existing_and_writes_atomically(archive, tmp_path):
+    """An existing archive is reused; a new one appears only once complete."""
+    session = MagicMock()
+    assert download_submissions_archive(archive, session=session) == archive
+    session.get.assert_not_called()
+
+    response = session.get.return_value.__enter__.return_value
+    response.iter_content.return_value = [b"PK", b"data"]
+    dest = tmp_path / "sec" / "submissions.zip"
+
+    assert download_submissions_archive(dest, session=session) == dest
+    assert dest.read_bytes() == b"PKdata"
+    assert not dest.with_suffix(".zip.part").exists()
@@ -12,8 +12,11 @@ import pytest
 from public_company_graph.ingest.sqlite_readers import (
     get_domain_count,
     get_domain_metadata_counts,
+    get_domain_watermark,
     get_technology_count,
     get_uses_relationship_count,
+    iter_domain_batches,
+    read_changed_domain_names,
     read_domains,
     read_technologies,
 )
@@ -146,6 +149,46 @@ def test_read_domains_includes_properties(test_db):
     assert example["description"] == "An example domain"
 
 
+def test_iter_domain_batches_matches_read_domains(test_db):
+    """Streamed batches hold the read_domains records minus empty values."""
+    batches = list(iter_domain_batches(test_db, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    streamed = {d["final_domain"]: d for batch in batches for d in batch}
+    for domain in read_domains(test_db):
+        expected = {k: v for k, v in domain.items() if v is not None}
+        assert streamed[domain["final_domain"]] == expected
+
+
+def test_iter_domain_batches_converts_timestamps(test_db):
+    """Epoch-millisecond columns become ISO UTC strings."""
+    with closing(sqlite3.connect(test_db)) as conn:
+        conn.execute("UPDATE url_status SET observed_at_ms = 86400000 WHERE id = 1")
+        conn.execute(
+            "INSERT INTO url_whois (url_status_id, creation_date_ms, registrar) VALUES (1, 0, '  ')"
+        )
+        conn.commit()
+
+    example = next(
+        d
+        for batch in iter_domain_batches(test_db)
+        for d in batch
+        if d["domain"] == "www.example.com"
+    )
+
+    assert example["timestamp"] == "1970-01-02T00:00:00+00:00"
+    assert example["observed_at_ms"] == 86400000
+    assert "creation_date" not in example  # 0 ms is treated as missing
+    assert "registrar" not in example  # Blank strings are omitted
+
+
+def test_iter_domain_batches_filters_domains(test_db):
+    """Only the selected domains are streamed."""
+    batches = list(iter_domain_batches(test_db, domains={"test.com", "missing.com"}))
+
+    assert [d["final_domain"] for batch in batches for d in batch] == ["test.com"]
+
+
 def test_read_technologies(test_db):
     """Test reading technology mappings from database."""
     tech_mappings = read_technologies(test_db)
@@ -165,6 +208,28 @@ def test_read_technologies_includes_domain(test_db):
     assert wordpress["technology_category"] == "CMS"
 
 
+def test_read_technologies_filters_domains(test_db):
+    """read_technologies(domains=...) only returns mappings of those domains."""
+    tech_mappings = read_technologies(test_db, domains=["example.com"])
+
+    assert {t["technology_name"] for t in tech_mappings} == {"WordPress", "jQuery"}
+
+
+def test_read_changed_domain_names(test_db):
+    """Rows past the mark, by timestamp or by id, identify the changed domains."""
+    with closing(sqlite3.connect(test_db)) as conn:
+        conn.execute("UPDATE url_status SET observed_at_ms = 1000")
+        conn.execute("UPDATE url_status SET observed_at_ms = 5000 WHERE id = 2")
+        conn.execute(
+            "INSERT INTO url_status (id, final_domain, observed_at_ms) VALUES (4, 'new.com', NULL)"
+        )
+        conn.commit()
+
+    assert get_domain_watermark(test_db) == (5000, 4)
+    assert read_changed_domain_names(test_db, 1000, 3) == {"test.com", "new.com"}
+    assert read_changed_domain_names(test_db, 5000, 4) == set()
+
+
 def test_get_domain_count(test_db):
     """Test domain count function."""
     count = get_domain_count(test_db)